@@ -1,13 +1,19 @@
+import asyncio
 import json
 import mimetypes
 import os
+import time
 
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from urllib.parse import quote
 
 import requests
 
+from requests.adapters import HTTPAdapter
+from typing_extensions import Self
+
 from memos.api.product_models import (
     MemOSAddFeedBackResponse,
     MemOSAddKnowledgebaseFileResponse,
@@ -22,22 +28,40 @@ from memos.api.product_models import (
     MemOSGetTaskStatusResponse,
     MemOSSearchResponse,
 )
+from memos.async_utils import http_limits
 from memos.log import get_logger
 
 
 logger = get_logger(__name__)
 
 MAX_RETRY_COUNT = 3
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_BATCH_WORKERS = 8
 
 
 class MemOSClient:
-    """MemOS API client"""
+    """MemOS API client
+
+    All calls share one ``requests.Session`` whose connection pool is sized by
+    ``pool_connections`` / ``pool_maxsize``, so repeated calls reuse keep-alive
+    connections instead of paying a new TCP/TLS handshake each time. Failed calls
+    are retried ``max_retries`` times, waiting ``retry_backoff * 2**attempt``
+    seconds between attempts.
+    """
 
     def __init__(
         self,
         api_key: str | None = None,
         base_url: str | None = None,
         is_global: str | bool = "false",
+        *,
+        session: Any | None = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        max_retries: int = MAX_RETRY_COUNT,
+        retry_backoff: float = 0.0,
+        timeout: float = 30,
     ):
         # Priority:
         # 1. base_url argument
@@ -61,6 +85,20 @@ class MemOSClient:
         self.api_key = api_key
         self.headers = {"Content-Type": "application/json", "Authorization": f"Token {api_key}"}
 
+        # One pooled session per client keeps TCP/TLS connections alive across calls.
+        self.max_retries = max(1, max_retries)
+        self.retry_backoff = retry_backoff
+        self.timeout = timeout
+        self.session = session or self._create_session(pool_connections, pool_maxsize)
+
+    @staticmethod
+    def _create_session(pool_connections: int, pool_maxsize: int) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
     def _validate_required_params(self, **params):
         """Validate required parameters - if passed, they must not be empty"""
         for param_name, param_value in params.items():
@@ -86,24 +124,123 @@ class MemOSClient:
     def _post_json_dict(
         self, endpoint: str, payload: dict[str, Any], operation: str
     ) -> dict[str, Any] | None:
+        return self._request(endpoint, operation, payload=payload)
+
+    def _request_kwargs(
+        self,
+        payload: dict[str, Any] | None,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        file_params: list | None,
+    ) -> dict[str, Any]:
+        kwargs: dict[str, Any] = {"headers": headers or self.headers, "timeout": self.timeout}
+        if payload is not None:
+            kwargs["data"] = json.dumps(payload)
+        if params is not None:
+            kwargs["params"] = params
+        if file_params is not None:
+            kwargs["files"] = file_params
+        return kwargs
+
+    def _log_retry(self, operation: str, retry: int, error: Exception) -> None:
+        logger.error(
+            "Failed to %s (retry %s/%s): %s",
+            operation,
+            retry + 1,
+            self.max_retries,
+            error,
+        )
+
+    def _retry_delay(self, retry: int) -> float:
+        return self.retry_backoff * (2**retry)
+
+    def _request(
+        self,
+        endpoint: str,
+        operation: str,
+        *,
+        method: str = "POST",
+        payload: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        files: Callable[[], list] | None = None,
+        parse: Callable[..., Any] | None = None,
+        stream: bool = False,
+    ) -> Any:
+        """Send one API call over the pooled session, retrying up to ``max_retries`` times.
+
+        ``files`` builds fresh multipart file tuples for every attempt; they are
+        closed after it. The JSON body is passed to ``parse`` as keyword arguments
+        (or returned as-is), and streamed responses are returned as an iterator of
+        SSE data payloads.
+        """
         url = f"{self.base_url}/{endpoint}"
-        for retry in range(MAX_RETRY_COUNT):
+        for retry in range(self.max_retries):
+            file_params = []
             try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
+                file_params = files() if files is not None else []
+                if method == "GET":
+                    response = self.session.get(url, headers=self.headers, timeout=self.timeout)
+                else:
+                    kwargs = self._request_kwargs(
+                        payload, params, headers, file_params if files is not None else None
+                    )
+                    if stream:
+                        kwargs["stream"] = True
+                    response = self.session.post(url, **kwargs)
                 response.raise_for_status()
-                return response.json()
+                if stream:
+                    return self._iter_sse_data(response)
+                response_data = response.json()
+                return parse(**response_data) if parse is not None else response_data
             except Exception as e:
-                logger.error(
-                    "Failed to %s (retry %s/%s): %s",
-                    operation,
-                    retry + 1,
-                    MAX_RETRY_COUNT,
-                    e,
-                )
-                if retry == MAX_RETRY_COUNT - 1:
+                self._log_retry(operation, retry, e)
+                if retry == self.max_retries - 1:
                     raise
+                if self.retry_backoff:
+                    time.sleep(self._retry_delay(retry))
+            finally:
+                for file_param in file_params:
+                    file_param[1][1].close()
+
+    def _run_batch(
+        self, method: Callable[..., Any], calls: list[dict[str, Any]], max_workers: int
+    ) -> list[Any]:
+        if not calls:
+            return []
+        workers = max(1, min(max_workers, len(calls)))
+        if workers == 1:
+            return [method(**kwargs) for kwargs in calls]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda kwargs: method(**kwargs), calls))
+
+    def add_message_batch(
+        self, calls: list[dict[str, Any]], max_workers: int = DEFAULT_BATCH_WORKERS
+    ) -> list[MemOSAddResponse | None]:
+        """Run ``add_message`` for each kwargs dict in ``calls``, ``max_workers`` at a time.
+
+        Results keep the order of ``calls``; the first failed call raises.
+        """
+        return self._run_batch(self.add_message, calls, max_workers)
+
+    def search_memory_batch(
+        self, calls: list[dict[str, Any]], max_workers: int = DEFAULT_BATCH_WORKERS
+    ) -> list[MemOSSearchResponse | None]:
+        """Run ``search_memory`` for each kwargs dict in ``calls``, ``max_workers`` at a time.
+
+        Results keep the order of ``calls``; the first failed call raises.
+        """
+        return self._run_batch(self.search_memory, calls, max_workers)
+
+    def close(self) -> None:
+        """Close the pooled session and its keep-alive connections."""
+        self.session.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def get_message(
         self,
@@ -117,7 +254,6 @@ class MemOSClient:
         # Validate required parameters
         self._validate_required_params(user_id=user_id, conversation_id=conversation_id)
 
-        url = f"{self.base_url}/get/message"
         payload = {
             "user_id": user_id,
             "conversation_id": conversation_id,
@@ -125,19 +261,9 @@ class MemOSClient:
             "message_limit_number": message_limit_number,
             "source": source,
         }
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSGetMessagesResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to get messages (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(
+            "get/message", "get messages", payload=payload, parse=MemOSGetMessagesResponse
+        )
 
     def add_message(
         self,
@@ -160,7 +286,6 @@ class MemOSClient:
         if not user_id and not agent_id:
             raise ValueError("user_id or agent_id is required")
 
-        url = f"{self.base_url}/add/message"
         payload = {
             "messages": messages,
             "user_id": user_id,
@@ -175,19 +300,7 @@ class MemOSClient:
             "tags": tags,
             "async_mode": async_mode,
         }
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSAddResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to add message (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request("add/message", "add message", payload=payload, parse=MemOSAddResponse)
 
     def search_memory(
         self,
@@ -214,7 +327,6 @@ class MemOSClient:
         self._validate_required_params(query=query)
         self._validate_profile_subject(user_id, agent_id)
 
-        url = f"{self.base_url}/search/memory"
         payload = {
             "query": query,
             "user_id": user_id,
@@ -234,20 +346,9 @@ class MemOSClient:
             "source": source,
             "include_tool_memory": include_tool_memory,
         }
-
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSSearchResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to search memory (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(
+            "search/memory", "search memory", payload=payload, parse=MemOSSearchResponse
+        )
 
     def get_memory(
         self,
@@ -266,7 +367,6 @@ class MemOSClient:
         if size > 50:
             raise ValueError("size must be less than or equal to 50")
 
-        url = f"{self.base_url}/get/memory"
         payload = {
             "include_preference": include_preference,
             "user_id": user_id,
@@ -277,20 +377,9 @@ class MemOSClient:
             "page": page,
             "size": size,
         }
-
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSGetMemoryResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to get memory (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(
+            "get/memory", "get memory", payload=payload, parse=MemOSGetMemoryResponse
+        )
 
     @staticmethod
     def _iter_sse_data(response: requests.Response) -> Iterator[str]:
@@ -309,21 +398,9 @@ class MemOSClient:
         """Get one memory detail by its memory ID."""
         self._validate_required_params(memid=memid)
 
-        url = f"{self.base_url}/get/memory/{quote(memid, safe='')}"
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.get(url, headers=self.headers, timeout=30)
-                response.raise_for_status()
-                return response.json()
-            except Exception as e:
-                logger.error(
-                    "Failed to get memory by ID (retry %s/%s): %s",
-                    retry + 1,
-                    MAX_RETRY_COUNT,
-                    e,
-                )
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(
+            f"get/memory/{quote(memid, safe='')}", "get memory by ID", method="GET"
+        )
 
     def create_knowledgebase(
         self, knowledgebase_name: str, knowledgebase_description: str | None = None
@@ -334,25 +411,16 @@ class MemOSClient:
         # Validate required parameters
         self._validate_required_params(knowledgebase_name=knowledgebase_name)
 
-        url = f"{self.base_url}/create/knowledgebase"
         payload = {
             "knowledgebase_name": knowledgebase_name,
             "knowledgebase_description": knowledgebase_description,
         }
-
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSCreateKnowledgebaseResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to create knowledgebase (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(
+            "create/knowledgebase",
+            "create knowledgebase",
+            payload=payload,
+            parse=MemOSCreateKnowledgebaseResponse,
+        )
 
     def delete_knowledgebase(
         self, knowledgebase_id: str
@@ -363,24 +431,15 @@ class MemOSClient:
         # Validate required parameters
         self._validate_required_params(knowledgebase_id=knowledgebase_id)
 
-        url = f"{self.base_url}/delete/knowledgebase"
         payload = {
             "knowledgebase_id": knowledgebase_id,
         }
-
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSDeleteKnowledgebaseResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to delete knowledgebase (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(
+            "delete/knowledgebase",
+            "delete knowledgebase",
+            payload=payload,
+            parse=MemOSDeleteKnowledgebaseResponse,
+        )
 
     def add_knowledgebase_file_json(
         self, knowledgebase_id: str, file: list[dict[str, Any]]
@@ -391,25 +450,16 @@ class MemOSClient:
         # Validate required parameters
         self._validate_required_params(knowledgebase_id=knowledgebase_id, file=file)
 
-        url = f"{self.base_url}/add/knowledgebase-file"
         payload = {
             "knowledgebase_id": knowledgebase_id,
             "file": file,
         }
-
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSAddKnowledgebaseFileResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to add knowledgebase-file json (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(
+            "add/knowledgebase-file",
+            "add knowledgebase-file json",
+            payload=payload,
+            parse=MemOSAddKnowledgebaseFileResponse,
+        )
 
     def add_knowledgebase_file_form(
         self, knowledgebase_id: str, files: list[str], type: str | None = None
@@ -444,7 +494,6 @@ class MemOSClient:
                 raise ValueError("files must contain at least one valid file path")
             return file_params
 
-        url = f"{self.base_url}/add/knowledgebase-file"
         payload = {
             "knowledgebase_id": knowledgebase_id,
         }
@@ -453,28 +502,14 @@ class MemOSClient:
         headers = {
             "Authorization": f"Token {self.api_key}",
         }
-        for retry in range(MAX_RETRY_COUNT):
-            file_params = []
-            try:
-                file_params = build_file_form_params()
-                response = requests.post(
-                    url,
-                    params=payload,
-                    headers=headers,
-                    timeout=30,
-                    files=file_params,
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSAddKnowledgebaseFileResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to add knowledgebase-file form (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
-            finally:
-                for file_param in file_params:
-                    file_param[1][1].close()
+        return self._request(
+            "add/knowledgebase-file",
+            "add knowledgebase-file form",
+            params=payload,
+            headers=headers,
+            files=build_file_form_params,
+            parse=MemOSAddKnowledgebaseFileResponse,
+        )
 
     def delete_knowledgebase_file(
         self, file_ids: list[str]
@@ -485,24 +520,15 @@ class MemOSClient:
         # Validate required parameters
         self._validate_required_params(file_ids=file_ids)
 
-        url = f"{self.base_url}/delete/knowledgebase-file"
         payload = {
             "file_ids": file_ids,
         }
-
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSDeleteKnowledgebaseResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to delete knowledgebase-file (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(
+            "delete/knowledgebase-file",
+            "delete knowledgebase-file",
+            payload=payload,
+            parse=MemOSDeleteKnowledgebaseResponse,
+        )
 
     def get_knowledgebase_file(
         self,
@@ -519,7 +545,6 @@ class MemOSClient:
         if bool(file_ids) == bool(knowledgebase_id):
             raise ValueError("exactly one of file_ids or knowledgebase_id is required")
 
-        url = f"{self.base_url}/get/knowledgebase-file"
         payload = {
             "file_ids": file_ids,
             "knowledgebase_id": knowledgebase_id,
@@ -527,20 +552,12 @@ class MemOSClient:
             "page": page,
             "page_size": page_size,
         }
-
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSGetKnowledgebaseFileResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to get knowledgebase-file (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(
+            "get/knowledgebase-file",
+            "get knowledgebase-file",
+            payload=payload,
+            parse=MemOSGetKnowledgebaseFileResponse,
+        )
 
     def get_task_status(self, task_id: str) -> MemOSGetTaskStatusResponse | None:
         """
@@ -549,25 +566,18 @@ class MemOSClient:
         # Validate required parameters
         self._validate_required_params(task_id=task_id)
 
-        url = f"{self.base_url}/get/status"
         payload = {
             "task_id": task_id,
         }
 
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-                response_data = self._normalize_task_status_response(response_data, task_id)
-
-                return MemOSGetTaskStatusResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to get task status (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(
+            "get/status",
+            "get task status",
+            payload=payload,
+            parse=lambda **response_data: MemOSGetTaskStatusResponse(
+                **self._normalize_task_status_response(response_data, task_id)
+            ),
+        )
 
     def add_feedback(
         self,
@@ -584,7 +594,6 @@ class MemOSClient:
         # Validate required parameters
         self._validate_required_params(feedback_content=feedback_content, user_id=user_id)
 
-        url = f"{self.base_url}/add/feedback"
         payload = {
             "feedback_content": feedback_content,
             "user_id": user_id,
@@ -595,19 +604,9 @@ class MemOSClient:
             "allow_public": allow_public,
             "allow_knowledgebase_ids": allow_knowledgebase_ids,
         }
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSAddFeedBackResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to add feedback (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(
+            "add/feedback", "add feedback", payload=payload, parse=MemOSAddFeedBackResponse
+        )
 
     def delete_memory(
         self,
@@ -635,7 +634,6 @@ class MemOSClient:
         if sum(delete_modes) != 1:
             raise ValueError("exactly one delete condition is required")
 
-        url = f"{self.base_url}/delete/memory"
         payload: dict[str, Any] = {}
         if memory_ids:
             payload["memory_ids"] = memory_ids
@@ -647,20 +645,9 @@ class MemOSClient:
             payload["filter"] = filter
         if memory_type is not None:
             payload["memory_type"] = memory_type
-
-        for retry in range(MAX_RETRY_COUNT):
-            try:
-                response = requests.post(
-                    url, data=json.dumps(payload), headers=self.headers, timeout=30
-                )
-                response.raise_for_status()
-                response_data = response.json()
-
-                return MemOSDeleteMemoryResponse(**response_data)
-            except Exception as e:
-                logger.error(f"Failed to delete memory (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
-                    raise
+        return self._request(
+            "delete/memory", "delete memory", payload=payload, parse=MemOSDeleteMemoryResponse
+        )
 
     def update_memory(
         self,
@@ -805,7 +792,6 @@ class MemOSClient:
             user_id=user_id, conversation_id=conversation_id, query=query
         )
 
-        url = f"{self.base_url}/chat"
         payload = {
             "user_id": user_id,
             "conversation_id": conversation_id,
@@ -838,22 +824,121 @@ class MemOSClient:
             "relativity": relativity,
         }
 
-        for retry in range(MAX_RETRY_COUNT):
+        return self._request(
+            "chat", "chat", payload=payload, parse=MemOSChatResponse, stream=stream
+        )
+
+
+class AsyncMemOSClient(MemOSClient):
+    """Asyncio MemOS API client over a pooled, keep-alive ``httpx.AsyncClient``.
+
+    It has the same methods and arguments as ``MemOSClient``; each one returns an
+    awaitable instead of the result (argument validation still raises on call).
+    ``add_message_batch`` / ``search_memory_batch`` run the calls concurrently
+    with at most ``max_workers`` in flight. Pass ``session`` to share an existing
+    ``httpx.AsyncClient``.
+    """
+
+    @staticmethod
+    def _create_session(pool_connections: int, pool_maxsize: int):
+        import httpx
+
+        return httpx.AsyncClient(
+            limits=http_limits(
+                max_connections=pool_maxsize, max_keepalive_connections=pool_connections
+            )
+        )
+
+    def _request_kwargs(
+        self,
+        payload: dict[str, Any] | None,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+        file_params: list | None,
+    ) -> dict[str, Any]:
+        kwargs = super()._request_kwargs(payload, params, headers, file_params)
+        # httpx takes a raw request body as ``content``
+        if "data" in kwargs:
+            kwargs["content"] = kwargs.pop("data")
+        return kwargs
+
+    async def _request(
+        self,
+        endpoint: str,
+        operation: str,
+        *,
+        method: str = "POST",
+        payload: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        files: Callable[[], list] | None = None,
+        parse: Callable[..., Any] | None = None,
+        stream: bool = False,
+    ) -> Any:
+        url = f"{self.base_url}/{endpoint}"
+        for retry in range(self.max_retries):
+            file_params = []
             try:
-                response = requests.post(
-                    url,
-                    data=json.dumps(payload),
-                    headers=self.headers,
-                    timeout=30,
-                    stream=stream,
-                )
-                response.raise_for_status()
+                file_params = files() if files is not None else []
+                if method == "GET":
+                    kwargs = {"headers": self.headers, "timeout": self.timeout}
+                else:
+                    kwargs = self._request_kwargs(
+                        payload, params, headers, file_params if files is not None else None
+                    )
+                request = self.session.build_request(method, url, **kwargs)
+                response = await self.session.send(request, stream=stream)
                 if stream:
-                    return self._iter_sse_data(response)
+                    try:
+                        response.raise_for_status()
+                    except Exception:
+                        await response.aclose()
+                        raise
+                    return self._aiter_sse_data(response)
+                response.raise_for_status()
                 response_data = response.json()
-
-                return MemOSChatResponse(**response_data)
+                return parse(**response_data) if parse is not None else response_data
             except Exception as e:
-                logger.error(f"Failed to chat (retry {retry + 1}/3): {e}")
-                if retry == MAX_RETRY_COUNT - 1:
+                self._log_retry(operation, retry, e)
+                if retry == self.max_retries - 1:
                     raise
+                if self.retry_backoff:
+                    await asyncio.sleep(self._retry_delay(retry))
+            finally:
+                for file_param in file_params:
+                    file_param[1][1].close()
+
+    @staticmethod
+    async def _aiter_sse_data(response) -> AsyncIterator[str]:
+        """Yield decoded data payloads from a streamed Server-Sent Events response."""
+        try:
+            async for line in response.aiter_lines():
+                if not line or not line.startswith("data:"):
+                    continue
+                yield line.removeprefix("data:").lstrip()
+        finally:
+            await response.aclose()
+
+    async def _run_batch(
+        self, method: Callable[..., Any], calls: list[dict[str, Any]], max_workers: int
+    ) -> list[Any]:
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def run(kwargs: dict[str, Any]) -> Any:
+            async with semaphore:
+                return await method(**kwargs)
+
+        return list(await asyncio.gather(*(run(kwargs) for kwargs in calls)))
+
+    async def close(self) -> None:
+        """Close the pooled ``httpx.AsyncClient`` and its keep-alive connections."""
+        await self.session.aclose()
+
+    def __enter__(self) -> Self:
+        raise TypeError("AsyncMemOSClient must be used with 'async with', not 'with'")
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
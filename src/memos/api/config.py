@@ -878,6 +878,8 @@ class APIConfig:
             == "true",
             "warm_up_on_startup_by_all": os.getenv("WARM_UP_ON_STARTUP_BY_ALL", "false").lower()
             == "true",
+            "hot_filter_columns": os.getenv("POLAR_DB_HOT_FILTER_COLUMNS", "false").lower()
+            == "true",
         }
 
     @staticmethod
@@ -904,6 +906,22 @@ class APIConfig:
             "maxconn": int(os.getenv("POSTGRES_MAX_CONN", "20")),
         }
 
+    @staticmethod
+    def get_sqlite_config(user_id: str | None = None) -> dict[str, Any]:
+        """Get embedded SQLite configuration for MemOS graph storage.
+
+        Runs in-process without an external database server.
+        """
+        user_name = os.getenv("MEMOS_USER_NAME", "default")
+        if user_id:
+            user_name = f"memos_{user_id.replace('-', '')}"
+
+        return {
+            "db_path": os.getenv("SQLITE_GRAPH_DB_PATH", "./.memos/graph.db"),
+            "user_name": user_name,
+            "embedding_dimension": int(os.getenv("EMBEDDING_DIMENSION", "1024")),
+        }
+
     @staticmethod
     def get_mysql_config() -> dict[str, Any]:
         """Get MySQL configuration."""
@@ -1202,11 +1220,13 @@ class APIConfig:
             else None
         )
         postgres_config = APIConfig.get_postgres_config(user_id=user_id)
+        sqlite_config = APIConfig.get_sqlite_config(user_id=user_id)
         graph_db_backend_map = {
             "neo4j-community": neo4j_community_config,
             "neo4j": neo4j_config,
             "polardb": polardb_config,
             "postgres": postgres_config,
+            "sqlite": sqlite_config,
         }
         # Support both GRAPH_DB_BACKEND and legacy NEO4J_BACKEND env vars
         graph_db_backend = os.getenv(
@@ -1280,11 +1300,13 @@ class APIConfig:
         neo4j_config = APIConfig.get_neo4j_config(user_id="default")
         polardb_config = APIConfig.get_polardb_config(user_id="default")
         postgres_config = APIConfig.get_postgres_config(user_id="default")
+        sqlite_config = APIConfig.get_sqlite_config(user_id="default")
         graph_db_backend_map = {
             "neo4j-community": neo4j_community_config,
             "neo4j": neo4j_config,
             "polardb": polardb_config,
             "postgres": postgres_config,
+            "sqlite": sqlite_config,
         }
         internet_config = (
             APIConfig.get_internet_config()
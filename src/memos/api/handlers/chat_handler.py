@@ -14,6 +14,7 @@ import traceback
 
 from collections.abc import Generator
 from datetime import datetime
+from functools import partial
 from typing import Any, Literal
 
 from fastapi import HTTPException
@@ -28,6 +29,7 @@ from memos.api.product_models import (
     ChatPlaygroundRequest,
     ChatRequest,
 )
+from memos.async_utils import submit_to_background_loop
 from memos.context.context import ContextThread
 from memos.mem_os.utils.format_utils import clean_json_response
 from memos.mem_os.utils.reference_utils import (
@@ -1452,9 +1454,13 @@ class ChatHandler(BaseHandler):
                 except Exception as e:
                     self.logger.warning(f"Failed to send chat notification (async): {e}")
 
-            # Send answer to scheduler
-            self._send_message_to_scheduler(
-                user_id=user_id, mem_cube_id=cube_id, query=clean_response, label=ANSWER_TASK_LABEL
+            # Send answer to scheduler; the submission blocks, so keep it off the event loop
+            await asyncio.to_thread(
+                self._send_message_to_scheduler,
+                user_id=user_id,
+                mem_cube_id=cube_id,
+                query=clean_response,
+                label=ANSWER_TASK_LABEL,
             )
 
             self.logger.info(f"Post-chat processing completed for user {user_id}")
@@ -1464,6 +1470,17 @@ class ChatHandler(BaseHandler):
                 f"Error in post-chat processing for user {user_id}: {e}", exc_info=True
             )
 
+    def _log_post_chat_failure(self, user_id: str, future: Any) -> None:
+        """Done-callback that logs the exception of a post-chat task or future."""
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            self.logger.error(
+                f"Error in background post-chat processing for user {user_id}: {exc}",
+                exc_info=exc,
+            )
+
     def _start_post_chat_processing(
         self,
         user_id: str,
@@ -1493,34 +1510,6 @@ class ChatHandler(BaseHandler):
             current_messages: Current message history
         """
 
-        def run_async_in_thread():
-            """Running asynchronous tasks in a new thread"""
-            try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(
-                        self._post_chat_processing(
-                            user_id=user_id,
-                            cube_id=cube_id,
-                            session_id=session_id,
-                            query=query,
-                            full_response=full_response,
-                            system_prompt=system_prompt,
-                            time_start=time_start,
-                            time_end=time_end,
-                            speed_improvement=speed_improvement,
-                            current_messages=current_messages,
-                        )
-                    )
-                finally:
-                    loop.close()
-            except Exception as e:
-                self.logger.error(
-                    f"Error in thread-based post-chat processing for user {user_id}: {e}",
-                    exc_info=True,
-                )
-
         try:
             # Try to get the current event loop
             asyncio.get_running_loop()
@@ -1540,24 +1529,24 @@ class ChatHandler(BaseHandler):
                 )
             )
             # Add exception handling for the background task
-            task.add_done_callback(
-                lambda t: (
-                    self.logger.error(
-                        f"Error in background post-chat processing for user {user_id}: {t.exception()}",
-                        exc_info=True,
-                    )
-                    if t.exception()
-                    else None
-                )
-            )
+            task.add_done_callback(partial(self._log_post_chat_failure, user_id))
         except RuntimeError:
-            # No event loop, run in a new thread with context propagation
-            thread = ContextThread(
-                target=run_async_in_thread,
-                name=f"PostChatProcessing-{user_id}",
-                daemon=True,
+            # No event loop: run on the shared background loop (request context is propagated)
+            future = submit_to_background_loop(
+                self._post_chat_processing(
+                    user_id=user_id,
+                    cube_id=cube_id,
+                    session_id=session_id,
+                    query=query,
+                    full_response=full_response,
+                    system_prompt=system_prompt,
+                    time_start=time_start,
+                    time_end=time_end,
+                    speed_improvement=speed_improvement,
+                    current_messages=current_messages,
+                )
             )
-            thread.start()
+            future.add_done_callback(partial(self._log_post_chat_failure, user_id))
 
     def _start_add_to_memory(
         self,
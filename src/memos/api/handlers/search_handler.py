@@ -12,12 +12,16 @@ import os
 from contextlib import suppress
 from typing import Any
 
+import numpy as np
+
 from memos.api.handlers.base_handler import BaseHandler, HandlerDependencies
 from memos.api.handlers.formatters_handler import rerank_knowledge_mem
 from memos.api.product_models import APISearchRequest, SearchResponse
 from memos.dream.contextualization import CONTEXT_MEMORY_TYPE
+from memos.embedders.quantized import embedding_matrix
 from memos.log import get_logger, summarize_search_request, summarize_search_results
 from memos.memories.textual.tree_text_memory.retrieve.retrieve_utils import (
+    char_similarity_matrices,
     cosine_similarity_matrix,
 )
 from memos.multi_mem_cube.composite_cube import CompositeCubeView
@@ -34,6 +38,9 @@ _ENV_CONTEXT_RECALL_TOP_K = "MEMOS_DREAM_CONTEXT_RECALL_TOP_K"
 _DEFAULT_CONTEXT_RECALL_TOP_K = 2
 _ENV_MMR_CANDIDATE_PRUNING = "MEMOS_MMR_CANDIDATE_PRUNING_ENABLED"
 _MMR_CANDIDATE_MULTIPLIER = 2
+# Text similarity is only checked against items above this embedding similarity
+_TEXT_SIM_EMBEDDING_GATE = 0.9
+_TEXT_SIM_THRESHOLD = 0.92
 
 
 def _env_enabled(name: str, default: str = "off") -> bool:
@@ -423,133 +430,109 @@ class SearchHandler(BaseHandler):
         # Returns numpy array but compatible with list[i][j] indexing
         similarity_matrix = cosine_similarity_matrix(embeddings)
 
-        # Initialize selection tracking for both text and preference
-        text_indices_by_bucket: dict[int, list[int]] = {i: [] for i in range(len(text_buckets))}
-        pref_indices_by_bucket: dict[int, list[int]] = {i: [] for i in range(len(pref_buckets))}
-
-        for flat_index, (mem_type, bucket_idx, _, _) in enumerate(flat):
-            if mem_type == "text":
-                text_indices_by_bucket[bucket_idx].append(flat_index)
-            elif mem_type == "preference":
-                pref_indices_by_bucket[bucket_idx].append(flat_index)
+        similarity = np.asarray(similarity_matrix, dtype=np.float64)
+        size = len(flat)
+        texts = [mem.get("memory", "").strip() for _, _, mem, _ in flat]
+        # Text similarity is only consulted for pairs above the embedding gate,
+        # so it is computed once, as matrix ops, for just those items.
+        text_similarity = self._combined_text_similarity(texts, similarity)
+        relevance = np.array([score for _, _, _, score in flat], dtype=np.float64)
+
+        text_ids: dict[str, int] = {}
+        text_id = np.array([text_ids.setdefault(text, len(text_ids)) for text in texts])
+        text_taken = np.zeros(len(text_ids), dtype=bool)  # Exact text already selected
+
+        # One capacity group per (memory type, bucket)
+        groups: dict[tuple[str, int], int] = {}
+        group_id = np.array(
+            [
+                groups.setdefault((mem_type, bucket_idx), len(groups))
+                for mem_type, bucket_idx, _, _ in flat
+            ]
+        )
+        group_capacity = np.array(
+            [text_top_k if mem_type == "text" else pref_top_k for mem_type, _ in groups]
+        )
+        group_target = np.minimum(group_capacity, np.bincount(group_id, minlength=len(groups)))
+        group_selected = np.zeros(len(groups), dtype=np.int64)
 
         selected_global: list[int] = []
-        text_selected_by_bucket: dict[int, list[int]] = {i: [] for i in range(len(text_buckets))}
-        pref_selected_by_bucket: dict[int, list[int]] = {i: [] for i in range(len(pref_buckets))}
-        selected_texts: set[str] = set()  # Track exact text content to avoid duplicates
+        selected_mask = np.zeros(size, dtype=bool)
+        # Max similarity to the selected set and the earliest selected item reaching it
+        max_sim = np.zeros(size, dtype=np.float64)
+        nearest = np.zeros(size, dtype=np.int64)
+        rows = np.arange(size)
+
+        def select(idx: int) -> None:
+            column = similarity[:, idx]
+            if selected_global:
+                closer = column > max_sim
+                max_sim[closer] = column[closer]
+                nearest[closer] = idx
+            else:
+                max_sim[:] = column
+                nearest[:] = idx
+            selected_global.append(idx)
+            selected_mask[idx] = True
+            text_taken[text_id[idx]] = True
+            group_selected[group_id[idx]] += 1
+
+        def highly_similar() -> np.ndarray:
+            # Dice + TF-IDF + 2-gram against the closest selected item, with embedding filter
+            if not selected_global:
+                return np.zeros(size, dtype=bool)
+            return (max_sim > _TEXT_SIM_EMBEDDING_GATE) & (
+                text_similarity[rows, nearest] >= _TEXT_SIM_THRESHOLD
+            )
 
         # Phase 1: Prefill top N by relevance
         # Use the smaller of text_top_k and pref_top_k for prefill count
         prefill_top_n = min(2, text_top_k, pref_top_k) if pref_buckets else min(2, text_top_k)
-        ordered_by_relevance = sorted(range(len(flat)), key=lambda idx: flat[idx][3], reverse=True)
-        for idx in ordered_by_relevance[: len(flat)]:
+        ordered_by_relevance = sorted(range(size), key=lambda idx: flat[idx][3], reverse=True)
+        blocked = highly_similar()
+        for idx in ordered_by_relevance:
             if len(selected_global) >= prefill_top_n:
                 break
-            mem_type, bucket_idx, mem, _ = flat[idx]
-
-            # Skip if exact text already exists in selected set
-            mem_text = mem.get("memory", "").strip()
-            if mem_text in selected_texts:
-                continue
-
-            # Skip if highly similar (Dice + TF-IDF + 2-gram combined, with embedding filter)
-            if SearchHandler._is_text_highly_similar_optimized(
-                idx, mem_text, selected_global, similarity_matrix, flat, threshold=0.92
-            ):
+            if text_taken[text_id[idx]] or blocked[idx]:
                 continue
-
-            # Check bucket capacity with correct top_k for each type
-            if mem_type == "text" and len(text_selected_by_bucket[bucket_idx]) < text_top_k:
-                selected_global.append(idx)
-                text_selected_by_bucket[bucket_idx].append(idx)
-                selected_texts.add(mem_text)
-            elif mem_type == "preference" and len(pref_selected_by_bucket[bucket_idx]) < pref_top_k:
-                selected_global.append(idx)
-                pref_selected_by_bucket[bucket_idx].append(idx)
-                selected_texts.add(mem_text)
+            if group_selected[group_id[idx]] < group_capacity[group_id[idx]]:
+                select(idx)
+                blocked = highly_similar()
 
         # Phase 2: MMR selection for remaining slots
         lambda_relevance = 0.8
-        similarity_threshold = 0.9  # Start exponential penalty from 0.9 (lowered from 0.9)
+        similarity_threshold = 0.9  # Start exponential penalty from 0.9
         alpha_exponential = 10.0  # Exponential penalty coefficient
-        remaining = set(range(len(flat))) - set(selected_global)
-
-        while remaining:
-            best_idx: int | None = None
-            best_mmr: float | None = None
-
-            for idx in remaining:
-                mem_type, bucket_idx, mem, _ = flat[idx]
-
-                # Check bucket capacity with correct top_k for each type
-                if (
-                    mem_type == "text" and len(text_selected_by_bucket[bucket_idx]) >= text_top_k
-                ) or (
-                    mem_type == "preference"
-                    and len(pref_selected_by_bucket[bucket_idx]) >= pref_top_k
-                ):
-                    continue
 
-                # Check if exact text already exists - if so, skip this candidate entirely
-                mem_text = mem.get("memory", "").strip()
-                if mem_text in selected_texts:
-                    continue  # Skip duplicate text, don't participate in MMR competition
-
-                # Skip if highly similar (Dice + TF-IDF + 2-gram combined, with embedding filter)
-                if SearchHandler._is_text_highly_similar_optimized(
-                    idx, mem_text, selected_global, similarity_matrix, flat, threshold=0.92
-                ):
-                    continue  # Skip highly similar text, don't participate in MMR competition
-
-                relevance = flat[idx][3]
-                max_sim = (
-                    0.0
-                    if not selected_global
-                    else max(similarity_matrix[idx][j] for j in selected_global)
-                )
-
-                # Exponential penalty for similarity > 0.80
-                if max_sim > similarity_threshold:
-                    penalty_multiplier = math.exp(
-                        alpha_exponential * (max_sim - similarity_threshold)
-                    )
-                    diversity = max_sim * penalty_multiplier
-                else:
-                    diversity = max_sim
-
-                mmr_score = lambda_relevance * relevance - (1.0 - lambda_relevance) * diversity
-
-                if best_mmr is None or mmr_score > best_mmr:
-                    best_mmr = mmr_score
-                    best_idx = idx
-
-            if best_idx is None:
+        while not np.all(group_selected >= group_target):
+            eligible = (
+                ~selected_mask
+                & ~text_taken[text_id]
+                & (group_selected[group_id] < group_capacity[group_id])
+                & ~highly_similar()
+            )
+            if not eligible.any():
                 break
 
-            mem_type, bucket_idx, mem, _ = flat[best_idx]
-
-            # Add to selected set and track text
-            mem_text = mem.get("memory", "").strip()
-            selected_global.append(best_idx)
-            selected_texts.add(mem_text)
+            if selected_global:
+                diversity = np.where(
+                    max_sim > similarity_threshold,
+                    max_sim * np.exp(alpha_exponential * (max_sim - similarity_threshold)),
+                    max_sim,
+                )
+            else:
+                diversity = np.zeros(size, dtype=np.float64)
+            mmr_scores = lambda_relevance * relevance - (1.0 - lambda_relevance) * diversity
+            select(int(np.argmax(np.where(eligible, mmr_scores, -np.inf))))
 
+        text_selected_by_bucket: dict[int, list[int]] = {i: [] for i in range(len(text_buckets))}
+        pref_selected_by_bucket: dict[int, list[int]] = {i: [] for i in range(len(pref_buckets))}
+        for idx in selected_global:
+            mem_type, bucket_idx, _, _ = flat[idx]
             if mem_type == "text":
-                text_selected_by_bucket[bucket_idx].append(best_idx)
+                text_selected_by_bucket[bucket_idx].append(idx)
             elif mem_type == "preference":
-                pref_selected_by_bucket[bucket_idx].append(best_idx)
-            remaining.remove(best_idx)
-
-            # Early termination: all buckets are full
-            text_all_full = all(
-                len(text_selected_by_bucket[b_idx]) >= min(text_top_k, len(bucket_indices))
-                for b_idx, bucket_indices in text_indices_by_bucket.items()
-            )
-            pref_all_full = all(
-                len(pref_selected_by_bucket[b_idx]) >= min(pref_top_k, len(bucket_indices))
-                for b_idx, bucket_indices in pref_indices_by_bucket.items()
-            )
-            if text_all_full and pref_all_full:
-                break
+                pref_selected_by_bucket[bucket_idx].append(idx)
 
         # Phase 3: Re-sort by original relevance and fill back to buckets
         for bucket_idx, bucket in enumerate(text_buckets):
@@ -662,8 +645,8 @@ class SearchHandler(BaseHandler):
             return 0.0
         return max(similarity_matrix[index][j] for j in selected_indices)
 
-    def _extract_embeddings(self, memories: list[dict[str, Any]]) -> list[list[float]]:
-        embeddings: list[list[float]] = []
+    def _extract_embeddings(self, memories: list[dict[str, Any]]) -> np.ndarray:
+        embeddings: list[Any] = []
         missing_indices: list[int] = []
         missing_documents: list[str] = []
 
@@ -688,7 +671,7 @@ class SearchHandler(BaseHandler):
                 embeddings[idx] = embedding
                 memories[idx]["metadata"]["embedding"] = embedding
 
-        return embeddings
+        return embedding_matrix(embeddings)
 
     @staticmethod
     def _strip_embeddings(results: dict[str, Any]) -> None:
@@ -798,231 +781,34 @@ class SearchHandler(BaseHandler):
         return dot_product / (norm1 * norm2)
 
     @staticmethod
-    def _is_text_highly_similar_optimized(
-        candidate_idx: int,
-        candidate_text: str,
-        selected_global: list[int],
-        similarity_matrix,
-        flat: list,
-        threshold: float = 0.9,
-    ) -> bool:
-        """
-        Multi-algorithm text similarity check with embedding pre-filtering.
-
-        Strategy:
-        1. Only compare with the single highest embedding similarity item (not all 25)
-        2. Only perform text comparison if embedding similarity > 0.60
-        3. Use weighted combination of three algorithms:
-           - Dice (40%): Fastest, character-level set similarity
-           - TF-IDF (35%): Considers character frequency weighting
-           - 2-gram (25%): Considers local character order
-
-        Combined formula:
-            combined_score = 0.40 * dice + 0.35 * tfidf + 0.25 * bigram
-
-        This reduces comparisons from O(N) to O(1) per candidate, with embedding pre-filtering.
-        Expected speedup: 100-200x compared to LCS approach.
-
-        Args:
-            candidate_idx: Index of candidate memory in flat list
-            candidate_text: Text content of candidate memory
-            selected_global: List of already selected memory indices
-            similarity_matrix: Precomputed embedding similarity matrix
-            flat: Flat list of all memories
-            threshold: Combined similarity threshold (default 0.75)
-
-        Returns:
-            True if candidate is highly similar to any selected memory
-        """
-        if not selected_global:
-            return False
-
-        # Find the already-selected memory with highest embedding similarity
-        max_sim_idx = max(selected_global, key=lambda j: similarity_matrix[candidate_idx][j])
-        max_sim = similarity_matrix[candidate_idx][max_sim_idx]
-
-        # If highest embedding similarity < 0.60, skip text comparison entirely
-        if max_sim <= 0.9:
-            return False
-
-        # Get text of most similar memory
-        most_similar_mem = flat[max_sim_idx][2]
-        most_similar_text = most_similar_mem.get("memory", "").strip()
-
-        # Calculate three similarity scores
-        dice_sim = SearchHandler._dice_similarity(candidate_text, most_similar_text)
-        tfidf_sim = SearchHandler._tfidf_similarity(candidate_text, most_similar_text)
-        bigram_sim = SearchHandler._bigram_similarity(candidate_text, most_similar_text)
-
-        # Weighted combination: Dice (40%) + TF-IDF (35%) + 2-gram (25%)
-        # Dice has highest weight (fastest and most reliable)
-        # TF-IDF considers frequency (handles repeated characters well)
-        # 2-gram considers order (catches local pattern similarity)
-        combined_score = 0.40 * dice_sim + 0.35 * tfidf_sim + 0.25 * bigram_sim
-
-        return combined_score >= threshold
-
-    @staticmethod
-    def _dice_similarity(text1: str, text2: str) -> float:
-        """
-        Calculate Dice coefficient (character-level, fastest).
-
-        Dice = 2 * |A ∩ B| / (|A| + |B|)
-        Speed: O(n + m), ~0.05-0.1ms per comparison
-
-        Args:
-            text1: First text string
-            text2: Second text string
-
-        Returns:
-            Dice similarity score between 0.0 and 1.0
-        """
-        if not text1 or not text2:
-            return 0.0
-
-        chars1 = set(text1)
-        chars2 = set(text2)
-
-        intersection = len(chars1 & chars2)
-        return 2 * intersection / (len(chars1) + len(chars2))
-
-    @staticmethod
-    def _bigram_similarity(text1: str, text2: str) -> float:
-        """
-        Calculate character-level 2-gram Jaccard similarity.
-
-        Speed: O(n + m), ~0.1-0.2ms per comparison
-        Considers local order (more strict than Dice).
-
-        Args:
-            text1: First text string
-            text2: Second text string
-
-        Returns:
-            Jaccard similarity score between 0.0 and 1.0
-        """
-        if not text1 or not text2:
-            return 0.0
-
-        # Generate 2-grams
-        bigrams1 = {text1[i : i + 2] for i in range(len(text1) - 1)} if len(text1) >= 2 else {text1}
-        bigrams2 = {text2[i : i + 2] for i in range(len(text2) - 1)} if len(text2) >= 2 else {text2}
-
-        intersection = len(bigrams1 & bigrams2)
-        union = len(bigrams1 | bigrams2)
-
-        return intersection / union if union > 0 else 0.0
-
-    @staticmethod
-    def _tfidf_similarity(text1: str, text2: str) -> float:
-        """
-        Calculate TF-IDF cosine similarity (character-level, no sklearn).
-
-        Speed: O(n + m), ~0.3-0.5ms per comparison
-        Considers character frequency weighting.
-
-        Args:
-            text1: First text string
-            text2: Second text string
-
-        Returns:
-            Cosine similarity score between 0.0 and 1.0
-        """
-        if not text1 or not text2:
-            return 0.0
-
-        from collections import Counter
-
-        # Character frequency (TF)
-        tf1 = Counter(text1)
-        tf2 = Counter(text2)
-
-        # All unique characters (vocabulary)
-        vocab = set(tf1.keys()) | set(tf2.keys())
-
-        # Simple IDF: log(2 / df) where df is document frequency
-        # For two documents, IDF is log(2/1)=0.693 if char appears in one doc,
-        # or log(2/2)=0 if appears in both (we use log(2/1) for simplicity)
-        idf = {char: (1.0 if char in tf1 and char in tf2 else 1.5) for char in vocab}
-
-        # TF-IDF vectors
-        vec1 = {char: tf1.get(char, 0) * idf[char] for char in vocab}
-        vec2 = {char: tf2.get(char, 0) * idf[char] for char in vocab}
-
-        # Cosine similarity
-        dot_product = sum(vec1[char] * vec2[char] for char in vocab)
-        norm1 = math.sqrt(sum(v * v for v in vec1.values()))
-        norm2 = math.sqrt(sum(v * v for v in vec2.values()))
-
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-
-        return dot_product / (norm1 * norm2)
-
-    @staticmethod
-    def _is_text_highly_similar_optimized(
-        candidate_idx: int,
-        candidate_text: str,
-        selected_global: list[int],
-        similarity_matrix,
-        flat: list,
-        threshold: float = 0.92,
-    ) -> bool:
+    def _combined_text_similarity(texts: list[str], similarity_matrix: np.ndarray) -> np.ndarray:
         """
-        Multi-algorithm text similarity check with embedding pre-filtering.
+        Weighted text similarity for every pair that passes the embedding gate.
 
-        Strategy:
-        1. Only compare with the single highest embedding similarity item (not all 25)
-        2. Only perform text comparison if embedding similarity > 0.60
-        3. Use weighted combination of three algorithms:
-           - Dice (40%): Fastest, character-level set similarity
-           - TF-IDF (35%): Considers character frequency weighting
-           - 2-gram (25%): Considers local character order
-
-        Combined formula:
+        Combined formula, matching the pairwise helpers above:
             combined_score = 0.40 * dice + 0.35 * tfidf + 0.25 * bigram
 
-        This reduces comparisons from O(N) to O(1) per candidate, with embedding pre-filtering.
-        Expected speedup: 100-200x compared to LCS approach.
+        Only items with some other item above the embedding similarity gate can
+        ever be text-compared during MMR, so features are built once for just
+        those items and all their pairs are scored with matrix products. Other
+        entries are left at 0.0.
 
         Args:
-            candidate_idx: Index of candidate memory in flat list
-            candidate_text: Text content of candidate memory
-            selected_global: List of already selected memory indices
+            texts: Stripped memory texts in flat order
             similarity_matrix: Precomputed embedding similarity matrix
-            flat: Flat list of all memories
-            threshold: Combined similarity threshold (default 0.75)
 
         Returns:
-            True if candidate is highly similar to any selected memory
+            (len(texts), len(texts)) array of combined text similarities
         """
-        if not selected_global:
-            return False
-
-        # Find the already-selected memory with highest embedding similarity
-        max_sim_idx = max(selected_global, key=lambda j: similarity_matrix[candidate_idx][j])
-        max_sim = similarity_matrix[candidate_idx][max_sim_idx]
-
-        # If highest embedding similarity < 0.60, skip text comparison entirely
-        if max_sim <= 0.9:
-            return False
-
-        # Get text of most similar memory
-        most_similar_mem = flat[max_sim_idx][2]
-        most_similar_text = most_similar_mem.get("memory", "").strip()
-
-        # Calculate three similarity scores
-        dice_sim = SearchHandler._dice_similarity(candidate_text, most_similar_text)
-        tfidf_sim = SearchHandler._tfidf_similarity(candidate_text, most_similar_text)
-        bigram_sim = SearchHandler._bigram_similarity(candidate_text, most_similar_text)
-
-        # Weighted combination: Dice (40%) + TF-IDF (35%) + 2-gram (25%)
-        # Dice has highest weight (fastest and most reliable)
-        # TF-IDF considers frequency (handles repeated characters well)
-        # 2-gram considers order (catches local pattern similarity)
-        combined_score = 0.40 * dice_sim + 0.35 * tfidf_sim + 0.25 * bigram_sim
-
-        return combined_score >= threshold
+        size = len(texts)
+        combined = np.zeros((size, size), dtype=np.float64)
+        gate = np.asarray(similarity_matrix) > _TEXT_SIM_EMBEDDING_GATE
+        np.fill_diagonal(gate, False)
+        involved = np.flatnonzero(gate.any(axis=1))
+        if involved.size:
+            dice, tfidf, bigram = char_similarity_matrices([texts[i] for i in involved])
+            combined[np.ix_(involved, involved)] = 0.40 * dice + 0.35 * tfidf + 0.25 * bigram
+        return combined
 
     def _resolve_cube_ids(self, search_req: APISearchRequest) -> list[str]:
         """
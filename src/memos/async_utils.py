@@ -0,0 +1,182 @@
+"""Shared asyncio plumbing for LLM and embedder backends.
+
+Async HTTP clients keep connections open per event loop, so they are pooled per running
+loop and reused by every backend instance pointing at the same endpoint. Each endpoint also
+gets a semaphore bounding in-flight requests. Sync callers that need to run coroutines
+submit them to one long-lived background loop instead of creating a loop per call, so the
+pooled clients on that loop stay warm.
+"""
+
+import asyncio
+import os
+import threading
+import weakref
+
+from collections.abc import Callable, Coroutine, Hashable
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+from memos.context.context import (
+    RequestContext,
+    get_current_context,
+    set_request_context,
+)
+from memos.log import get_logger
+
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONNECTIONS = int(os.getenv("MOS_ASYNC_HTTP_MAX_CONNECTIONS", "100"))
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("MOS_ASYNC_HTTP_MAX_KEEPALIVE", "20"))
+DEFAULT_MAX_CONCURRENCY = int(os.getenv("MOS_ASYNC_MAX_CONCURRENCY", "32"))
+
+_loop_states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = (
+    weakref.WeakKeyDictionary()
+)
+_loop_states_lock = threading.Lock()
+
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_lock = threading.Lock()
+
+
+def _loop_state() -> dict:
+    loop = asyncio.get_running_loop()
+    with _loop_states_lock:
+        state = _loop_states.get(loop)
+        if state is None:
+            state = _loop_states[loop] = {"clients": {}, "limiters": {}}
+    return state
+
+
+def freeze(value: Any) -> Hashable:
+    """Turn a headers dict (or None) into a hashable client cache key part."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), freeze(v)) for k, v in value.items()))
+    if isinstance(value, list | tuple):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def http_limits(
+    max_connections: int | None = None, max_keepalive_connections: int | None = None
+) -> Any:
+    """Connection pool limits for async httpx clients; unset values use MOS_ASYNC_HTTP_*."""
+    import httpx
+
+    return httpx.Limits(
+        max_connections=DEFAULT_MAX_CONNECTIONS if max_connections is None else max_connections,
+        max_keepalive_connections=(
+            DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+            if max_keepalive_connections is None
+            else max_keepalive_connections
+        ),
+    )
+
+
+def get_shared_async_client(key: Hashable, factory: Callable[[], T]) -> T:
+    """
+    Return the async client for `key` on the running event loop, creating it on first use.
+
+    Must be called from a coroutine. Clients are dropped together with their loop.
+    """
+    clients = _loop_state()["clients"]
+    client = clients.get(key)
+    if client is None:
+        client = clients[key] = factory()
+    return client
+
+
+def get_async_limiter(key: Hashable, limit: int | None = None) -> asyncio.Semaphore:
+    """Return the semaphore bounding concurrent requests for `key` on the running loop."""
+    limiters = _loop_state()["limiters"]
+    limiter = limiters.get(key)
+    if limiter is None:
+        limiter = limiters[key] = asyncio.Semaphore(limit or DEFAULT_MAX_CONCURRENCY)
+    return limiter
+
+
+def get_shared_async_openai_client(
+    api_key: str | None,
+    base_url: str | None,
+    default_headers: dict | None = None,
+) -> Any:
+    """Pooled `openai.AsyncOpenAI` client for the running loop."""
+    import openai
+
+    return get_shared_async_client(
+        ("openai", api_key, base_url, freeze(default_headers)),
+        lambda: openai.AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            default_headers=default_headers,
+            http_client=openai.DefaultAsyncHttpxClient(limits=http_limits()),
+        ),
+    )
+
+
+def get_shared_async_azure_client(
+    azure_endpoint: str | None, api_version: str | None, api_key: str | None
+) -> Any:
+    """Pooled `openai.AsyncAzureOpenAI` client for the running loop."""
+    import openai
+
+    return get_shared_async_client(
+        ("azure", azure_endpoint, api_version, api_key),
+        lambda: openai.AsyncAzureOpenAI(
+            azure_endpoint=azure_endpoint,
+            api_version=api_version,
+            api_key=api_key,
+            http_client=openai.DefaultAsyncHttpxClient(limits=http_limits()),
+        ),
+    )
+
+
+def get_shared_async_ollama_client(host: str | None) -> Any:
+    """Pooled `ollama.AsyncClient` for the running loop."""
+    from ollama import AsyncClient
+
+    return get_shared_async_client(
+        ("ollama", host), lambda: AsyncClient(host=host, limits=http_limits())
+    )
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    global _background_loop
+    with _background_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="MemOSAsyncLoop", daemon=True).start()
+            _background_loop = loop
+        return _background_loop
+
+
+async def _with_request_context(coro: Coroutine[Any, Any, T], context: RequestContext | None) -> T:
+    if context is not None:
+        # Each task runs in its own contextvars copy, so this does not leak between tasks.
+        child_context = RequestContext(
+            trace_id=context.trace_id,
+            api_path=context.api_path,
+            env=context.env,
+            user_type=context.user_type,
+            user_name=context.user_name,
+            source=context.source,
+        )
+        child_context._data = context._data.copy()
+        set_request_context(child_context)
+    return await coro
+
+
+def submit_to_background_loop(coro: Coroutine[Any, Any, T]) -> Future:
+    """
+    Run a coroutine on the shared background event loop from synchronous code.
+
+    The caller's request context is propagated like `ContextThread` does.
+
+    Returns:
+        A `concurrent.futures.Future` for the coroutine's result.
+    """
+    return asyncio.run_coroutine_threadsafe(
+        _with_request_context(coro, get_current_context()), _get_background_loop()
+    )
@@ -0,0 +1,211 @@
+"""Shared plumbing for the embedding and LLM response caches.
+
+Both caches read their knobs from the environment with the same parsing rules
+and persist entries in a size-bounded SQLite table keyed by content address.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+
+from typing import TYPE_CHECKING, Any
+
+from memos.log import get_logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+
+logger = get_logger(__name__)
+
+
+_SQLITE_MAX_VARIABLES = 500
+# Seconds before a read refreshes an entry's ``accessed_at`` again.
+_DEFAULT_TOUCH_INTERVAL = 60.0
+
+
+def env_enabled(name: str, default: bool = False) -> bool:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() in {"1", "true", "yes", "y", "on"}
+
+
+def env_float(name: str, default: float, minimum: float = 0.0) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return max(minimum, float(raw))
+    except ValueError:
+        logger.warning("Invalid %s=%r; using default %s", name, raw, default)
+        return default
+
+
+def env_int(name: str, default: int, minimum: int = 1) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return max(minimum, int(raw))
+    except ValueError:
+        logger.warning("Invalid %s=%r; using default %s", name, raw, default)
+        return default
+
+
+class SQLiteCacheStore:
+    """Size-bounded key/value table in a local SQLite file.
+
+    Each row holds the ``value_columns`` plus an ``accessed_at`` timestamp.
+    Reads refresh ``accessed_at`` at most once per ``touch_interval`` seconds,
+    in one write transaction per lookup. When the entry count exceeds
+    ``max_entries`` the least recently read entries are evicted down to
+    ``evict_ratio * max_entries`` so eviction cost is amortised across writes.
+    The file may be shared by several processes on the same host.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        table: str,
+        value_columns: Mapping[str, str],
+        max_entries: int,
+        evict_ratio: float = 0.9,
+        busy_timeout: float = 5.0,
+        touch_interval: float = _DEFAULT_TOUCH_INTERVAL,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+
+        self.path = path
+        self.table = table
+        self.max_entries = max_entries
+        self.touch_interval = touch_interval
+        self._value_columns = tuple(value_columns)
+        self._low_watermark = max(1, int(max_entries * min(max(evict_ratio, 0.0), 1.0)))
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(
+            path, timeout=busy_timeout, check_same_thread=False, isolation_level=None
+        )
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        columns = "".join(f"{name} {sql_type}, " for name, sql_type in value_columns.items())
+        self._conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                key TEXT PRIMARY KEY,
+                {columns}accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_accessed ON {table} (accessed_at)"
+        )
+        self._count = self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    @staticmethod
+    def _chunks(keys: Sequence[str]) -> Iterable[Sequence[str]]:
+        for start in range(0, len(keys), _SQLITE_MAX_VARIABLES):
+            yield keys[start : start + _SQLITE_MAX_VARIABLES]
+
+    def get_rows(self, keys: Sequence[str]) -> dict[str, tuple[Any, ...]]:
+        """Return the value columns of every stored key, refreshing stale access times."""
+        if not keys:
+            return {}
+        found: dict[str, tuple[Any, ...]] = {}
+        touched: list[str] = []
+        now = time.time()
+        select = ", ".join(("key", *self._value_columns, "accessed_at"))
+        with self._lock:
+            for chunk in self._chunks(list(keys)):
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT {select} FROM {self.table} WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, *values, accessed_at in rows:
+                    found[key] = tuple(values)
+                    if now - accessed_at >= self.touch_interval:
+                        touched.append(key)
+            if touched:
+                # Eviction only needs coarse recency, so entries are refreshed lazily.
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._conn.executemany(
+                        f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?",
+                        [(now, key) for key in touched],
+                    )
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+        return found
+
+    def set_rows(self, rows: Mapping[str, Sequence[Any]]) -> None:
+        """Insert rows whose keys are not stored yet, evicting if over capacity."""
+        if not rows:
+            return
+        now = time.time()
+        columns = ", ".join(("key", *self._value_columns, "accessed_at"))
+        placeholders = ",".join("?" * (len(self._value_columns) + 2))
+        params = [(key, *values, now) for key, values in rows.items()]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                before = self._conn.total_changes
+                self._conn.executemany(
+                    f"INSERT OR IGNORE INTO {self.table} ({columns}) VALUES ({placeholders})",
+                    params,
+                )
+                self._count += self._conn.total_changes - before
+                if self._count > self.max_entries:
+                    self._evict()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _evict(self) -> None:
+        # Other processes may write to the same file, so recount before evicting.
+        self._count = self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+        excess = self._count - self._low_watermark
+        if self._count <= self.max_entries or excess <= 0:
+            return
+        self._conn.execute(
+            f"""
+            DELETE FROM {self.table} WHERE key IN (
+                SELECT key FROM {self.table} ORDER BY accessed_at ASC LIMIT ?
+            )
+            """,
+            (excess,),
+        )
+        self._count -= excess
+        logger.info(
+            "%s evicted entries=%d remaining=%d path=%s",
+            self.table,
+            excess,
+            self._count,
+            self.path,
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table}")
+            self._count = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
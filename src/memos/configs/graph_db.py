@@ -178,6 +178,15 @@ class PolarDBGraphDBConfig(BaseConfig):
             "first-query latency (~200ms planning). Requires user_name in config."
         ),
     )
+    hot_filter_columns: bool = Field(
+        default=False,
+        description=(
+            "If True, maintain typed generated columns with B-tree indexes for hot filter "
+            "fields (id, user_name, user_id, memory_type, status, session_id) and filter on "
+            "them instead of extracting each field from `properties` per row. Adding the "
+            "columns rewrites the Memory table once."
+        ),
+    )
 
     @model_validator(mode="after")
     def validate_config(self):
@@ -230,6 +239,28 @@ class PostgresGraphDBConfig(BaseConfig):
         default=20,
         description="Maximum number of connections in the connection pool",
     )
+    minconn: int = Field(
+        default=2,
+        description="Number of connections opened when the pool is created",
+    )
+    connection_wait_timeout: float = Field(
+        default=30.0,
+        description="Seconds to wait for a free connection when all maxconn are checked out",
+    )
+    health_check_idle_seconds: float = Field(
+        default=30.0,
+        description=(
+            "Ping a pooled connection before reuse only if it has been idle longer than this; "
+            "0 pings on every checkout"
+        ),
+    )
+    use_prepared_statements: bool = Field(
+        default=True,
+        description=(
+            "Run hot read queries as server-side prepared statements; disable behind "
+            "transaction-pooling proxies such as PgBouncer"
+        ),
+    )
 
     @model_validator(mode="after")
     def validate_config(self):
@@ -241,6 +272,52 @@ class PostgresGraphDBConfig(BaseConfig):
         return self
 
 
+class SQLiteGraphDBConfig(BaseConfig):
+    """
+    Embedded SQLite configuration for MemOS.
+
+    Runs fully in-process: nodes and edges live in a single SQLite file and
+    embeddings are mirrored into an in-memory cosine index, so no external
+    database server is needed. Suitable for single-process deployments,
+    edge nodes and tests.
+
+    Schema:
+    - memories: Memory nodes (id, memory, properties JSON, float32 embedding blob)
+    - edges: Relationships between memory nodes (source_id, target_id, edge_type)
+
+    Example:
+    ---
+    db_path = "./data/memos_graph.db"   # or ":memory:"
+    user_name = "alice"
+    embedding_dimension = 1024
+    """
+
+    db_path: str = Field(
+        default=":memory:",
+        description="Path of the SQLite database file, or ':memory:' for a transient store",
+    )
+    user_name: str | None = Field(
+        default=None,
+        description=(
+            "Logical user/tenant ID for data isolation. "
+            "If None, queries are not filtered by user unless user_name is passed per call."
+        ),
+    )
+    embedding_dimension: int = Field(default=1024, description="Dimension of vector embedding")
+    busy_timeout: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds to wait on a locked database file before raising",
+    )
+
+    @model_validator(mode="after")
+    def validate_config(self):
+        """Validate config."""
+        if not self.db_path:
+            raise ValueError("`db_path` must be provided")
+        return self
+
+
 class GraphDBConfigFactory(BaseModel):
     backend: str = Field(..., description="Backend for graph database")
     config: dict[str, Any] = Field(..., description="Configuration for the graph database backend")
@@ -250,6 +327,7 @@ class GraphDBConfigFactory(BaseModel):
         "neo4j-community": Neo4jCommunityGraphDBConfig,
         "polardb": PolarDBGraphDBConfig,
         "postgres": PostgresGraphDBConfig,
+        "sqlite": SQLiteGraphDBConfig,
     }
 
     @field_validator("backend")
@@ -70,6 +70,20 @@ class MOSConfig(BaseConfig):
         default=False,
         description="Enable PRO mode for complex query decomposition",
     )
+    max_resident_cubes: int | None = Field(
+        default=None,
+        description="Maximum number of MemCubes kept loaded; others are loaded lazily and the "
+        "least recently used idle cubes are evicted. None keeps every registered cube loaded",
+    )
+    max_resident_cube_bytes: int | None = Field(
+        default=None,
+        description="Estimated memory budget in bytes for loaded MemCubes (see max_resident_cubes)",
+    )
+    cube_spill_dir: str | None = Field(
+        default=None,
+        description="Directory where modified or in-memory-only MemCubes are dumped before "
+        "eviction; without it such cubes stay loaded",
+    )
 
 
 class MemOSConfigFactory(BaseConfig):
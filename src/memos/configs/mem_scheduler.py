@@ -13,8 +13,10 @@ from memos.mem_scheduler.schemas.general_schemas import (
     DEFAULT_ACT_MEM_DUMP_PATH,
     DEFAULT_ACTIVATION_MEM_MONITOR_SIZE_LIMIT,
     DEFAULT_CONSUME_BATCH,
+    DEFAULT_CONSUME_BLOCK_TIMEOUT_SECONDS,
     DEFAULT_CONSUME_INTERVAL_SECONDS,
     DEFAULT_CONTEXT_WINDOW_SIZE,
+    DEFAULT_EVENT_DRIVEN_CONSUMER,
     DEFAULT_MAX_INTERNAL_MESSAGE_QUEUE_SIZE,
     DEFAULT_MULTI_TASK_RUNNING_TIMEOUT,
     DEFAULT_SCHEDULER_RETRIEVER_BATCH_SIZE,
@@ -51,6 +53,15 @@ class BaseSchedulerConfig(BaseConfig):
         gt=0,
         description=f"Number of messages to consume in each batch (default: {DEFAULT_CONSUME_BATCH})",
     )
+    event_driven_consumer: bool = Field(
+        default=DEFAULT_EVENT_DRIVEN_CONSUMER,
+        description="Block on the queue and on free worker slots instead of polling every consume_interval_seconds",
+    )
+    consume_block_timeout_seconds: float = Field(
+        default=DEFAULT_CONSUME_BLOCK_TIMEOUT_SECONDS,
+        gt=0,
+        description=f"Longest single wait of the event-driven consumer in seconds (default: {DEFAULT_CONSUME_BLOCK_TIMEOUT_SECONDS})",
+    )
     auth_config_path: str | None = Field(
         default=None,
         description="Path to the authentication configuration file containing private credentials",
@@ -1,4 +1,4 @@
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Literal
 
 from pydantic import Field, field_validator, model_validator
 
@@ -54,6 +54,20 @@ class KVCacheMemoryConfig(BaseActMemoryConfig):
         default_factory=LLMConfigFactory,
         description="LLM configuration for the memory extractor",
     )
+    incremental_update: bool = Field(
+        default=False,
+        description=(
+            "Reuse the cached prefix when activation memories are appended and prefill only "
+            "the new ones (huggingface backends)"
+        ),
+    )
+    storage_format: Literal["pickle", "safetensors"] = Field(
+        default="pickle",
+        description=(
+            "How dump() stores caches: 'pickle' writes one pickle file; 'safetensors' writes "
+            "per-cache tensor files with a JSON index and loads them lazily on first use"
+        ),
+    )
 
     @field_validator("extractor_llm")
     @classmethod
@@ -12,6 +12,7 @@ from uuid import uuid4
 
 from memos.dream.enrichment import DREAM_INTERNAL_INFO_KEY
 from memos.dream.prompts import CONTEXT_BINDING_PROMPT, CONTEXT_SUMMARY_PROMPT
+from memos.memories.textual.tree_text_memory.retrieve.result_cache import bump_cube_version
 
 
 logger = logging.getLogger(__name__)
@@ -187,6 +188,8 @@ class DreamContextualizer:
                 report.updated_context_count += 1
             report.bound_memory_count += len(group.memory_ids)
             report.contexts.append(context_event)
+        if report.contexts:
+            bump_cube_version(cube_id)
         return report
 
     def _load_memories(
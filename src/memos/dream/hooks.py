@@ -18,7 +18,8 @@ def on_dream_execute(
 
     The scheduler handler always calls this hook. The active Dream plugin decides
     which pipeline implementation to run. After the pipeline finishes, the hook
-    resets the signal store so the next accumulation cycle starts fresh.
+    consumes the snapshot's ids from the signal store; ids added during the run
+    stay pending for the next cycle.
     """
 
     results = plugin.pipeline.run(
@@ -28,7 +29,7 @@ def on_dream_execute(
         signal_snapshot=signal_snapshot,
         text_mem=text_mem,
     )
-    plugin.signal_store.reset(mem_cube_id=mem_cube_id)
+    plugin.signal_store.reset(mem_cube_id=mem_cube_id, snapshot=signal_snapshot)
     return results
 
 
@@ -38,6 +39,8 @@ def on_add_signal(plugin, *, request, result, **kwargs) -> None:
     The current implementation only extracts enough information to build a scheduler payload.
     If a runtime scheduler handle is not available yet, the signal is still kept
     locally so manual triggering and future auto-trigger logic use the same store.
+    ``record_add`` returns a snapshot only for the add that crosses the trigger
+    threshold, so concurrent adds on several workers submit one Dream task.
     """
 
     mem_cube_id = _extract_mem_cube_id(request=request, result=result)
@@ -52,7 +55,7 @@ def on_add_signal(plugin, *, request, result, **kwargs) -> None:
         session_id=getattr(request, "session_id", "") or "",
         memory_ids=memory_ids,
     )
-    if plugin.signal_store.should_trigger(mem_cube_id=mem_cube_id):
+    if snapshot is not None:
         plugin.submit_dream_task(
             mem_cube_id=mem_cube_id,
             user_id=snapshot.user_id,
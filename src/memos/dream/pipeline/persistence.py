@@ -7,6 +7,7 @@ from typing import Any
 
 from memos.dream.hook_defs import DreamH
 from memos.dream.types import DreamActionType, TargetMemoryType
+from memos.memories.textual.tree_text_memory.retrieve.result_cache import bump_cube_version
 from memos.plugins.hooks import trigger_hook
 
 
@@ -60,6 +61,7 @@ class DreamPersistence:
                 user_id=user_id,
                 signal_snapshot=signal_snapshot,
             )
+        bump_cube_version(cube_id)
 
         trigger_hook(DreamH.DREAM_AFTER_PERSIST, mem_cube_id=mem_cube_id, results=results)
 
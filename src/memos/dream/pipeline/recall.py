@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import heapq
 import logging
 
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 
 if TYPE_CHECKING:
     from memos.dream.types import DreamCluster
@@ -13,6 +16,9 @@ logger = logging.getLogger(__name__)
 
 _RECALL_TOP_K = 10
 _RECALL_SCOPES = ("UserMemory", "LongTermMemory")
+# Source embeddings at least this similar share one query. The default only
+# merges identical embeddings, so recall results are unchanged.
+_DEDUP_SIMILARITY = 1.0
 
 
 class DirectRecall:
@@ -24,6 +30,11 @@ class DirectRecall:
     memories and scopes are deduplicated and sorted by score, then the top-k
     are kept as ``cluster.recalled_items``.
 
+    All clusters of a run are recalled as one batch: source embeddings are
+    fetched with a single ``get_nodes`` call, identical embeddings (or, with
+    ``dedup_similarity`` below 1, near-identical ones) share one query, and
+    the distinct queries go to ``search_batch`` once per scope.
+
     Scope is restricted on purpose: Dream-produced nodes (DreamDiary,
     InsightMemory, …) and short-lived WorkingMemory are excluded so that
     each Dream run reflects on the user's real daytime experiences rather
@@ -31,8 +42,14 @@ class DirectRecall:
     they are intermediate indexes, not original user memories.
     """
 
-    def __init__(self, *, recall_top_k: int = _RECALL_TOP_K) -> None:
+    def __init__(
+        self,
+        *,
+        recall_top_k: int = _RECALL_TOP_K,
+        dedup_similarity: float = _DEDUP_SIMILARITY,
+    ) -> None:
         self.recall_top_k = recall_top_k
+        self.dedup_similarity = dedup_similarity
 
     def bind_context(self, context: dict) -> None:
         self.context = context
@@ -42,11 +59,12 @@ class DirectRecall:
             return clusters
 
         graph_db = self.context.get("shared", {}).get("graph_db")
+        recalled = self._recall_clusters(
+            [cluster.motive.memory_ids for cluster in clusters], graph_db, cube_id
+        )
 
-        for cluster in clusters:
-            cluster.recalled_items = self._recall_by_embeddings(
-                cluster.motive.memory_ids, graph_db, cube_id
-            )
+        for cluster, items in zip(clusters, recalled, strict=True):
+            cluster.recalled_items = items
             logger.info(
                 "[Dream Recall] cluster=%s recalled=%d",
                 cluster.cluster_id,
@@ -55,59 +73,112 @@ class DirectRecall:
 
         return clusters
 
-    def _recall_by_embeddings(
-        self, memory_ids: list[str], graph_db, cube_id: str
-    ) -> list[dict[str, Any]]:
-        if not memory_ids or graph_db is None:
-            return []
+    def _recall_clusters(
+        self, memory_id_groups: list[list[str]], graph_db, cube_id: str
+    ) -> list[list[dict[str, Any]]]:
+        """Recall the top-k related memories for each group of source memory ids."""
+        empty: list[list[dict[str, Any]]] = [[] for _ in memory_id_groups]
+        all_ids = list(dict.fromkeys(mid for ids in memory_id_groups for mid in ids or []))
+        if not all_ids or graph_db is None:
+            return empty
 
         try:
-            nodes = graph_db.get_nodes(memory_ids, include_embedding=True, user_name=cube_id)
+            nodes = graph_db.get_nodes(all_ids, include_embedding=True, user_name=cube_id)
         except Exception:
             logger.warning("[Dream Recall] failed to fetch source memory embeddings.")
-            return []
-
-        source_id_set = set(memory_ids)
-        seen: dict[str, dict[str, Any]] = {}
+            return empty
 
+        embeddings: dict[str, list[float]] = {}
         for node in nodes or []:
             if not isinstance(node, dict):
                 continue
             metadata = node.get("metadata") if isinstance(node.get("metadata"), dict) else {}
             embedding = metadata.get("embedding") if metadata else None
-            if not embedding:
+            if embedding and node.get("id"):
+                embeddings[node["id"]] = embedding
+
+        query_of, queries = self._dedup_embeddings(embeddings)
+        hits_by_query = self._search_all(queries, graph_db, cube_id)
+
+        results = []
+        for ids in memory_id_groups:
+            source_id_set = set(ids or [])
+            query_indexes = {query_of[mid] for mid in source_id_set if mid in query_of}
+            seen: dict[str, dict[str, Any]] = {}
+            for query_index in query_indexes:
+                for hit in hits_by_query.get(query_index, []):
+                    hit_id = hit["id"]
+                    if hit_id in source_id_set:
+                        continue
+                    if hit_id not in seen or hit["score"] > seen[hit_id]["score"]:
+                        seen[hit_id] = hit
+            results.append(
+                heapq.nlargest(self.recall_top_k, seen.values(), key=lambda x: x["score"])
+            )
+        return results
+
+    def _dedup_embeddings(
+        self, embeddings: dict[str, list[float]]
+    ) -> tuple[dict[str, int], list[tuple[str, list[float]]]]:
+        """Map each source id to a query; identical or near-identical embeddings share one."""
+        query_of: dict[str, int] = {}
+        queries: list[tuple[str, list[float]]] = []
+        exact: dict[tuple[float, ...], int] = {}
+        kept: list[np.ndarray] = []
+        for memory_id, embedding in embeddings.items():
+            key = tuple(embedding)
+            if key in exact:
+                query_of[memory_id] = exact[key]
                 continue
-
-            for scope in _RECALL_SCOPES:
-                try:
-                    hits = graph_db.search_by_embedding(
-                        embedding,
-                        top_k=self.recall_top_k,
-                        scope=scope,
-                        status="activated",
-                        return_fields=["memory", "created_at"],
-                        user_name=cube_id,
-                    )
-                except Exception:
-                    logger.warning(
-                        "[Dream Recall] embedding search failed for node=%s scope=%s",
-                        node.get("id"),
-                        scope,
-                    )
+            vector = np.asarray(embedding, dtype=np.float32)
+            norm = float(np.linalg.norm(vector))
+            unit = vector / norm if norm else vector
+            if self.dedup_similarity < 1.0 and kept and len(kept[0]) == len(unit):
+                similarities = np.stack(kept) @ unit
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self.dedup_similarity:
+                    query_of[memory_id] = best
                     continue
-
-                for hit in hits:
-                    hit_id = hit.get("id", "")
-                    if not hit_id or hit_id in source_id_set:
-                        continue
-                    score = float(hit.get("score", 0.0))
-                    if hit_id not in seen or score > seen[hit_id]["score"]:
-                        seen[hit_id] = {
-                            "id": hit_id,
-                            "memory": hit.get("memory", ""),
-                            "score": score,
-                            "created_at": hit.get("created_at", ""),
-                        }
-
-        ranked = sorted(seen.values(), key=lambda x: x["score"], reverse=True)
-        return ranked[: self.recall_top_k]
+            query_of[memory_id] = exact[key] = len(queries)
+            queries.append((memory_id, embedding))
+            kept.append(unit)
+        return query_of, queries
+
+    def _search_all(
+        self, queries: list[tuple[str, list[float]]], graph_db, cube_id: str
+    ) -> dict[int, list[dict[str, Any]]]:
+        """Run every query against each scope with one ``search_batch`` call per scope."""
+        hits_by_query: dict[int, list[dict[str, Any]]] = {}
+        if not queries:
+            return hits_by_query
+
+        vectors = [embedding for _memory_id, embedding in queries]
+        for scope in _RECALL_SCOPES:
+            try:
+                batches = graph_db.search_batch(
+                    vectors,
+                    top_k=self.recall_top_k,
+                    scope=scope,
+                    status="activated",
+                    return_fields=["memory", "created_at"],
+                    user_name=cube_id,
+                )
+            except Exception:
+                logger.warning(
+                    "[Dream Recall] embedding search failed for scope=%s queries=%d",
+                    scope,
+                    len(vectors),
+                )
+                continue
+            for query_index, hits in enumerate(batches):
+                hits_by_query.setdefault(query_index, []).extend(
+                    {
+                        "id": hit["id"],
+                        "memory": hit.get("memory", ""),
+                        "score": float(hit.get("score", 0.0)),
+                        "created_at": hit.get("created_at", ""),
+                    }
+                    for hit in hits or []
+                    if hit.get("id")
+                )
+        return hits_by_query
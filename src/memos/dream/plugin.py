@@ -23,7 +23,7 @@ from memos.dream.pipeline import (
 from memos.dream.routers.diary_router import create_diary_router
 from memos.dream.routers.trigger_router import create_trigger_router
 from memos.dream.search import DreamContextSearchExtension
-from memos.dream.signal_store import DreamSignalStore
+from memos.dream.signal_store import DreamSignalStore, create_signal_backend
 from memos.mem_scheduler.schemas.message_schemas import ScheduleMessageItem
 from memos.mem_scheduler.schemas.task_schemas import MEM_DREAM_TASK_LABEL
 from memos.plugins.base import MemOSPlugin
@@ -50,7 +50,7 @@ class CommunityDreamPlugin(MemOSPlugin):
 
     def on_load(self) -> None:
         self.context: dict[str, Any] = {"shared": {}, "configs": {}}
-        self.signal_store = DreamSignalStore()
+        self.signal_store = DreamSignalStore(backend=create_signal_backend())
         self.heuristic_enricher = DreamHeuristicEnricher()
         self.search_extension = DreamContextSearchExtension()
         self.pipeline = AbstractDreamPipeline(
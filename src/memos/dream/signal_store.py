@@ -1,67 +1,451 @@
 from __future__ import annotations
 
-from copy import deepcopy
+import logging
+import os
+import sqlite3
+import threading
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
 
 from memos.dream.types import DreamSignalSnapshot
 
 
-class DreamSignalStore:
-    """In-memory Dream signal accumulator.
+logger = logging.getLogger(__name__)
+
+_BACKEND_ENV = "MEMOS_DREAM_SIGNAL_STORE"
+_SQLITE_PATH_ENV = "MEMOS_DREAM_SIGNAL_SQLITE_PATH"
+_REDIS_URL_ENV = "MEMOS_DREAM_SIGNAL_REDIS_URL"
+_DEFAULT_SHARDS = 16
+
 
-    We accumulates new memory ids. Can add more
-    signal channels, ranking policy, persistence, or decay windows around this
-    minimal store.
+class DreamSignalBackend(ABC):
+    """Storage for pending Dream signals, keyed by cube.
+
+    Backends must make ``append`` atomic: the returned pending count is the
+    cube's count right after this append, even when several threads, workers,
+    or replicas add to the same cube concurrently.
     """
 
-    def __init__(self, trigger_threshold: int = 100) -> None:
-        self.trigger_threshold = trigger_threshold
-        self._snapshots: dict[str, DreamSignalSnapshot] = {}
+    @abstractmethod
+    def append(
+        self,
+        mem_cube_id: str,
+        *,
+        user_id: str = "",
+        user_name: str = "",
+        session_id: str = "",
+        memory_ids: list[str] | tuple[str, ...] = (),
+    ) -> int:
+        """Record new memory ids (and non-empty metadata); return the pending count."""
 
-    def record_add(
+    @abstractmethod
+    def snapshot(self, mem_cube_id: str) -> DreamSignalSnapshot | None:
+        """Return the cube's pending signals, or None if nothing is recorded."""
+
+    @abstractmethod
+    def count(self, mem_cube_id: str) -> int:
+        """Return the number of pending memory ids for the cube."""
+
+    @abstractmethod
+    def reset(self, mem_cube_id: str, consumed: int | None = None) -> None:
+        """Drop the cube's oldest ``consumed`` pending ids, or all signals if None.
+
+        Ids appended after the consumed ones stay pending, so adds that land
+        while a Dream run is in flight are not lost.
+        """
+
+
+@dataclass
+class _PendingSignals:
+    user_id: str = ""
+    user_name: str = ""
+    session_id: str = ""
+    memory_ids: list[str] = field(default_factory=list)
+    # Built lazily and reused until the next append.
+    view: DreamSignalSnapshot | None = None
+
+
+class InMemorySignalBackend(DreamSignalBackend):
+    """Process-local backend with one lock per shard of cubes.
+
+    Adds to different cubes rarely contend, and an add only appends to the
+    cube's id list. Snapshots are immutable and cached until the next append,
+    so repeated reads share one instance. Signals are lost on restart and are
+    not shared between workers; use the SQLite or Redis backend for that.
+    """
+
+    def __init__(self, num_shards: int = _DEFAULT_SHARDS) -> None:
+        self._shards: list[tuple[threading.Lock, dict[str, _PendingSignals]]] = [
+            (threading.Lock(), {}) for _ in range(max(1, num_shards))
+        ]
+
+    def _shard(self, mem_cube_id: str) -> tuple[threading.Lock, dict[str, _PendingSignals]]:
+        return self._shards[hash(mem_cube_id) % len(self._shards)]
+
+    def append(
         self,
+        mem_cube_id: str,
         *,
+        user_id: str = "",
+        user_name: str = "",
+        session_id: str = "",
+        memory_ids: list[str] | tuple[str, ...] = (),
+    ) -> int:
+        lock, signals = self._shard(mem_cube_id)
+        with lock:
+            pending = signals.get(mem_cube_id)
+            if pending is None:
+                pending = signals[mem_cube_id] = _PendingSignals()
+            pending.user_id = user_id or pending.user_id
+            pending.user_name = user_name or pending.user_name
+            pending.session_id = session_id or pending.session_id
+            pending.memory_ids.extend(memory_ids)
+            pending.view = None
+            return len(pending.memory_ids)
+
+    def snapshot(self, mem_cube_id: str) -> DreamSignalSnapshot | None:
+        lock, signals = self._shard(mem_cube_id)
+        with lock:
+            pending = signals.get(mem_cube_id)
+            if pending is None:
+                return None
+            if pending.view is None:
+                pending.view = DreamSignalSnapshot(
+                    mem_cube_id=mem_cube_id,
+                    user_id=pending.user_id,
+                    user_name=pending.user_name,
+                    session_id=pending.session_id,
+                    pending_memory_ids=tuple(pending.memory_ids),
+                )
+            return pending.view
+
+    def count(self, mem_cube_id: str) -> int:
+        lock, signals = self._shard(mem_cube_id)
+        with lock:
+            pending = signals.get(mem_cube_id)
+            return len(pending.memory_ids) if pending is not None else 0
+
+    def reset(self, mem_cube_id: str, consumed: int | None = None) -> None:
+        lock, signals = self._shard(mem_cube_id)
+        with lock:
+            if consumed is None:
+                signals.pop(mem_cube_id, None)
+                return
+            pending = signals.get(mem_cube_id)
+            if pending is not None and consumed > 0:
+                del pending.memory_ids[:consumed]
+                pending.view = None
+
+
+class SQLiteSignalBackend(DreamSignalBackend):
+    """Durable single-host backend on a local SQLite file.
+
+    Every append runs in one ``BEGIN IMMEDIATE`` transaction that inserts the
+    ids and bumps a per-cube counter, so workers sharing the file see a
+    consistent pending count and signals survive restarts.
+    """
+
+    def __init__(self, path: str | Path, *, timeout: float = 30.0) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(path), timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._conn.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS dream_signal_cubes (
+                mem_cube_id TEXT PRIMARY KEY,
+                user_id TEXT NOT NULL DEFAULT '',
+                user_name TEXT NOT NULL DEFAULT '',
+                session_id TEXT NOT NULL DEFAULT '',
+                pending_count INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE TABLE IF NOT EXISTS dream_signal_ids (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                mem_cube_id TEXT NOT NULL,
+                memory_id TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_dream_signal_ids_cube
+                ON dream_signal_ids (mem_cube_id, seq);
+            """
+        )
+
+    def _transaction(self, statements) -> Any:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = statements(self._conn)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return result
+
+    def append(
+        self,
         mem_cube_id: str,
+        *,
         user_id: str = "",
         user_name: str = "",
         session_id: str = "",
-        memory_ids: list[str] | None = None,
-    ) -> DreamSignalSnapshot:
-        snapshot = self._ensure_snapshot(
+        memory_ids: list[str] | tuple[str, ...] = (),
+    ) -> int:
+        def statements(conn: sqlite3.Connection) -> int:
+            conn.execute(
+                """
+                INSERT INTO dream_signal_cubes
+                    (mem_cube_id, user_id, user_name, session_id, pending_count)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (mem_cube_id) DO UPDATE SET
+                    user_id = COALESCE(NULLIF(excluded.user_id, ''), user_id),
+                    user_name = COALESCE(NULLIF(excluded.user_name, ''), user_name),
+                    session_id = COALESCE(NULLIF(excluded.session_id, ''), session_id),
+                    pending_count = pending_count + excluded.pending_count
+                """,
+                (mem_cube_id, user_id, user_name, session_id, len(memory_ids)),
+            )
+            if memory_ids:
+                conn.executemany(
+                    "INSERT INTO dream_signal_ids (mem_cube_id, memory_id) VALUES (?, ?)",
+                    [(mem_cube_id, memory_id) for memory_id in memory_ids],
+                )
+            row = conn.execute(
+                "SELECT pending_count FROM dream_signal_cubes WHERE mem_cube_id = ?",
+                (mem_cube_id,),
+            ).fetchone()
+            return int(row[0])
+
+        return self._transaction(statements)
+
+    def snapshot(self, mem_cube_id: str) -> DreamSignalSnapshot | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT user_id, user_name, session_id FROM dream_signal_cubes "
+                "WHERE mem_cube_id = ?",
+                (mem_cube_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            ids = self._conn.execute(
+                "SELECT memory_id FROM dream_signal_ids WHERE mem_cube_id = ? ORDER BY seq",
+                (mem_cube_id,),
+            ).fetchall()
+        return DreamSignalSnapshot(
             mem_cube_id=mem_cube_id,
-            user_id=user_id,
-            user_name=user_name,
-            session_id=session_id,
+            user_id=row[0],
+            user_name=row[1],
+            session_id=row[2],
+            pending_memory_ids=tuple(memory_id for (memory_id,) in ids),
         )
+
+    def count(self, mem_cube_id: str) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT pending_count FROM dream_signal_cubes WHERE mem_cube_id = ?",
+                (mem_cube_id,),
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+    def reset(self, mem_cube_id: str, consumed: int | None = None) -> None:
+        def statements(conn: sqlite3.Connection) -> None:
+            if consumed is None:
+                conn.execute("DELETE FROM dream_signal_ids WHERE mem_cube_id = ?", (mem_cube_id,))
+                conn.execute("DELETE FROM dream_signal_cubes WHERE mem_cube_id = ?", (mem_cube_id,))
+                return
+            if consumed <= 0:
+                return
+            row = conn.execute(
+                "SELECT seq FROM dream_signal_ids WHERE mem_cube_id = ? "
+                "ORDER BY seq LIMIT 1 OFFSET ?",
+                (mem_cube_id, consumed - 1),
+            ).fetchone()
+            if row is None:
+                # Fewer ids than consumed are left; drop whatever remains.
+                max_seq = conn.execute(
+                    "SELECT MAX(seq) FROM dream_signal_ids WHERE mem_cube_id = ?",
+                    (mem_cube_id,),
+                ).fetchone()[0]
+                if max_seq is None:
+                    return
+            else:
+                max_seq = row[0]
+            deleted = conn.execute(
+                "DELETE FROM dream_signal_ids WHERE mem_cube_id = ? AND seq <= ?",
+                (mem_cube_id, max_seq),
+            ).rowcount
+            conn.execute(
+                "UPDATE dream_signal_cubes SET pending_count = MAX(0, pending_count - ?) "
+                "WHERE mem_cube_id = ?",
+                (deleted, mem_cube_id),
+            )
+
+        self._transaction(statements)
+
+
+class RedisSignalBackend(DreamSignalBackend):
+    """Shared backend for multi-replica deployments.
+
+    Each cube is a hash of metadata plus a list of pending ids. An append is one
+    ``MULTI`` pipeline whose ``RPUSH`` reply is the new pending count, so every
+    replica observes each count exactly once.
+    """
+
+    def __init__(self, client, *, key_prefix: str = "memos:dream:signals:") -> None:
+        self._client = client
+        self._key_prefix = key_prefix
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> RedisSignalBackend:
+        import redis
+
+        return cls(redis.from_url(url, decode_responses=True), **kwargs)
+
+    def _keys(self, mem_cube_id: str) -> tuple[str, str]:
+        base = f"{self._key_prefix}{mem_cube_id}"
+        return f"{base}:meta", f"{base}:ids"
+
+    def append(
+        self,
+        mem_cube_id: str,
+        *,
+        user_id: str = "",
+        user_name: str = "",
+        session_id: str = "",
+        memory_ids: list[str] | tuple[str, ...] = (),
+    ) -> int:
+        meta_key, ids_key = self._keys(mem_cube_id)
+        fields = {
+            "mem_cube_id": mem_cube_id,
+            **{
+                name: value
+                for name, value in (
+                    ("user_id", user_id),
+                    ("user_name", user_name),
+                    ("session_id", session_id),
+                )
+                if value
+            },
+        }
+        pipe = self._client.pipeline(transaction=True)
+        pipe.hset(meta_key, mapping=fields)
         if memory_ids:
-            snapshot.pending_memory_ids.extend(memory_ids)
-        return deepcopy(snapshot)
+            pipe.rpush(ids_key, *memory_ids)
+        else:
+            pipe.llen(ids_key)
+        return int(pipe.execute()[-1])
 
-    def snapshot(
+    def snapshot(self, mem_cube_id: str) -> DreamSignalSnapshot | None:
+        meta_key, ids_key = self._keys(mem_cube_id)
+        pipe = self._client.pipeline(transaction=True)
+        pipe.hgetall(meta_key)
+        pipe.lrange(ids_key, 0, -1)
+        meta, ids = pipe.execute()
+        if not meta and not ids:
+            return None
+        meta = {_decode(key): _decode(value) for key, value in (meta or {}).items()}
+        return DreamSignalSnapshot(
+            mem_cube_id=mem_cube_id,
+            user_id=meta.get("user_id", ""),
+            user_name=meta.get("user_name", ""),
+            session_id=meta.get("session_id", ""),
+            pending_memory_ids=tuple(_decode(memory_id) for memory_id in ids or ()),
+        )
+
+    def count(self, mem_cube_id: str) -> int:
+        return int(self._client.llen(self._keys(mem_cube_id)[1]))
+
+    def reset(self, mem_cube_id: str, consumed: int | None = None) -> None:
+        if consumed is None:
+            self._client.delete(*self._keys(mem_cube_id))
+        elif consumed > 0:
+            # Ids pushed after the snapshot sit past index ``consumed`` and survive.
+            self._client.ltrim(self._keys(mem_cube_id)[1], consumed, -1)
+
+
+def _decode(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+def create_signal_backend() -> DreamSignalBackend:
+    """Build the backend selected by ``MEMOS_DREAM_SIGNAL_STORE`` (memory|sqlite|redis).
+
+    Falls back to the in-memory backend when the durable one cannot be opened,
+    so a misconfigured store never blocks memory adds.
+    """
+    kind = (os.getenv(_BACKEND_ENV) or "memory").strip().lower()
+    try:
+        if kind == "sqlite":
+            from memos import settings
+
+            path = os.getenv(_SQLITE_PATH_ENV) or settings.MEMOS_DIR / "dream" / "signals.db"
+            return SQLiteSignalBackend(path)
+        if kind == "redis":
+            url = os.getenv(_REDIS_URL_ENV) or os.getenv("REDIS_URL", "redis://localhost:6379")
+            return RedisSignalBackend.from_url(url)
+    except Exception:
+        logger.warning(
+            "[Dream] failed to open %s signal store; keeping signals in memory",
+            kind,
+            exc_info=True,
+        )
+        return InMemorySignalBackend()
+    if kind != "memory":
+        logger.warning("[Dream] unknown %s=%r; keeping signals in memory", _BACKEND_ENV, kind)
+    return InMemorySignalBackend()
+
+
+class DreamSignalStore:
+    """Dream signal accumulator over a pluggable backend.
+
+    We accumulates new memory ids per cube. The backend decides where they
+    live: in process (default), in a local SQLite file, or in Redis so that
+    signals survive restarts and are shared by all API replicas. Can add more
+    signal channels, ranking policy, or decay windows around this store.
+    """
+
+    def __init__(
+        self,
+        trigger_threshold: int = 100,
+        backend: DreamSignalBackend | None = None,
+    ) -> None:
+        self.trigger_threshold = trigger_threshold
+        self.backend = backend or InMemorySignalBackend()
+
+    def record_add(
         self,
         *,
         mem_cube_id: str,
         user_id: str = "",
         user_name: str = "",
         session_id: str = "",
-    ) -> DreamSignalSnapshot:
-        snapshot = self._ensure_snapshot(
-            mem_cube_id=mem_cube_id,
+        memory_ids: list[str] | None = None,
+    ) -> DreamSignalSnapshot | None:
+        """Record an add; return a snapshot only when this add should trigger Dream.
+
+        A trigger fires each time the atomic pending count crosses a multiple of
+        ``trigger_threshold``. Exactly one add (on one replica) sees each crossing,
+        and a cube whose Dream run was lost re-triggers after another threshold
+        worth of adds instead of never again.
+        """
+        memory_ids = memory_ids or []
+        count = self.backend.append(
+            mem_cube_id,
             user_id=user_id,
             user_name=user_name,
             session_id=session_id,
+            memory_ids=memory_ids,
         )
-        return deepcopy(snapshot)
-
-    def reset(self, *, mem_cube_id: str) -> None:
-        self._snapshots.pop(mem_cube_id, None)
+        if not memory_ids or not self._crossed_threshold(count - len(memory_ids), count):
+            return None
+        return self.snapshot(mem_cube_id=mem_cube_id)
 
-    def should_trigger(self, *, mem_cube_id: str) -> bool:
-        snapshot = self._snapshots.get(mem_cube_id)
-        if snapshot is None:
-            return False
-        return len(snapshot.pending_memory_ids) >= self.trigger_threshold
-
-    def _ensure_snapshot(
+    def snapshot(
         self,
         *,
         mem_cube_id: str,
@@ -69,17 +453,23 @@ class DreamSignalStore:
         user_name: str = "",
         session_id: str = "",
     ) -> DreamSignalSnapshot:
-        snapshot = self._snapshots.get(mem_cube_id)
-        if snapshot is None:
-            snapshot = DreamSignalSnapshot(
-                mem_cube_id=mem_cube_id,
-                user_id=user_id,
-                user_name=user_name,
-                session_id=session_id,
+        if user_id or user_name or session_id:
+            self.backend.append(
+                mem_cube_id, user_id=user_id, user_name=user_name, session_id=session_id
             )
-            self._snapshots[mem_cube_id] = snapshot
-        else:
-            snapshot.user_id = user_id or snapshot.user_id
-            snapshot.user_name = user_name or snapshot.user_name
-            snapshot.session_id = session_id or snapshot.session_id
+        snapshot = self.backend.snapshot(mem_cube_id)
+        if snapshot is None:
+            return DreamSignalSnapshot(mem_cube_id=mem_cube_id)
         return snapshot
+
+    def reset(self, *, mem_cube_id: str, snapshot: DreamSignalSnapshot | None = None) -> None:
+        """Consume the ids in ``snapshot``, or drop all pending signals without one."""
+        consumed = None if snapshot is None else len(snapshot.pending_memory_ids)
+        self.backend.reset(mem_cube_id, consumed)
+
+    def should_trigger(self, *, mem_cube_id: str) -> bool:
+        return self.backend.count(mem_cube_id) >= self.trigger_threshold
+
+    def _crossed_threshold(self, before: int, after: int) -> bool:
+        threshold = max(1, self.trigger_threshold)
+        return before // threshold < after // threshold
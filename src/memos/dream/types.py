@@ -5,7 +5,7 @@ from enum import Enum
 from typing import Any
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class MotiveType(str, Enum):
@@ -90,13 +90,18 @@ class DreamSignalSnapshot(BaseModel):
     The current plugin ships the newness signal only. Projects that need
     recall/conflict/feedback signals should add those fields together with
     corresponding producers.
+
+    Snapshots are immutable, so the signal store can hand the same instance to
+    several readers without copying it.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     mem_cube_id: str
     user_id: str = ""
     user_name: str = ""
     session_id: str = ""
-    pending_memory_ids: list[str] = Field(default_factory=list)
+    pending_memory_ids: tuple[str, ...] = ()
 
 
 class DreamMotive(BaseModel):
@@ -1,4 +1,6 @@
+import asyncio
 import functools
+import inspect
 import re
 import time
 
@@ -17,45 +19,62 @@ EmbeddingCallable = TypeVar("EmbeddingCallable", bound=Callable[..., Any])
 def log_embedding_call(func: EmbeddingCallable) -> EmbeddingCallable:
     """Log embedding request dimensions and timing without text or vectors."""
 
-    @functools.wraps(func)
-    def wrapper(self, texts, *args, **kwargs):
+    def _log(self, texts, started_at: float, error_type: str | None) -> None:
         normalized_texts = [texts] if isinstance(texts, str) else list(texts or [])
         text_lengths = [len(str(text or "")) for text in normalized_texts]
         config = getattr(self, "config", None)
         model = getattr(config, "model_name_or_path", None) or "unknown"
         backup_model = getattr(config, "backup_model_name_or_path", None) or "none"
         backup_enabled = bool(getattr(self, "use_backup_client", False))
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+        log_message = (
+            "Embedding request model=%s backup_model=%s backup_enabled=%s "
+            "batch_size=%d total_chars=%d max_chars=%d text_hash=%s "
+            "elapsed_ms=%.2f status=%s"
+        )
+        log_values = (
+            model,
+            backup_model,
+            backup_enabled,
+            len(normalized_texts),
+            sum(text_lengths),
+            max(text_lengths, default=0),
+            text_hash(normalized_texts),
+            elapsed_ms,
+            "success" if error_type is None else "failed",
+        )
+        if error_type is None:
+            logger.info(log_message, *log_values)
+        else:
+            logger.info(log_message + " error_type=%s", *log_values, error_type)
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(self, texts, *args, **kwargs):
+            started_at = time.perf_counter()
+            error_type = None
+            try:
+                return await func(self, texts, *args, **kwargs)
+            except Exception as exc:
+                error_type = type(exc).__name__
+                raise
+            finally:
+                _log(self, texts, started_at, error_type)
+
+        return cast("EmbeddingCallable", async_wrapper)
+
+    @functools.wraps(func)
+    def wrapper(self, texts, *args, **kwargs):
         started_at = time.perf_counter()
-        status = "success"
         error_type = None
         try:
             return func(self, texts, *args, **kwargs)
         except Exception as exc:
-            status = "failed"
             error_type = type(exc).__name__
             raise
         finally:
-            elapsed_ms = (time.perf_counter() - started_at) * 1000
-            log_message = (
-                "Embedding request model=%s backup_model=%s backup_enabled=%s "
-                "batch_size=%d total_chars=%d max_chars=%d text_hash=%s "
-                "elapsed_ms=%.2f status=%s"
-            )
-            log_values = (
-                model,
-                backup_model,
-                backup_enabled,
-                len(normalized_texts),
-                sum(text_lengths),
-                max(text_lengths, default=0),
-                text_hash(normalized_texts),
-                elapsed_ms,
-                status,
-            )
-            if error_type is None:
-                logger.info(log_message, *log_values)
-            else:
-                logger.info(log_message + " error_type=%s", *log_values, error_type)
+            _log(self, texts, started_at, error_type)
 
     return cast("EmbeddingCallable", wrapper)
 
@@ -159,3 +178,11 @@ class BaseEmbedder(ABC):
     @abstractmethod
     def embed(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings for the given texts."""
+
+    async def aembed(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings without blocking the event loop.
+        Backends with an async client override this; the default runs `embed`
+        in a worker thread.
+        """
+        return await asyncio.to_thread(self.embed, texts)
@@ -0,0 +1,179 @@
+"""Coalesce concurrent embedding calls into shared provider batches.
+
+Many threads (API handlers, scheduler consumers, mem_reader pools) embed a few
+texts at a time. ``EmbeddingBatcher`` queues those calls for a short window and
+sends them to the provider as one batch, bounded by text count and an estimated
+token budget, then hands each caller its own slice of the result.
+
+No background thread is used: the first caller to arrive leads the batch. When
+the window closes it takes as many queued calls as fit, hands leadership to the
+next queued call (if any) and flushes its batch outside the lock.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from collections import Counter, deque
+from typing import TYPE_CHECKING
+
+from memos.exceptions import EmbedderError
+from memos.log import get_logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+logger = get_logger(__name__)
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate: CJK characters count as one token, others as ~4 chars."""
+    if not text:
+        return 1
+    cjk = sum(1 for char in text if "\u4e00" <= char <= "\u9fff")
+    return cjk + max(1, (len(text) - cjk) // 4)
+
+
+class _PendingCall:
+    __slots__ = ("error", "finished", "leader", "result", "texts", "tokens")
+
+    def __init__(self, texts: list[str]):
+        self.texts = texts
+        self.tokens = sum(estimate_tokens(text) for text in texts)
+        self.leader = False
+        self.finished = False
+        self.result: list[list[float]] | None = None
+        self.error: BaseException | None = None
+
+
+class EmbeddingBatcher:
+    """Merge embed calls from many threads into fewer backend calls.
+
+    Args:
+        embed_fn: Backend embedding function taking and returning lists.
+        window_seconds: How long the leading call waits for others to join.
+        max_batch_size: Flush early once this many texts are queued.
+        max_batch_tokens: Flush early once this many estimated tokens are queued.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[list[str]], list[list[float]]],
+        window_seconds: float,
+        max_batch_size: int = 64,
+        max_batch_tokens: int = 8192,
+    ):
+        self._embed_fn = embed_fn
+        self.window_seconds = max(0.0, window_seconds)
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_batch_tokens = max(1, max_batch_tokens)
+        self._cond = threading.Condition()
+        self._queue: deque[_PendingCall] = deque()
+        self._queued_texts = 0
+        self._queued_tokens = 0
+        self._has_leader = False
+        self._stats: Counter[str] = Counter()
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        call = _PendingCall(list(texts))
+        with self._cond:
+            self._queue.append(call)
+            self._queued_texts += len(call.texts)
+            self._queued_tokens += call.tokens
+            self._stats["requests"] += 1
+            if not self._has_leader:
+                self._has_leader = True
+                call.leader = True
+            elif self._batch_full():
+                self._cond.notify_all()
+            while not call.leader and not call.finished:
+                self._cond.wait()
+
+        if call.leader:
+            self._lead()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def _batch_full(self) -> bool:
+        return (
+            self._queued_texts >= self.max_batch_size
+            or self._queued_tokens >= self.max_batch_tokens
+        )
+
+    def _lead(self) -> None:
+        with self._cond:
+            deadline = time.monotonic() + self.window_seconds
+            while not self._batch_full():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            batch = self._take_batch()
+            if self._queue:
+                self._queue[0].leader = True
+                self._cond.notify_all()
+            else:
+                self._has_leader = False
+        self._flush(batch)
+
+    def _take_batch(self) -> list[_PendingCall]:
+        """Pop queued calls that fit the limits; always at least the first one."""
+        batch: list[_PendingCall] = []
+        texts = tokens = 0
+        while self._queue:
+            call = self._queue[0]
+            if batch and (
+                texts + len(call.texts) > self.max_batch_size
+                or tokens + call.tokens > self.max_batch_tokens
+            ):
+                break
+            self._queue.popleft()
+            batch.append(call)
+            texts += len(call.texts)
+            tokens += call.tokens
+        self._queued_texts -= texts
+        self._queued_tokens -= tokens
+        return batch
+
+    def _flush(self, batch: list[_PendingCall]) -> None:
+        unique_texts = list(dict.fromkeys(text for call in batch for text in call.texts))
+        try:
+            vectors = self._embed_fn(unique_texts)
+            if len(vectors) != len(unique_texts):
+                raise EmbedderError(
+                    "Embedding backend returned a different number of vectors than texts"
+                )
+            by_text = dict(zip(unique_texts, vectors, strict=True))
+            for call in batch:
+                call.result = [by_text[text] for text in call.texts]
+        except Exception as exc:
+            for call in batch:
+                call.error = exc
+
+        logger.debug(
+            "embedding batch flushed calls=%d texts=%d unique_texts=%d",
+            len(batch),
+            sum(len(call.texts) for call in batch),
+            len(unique_texts),
+        )
+        with self._cond:
+            self._stats["batches"] += 1
+            self._stats["batched_texts"] += len(unique_texts)
+            for call in batch:
+                call.finished = True
+            self._cond.notify_all()
+
+    def stats(self) -> dict[str, int]:
+        with self._cond:
+            return {
+                "batcher_requests": self._stats["requests"],
+                "batcher_batches": self._stats["batches"],
+                "batcher_texts": self._stats["batched_texts"],
+                "batcher_queued": len(self._queue),
+            }
@@ -7,9 +7,18 @@ from collections import Counter
 from concurrent.futures import Future
 from typing import TYPE_CHECKING, Any
 
+from memos.cache_store import env_enabled, env_float, env_int
 from memos.context.context import get_current_trace_id
 from memos.dependency import require_python_package
 from memos.embedders.base import BaseEmbedder
+from memos.embedders.batcher import EmbeddingBatcher
+from memos.embedders.cache_store import (
+    CachedVector,
+    EmbeddingCacheStore,
+    SQLiteEmbeddingCacheStore,
+    embedding_cache_key,
+)
+from memos.embedders.quantized import QuantizedEmbedding, embedding_quantization
 from memos.exceptions import EmbedderError
 from memos.log import get_logger
 
@@ -26,58 +35,62 @@ _CACHE_TTL_ENV = "MEMOS_EMBEDDING_CACHE_TTL_SECONDS"
 _CACHE_MAX_SIZE_ENV = "MEMOS_EMBEDDING_CACHE_MAX_SIZE"
 _REQUEST_CACHE_TTL_ENV = "MEMOS_EMBEDDING_REQUEST_CACHE_TTL_SECONDS"
 _REQUEST_CACHE_MAX_REQUESTS_ENV = "MEMOS_EMBEDDING_REQUEST_CACHE_MAX_REQUESTS"
+_PERSISTENT_CACHE_PATH_ENV = "MEMOS_EMBEDDING_PERSISTENT_CACHE_PATH"
+_PERSISTENT_CACHE_MAX_ENTRIES_ENV = "MEMOS_EMBEDDING_PERSISTENT_CACHE_MAX_ENTRIES"
+_PERSISTENT_CACHE_DTYPE_ENV = "MEMOS_EMBEDDING_PERSISTENT_CACHE_DTYPE"
+_BATCH_WINDOW_MS_ENV = "MEMOS_EMBEDDING_BATCH_WINDOW_MS"
+_BATCH_MAX_SIZE_ENV = "MEMOS_EMBEDDING_BATCH_MAX_SIZE"
+_BATCH_MAX_TOKENS_ENV = "MEMOS_EMBEDDING_BATCH_MAX_TOKENS"
 
 _DEFAULT_CACHE_TTL_SECONDS = 30.0
 _DEFAULT_CACHE_MAX_SIZE = 4096
 _DEFAULT_REQUEST_CACHE_TTL_SECONDS = 60.0
 _DEFAULT_REQUEST_CACHE_MAX_REQUESTS = 1024
+_DEFAULT_PERSISTENT_CACHE_MAX_ENTRIES = 200_000
+_DEFAULT_PERSISTENT_CACHE_DTYPE = "float32"
+_DEFAULT_BATCH_WINDOW_MS = 0.0
+_DEFAULT_BATCH_MAX_SIZE = 64
+_DEFAULT_BATCH_MAX_TOKENS = 8192
 
 _INVALID_REQUEST_IDS = {None, "", "trace-id"}
 
-CachedVector = tuple[float, ...]
-
-
-def _env_enabled(name: str, default: bool = False) -> bool:
-    raw = os.getenv(name)
-    if raw is None:
-        return default
-    return raw.strip().lower() in {"1", "true", "yes", "y", "on"}
-
 
 def embedding_optimization_enabled() -> bool:
-    return _env_enabled(_OPTIMIZATION_ENABLED_ENV)
-
-
-def _env_float(name: str, default: float, minimum: float = 0.0) -> float:
-    raw = os.getenv(name)
-    if raw is None:
-        return default
-    try:
-        return max(minimum, float(raw))
-    except ValueError:
-        logger.warning("Invalid %s=%r; using default %s", name, raw, default)
-        return default
+    return env_enabled(_OPTIMIZATION_ENABLED_ENV)
 
 
-def _env_int(name: str, default: int, minimum: int = 1) -> int:
-    raw = os.getenv(name)
-    if raw is None:
-        return default
+def _persistent_store_from_env() -> EmbeddingCacheStore | None:
+    path = (os.getenv(_PERSISTENT_CACHE_PATH_ENV) or "").strip()
+    if not path:
+        return None
+    max_entries = env_int(_PERSISTENT_CACHE_MAX_ENTRIES_ENV, _DEFAULT_PERSISTENT_CACHE_MAX_ENTRIES)
+    dtype = (os.getenv(_PERSISTENT_CACHE_DTYPE_ENV) or _DEFAULT_PERSISTENT_CACHE_DTYPE).strip()
     try:
-        return max(minimum, int(raw))
-    except ValueError:
-        logger.warning("Invalid %s=%r; using default %s", name, raw, default)
-        return default
+        return SQLiteEmbeddingCacheStore(path, max_entries=max_entries, dtype=dtype.lower())
+    except Exception as exc:
+        logger.warning("Persistent embedding cache disabled path=%s error=%s", path, exc)
+        return None
 
 
 class CachingEmbedder(BaseEmbedder):
-    """Add exact caches and singleflight coordination to an embedder."""
+    """Add exact caches and singleflight coordination to an embedder.
+
+    Lookups go through a per-request cache, a short in-process TTL cache and,
+    when configured, a durable content-addressed store shared across restarts
+    and processes. Only texts missing from every tier reach the backend; with
+    ``MEMOS_EMBEDDING_BATCH_WINDOW_MS`` set, those misses are coalesced with
+    concurrent callers into shared backend batches. With
+    ``MEMOS_EMBEDDING_QUANTIZATION`` set, the in-process tiers hold vectors as
+    float16 or int8 ``QuantizedEmbedding`` instead of float tuples: a miss
+    returns the backend's full-precision vector, but later hits from those
+    tiers return the dequantized, lossy copy.
+    """
 
     @require_python_package(
         import_name="cachetools",
         install_command="pip install 'cachetools>=6.0.0'",
     )
-    def __init__(self, backend: BaseEmbedder):
+    def __init__(self, backend: BaseEmbedder, persistent_store: EmbeddingCacheStore | None = None):
         from cachetools import LRUCache, TTLCache
 
         self._backend = backend
@@ -86,15 +99,16 @@ class CachingEmbedder(BaseEmbedder):
         self._lock = threading.RLock()
         self._inflight: dict[str, Future[CachedVector]] = {}
         self._stats: Counter[str] = Counter()
+        self._quantization = embedding_quantization()
 
-        cache_ttl = _env_float(_CACHE_TTL_ENV, _DEFAULT_CACHE_TTL_SECONDS)
-        cache_max_size = _env_int(_CACHE_MAX_SIZE_ENV, _DEFAULT_CACHE_MAX_SIZE)
+        cache_ttl = env_float(_CACHE_TTL_ENV, _DEFAULT_CACHE_TTL_SECONDS)
+        cache_max_size = env_int(_CACHE_MAX_SIZE_ENV, _DEFAULT_CACHE_MAX_SIZE)
         self._cache: TTLCache[str, CachedVector] | None = (
             TTLCache(maxsize=cache_max_size, ttl=cache_ttl) if cache_ttl > 0 else None
         )
 
-        request_cache_ttl = _env_float(_REQUEST_CACHE_TTL_ENV, _DEFAULT_REQUEST_CACHE_TTL_SECONDS)
-        request_cache_max_requests = _env_int(
+        request_cache_ttl = env_float(_REQUEST_CACHE_TTL_ENV, _DEFAULT_REQUEST_CACHE_TTL_SECONDS)
+        request_cache_max_requests = env_int(
             _REQUEST_CACHE_MAX_REQUESTS_ENV, _DEFAULT_REQUEST_CACHE_MAX_REQUESTS
         )
         self._request_cache_text_limit = cache_max_size
@@ -104,6 +118,25 @@ class CachingEmbedder(BaseEmbedder):
             else None
         )
 
+        self._persistent_store = (
+            persistent_store if persistent_store is not None else _persistent_store_from_env()
+        )
+        batch_window_ms = env_float(_BATCH_WINDOW_MS_ENV, _DEFAULT_BATCH_WINDOW_MS)
+        self._batcher: EmbeddingBatcher | None = (
+            EmbeddingBatcher(
+                backend.embed,
+                window_seconds=batch_window_ms / 1000,
+                max_batch_size=env_int(_BATCH_MAX_SIZE_ENV, _DEFAULT_BATCH_MAX_SIZE),
+                max_batch_tokens=env_int(_BATCH_MAX_TOKENS_ENV, _DEFAULT_BATCH_MAX_TOKENS),
+            )
+            if batch_window_ms > 0
+            else None
+        )
+        self._persistent_namespace = (
+            getattr(self.config, "model_name_or_path", None),
+            getattr(self.config, "embedding_dims", None),
+        )
+
     def __getattr__(self, name: str) -> Any:
         return getattr(self._backend, name)
 
@@ -126,6 +159,7 @@ class CachingEmbedder(BaseEmbedder):
                 "request_hits": 0,
                 "ttl_hits": 0,
                 "singleflight_joins": 0,
+                "persistent_hits": 0,
                 "misses": 0,
             }
         )
@@ -148,17 +182,33 @@ class CachingEmbedder(BaseEmbedder):
                     future: Future[CachedVector] = Future()
                     self._inflight[text] = future
                     owned[text] = future
-                    local_stats["misses"] += 1
 
             self._stats.update(local_stats)
 
+        if owned:
+            persisted = self._load_persisted(list(owned))
+            with self._lock:
+                for text, vector in persisted.items():
+                    resolved[text] = vector
+                    self._remember(text, vector, request_cache)
+                    self._inflight.pop(text, None)
+                    owned.pop(text).set_result(vector)
+                local_stats["persistent_hits"] = len(persisted)
+                local_stats["misses"] = len(owned)
+                self._stats["persistent_hits"] += len(persisted)
+                self._stats["misses"] += len(owned)
+
         if owned:
             owned_texts = list(owned)
             with self._lock:
                 self._stats["backend_calls"] += 1
                 self._stats["backend_texts"] += len(owned_texts)
             try:
-                computed = self._backend.embed(owned_texts)
+                computed = (
+                    self._batcher.embed(owned_texts)
+                    if self._batcher is not None
+                    else self._backend.embed(owned_texts)
+                )
                 if len(computed) != len(owned_texts):
                     raise EmbedderError(
                         "Embedding backend returned a different number of vectors than texts"
@@ -175,34 +225,85 @@ class CachingEmbedder(BaseEmbedder):
             with self._lock:
                 for text, vector in zip(owned_texts, computed_vectors, strict=True):
                     resolved[text] = vector
-                    if self._cache is not None:
-                        self._cache[text] = vector
-                    if request_cache is not None:
-                        request_cache[text] = vector
+                    self._remember(text, vector, request_cache)
                     self._inflight.pop(text, None)
                     owned[text].set_result(vector)
 
+            self._store_persisted(dict(zip(owned_texts, computed_vectors, strict=True)))
+
         for text, future in waiting.items():
             vector = future.result()
             resolved[text] = vector
             if request_cache is not None:
                 with self._lock:
-                    request_cache[text] = vector
+                    request_cache[text] = self._compact(vector)
 
         logger.info(
             "embedding cache summary batch_size=%d unique_texts=%d "
             "request_hits=%d ttl_hits=%d batch_dedup_hits=%d "
-            "singleflight_joins=%d misses=%d",
+            "singleflight_joins=%d persistent_hits=%d misses=%d",
             len(texts),
             len(unique_texts),
             local_stats["request_hits"],
             local_stats["ttl_hits"],
             local_stats["batch_dedup_hits"],
             local_stats["singleflight_joins"],
+            local_stats["persistent_hits"],
             local_stats["misses"],
         )
         return [list(resolved[text]) for text in texts]
 
+    def _compact(
+        self, vector: CachedVector | QuantizedEmbedding
+    ) -> CachedVector | QuantizedEmbedding:
+        if self._quantization is None or isinstance(vector, QuantizedEmbedding):
+            return vector
+        return QuantizedEmbedding.from_vector(vector, self._quantization)
+
+    def _remember(
+        self,
+        text: str,
+        vector: CachedVector,
+        request_cache: LRUCache[str, CachedVector] | None,
+    ) -> None:
+        """Store a (possibly quantized) copy of a full-precision vector in the in-process tiers."""
+        cached = self._compact(vector)
+        if self._cache is not None:
+            self._cache[text] = cached
+        if request_cache is not None:
+            request_cache[text] = cached
+
+    def _persistent_keys(self, texts: list[str]) -> dict[str, str]:
+        model, dims = self._persistent_namespace
+        return {embedding_cache_key(model, dims, text): text for text in texts}
+
+    def _load_persisted(self, texts: list[str]) -> dict[str, CachedVector]:
+        if self._persistent_store is None:
+            return {}
+        keys = self._persistent_keys(texts)
+        try:
+            stored = self._persistent_store.get_many(list(keys))
+        except Exception as exc:
+            logger.warning("Persistent embedding cache read failed: %s", exc)
+            with self._lock:
+                self._stats["persistent_errors"] += 1
+            return {}
+        return {keys[key]: tuple(vector) for key, vector in stored.items()}
+
+    def _store_persisted(self, vectors: dict[str, CachedVector]) -> None:
+        if self._persistent_store is None or not vectors:
+            return
+        keys = self._persistent_keys(list(vectors))
+        try:
+            self._persistent_store.set_many({key: vectors[text] for key, text in keys.items()})
+        except Exception as exc:
+            logger.warning("Persistent embedding cache write failed: %s", exc)
+            with self._lock:
+                self._stats["persistent_errors"] += 1
+            return
+        with self._lock:
+            self._stats["persistent_writes"] += len(vectors)
+
     def _get_request_cache(self, request_id: str | None) -> LRUCache[str, CachedVector] | None:
         if request_id in _INVALID_REQUEST_IDS or self._request_caches is None:
             return None
@@ -220,22 +321,38 @@ class CachingEmbedder(BaseEmbedder):
                 "request_hits",
                 "ttl_hits",
                 "singleflight_joins",
+                "persistent_hits",
+                "persistent_writes",
+                "persistent_errors",
                 "misses",
                 "backend_calls",
                 "backend_texts",
                 "backend_errors",
             ):
                 info.setdefault(key, 0)
+            info["persistent_cache_size"] = self._persistent_cache_size()
             info["ttl_cache_size"] = len(self._cache) if self._cache is not None else 0
             info["request_cache_count"] = (
                 len(self._request_caches) if self._request_caches is not None else 0
             )
             info["inflight"] = len(self._inflight)
-            return info
-
-    def clear_cache(self) -> None:
+        if self._batcher is not None:
+            info.update(self._batcher.stats())
+        return info
+
+    def _persistent_cache_size(self) -> int:
+        if self._persistent_store is None:
+            return 0
+        try:
+            return len(self._persistent_store)
+        except Exception:
+            return 0
+
+    def clear_cache(self, include_persistent: bool = False) -> None:
         with self._lock:
             if self._cache is not None:
                 self._cache.clear()
             if self._request_caches is not None:
                 self._request_caches.clear()
+        if include_persistent and self._persistent_store is not None:
+            self._persistent_store.clear()
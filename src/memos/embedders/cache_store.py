@@ -0,0 +1,107 @@
+"""Durable, content-addressed storage tiers for ``CachingEmbedder``.
+
+Vectors are keyed by a hash of ``(model, dims, text)`` so identical texts are
+embedded once and then reused across requests, worker restarts and any process
+that points at the same store.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+from memos.cache_store import SQLiteCacheStore
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+
+CachedVector = tuple[float, ...]
+
+_VECTOR_FORMATS = {"float32": "f", "float16": "e"}
+
+
+def embedding_cache_key(model: str | None, dims: int | None, text: str) -> str:
+    """Return the content address of ``text`` embedded by ``model`` at ``dims``."""
+    digest = hashlib.sha256()
+    digest.update(f"{model or ''}\x00{dims or ''}\x00".encode())
+    digest.update(text.encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+class EmbeddingCacheStore(ABC):
+    """Key/value tier that persists embedding vectors by content address.
+
+    Implementations must be safe to call from multiple threads. Errors may be
+    raised freely; ``CachingEmbedder`` treats any failure as a cache miss.
+    """
+
+    @abstractmethod
+    def get_many(self, keys: Sequence[str]) -> dict[str, CachedVector]:
+        """Return the stored vectors for the keys that are present."""
+
+    @abstractmethod
+    def set_many(self, items: Mapping[str, Sequence[float]]) -> None:
+        """Store vectors, evicting old entries if the store is bounded."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every stored vector."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of stored vectors."""
+
+    def close(self) -> None:  # noqa: B027
+        """Release resources held by the store."""
+
+
+class SQLiteEmbeddingCacheStore(SQLiteCacheStore, EmbeddingCacheStore):
+    """Size-bounded embedding store in a local SQLite file.
+
+    Vectors are packed as little-endian float32 (exact) or float16 (half the
+    size, ~3 significant digits) blobs. Eviction and sharing follow
+    ``SQLiteCacheStore``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 200_000,
+        dtype: str = "float32",
+        evict_ratio: float = 0.9,
+        busy_timeout: float = 5.0,
+    ):
+        if dtype not in _VECTOR_FORMATS:
+            raise ValueError(f"Unsupported embedding cache dtype: {dtype}")
+        super().__init__(
+            path,
+            table="embedding_cache",
+            value_columns={"dtype": "TEXT NOT NULL", "vector": "BLOB NOT NULL"},
+            max_entries=max_entries,
+            evict_ratio=evict_ratio,
+            busy_timeout=busy_timeout,
+        )
+        self.dtype = dtype
+        self._format_char = _VECTOR_FORMATS[dtype]
+
+    def _pack(self, vector: Sequence[float]) -> bytes:
+        return struct.pack(f"<{len(vector)}{self._format_char}", *vector)
+
+    @staticmethod
+    def _unpack(blob: bytes, dtype: str) -> CachedVector:
+        format_char = _VECTOR_FORMATS[dtype]
+        count = len(blob) // struct.calcsize(format_char)
+        return struct.unpack(f"<{count}{format_char}", blob)
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, CachedVector]:
+        return {
+            key: self._unpack(blob, dtype) for key, (dtype, blob) in self.get_rows(keys).items()
+        }
+
+    def set_many(self, items: Mapping[str, Sequence[float]]) -> None:
+        self.set_rows({key: (self.dtype, self._pack(vector)) for key, vector in items.items()})
@@ -0,0 +1,165 @@
+"""Compact in-memory representation of embedding vectors.
+
+A 1024-dim embedding held as ``list[float]`` costs ~32 KB of Python objects;
+the same vector as float16 takes 2 KB and as int8 with a per-vector scale
+1 KB. ``QuantizedEmbedding`` holds such a vector as a NumPy array, converts
+back to floats on demand, and serialises as a plain float list, so it can sit
+in ``TreeNodeTextualMemoryMetadata.embedding`` and caches without changing any
+API output. ``embedding_matrix`` builds the float32 matrix used by the cosine
+rerank / MMR code directly from lists, arrays or quantized vectors.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+
+from pydantic_core import core_schema
+
+from memos.log import get_logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+
+logger = get_logger(__name__)
+
+
+QuantizationMode = Literal["float16", "int8"]
+
+_QUANTIZATION_ENV = "MEMOS_EMBEDDING_QUANTIZATION"
+_DTYPES: dict[str, np.dtype] = {"float16": np.dtype(np.float16), "int8": np.dtype(np.int8)}
+_BYTES_HEADER = struct.Struct("<Bf")
+_DTYPE_CODES = {"float16": 1, "int8": 2}
+_CODE_DTYPES = {code: name for name, code in _DTYPE_CODES.items()}
+
+
+def embedding_quantization() -> QuantizationMode | None:
+    """The quantization configured by ``MEMOS_EMBEDDING_QUANTIZATION``, or None."""
+    raw = (os.getenv(_QUANTIZATION_ENV) or "").strip().lower()
+    if raw in ("", "none", "float32", "false", "0"):
+        return None
+    if raw not in _DTYPES:
+        logger.warning("Invalid %s=%r; embeddings are kept as float lists", _QUANTIZATION_ENV, raw)
+        return None
+    return raw
+
+
+class QuantizedEmbedding:
+    """An embedding stored as float16, or as int8 with one float scale per vector."""
+
+    __slots__ = ("data", "scale")
+
+    def __init__(self, data: np.ndarray, scale: float = 1.0):
+        self.data = data
+        # float32, so the value survives to_bytes / from_bytes unchanged
+        self.scale = float(np.float32(scale))
+
+    @classmethod
+    def from_vector(
+        cls, vector: Sequence[float] | np.ndarray, mode: QuantizationMode = "int8"
+    ) -> QuantizedEmbedding:
+        values = np.asarray(vector, dtype=np.float32)
+        if mode == "float16":
+            return cls(values.astype(np.float16))
+        if mode != "int8":
+            raise ValueError(f"Unsupported embedding quantization: {mode}")
+        peak = float(np.max(np.abs(values))) if values.size else 0.0
+        scale = peak / 127.0 if peak > 0 else 1.0
+        return cls(np.round(values / scale).astype(np.int8), scale)
+
+    @property
+    def mode(self) -> QuantizationMode:
+        return "int8" if self.data.dtype == np.int8 else "float16"
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes
+
+    def to_numpy(self, dtype: Any = np.float32) -> np.ndarray:
+        values = self.data.astype(dtype)
+        if self.scale != 1.0:
+            values *= self.scale
+        return values
+
+    def tolist(self) -> list[float]:
+        return self.to_numpy().tolist()
+
+    def to_bytes(self) -> bytes:
+        return _BYTES_HEADER.pack(_DTYPE_CODES[self.mode], self.scale) + self.data.tobytes()
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> QuantizedEmbedding:
+        code, scale = _BYTES_HEADER.unpack_from(blob)
+        data = np.frombuffer(blob, dtype=_DTYPES[_CODE_DTYPES[code]], offset=_BYTES_HEADER.size)
+        return cls(data.copy(), scale)
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        return self.to_numpy(np.float32 if dtype is None else dtype)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.tolist())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, QuantizedEmbedding):
+            return NotImplemented
+        return self.scale == other.scale and np.array_equal(self.data, other.data)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"QuantizedEmbedding(mode={self.mode}, dims={len(self)})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: Any) -> core_schema.CoreSchema:
+        # Accept instances as-is and dump them as float lists, so models holding a
+        # quantized embedding serialise exactly like ones holding list[float].
+        return core_schema.is_instance_schema(
+            cls,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda value: value.tolist()
+            ),
+        )
+
+
+def quantize_embedding(
+    vector: Sequence[float] | np.ndarray | QuantizedEmbedding | None,
+    mode: QuantizationMode | None = None,
+) -> Sequence[float] | QuantizedEmbedding | None:
+    """Quantize ``vector`` with ``mode`` (default: the configured mode); pass through otherwise."""
+    mode = mode or embedding_quantization()
+    if mode is None or vector is None or isinstance(vector, QuantizedEmbedding):
+        return vector
+    return QuantizedEmbedding.from_vector(vector, mode)
+
+
+def embedding_matrix(
+    vectors: Sequence[Sequence[float] | np.ndarray | QuantizedEmbedding] | np.ndarray,
+    dtype: Any = np.float32,
+) -> np.ndarray:
+    """Stack embeddings of any supported representation into a 2-D ``dtype`` matrix."""
+    if isinstance(vectors, np.ndarray):
+        return vectors.astype(dtype, copy=False)
+    if vectors and all(isinstance(vector, QuantizedEmbedding) for vector in vectors):
+        dtypes = {vector.data.dtype for vector in vectors}
+        if len(dtypes) == 1:
+            matrix = np.stack([vector.data for vector in vectors]).astype(dtype)
+            scales = np.fromiter((vector.scale for vector in vectors), dtype=dtype)
+            if np.any(scales != 1.0):
+                matrix *= scales[:, None]
+            return matrix
+    return np.asarray(
+        [
+            vector.to_numpy(dtype) if isinstance(vector, QuantizedEmbedding) else vector
+            for vector in vectors
+        ],
+        dtype=dtype,
+    )
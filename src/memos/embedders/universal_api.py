@@ -4,6 +4,11 @@ from openai import AzureOpenAI as AzureClient
 from openai import BadRequestError
 from openai import OpenAI as OpenAIClient
 
+from memos.async_utils import (
+    get_async_limiter,
+    get_shared_async_azure_client,
+    get_shared_async_openai_client,
+)
 from memos.configs.embedder import UniversalAPIEmbedderConfig
 from memos.embedders.base import BaseEmbedder, log_embedding_call
 from memos.log import get_logger
@@ -112,6 +117,44 @@ class UniversalAPIEmbedder(BaseEmbedder):
 
         return [item.embedding for item in response.data]
 
+    async def _acall_embeddings_api(
+        self, client, model: str, texts: list[str], timeout: int
+    ) -> list[list[float]]:
+        embedding_dims = getattr(self.config, "embedding_dims", None)
+        kwargs = self._build_embedding_kwargs(model, texts, embedding_dims)
+
+        async with get_async_limiter(("embedder", str(client.base_url))):
+            try:
+                response = await client.embeddings.create(**kwargs, timeout=timeout)
+            except BadRequestError as error:
+                if embedding_dims is None or not self._is_dimensions_unsupported(error):
+                    raise
+
+                logger.warning(
+                    "Embedding provider rejected dimensions=%d; retrying without dimensions",
+                    embedding_dims,
+                )
+                fallback_kwargs = self._build_embedding_kwargs(model, texts, None)
+                response = await client.embeddings.create(**fallback_kwargs, timeout=timeout)
+
+        return [item.embedding for item in response.data]
+
+    def _async_client(self):
+        if self.provider == "azure":
+            return get_shared_async_azure_client(
+                self.config.base_url, "2024-03-01-preview", self.config.api_key
+            )
+        return get_shared_async_openai_client(
+            self.config.api_key, self.config.base_url, self.config.headers_extra or None
+        )
+
+    def _async_backup_client(self):
+        return get_shared_async_openai_client(
+            self.config.backup_api_key,
+            self.config.backup_base_url,
+            self.config.backup_headers_extra or None,
+        )
+
     @log_embedding_call
     def embed(self, texts: list[str]) -> list[list[float]]:
         if isinstance(texts, str):
@@ -146,3 +189,32 @@ class UniversalAPIEmbedder(BaseEmbedder):
                     raise ValueError(f"Embeddings request ended with error: {e}") from e
         else:
             raise ValueError(f"Embeddings unsupported provider: {self.provider}")
+
+    @log_embedding_call
+    async def aembed(self, texts: list[str]) -> list[list[float]]:
+        if isinstance(texts, str):
+            texts = [texts]
+        texts = [_sanitize_unicode(t) for t in texts]
+        texts = self._truncate_texts(texts)
+        timeout = int(os.getenv("MOS_EMBEDDER_TIMEOUT", 5))
+        try:
+            model = getattr(self.config, "model_name_or_path", "text-embedding-3-large")
+            return await self._acall_embeddings_api(self._async_client(), model, texts, timeout)
+        except Exception as e:
+            if not self.use_backup_client:
+                raise ValueError(f"Embeddings request ended with error: {e}") from e
+            logger.warning(
+                "Embedding request failed error_type=%s; trying backup client",
+                type(e).__name__,
+            )
+            try:
+                backup_model = getattr(
+                    self.config, "backup_model_name_or_path", "text-embedding-3-large"
+                )
+                return await self._acall_embeddings_api(
+                    self._async_backup_client(), backup_model, texts, timeout
+                )
+            except Exception as e_backup:
+                raise ValueError(
+                    f"Backup embeddings request ended with error: {e_backup}"
+                ) from e_backup
@@ -1,6 +1,7 @@
 import re
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import Any, Literal
 
 
@@ -190,6 +191,34 @@ class BaseGraphDB(ABC):
             - Commonly used for RAG recall stage to find semantically similar memories.
         """
 
+    def search_batch(
+        self, vectors: list[list[float]], top_k: int = 5, **kwargs
+    ) -> list[list[dict]]:
+        """
+        Run `search_by_embedding` for several query vectors with the same filters.
+
+        Backends override this with a single native query. The default fans the
+        vectors out over a small thread pool.
+
+        Args:
+            vectors (list[list[float]]): Query embeddings.
+            top_k (int): Number of results per query vector.
+            **kwargs: Any other `search_by_embedding` argument (scope, status, filters,
+                user_name, return_fields, ...), applied to every vector.
+
+        Returns:
+            list[list[dict]]: One `search_by_embedding` result list per vector, in input order.
+        """
+        from memos.context.context import ContextThreadPoolExecutor
+
+        def search_one(vector: list[float]) -> list[dict]:
+            return self.search_by_embedding(vector=vector, top_k=top_k, **kwargs) or []
+
+        if len(vectors) <= 1:
+            return [search_one(vector) for vector in vectors]
+        with ContextThreadPoolExecutor(max_workers=min(len(vectors), 8)) as executor:
+            return list(executor.map(search_one, vectors))
+
     @abstractmethod
     def get_by_metadata(
         self, filters: list[dict[str, Any]], status: str | None = None
@@ -273,6 +302,56 @@ class BaseGraphDB(ABC):
             data: A dictionary containing all nodes and edges to be loaded.
         """
 
+    def iter_export_nodes(
+        self,
+        page_size: int = 1000,
+        include_embedding: bool = False,
+        after_id: str | None = None,
+        user_name: str | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Yield the nodes `export_graph` would return, in pages ordered by node id.
+
+        Backends override this with a keyset cursor so memory stays bounded by
+        `page_size`; this fallback exports the whole graph once and slices it.
+
+        Args:
+            page_size: Maximum number of nodes per page.
+            include_embedding: Whether to include embeddings in node metadata.
+            after_id: Resume after this node id (exclusive).
+            user_name: Optional user name (will use config default if not provided)
+        """
+        data = self.export_graph(include_embedding=include_embedding, user_name=user_name)
+        nodes = sorted(data.get("nodes", []), key=lambda node: node["id"])
+        if after_id is not None:
+            nodes = [node for node in nodes if node["id"] > after_id]
+        for start in range(0, len(nodes), page_size):
+            yield nodes[start : start + page_size]
+
+    def iter_export_edges(
+        self,
+        page_size: int = 1000,
+        after: tuple[str, str, str] | None = None,
+        user_name: str | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Yield the edges `export_graph` would return, in pages ordered by
+        (source, target, type).
+
+        Args:
+            page_size: Maximum number of edges per page.
+            after: Resume after this (source, target, type) key (exclusive).
+            user_name: Optional user name (will use config default if not provided)
+        """
+        data = self.export_graph(include_embedding=False, user_name=user_name)
+        edges = sorted(
+            data.get("edges", []), key=lambda edge: (edge["source"], edge["target"], edge["type"])
+        )
+        if after is not None:
+            edges = [e for e in edges if (e["source"], e["target"], e["type"]) > tuple(after)]
+        for start in range(0, len(edges), page_size):
+            yield edges[start : start + page_size]
+
     @abstractmethod
     def get_all_memory_items(
         self, scope: str, include_embedding: bool = False, status: str | None = None
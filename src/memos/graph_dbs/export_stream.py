@@ -0,0 +1,410 @@
+"""Streaming, resumable graph export/import.
+
+``export_graph``/``import_graph`` move the whole graph as one dict. For large
+cubes this module instead writes a directory:
+
+- ``nodes.jsonl``: one node per line. Embeddings are moved out of the metadata
+  and replaced by ``embedding_row``, a row index into ``embeddings.f32``.
+- ``embeddings.f32``: a little-endian float32 matrix of ``embedding_dim``
+  columns. Vectors of another dimension stay inline in the node metadata.
+- ``edges.jsonl``: one ``{"source", "target", "type"}`` edge per line.
+- ``manifest.json``: counts, byte offsets and the last exported cursor.
+
+Export pages through the backend's ``iter_export_nodes``/``iter_export_edges``
+and updates the manifest after every page, so an interrupted export resumes
+from the last completed page. Import reads the files page by page, writes
+nodes through parallel ``add_nodes_batch`` calls, and records its progress in
+``import_progress.<target>.json`` (one file per target store and cube) so an
+interrupted import can be resumed on request. The file is removed once the
+import completes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from memos.context.context import ContextThreadPoolExecutor
+from memos.log import get_logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from memos.graph_dbs.base import BaseGraphDB
+
+
+logger = get_logger(__name__)
+
+FORMAT_NAME = "memos-graph-stream"
+FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+NODES_FILE = "nodes.jsonl"
+EDGES_FILE = "edges.jsonl"
+EMBEDDINGS_FILE = "embeddings.f32"
+IMPORT_PROGRESS_FILE = "import_progress.{target}.json"
+
+_EMBEDDING_DTYPE = np.dtype("<f4")
+
+
+def is_graph_stream(directory: str) -> bool:
+    """Return True if ``directory`` holds a streaming export."""
+    manifest = _read_json(os.path.join(directory, MANIFEST_FILE))
+    return bool(manifest) and manifest.get("format") == FORMAT_NAME
+
+
+def export_graph_stream(
+    graph_store: BaseGraphDB,
+    directory: str,
+    include_embedding: bool = False,
+    user_name: str | None = None,
+    page_size: int = 1000,
+    resume: bool = True,
+) -> dict[str, Any]:
+    """
+    Export the graph of ``user_name`` into ``directory`` page by page.
+
+    Args:
+        graph_store: Backend to export from.
+        directory: Output directory, created if missing.
+        include_embedding: Whether to write node embeddings.
+        user_name: Cube to export (backend default if None).
+        page_size: Nodes/edges fetched and written per page.
+        resume: Continue an unfinished export with the same settings instead of
+            starting over.
+
+    Returns:
+        The final manifest.
+    """
+    os.makedirs(directory, exist_ok=True)
+    manifest_path = os.path.join(directory, MANIFEST_FILE)
+    manifest = _read_json(manifest_path) if resume else None
+    if not (
+        manifest
+        and manifest.get("format") == FORMAT_NAME
+        and not manifest.get("complete")
+        and manifest.get("include_embedding") == include_embedding
+        and manifest.get("user_name") == user_name
+    ):
+        manifest = _new_manifest(include_embedding, user_name)
+    elif manifest["nodes"]["count"] or manifest["edges"]["count"]:
+        logger.info(
+            "Resuming graph export in %s after %d nodes and %d edges",
+            directory,
+            manifest["nodes"]["count"],
+            manifest["edges"]["count"],
+        )
+
+    nodes_path = os.path.join(directory, NODES_FILE)
+    edges_path = os.path.join(directory, EDGES_FILE)
+    embeddings_path = os.path.join(directory, EMBEDDINGS_FILE)
+    nodes_state, edges_state = manifest["nodes"], manifest["edges"]
+    _truncate(nodes_path, nodes_state["bytes"])
+    _truncate(edges_path, edges_state["bytes"])
+    dim = manifest["embedding_dim"]
+    _truncate(embeddings_path, manifest["embedding_rows"] * (dim or 0) * _EMBEDDING_DTYPE.itemsize)
+
+    if not nodes_state["done"]:
+        with open(nodes_path, "ab") as nodes_file, open(embeddings_path, "ab") as vectors_file:
+            for page in graph_store.iter_export_nodes(
+                page_size=page_size,
+                include_embedding=include_embedding,
+                after_id=nodes_state["cursor"],
+                user_name=user_name,
+            ):
+                lines, vectors = [], []
+                for node in page:
+                    row = manifest["embedding_rows"] + len(vectors)
+                    vector = None
+                    if include_embedding:
+                        vector = _pop_matrix_embedding(node, manifest, row)
+                    if vector is not None:
+                        vectors.append(vector)
+                    lines.append(_dumps_line(node))
+                if vectors:
+                    vectors_file.write(np.asarray(vectors, dtype=_EMBEDDING_DTYPE).tobytes())
+                    vectors_file.flush()
+                nodes_file.write(b"".join(lines))
+                nodes_file.flush()
+                manifest["embedding_rows"] += len(vectors)
+                nodes_state["count"] += len(page)
+                nodes_state["bytes"] = nodes_file.tell()
+                nodes_state["cursor"] = page[-1]["id"]
+                _write_json(manifest_path, manifest)
+        nodes_state["done"] = True
+        _write_json(manifest_path, manifest)
+
+    if not edges_state["done"]:
+        with open(edges_path, "ab") as edges_file:
+            for page in graph_store.iter_export_edges(
+                page_size=page_size,
+                after=tuple(edges_state["cursor"]) if edges_state["cursor"] else None,
+                user_name=user_name,
+            ):
+                edges_file.write(b"".join(_dumps_line(edge) for edge in page))
+                edges_file.flush()
+                last = page[-1]
+                edges_state["count"] += len(page)
+                edges_state["bytes"] = edges_file.tell()
+                edges_state["cursor"] = [last["source"], last["target"], last["type"]]
+                _write_json(manifest_path, manifest)
+        edges_state["done"] = True
+
+    manifest["complete"] = True
+    _write_json(manifest_path, manifest)
+    logger.info(
+        "Exported %d nodes and %d edges to %s",
+        nodes_state["count"],
+        edges_state["count"],
+        directory,
+    )
+    return manifest
+
+
+def import_graph_stream(
+    graph_store: BaseGraphDB,
+    directory: str,
+    user_name: str | None = None,
+    page_size: int = 1000,
+    max_workers: int = 4,
+    resume: bool = False,
+) -> dict[str, int]:
+    """
+    Import a streaming export from ``directory`` into ``graph_store``.
+
+    Nodes are written with up to ``max_workers`` concurrent ``add_nodes_batch``
+    calls of ``page_size`` nodes; at most ``2 * max_workers`` pages are held in
+    memory. Edges are added after all nodes, since backends only link existing
+    nodes.
+
+    Args:
+        graph_store: Backend to import into.
+        directory: Directory written by :func:`export_graph_stream`.
+        user_name: Cube to import into (backend default if None).
+        page_size: Nodes/edges per batch.
+        max_workers: Concurrent batch writers.
+        resume: Skip the nodes and edges that an interrupted import into the same
+            store and cube already committed. Progress is kept per target and
+            dropped once an import completes.
+
+    Returns:
+        Number of nodes and edges imported by this call.
+    """
+    manifest = _read_json(os.path.join(directory, MANIFEST_FILE))
+    if not manifest or manifest.get("format") != FORMAT_NAME:
+        raise ValueError(f"{directory} does not contain a graph stream export")
+    if not manifest.get("complete"):
+        raise ValueError(f"Graph stream export in {directory} is incomplete")
+
+    progress_path = os.path.join(
+        directory, IMPORT_PROGRESS_FILE.format(target=_import_target(graph_store, user_name))
+    )
+    progress = (_read_json(progress_path) if resume else None) or {"nodes": 0, "edges": 0}
+
+    embeddings = None
+    dim = manifest.get("embedding_dim")
+    if manifest.get("embedding_rows") and dim:
+        embeddings = np.memmap(
+            os.path.join(directory, EMBEDDINGS_FILE),
+            dtype=_EMBEDDING_DTYPE,
+            mode="r",
+            shape=(manifest["embedding_rows"], dim),
+        )
+
+    def write_nodes(page: list[dict[str, Any]]) -> None:
+        for node in page:
+            row = node.pop("embedding_row", None)
+            if row is not None and embeddings is not None:
+                node.setdefault("metadata", {})["embedding"] = embeddings[row].tolist()
+        graph_store.add_nodes_batch(page, user_name=user_name)
+
+    def write_edges(page: list[dict[str, Any]]) -> None:
+        for edge in page:
+            graph_store.add_edge(edge["source"], edge["target"], edge["type"], user_name=user_name)
+
+    def committer(key: str) -> Callable[[int], None]:
+        def commit(count: int) -> None:
+            progress[key] = count
+            _write_json(progress_path, progress)
+
+        return commit
+
+    imported_nodes = _import_pages(
+        os.path.join(directory, NODES_FILE),
+        skip=progress["nodes"],
+        page_size=page_size,
+        max_workers=max_workers,
+        write_page=write_nodes,
+        on_committed=committer("nodes"),
+    )
+    imported_edges = _import_pages(
+        os.path.join(directory, EDGES_FILE),
+        skip=progress["edges"],
+        page_size=page_size,
+        max_workers=max_workers,
+        write_page=write_edges,
+        on_committed=committer("edges"),
+    )
+    if os.path.exists(progress_path):
+        os.remove(progress_path)
+    logger.info("Imported %d nodes and %d edges from %s", imported_nodes, imported_edges, directory)
+    return {"nodes": imported_nodes, "edges": imported_edges}
+
+
+def _import_pages(
+    path: str,
+    skip: int,
+    page_size: int,
+    max_workers: int,
+    write_page: Callable[[list[dict[str, Any]]], None],
+    on_committed: Callable[[int], None],
+) -> int:
+    """
+    Write the records of a JSONL file in parallel pages.
+
+    ``on_committed`` receives the number of leading records that are written,
+    which only advances once every earlier page has finished, so a resumed
+    import never skips a failed page.
+    """
+    if not os.path.exists(path):
+        return 0
+    max_workers = max(1, max_workers)
+    pending: dict[Any, tuple[int, int]] = {}
+    finished: dict[int, int] = {}
+    committed, next_start = skip, skip
+    executor = ContextThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="graph_import")
+    with executor:
+        try:
+            for page in _read_pages(path, skip, page_size):
+                if len(pending) >= 2 * max_workers:
+                    committed = _drain(pending, finished, committed, on_committed)
+                future = executor.submit(write_page, page)
+                pending[future] = (next_start, len(page))
+                next_start += len(page)
+            while pending:
+                committed = _drain(pending, finished, committed, on_committed)
+        finally:
+            for future in pending:
+                future.cancel()
+    return committed - skip
+
+
+def _drain(
+    pending: dict[Any, tuple[int, int]],
+    finished: dict[int, int],
+    committed: int,
+    on_committed: Callable[[int], None],
+) -> int:
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        start, size = pending.pop(future)
+        future.result()
+        finished[start] = size
+    advanced = committed
+    while advanced in finished:
+        advanced += finished.pop(advanced)
+    if advanced != committed:
+        on_committed(advanced)
+    return advanced
+
+
+def _read_pages(path: str, skip: int, page_size: int) -> Iterator[list[dict[str, Any]]]:
+    page: list[dict[str, Any]] = []
+    with open(path, encoding="utf-8") as f:
+        for index, line in enumerate(f):
+            if index < skip or not line.strip():
+                continue
+            page.append(json.loads(line))
+            if len(page) >= page_size:
+                yield page
+                page = []
+    if page:
+        yield page
+
+
+def _pop_matrix_embedding(
+    node: dict[str, Any], manifest: dict[str, Any], row: int
+) -> list[float] | None:
+    """Move the node embedding into the matrix if it has the matrix dimension."""
+    metadata = node.get("metadata") or {}
+    embedding = metadata.get("embedding")
+    if isinstance(embedding, str):
+        try:
+            embedding = json.loads(embedding)
+        except json.JSONDecodeError:
+            return None
+    if not isinstance(embedding, list | tuple) or not embedding:
+        return None
+    if manifest["embedding_dim"] is None:
+        manifest["embedding_dim"] = len(embedding)
+    if len(embedding) != manifest["embedding_dim"]:
+        return None
+    del metadata["embedding"]
+    node["embedding_row"] = row
+    return embedding
+
+
+def _import_target(graph_store: BaseGraphDB, user_name: str | None) -> str:
+    """Short digest identifying the store and cube an import writes into."""
+    config = getattr(graph_store, "config", None)
+
+    def setting(name: str) -> Any:
+        if isinstance(config, dict):
+            return config.get(name)
+        return getattr(config, name, None)
+
+    location = [setting(name) for name in ("uri", "host", "port", "db_name", "db_path")]
+    if setting("db_path") == ":memory:" or not any(location):
+        # Nothing outlives the process, so the instance itself is the target
+        location.append(id(graph_store))
+    identity = [type(graph_store).__name__, *location, user_name or setting("user_name")]
+    return hashlib.sha1(json.dumps(identity, default=str).encode("utf-8")).hexdigest()[:16]
+
+
+def _new_manifest(include_embedding: bool, user_name: str | None) -> dict[str, Any]:
+    return {
+        "format": FORMAT_NAME,
+        "version": FORMAT_VERSION,
+        "user_name": user_name,
+        "include_embedding": include_embedding,
+        "embedding_dim": None,
+        "embedding_rows": 0,
+        "nodes": {"count": 0, "bytes": 0, "cursor": None, "done": False},
+        "edges": {"count": 0, "bytes": 0, "cursor": None, "done": False},
+        "complete": False,
+    }
+
+
+def _dumps_line(record: dict[str, Any]) -> bytes:
+    return (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+def _truncate(path: str, size: int) -> None:
+    """Drop anything written after the last recorded page (or create the file)."""
+    with open(path, "ab") as f:
+        f.truncate(size)
+
+
+def _read_json(path: str) -> dict[str, Any] | None:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except json.JSONDecodeError:
+        logger.warning("Ignoring unreadable %s", path)
+        return None
+
+
+def _write_json(path: str, data: dict[str, Any]) -> None:
+    """Atomically replace ``path`` so a crash never leaves a half-written manifest."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
@@ -1,6 +1,7 @@
 import json
 import time
 
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any, Literal
 
@@ -882,6 +883,135 @@ class Neo4jGraphDB(BaseGraphDB):
               is used for maximum efficiency.
             - If threshold is provided, only results with score >= threshold will be returned.
         """
+        where_clause, return_clause, parameters = self._vector_search_clauses(
+            scope=scope,
+            status=status,
+            search_filter=search_filter,
+            user_name=user_name,
+            filter=filter,
+            knowledgebase_ids=knowledgebase_ids,
+            return_fields=return_fields,
+            cube_name=kwargs.get("cube_name"),
+        )
+
+        if where_clause:
+            # Pre-filtering (Neo4j 5.18+): filter nodes first, then compute similarity.
+            # This avoids the post-filter problem where relevant nodes are excluded
+            # from the global top-k returned by queryNodes.
+            query = f"""
+                MATCH (node:Memory)
+                {where_clause}
+                WITH node, vector.similarity.cosine(node.embedding, $embedding) AS score
+                {return_clause}
+                ORDER BY score DESC
+                LIMIT $top_k
+            """
+        else:
+            # No filter: use ANN vector index for efficiency.
+            query = f"""
+                CALL db.index.vector.queryNodes('memory_vector_index', $top_k, $embedding)
+                YIELD node, score
+                {return_clause}
+            """
+        parameters.update({"embedding": vector, "top_k": top_k})
+
+        logger.info(f"[search_by_embedding] query: {query},parameters: {parameters}")
+        print(f"[search_by_embedding] query: {query},parameters: {parameters}")
+        with self.driver.session(database=self.db_name) as session:
+            result = session.run(query, parameters)
+            records = [self._vector_record_to_item(record, return_fields) for record in result]
+
+        # Threshold filtering after retrieval
+        if threshold is not None:
+            records = [r for r in records if r["score"] >= threshold]
+
+        return records
+
+    def search_batch(
+        self,
+        vectors: list[list[float]],
+        top_k: int = 5,
+        scope: str | None = None,
+        status: str | None = None,
+        threshold: float | None = None,
+        search_filter: dict | None = None,
+        user_name: str | None = None,
+        filter: dict | None = None,
+        knowledgebase_ids: list[str] | None = None,
+        return_fields: list[str] | None = None,
+        **kwargs,
+    ) -> list[list[dict]]:
+        """
+        Vector search for several query vectors in a single Cypher query.
+
+        The vectors are UNWIND-ed and each one runs the same per-vector top-k
+        subquery as `search_by_embedding` (pre-filtered scan or ANN index).
+
+        Returns:
+            list[list[dict]]: One `search_by_embedding` result list per vector, in input order.
+        """
+        if not vectors:
+            return []
+        where_clause, return_clause, parameters = self._vector_search_clauses(
+            scope=scope,
+            status=status,
+            search_filter=search_filter,
+            user_name=user_name,
+            filter=filter,
+            knowledgebase_ids=knowledgebase_ids,
+            return_fields=return_fields,
+            cube_name=kwargs.get("cube_name"),
+        )
+
+        if where_clause:
+            per_vector = f"""
+                    MATCH (node:Memory)
+                    {where_clause}
+                    WITH node, vector.similarity.cosine(node.embedding, $embeddings[idx]) AS score
+                    ORDER BY score DESC
+                    LIMIT $top_k
+                    RETURN node, score
+            """
+        else:
+            per_vector = """
+                    CALL db.index.vector.queryNodes('memory_vector_index', $top_k, $embeddings[idx])
+                    YIELD node, score
+                    RETURN node, score
+            """
+        query = f"""
+            UNWIND range(0, size($embeddings) - 1) AS idx
+            CALL {{
+                WITH idx
+                {per_vector}
+            }}
+            {return_clause.replace("RETURN ", "RETURN idx, ", 1)}
+        """
+        parameters.update({"embeddings": vectors, "top_k": top_k})
+
+        logger.info(f"[search_batch] vectors: {len(vectors)}, query: {query}")
+        results: list[list[dict]] = [[] for _ in vectors]
+        with self.driver.session(database=self.db_name) as session:
+            for record in session.run(query, parameters):
+                item = self._vector_record_to_item(record, return_fields)
+                if threshold is None or item["score"] >= threshold:
+                    results[record["idx"]].append(item)
+
+        for hits in results:
+            hits.sort(key=lambda hit: hit["score"], reverse=True)
+        return results
+
+    def _vector_search_clauses(
+        self,
+        scope: str | None,
+        status: str | None,
+        search_filter: dict | None,
+        user_name: str | None,
+        filter: dict | None,
+        knowledgebase_ids: list[str] | None,
+        return_fields: list[str] | None,
+        cube_name: str | None,
+    ) -> tuple[str, str, dict[str, Any]]:
+        """Build the WHERE clause, RETURN clause and parameters of a vector search."""
         user_name = user_name if user_name else self.config.user_name
         # Build WHERE clause dynamically
         where_clauses = []
@@ -921,6 +1051,7 @@ class Neo4jGraphDB(BaseGraphDB):
 
         where_clause = ""
         if where_clauses:
+            where_clauses.append("node.embedding IS NOT NULL")
             where_clause = "WHERE " + " AND ".join(where_clauses)
 
         return_clause = "RETURN node.id AS id, score"
@@ -932,29 +1063,7 @@ class Neo4jGraphDB(BaseGraphDB):
             if extra_fields:
                 return_clause = f"RETURN node.id AS id, score, {extra_fields}"
 
-        if where_clause:
-            # Pre-filtering (Neo4j 5.18+): filter nodes first, then compute similarity.
-            # This avoids the post-filter problem where relevant nodes are excluded
-            # from the global top-k returned by queryNodes.
-            where_clause += " AND node.embedding IS NOT NULL"
-            query = f"""
-                MATCH (node:Memory)
-                {where_clause}
-                WITH node, vector.similarity.cosine(node.embedding, $embedding) AS score
-                {return_clause}
-                ORDER BY score DESC
-                LIMIT $top_k
-            """
-            parameters = {"embedding": vector, "top_k": top_k}
-        else:
-            # No filter: use ANN vector index for efficiency.
-            query = f"""
-                CALL db.index.vector.queryNodes('memory_vector_index', $top_k, $embedding)
-                YIELD node, score
-                {return_clause}
-            """
-            parameters = {"embedding": vector, "top_k": top_k}
-
+        parameters: dict[str, Any] = {}
         if scope:
             parameters["scope"] = scope
         if status:
@@ -964,8 +1073,8 @@ class Neo4jGraphDB(BaseGraphDB):
         parameters.update(user_name_params)
 
         # Handle cube_name override for user_name
-        if kwargs.get("cube_name"):
-            parameters["user_name"] = kwargs["cube_name"]
+        if cube_name:
+            parameters["user_name"] = cube_name
 
         if search_filter:
             for key, value in search_filter.items():
@@ -976,25 +1085,17 @@ class Neo4jGraphDB(BaseGraphDB):
         if filter_params:
             parameters.update(filter_params)
 
-        logger.info(f"[search_by_embedding] query: {query},parameters: {parameters}")
-        print(f"[search_by_embedding] query: {query},parameters: {parameters}")
-        with self.driver.session(database=self.db_name) as session:
-            result = session.run(query, parameters)
-            records = []
-            for record in result:
-                item = {"id": record["id"], "score": record["score"]}
-                if return_fields:
-                    record_keys = record.keys()
-                    for field in return_fields:
-                        if field != "id" and field in record_keys:
-                            item[field] = record[field]
-                records.append(item)
-
-        # Threshold filtering after retrieval
-        if threshold is not None:
-            records = [r for r in records if r["score"] >= threshold]
+        return where_clause, return_clause, parameters
 
-        return records
+    @staticmethod
+    def _vector_record_to_item(record: Any, return_fields: list[str] | None) -> dict:
+        item = {"id": record["id"], "score": record["score"]}
+        if return_fields:
+            record_keys = record.keys()
+            for field in return_fields:
+                if field != "id" and field in record_keys:
+                    item[field] = record[field]
+        return item
 
     def search_by_fulltext(
         self,
@@ -1452,6 +1553,79 @@ class Neo4jGraphDB(BaseGraphDB):
                     target_id=edge["target"],
                 )
 
+    def iter_export_nodes(
+        self,
+        page_size: int = 1000,
+        include_embedding: bool = False,
+        after_id: str | None = None,
+        user_name: str | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield non-deleted nodes in pages ordered by id, using `id > $after_id` as cursor."""
+        user_name = user_name if user_name else self.config.user_name
+        where_clauses = ["n.status <> 'deleted'", "($after_id IS NULL OR n.id > $after_id)"]
+        params: dict[str, Any] = {"limit": page_size}
+        if not self.config.use_multi_db and user_name:
+            where_clauses.append("n.user_name = $user_name")
+            params["user_name"] = user_name
+        query = (
+            f"MATCH (n:Memory) WHERE {' AND '.join(where_clauses)} "
+            "RETURN n ORDER BY n.id LIMIT $limit"
+        )
+        while True:
+            params["after_id"] = after_id
+            with self.driver.session(database=self.db_name) as session:
+                records = list(session.run(query, params))
+            if not records:
+                return
+            nodes = []
+            for record in records:
+                node_dict = dict(record["n"])
+                if not include_embedding:
+                    for key in ("embedding", "embedding_1024", "embedding_3072", "embedding_768"):
+                        node_dict.pop(key, None)
+                nodes.append(self._parse_node(node_dict))
+            yield nodes
+            if len(records) < page_size:
+                return
+            after_id = nodes[-1]["id"]
+
+    def iter_export_edges(
+        self,
+        page_size: int = 1000,
+        after: tuple[str, str, str] | None = None,
+        user_name: str | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield edges between non-deleted nodes in pages keyed by (source, target, type)."""
+        user_name = user_name if user_name else self.config.user_name
+        where_clauses = [
+            "a.status <> 'deleted' AND b.status <> 'deleted'",
+            "($source IS NULL OR a.id > $source OR (a.id = $source AND "
+            "(b.id > $target OR (b.id = $target AND type(r) > $type))))",
+        ]
+        params: dict[str, Any] = {"limit": page_size}
+        if not self.config.use_multi_db and user_name:
+            where_clauses.append("a.user_name = $user_name AND b.user_name = $user_name")
+            params["user_name"] = user_name
+        query = (
+            f"MATCH (a:Memory)-[r]->(b:Memory) WHERE {' AND '.join(where_clauses)} "
+            "RETURN a.id AS source, b.id AS target, type(r) AS type "
+            "ORDER BY source, target, type LIMIT $limit"
+        )
+        while True:
+            params["source"], params["target"], params["type"] = after or (None, None, None)
+            with self.driver.session(database=self.db_name) as session:
+                edges = [
+                    {"source": record["source"], "target": record["target"], "type": record["type"]}
+                    for record in session.run(query, params)
+                ]
+            if not edges:
+                return
+            yield edges
+            if len(edges) < page_size:
+                return
+            last = edges[-1]
+            after = (last["source"], last["target"], last["type"])
+
     def get_all_memory_items(
         self,
         scope: str,
@@ -248,7 +248,7 @@ class Neo4jCommunityGraphDB(Neo4jGraphDB):
 
         # Get embeddings from vector DB
         ids = [n["id"] for n in child_nodes]
-        vec_items = {v.id: v.vector for v in self.vec_db.get_by_ids(ids)}
+        vec_items = {v.id: v.vector for v in self.vec_db.get_by_ids(ids, payload_fields=[])}
 
         # Merge results
         for node in child_nodes:
@@ -336,33 +336,103 @@ class Neo4jCommunityGraphDB(Neo4jGraphDB):
             - The returned IDs can be used to fetch full node data from Neo4j if needed.
         """
         user_name = user_name if user_name else self.config.user_name
+        vec_filter = self._vec_search_filter(
+            scope, status, search_filter, kwargs.get("cube_name") or user_name
+        )
+
+        # Perform vector search; hits are resolved by id, so skip vectors and payloads
+        vec_results = []
+        if self.vec_db:
+            try:
+                vec_results = self.vec_db.search(
+                    query_vector=vector,
+                    top_k=top_k,
+                    filter=vec_filter,
+                    return_vector=False,
+                    payload_fields=[],
+                )
+            except Exception as e:
+                logger.warning(f"[VecDB] search failed: {e}")
+
+        return self._resolve_vec_results(
+            vec_results, threshold, user_name, filter, knowledgebase_ids, return_fields
+        )
+
+    def search_batch(
+        self,
+        vectors: list[list[float]],
+        top_k: int = 5,
+        scope: str | None = None,
+        status: str | None = None,
+        threshold: float | None = None,
+        search_filter: dict | None = None,
+        user_name: str | None = None,
+        filter: dict | None = None,
+        knowledgebase_ids: list[str] | None = None,
+        return_fields: list[str] | None = None,
+        **kwargs,
+    ) -> list[list[dict]]:
+        """
+        Vector search for several query vectors through the external vector DB's batch search.
 
-        # First, perform vector search in external vector DB
+        Returns:
+            list[list[dict]]: One `search_by_embedding` result list per vector, in input order.
+        """
+        if not vectors:
+            return []
+        user_name = user_name if user_name else self.config.user_name
+        vec_filter = self._vec_search_filter(
+            scope, status, search_filter, kwargs.get("cube_name") or user_name
+        )
+
+        batch_results = [[] for _ in vectors]
+        if self.vec_db:
+            try:
+                batch_results = self.vec_db.search_batch(
+                    query_vectors=vectors,
+                    top_k=top_k,
+                    filter=vec_filter,
+                    return_vector=False,
+                    payload_fields=[],
+                )
+            except Exception as e:
+                logger.warning(f"[VecDB] batch search failed: {e}")
+
+        return [
+            self._resolve_vec_results(
+                vec_results, threshold, user_name, filter, knowledgebase_ids, return_fields
+            )
+            for vec_results in batch_results
+        ]
+
+    @staticmethod
+    def _vec_search_filter(
+        scope: str | None, status: str | None, search_filter: dict | None, user_name: str | None
+    ) -> dict[str, Any]:
+        """Payload filter for the external vector DB search."""
         vec_filter = {}
         if scope:
             vec_filter["memory_type"] = scope
         if status:
             vec_filter["status"] = status
         vec_filter["vector_sync"] = "success"
-        if kwargs.get("cube_name"):
-            vec_filter["user_name"] = kwargs["cube_name"]
-        else:
-            vec_filter["user_name"] = user_name
+        vec_filter["user_name"] = user_name
 
         # Add search_filter conditions
         if search_filter:
             vec_filter.update(search_filter)
+        return vec_filter
 
-        # Perform vector search
-        vec_results = []
-        if self.vec_db:
-            try:
-                vec_results = self.vec_db.search(
-                    query_vector=vector, top_k=top_k, filter=vec_filter
-                )
-            except Exception as e:
-                logger.warning(f"[VecDB] search failed: {e}")
-
+    def _resolve_vec_results(
+        self,
+        vec_results: list,
+        threshold: float | None,
+        user_name: str | None,
+        filter: dict | None,
+        knowledgebase_ids: list[str] | None,
+        return_fields: list[str] | None,
+    ) -> list[dict]:
+        """Apply threshold, Neo4j-side filters and return_fields to vector DB hits."""
         # Filter by threshold
         if threshold is not None:
             vec_results = [r for r in vec_results if r.score is None or r.score >= threshold]
@@ -1081,7 +1151,9 @@ class Neo4jCommunityGraphDB(Neo4jGraphDB):
 
         # Step2: Clear the vector db
         try:
-            items = self.vec_db.get_by_filter({"user_name": user_name})
+            items = self.vec_db.get_by_filter(
+                {"user_name": user_name}, return_vector=False, payload_fields=[]
+            )
             if items:
                 self.vec_db.delete([item.id for item in items])
                 logger.info(f"Cleared {len(items)} vectors for user '{user_name}'.")
@@ -1216,7 +1288,7 @@ class Neo4jCommunityGraphDB(Neo4jGraphDB):
         vec_items_map = {}
         if node_ids:
             try:
-                vec_items = self.vec_db.get_by_ids(node_ids)
+                vec_items = self.vec_db.get_by_ids(node_ids, payload_fields=[])
                 vec_items_map = {v.id: v.vector for v in vec_items if v and v.vector}
             except Exception as e:
                 logger.warning(f"Failed to batch fetch vectors for {len(node_ids)} nodes: {e}")
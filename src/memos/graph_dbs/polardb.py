@@ -4,7 +4,9 @@ import random
 import textwrap
 import threading
 import time
+import weakref
 
+from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import datetime
 from typing import Any, Literal
@@ -20,6 +22,13 @@ from memos.utils import timed
 
 logger = get_logger(__name__)
 
+# Properties mirrored into typed, B-tree indexed columns when `hot_filter_columns` is enabled.
+HOT_FILTER_FIELDS = ("id", "user_name", "user_id", "memory_type", "status", "session_id")
+
+
+def _hot_column_name(field: str) -> str:
+    return f"hot_{field}"
+
 
 def _build_lightweight_return_columns(return_fields: list[str]) -> str:
     columns = []
@@ -126,6 +135,7 @@ class PolarDBGraphDB(BaseGraphDB):
     """PolarDB-based implementation using Apache AGE graph database extension."""
 
     supports_lightweight_vector_search = True
+    _hot_filter_columns = False
 
     @require_python_package(
         import_name="psycopg2",
@@ -167,6 +177,7 @@ class PolarDBGraphDB(BaseGraphDB):
             self._skip_connection_health_check = config.get("skip_connection_health_check", False)
             self._warm_up_on_startup_by_full = config.get("warm_up_on_startup_by_full", False)
             self._warm_up_on_startup_by_all = config.get("warm_up_on_startup_by_all", False)
+            self._hot_filter_columns = config.get("hot_filter_columns", False)
         else:
             self.db_name = config.db_name
             self.user_name = config.user_name
@@ -181,6 +192,7 @@ class PolarDBGraphDB(BaseGraphDB):
             )
             self._warm_up_on_startup_by_full = getattr(config, "warm_up_on_startup_by_full", False)
             self._warm_up_on_startup_by_all = getattr(config, "warm_up_on_startup_by_all", False)
+            self._hot_filter_columns = getattr(config, "hot_filter_columns", False)
             logger.info(
                 f"polardb init config connection_wait_timeout:{self._connection_wait_timeout},_skip_connection_health_check:{self._skip_connection_health_check},warm_up_on_startup_by_full:{self._warm_up_on_startup_by_full},warm_up_on_startup_by_all:{self._warm_up_on_startup_by_all}"
             )
@@ -207,6 +219,14 @@ class PolarDBGraphDB(BaseGraphDB):
         )
 
         self._semaphore = threading.BoundedSemaphore(maxconn)
+        # Pooled connections whose session state (search_path) is already set.
+        self._initialized_connections: weakref.WeakSet = weakref.WeakSet()
+        if self._hot_filter_columns:
+            try:
+                self.ensure_hot_filter_columns()
+            except Exception as e:
+                logger.warning(f"Hot filter columns unavailable, using property access: {e}")
+                self._hot_filter_columns = False
         if self._warm_up_on_startup_by_full:
             self._warm_up_search_connections_by_full()
         if self._warm_up_on_startup_by_all:
@@ -290,17 +310,25 @@ class PolarDBGraphDB(BaseGraphDB):
                 conn = self.connection_pool.getconn()
                 conn.autocommit = True
                 try:
-                    with conn.cursor() as cur:
-                        cur.execute("SELECT 1")
+                    if conn not in self._initialized_connections:
+                        # First checkout: set session state once; this also proves the
+                        # connection is alive.
+                        with conn.cursor() as cur:
+                            cur.execute(
+                                f'SET search_path = {self.db_name}_graph, ag_catalog, "$user", public;'
+                            )
+                        self._initialized_connections.add(conn)
+                    elif not self._skip_connection_health_check:
+                        with conn.cursor() as cur:
+                            cur.execute("SELECT 1")
                     break
                 except psycopg2.Error:
                     logger.warning(f"Dead connection detected, recreating (attempt {attempt + 1})")
+                    self._initialized_connections.discard(conn)
                     self.connection_pool.putconn(conn, close=True)
                     conn = None
             else:
                 raise RuntimeError("Cannot obtain valid DB connection after 2 attempts")
-            with conn.cursor() as cur:
-                cur.execute(f'SET search_path = {self.db_name}_graph, ag_catalog, "$user", public;')
             yield conn
         except (psycopg2.Error, psycopg2.OperationalError) as e:
             broken = True
@@ -311,6 +339,8 @@ class PolarDBGraphDB(BaseGraphDB):
             raise
         finally:
             if conn is not None:
+                if broken:
+                    self._initialized_connections.discard(conn)
                 try:
                     self.connection_pool.putconn(conn, close=broken)
                     logger.debug(f"Returned connection {id(conn)} to pool (broken={broken})")
@@ -414,6 +444,40 @@ class PolarDBGraphDB(BaseGraphDB):
         except Exception as e:
             logger.warning(f"Failed to create indexes: {e}")
 
+    def ensure_hot_filter_columns(self) -> None:
+        """
+        Add typed generated columns and B-tree indexes for the hot filter fields.
+
+        Each field in HOT_FILTER_FIELDS is mirrored from `properties` into a stored
+        `hot_<field>` text column, so filters on it become index scans instead of a
+        per-row agtype lookup. Adding a stored column rewrites the table once; later
+        calls are no-ops.
+        """
+        table = f'"{self.db_name}_graph"."Memory"'
+        with self._get_connection() as conn, conn.cursor() as cursor:
+            for field in HOT_FILTER_FIELDS:
+                column = _hot_column_name(field)
+                cursor.execute(f"""
+                    ALTER TABLE {table}
+                    ADD COLUMN IF NOT EXISTS {column} TEXT
+                    GENERATED ALWAYS AS (ag_catalog.agtype_object_field_text(properties, '{field}')) STORED;
+                """)
+                cursor.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_memory_{column} ON {table} ({column});"
+                )
+            # Most searches filter on all three together.
+            cursor.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_memory_hot_user_type_status
+                ON {table} (hot_user_name, hot_memory_type, hot_status);
+            """)
+        logger.info(f"Hot filter columns ensured on {table}: {', '.join(HOT_FILTER_FIELDS)}")
+
+    def _property_equals_sql(self, key: str, value: str) -> str:
+        """SQL condition `properties.<key> = value`; `value` is inlined as given."""
+        if self._hot_filter_columns and key in HOT_FILTER_FIELDS:
+            return f"{_hot_column_name(key)} = '{value}'"
+        return f"ag_catalog.agtype_access_operator(properties, '\"{key}\"'::agtype) = '\"{value}\"'::agtype"
+
     def get_memory_count(self, memory_type: str, user_name: str | None = None) -> int:
         """Get count of memory nodes by type."""
         user_name = user_name if user_name else self._get_config_value("user_name")
@@ -1530,17 +1594,11 @@ class PolarDBGraphDB(BaseGraphDB):
         where_clauses = []
 
         if scope:
-            where_clauses.append(
-                f"ag_catalog.agtype_access_operator(properties, '\"memory_type\"'::agtype) = '\"{scope}\"'::agtype"
-            )
+            where_clauses.append(self._property_equals_sql("memory_type", scope))
         if status:
-            where_clauses.append(
-                f"ag_catalog.agtype_access_operator(properties, '\"status\"'::agtype) = '\"{status}\"'::agtype"
-            )
+            where_clauses.append(self._property_equals_sql("status", status))
         else:
-            where_clauses.append(
-                "ag_catalog.agtype_access_operator(properties, '\"status\"'::agtype) = '\"activated\"'::agtype"
-            )
+            where_clauses.append(self._property_equals_sql("status", "activated"))
 
         # Build user_name filter with knowledgebase_ids support (OR relationship) using common method
         user_name_conditions = self._build_user_name_and_kb_ids_conditions_sql(
@@ -1560,9 +1618,7 @@ class PolarDBGraphDB(BaseGraphDB):
         if search_filter:
             for key, value in search_filter.items():
                 if isinstance(value, str):
-                    where_clauses.append(
-                        f"ag_catalog.agtype_access_operator(properties, '\"{key}\"'::agtype) = '\"{value}\"'::agtype"
-                    )
+                    where_clauses.append(self._property_equals_sql(key, value))
                 else:
                     where_clauses.append(
                         f"ag_catalog.agtype_access_operator(properties, '\"{key}\"'::agtype) = {value}::agtype"
@@ -1629,17 +1685,11 @@ class PolarDBGraphDB(BaseGraphDB):
         where_clauses = []
 
         if scope:
-            where_clauses.append(
-                f"ag_catalog.agtype_access_operator(properties, '\"memory_type\"'::agtype) = '\"{scope}\"'::agtype"
-            )
+            where_clauses.append(self._property_equals_sql("memory_type", scope))
         if status:
-            where_clauses.append(
-                f"ag_catalog.agtype_access_operator(properties, '\"status\"'::agtype) = '\"{status}\"'::agtype"
-            )
+            where_clauses.append(self._property_equals_sql("status", status))
         else:
-            where_clauses.append(
-                "ag_catalog.agtype_access_operator(properties, '\"status\"'::agtype) = '\"activated\"'::agtype"
-            )
+            where_clauses.append(self._property_equals_sql("status", "activated"))
 
         # Build user_name filter with knowledgebase_ids support (OR relationship) using common method
         user_name_conditions = self._build_user_name_and_kb_ids_conditions_sql(
@@ -1659,9 +1709,7 @@ class PolarDBGraphDB(BaseGraphDB):
         if search_filter:
             for key, value in search_filter.items():
                 if isinstance(value, str):
-                    where_clauses.append(
-                        f"ag_catalog.agtype_access_operator(properties, '\"{key}\"'::agtype) = '\"{value}\"'::agtype"
-                    )
+                    where_clauses.append(self._property_equals_sql(key, value))
                 else:
                     where_clauses.append(
                         f"ag_catalog.agtype_access_operator(properties, '\"{key}\"'::agtype) = {value}::agtype"
@@ -1748,17 +1796,11 @@ class PolarDBGraphDB(BaseGraphDB):
         where_clauses = []
 
         if scope:
-            where_clauses.append(
-                f"ag_catalog.agtype_access_operator(properties, '\"memory_type\"'::agtype) = '\"{scope}\"'::agtype"
-            )
+            where_clauses.append(self._property_equals_sql("memory_type", scope))
         if status:
-            where_clauses.append(
-                f"ag_catalog.agtype_access_operator(properties, '\"status\"'::agtype) = '\"{status}\"'::agtype"
-            )
+            where_clauses.append(self._property_equals_sql("status", status))
         else:
-            where_clauses.append(
-                "ag_catalog.agtype_access_operator(properties, '\"status\"'::agtype) = '\"activated\"'::agtype"
-            )
+            where_clauses.append(self._property_equals_sql("status", "activated"))
 
         user_name_conditions = self._build_user_name_and_kb_ids_conditions_sql(
             user_name=user_name,
@@ -1775,9 +1817,7 @@ class PolarDBGraphDB(BaseGraphDB):
         if search_filter:
             for key, value in search_filter.items():
                 if isinstance(value, str):
-                    where_clauses.append(
-                        f"ag_catalog.agtype_access_operator(properties, '\"{key}\"'::agtype) = '\"{value}\"'::agtype"
-                    )
+                    where_clauses.append(self._property_equals_sql(key, value))
                 else:
                     where_clauses.append(
                         f"ag_catalog.agtype_access_operator(properties, '\"{key}\"'::agtype) = {value}::agtype"
@@ -1879,17 +1919,11 @@ class PolarDBGraphDB(BaseGraphDB):
         start_time = time.perf_counter()
         where_clauses = []
         if scope:
-            where_clauses.append(
-                f"ag_catalog.agtype_access_operator(properties, '\"memory_type\"'::agtype) = '\"{scope}\"'::agtype"
-            )
+            where_clauses.append(self._property_equals_sql("memory_type", scope))
         if status:
-            where_clauses.append(
-                f"ag_catalog.agtype_access_operator(properties, '\"status\"'::agtype) = '\"{status}\"'::agtype"
-            )
+            where_clauses.append(self._property_equals_sql("status", status))
         else:
-            where_clauses.append(
-                "ag_catalog.agtype_access_operator(properties, '\"status\"'::agtype) = '\"activated\"'::agtype"
-            )
+            where_clauses.append(self._property_equals_sql("status", "activated"))
         where_clauses.append("embedding is not null")
         user_name_conditions = self._build_user_name_and_kb_ids_conditions_sql(
             user_name=user_name,
@@ -1906,9 +1940,7 @@ class PolarDBGraphDB(BaseGraphDB):
         if search_filter:
             for key, value in search_filter.items():
                 if isinstance(value, str):
-                    where_clauses.append(
-                        f"ag_catalog.agtype_access_operator(properties, '\"{key}\"'::agtype) = '\"{value}\"'::agtype"
-                    )
+                    where_clauses.append(self._property_equals_sql(key, value))
                 else:
                     where_clauses.append(
                         f"ag_catalog.agtype_access_operator(properties, '\"{key}\"'::agtype) = {value}::agtype"
@@ -2206,7 +2238,7 @@ class PolarDBGraphDB(BaseGraphDB):
 
         user_name = user_name if user_name else self._get_config_value("user_name")
 
-        user_clause = f"ag_catalog.agtype_access_operator(properties, '\"user_name\"'::agtype) = '\"{user_name}\"'::agtype"
+        user_clause = self._property_equals_sql("user_name", user_name)
         if where_clause:
             where_clause = where_clause.strip()
             if where_clause.upper().startswith("WHERE"):
@@ -2225,7 +2257,7 @@ class PolarDBGraphDB(BaseGraphDB):
         if "user_name = %s" in where_clause:
             where_clause = where_clause.replace(
                 "user_name = %s",
-                f"ag_catalog.agtype_access_operator(properties, '\"user_name\"'::agtype) = '\"{user_name}\"'::agtype",
+                self._property_equals_sql("user_name", user_name),
             )
 
         cte_select_list = []
@@ -2397,9 +2429,7 @@ class PolarDBGraphDB(BaseGraphDB):
         )
 
         if user_name and not has_object_type_filter:
-            where_conditions.append(
-                f"ag_catalog.agtype_access_operator(properties, '\"user_name\"'::agtype) = '\"{user_name}\"'::agtype"
-            )
+            where_conditions.append(self._property_equals_sql("user_name", user_name))
 
         if has_object_type_filter:
             object_type_value = extracted_object_type.strip().lower()
@@ -3469,9 +3499,7 @@ class PolarDBGraphDB(BaseGraphDB):
             where_clauses.append(f"({' AND '.join(exclude_conditions)})")
 
         # Status filter - keep only 'activated'
-        where_clauses.append(
-            "ag_catalog.agtype_access_operator(properties, '\"status\"'::agtype) = '\"activated\"'::agtype"
-        )
+        where_clauses.append(self._property_equals_sql("status", "activated"))
 
         # Type filter - exclude 'reasoning' type
         where_clauses.append(
@@ -3711,6 +3739,72 @@ class PolarDBGraphDB(BaseGraphDB):
             return []
 
     @timed
+    def iter_export_nodes(
+        self,
+        page_size: int = 1000,
+        include_embedding: bool = False,
+        after_id: str | None = None,
+        user_name: str | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Yield non-deleted nodes in pages ordered by node id.
+
+        The node id lives inside the agtype properties and has no btree index,
+        so instead of re-sorting per page this reads one server-side cursor and
+        fetches `page_size` rows at a time.
+        """
+        user_name = user_name if user_name else self._get_config_value("user_name")
+        id_expr = "ag_catalog.agtype_access_operator(properties, '\"id\"'::agtype)"
+        where_conditions = [
+            "ag_catalog.agtype_access_operator(properties, '\"user_name\"'::agtype) = %s::agtype",
+            "ag_catalog.agtype_access_operator(properties, '\"status\"'::agtype) <> '\"deleted\"'::agtype",
+        ]
+        params: list[Any] = [json.dumps(user_name)]
+        if after_id is not None:
+            where_conditions.append(f"{id_expr} > %s::agtype")
+            params.append(json.dumps(after_id))
+        cols = "properties, embedding" if include_embedding else "properties"
+        query = f"""
+            SELECT {cols}
+            FROM "{self.db_name}_graph"."Memory"
+            WHERE {" AND ".join(where_conditions)}
+            ORDER BY {id_expr}
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor(name=f"export_nodes_{os.getpid()}_{id(self)}", withhold=True)
+            cursor.itersize = page_size
+            try:
+                cursor.execute(query, params)
+                while True:
+                    rows = cursor.fetchmany(page_size)
+                    if not rows:
+                        return
+                    nodes = []
+                    for row in rows:
+                        properties = row[0]
+                        if isinstance(properties, str):
+                            try:
+                                properties = json.loads(properties)
+                            except json.JSONDecodeError:
+                                properties = {}
+                        properties = dict(properties or {})
+                        properties.pop("embedding", None)
+                        if include_embedding and row[1] is not None:
+                            properties["embedding"] = row[1]
+                        nodes.append(self._parse_node(properties))
+                    yield nodes
+            finally:
+                cursor.close()
+
+    def iter_export_edges(
+        self,
+        page_size: int = 1000,
+        after: tuple[str, str, str] | None = None,
+        user_name: str | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield nothing: like `export_graph`, this backend exports nodes only."""
+        return iter(())
+
     def import_graph(self, data: dict[str, Any], user_name: str | None = None) -> None:
         """
         Import the entire graph from a serialized dictionary.
@@ -3954,17 +4048,13 @@ class PolarDBGraphDB(BaseGraphDB):
         effective_user_name = user_name if user_name else default_user_name
 
         if user_name:
-            user_name_conditions.append(
-                f"ag_catalog.agtype_access_operator(properties, '\"user_name\"'::agtype) = '\"{effective_user_name}\"'::agtype"
-            )
+            user_name_conditions.append(self._property_equals_sql("user_name", effective_user_name))
 
         # Add knowledgebase_ids conditions (checking user_name field in the data)
         if knowledgebase_ids and isinstance(knowledgebase_ids, list) and len(knowledgebase_ids) > 0:
             for kb_id in knowledgebase_ids:
                 if isinstance(kb_id, str):
-                    user_name_conditions.append(
-                        f"ag_catalog.agtype_access_operator(properties, '\"user_name\"'::agtype) = '\"{kb_id}\"'::agtype"
-                    )
+                    user_name_conditions.append(self._property_equals_sql("user_name", kb_id))
 
         return user_name_conditions
 
@@ -4479,7 +4569,7 @@ class PolarDBGraphDB(BaseGraphDB):
                                             )
                                         else:
                                             condition_parts.append(
-                                                f"ag_catalog.agtype_access_operator(properties, '\"{key}\"'::agtype) = '\"{escaped_value}\"'::agtype"
+                                                self._property_equals_sql(key, escaped_value)
                                             )
                                     elif isinstance(op_value, list):
                                         # For array fields, format list as JSON array string
@@ -4615,7 +4705,7 @@ class PolarDBGraphDB(BaseGraphDB):
                                             if isinstance(item, str):
                                                 escaped_value = escape_sql_string(item)
                                                 condition_parts.append(
-                                                    f"ag_catalog.agtype_access_operator(properties, '\"{key}\"'::agtype) = '\"{escaped_value}\"'::agtype"
+                                                    self._property_equals_sql(key, escaped_value)
                                                 )
                                             else:
                                                 condition_parts.append(
@@ -4636,7 +4726,9 @@ class PolarDBGraphDB(BaseGraphDB):
                                                 if isinstance(item, str):
                                                     escaped_value = escape_sql_string(item)
                                                     or_conditions.append(
-                                                        f"ag_catalog.agtype_access_operator(properties, '\"{key}\"'::agtype) = '\"{escaped_value}\"'::agtype"
+                                                        self._property_equals_sql(
+                                                            key, escaped_value
+                                                        )
                                                     )
                                                 else:
                                                     or_conditions.append(
@@ -4730,9 +4822,7 @@ class PolarDBGraphDB(BaseGraphDB):
                         # Direct property access (simple equality)
                         if isinstance(value, str):
                             escaped_value = escape_sql_string(value)
-                            condition_parts.append(
-                                f"ag_catalog.agtype_access_operator(properties, '\"{key}\"'::agtype) = '\"{escaped_value}\"'::agtype"
-                            )
+                            condition_parts.append(self._property_equals_sql(key, escaped_value))
                         else:
                             # For non-string values (numbers, booleans, etc.), convert to JSON string and then to agtype
                             value_json = json.dumps(value)
@@ -9,10 +9,15 @@ Tables:
 - {schema}.edges: Relationships between memory nodes
 """
 
+import hashlib
+import itertools
 import json
 import re
+import threading
 import time
 
+from collections import Counter
+from collections.abc import Callable, Iterator
 from contextlib import suppress
 from datetime import datetime
 from typing import Any, Literal
@@ -25,6 +30,14 @@ from memos.log import get_logger
 
 logger = get_logger(__name__)
 
+# Upper bound on distinct prepared statements kept per connection; queries whose
+# shape varies with the filters fall back to plain execution beyond it.
+_MAX_PREPARED_PER_CONN = 64
+# SQLSTATEs after which a prepared statement must be dropped and prepared again:
+# invalid_sql_statement_name (e.g. after DISCARD ALL) and
+# feature_not_supported ("cached plan must not change result type").
+_REPREPARE_PGCODES = {"26000", "0A000"}
+
 
 def _prepare_node_metadata(metadata: dict[str, Any]) -> dict[str, Any]:
     """Ensure metadata has proper datetime fields and normalized types."""
@@ -40,6 +53,189 @@ def _prepare_node_metadata(metadata: dict[str, Any]) -> dict[str, Any]:
     return metadata
 
 
+def _to_positional(sql: str) -> tuple[str, int]:
+    """Rewrite ``%s`` placeholders to ``$n`` for PREPARE; returns the SQL and parameter count."""
+    counter = itertools.count(1)
+    count = 0
+
+    def _replace(match: re.Match) -> str:
+        nonlocal count
+        if match.group(0) == "%%":
+            return "%"
+        count = next(counter)
+        return f"${count}"
+
+    return re.sub(r"%%|%s", _replace, sql), count
+
+
+def _vector_literal(vector: list[float]) -> str:
+    """pgvector text form of ``vector``, usable as ``%s::vector``."""
+    return "[" + ",".join(repr(float(x)) for x in vector) + "]"
+
+
+class _ConnectionPool:
+    """Thread-safe connection pool with idle-time based validation.
+
+    Unlike ``psycopg2.pool.ThreadedConnectionPool``, returned connections stay
+    open up to ``maxconn`` (psycopg2 closes every connection above ``minconn``),
+    a checkout waits up to ``wait_timeout`` for a free connection instead of
+    failing, and a connection is pinged before reuse only when it has been idle
+    for longer than ``health_check_idle_seconds``. Dead connections that are
+    noticed during a query are reported closed by psycopg2 and discarded on the
+    next checkout without a round trip.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        minconn: int,
+        maxconn: int,
+        wait_timeout: float,
+        health_check_idle_seconds: float,
+    ):
+        self._connect = connect
+        self.maxconn = max(1, maxconn)
+        self.wait_timeout = wait_timeout
+        self.health_check_idle_seconds = health_check_idle_seconds
+        self._cond = threading.Condition()
+        # LIFO stack of (connection, returned_at) so the warmest connection is reused first
+        self._idle: list[tuple[Any, float]] = []
+        self._size = 0
+        self._closed = False
+        self._prepared: dict[int, set[str]] = {}
+        self._stats: Counter[str] = Counter()
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+        for _ in range(min(max(0, minconn), self.maxconn)):
+            self._idle.append((self._open(), time.monotonic()))
+            self._size += 1
+            self._stats["opened"] += 1
+
+    def _open(self):
+        conn = self._connect()
+        conn.autocommit = True
+        return conn
+
+    def _discard(self, conn) -> None:
+        """Close ``conn`` and forget it; caller holds ``self._cond``."""
+        self._size -= 1
+        self._stats["discarded"] += 1
+        self._prepared.pop(id(conn), None)
+        with suppress(Exception):
+            conn.close()
+        self._cond.notify()
+
+    def getconn(self):
+        """Check out a connection, waiting for one to be returned if the pool is full."""
+        start = time.monotonic()
+        deadline = start + self.wait_timeout if self.wait_timeout > 0 else None
+        waited = False
+        while True:
+            with self._cond:
+                conn, returned_at = None, None
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Connection pool is closed")
+                    if self._idle:
+                        conn, returned_at = self._idle.pop()
+                        break
+                    if self._size < self.maxconn:
+                        self._size += 1
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise RuntimeError(
+                            f"Connection pool exhausted: {self.maxconn} connections in use "
+                            f"after waiting {self.wait_timeout}s"
+                        )
+                    waited = True
+                    self._cond.wait(remaining)
+                if conn is not None and conn.closed != 0:
+                    self._discard(conn)
+                    continue
+
+            if conn is None:
+                try:
+                    conn = self._open()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._stats["opened"] += 1
+            elif time.monotonic() - returned_at > self.health_check_idle_seconds:
+                self._stats["pings"] += 1
+                try:
+                    with conn.cursor() as cur:
+                        cur.execute("SELECT 1")
+                except Exception as e:
+                    logger.warning(f"Discarding dead pooled connection: {e}")
+                    with self._cond:
+                        self._stats["ping_failures"] += 1
+                        self._discard(conn)
+                    continue
+            break
+
+        wait_seconds = time.monotonic() - start
+        with self._cond:
+            self._stats["checkouts"] += 1
+            if waited:
+                self._stats["waits"] += 1
+            self._wait_seconds_total += wait_seconds
+            self._wait_seconds_max = max(self._wait_seconds_max, wait_seconds)
+        return conn
+
+    def putconn(self, conn, close: bool = False) -> None:
+        """Return ``conn`` to the pool, or close it if ``close`` or it is no longer usable."""
+        with self._cond:
+            if close or self._closed or conn.closed != 0:
+                self._discard(conn)
+                return
+            self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    def prepared_statements(self, conn) -> set[str]:
+        """Names of the statements already prepared on ``conn``."""
+        with self._cond:
+            return self._prepared.setdefault(id(conn), set())
+
+    def closeall(self) -> None:
+        with self._cond:
+            self._closed = True
+            for conn, _ in self._idle:
+                with suppress(Exception):
+                    conn.close()
+            self._size -= len(self._idle)
+            self._idle.clear()
+            self._prepared.clear()
+            self._cond.notify_all()
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            checkouts = self._stats["checkouts"]
+            in_use = self._size - len(self._idle)
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": in_use,
+                "maxconn": self.maxconn,
+                "utilization": in_use / self.maxconn,
+                "checkouts": checkouts,
+                "waits": self._stats["waits"],
+                "timeouts": self._stats["timeouts"],
+                "avg_wait_ms": self._wait_seconds_total / checkouts * 1000 if checkouts else 0.0,
+                "max_wait_ms": self._wait_seconds_max * 1000,
+                "opened": self._stats["opened"],
+                "discarded": self._stats["discarded"],
+                "pings": self._stats["pings"],
+                "ping_failures": self._stats["ping_failures"],
+                "prepared_statements": sum(len(names) for names in self._prepared.values()),
+            }
+
+
 class PostgresGraphDB(BaseGraphDB):
     """PostgreSQL + pgvector implementation of a graph memory store."""
 
@@ -51,55 +247,59 @@ class PostgresGraphDB(BaseGraphDB):
     def __init__(self, config: PostgresGraphDBConfig):
         """Initialize PostgreSQL connection pool."""
         import psycopg2
-        import psycopg2.pool
 
         self.config = config
         self.schema = config.schema_name
         self.user_name = config.user_name
         self._pool_closed = False
+        self._use_prepared_statements = config.use_prepared_statements
 
         logger.info(f"Connecting to PostgreSQL: {config.host}:{config.port}/{config.db_name}")
 
+        def _connect():
+            return psycopg2.connect(
+                host=config.host,
+                port=config.port,
+                user=config.user,
+                password=config.password,
+                dbname=config.db_name,
+                connect_timeout=30,
+                keepalives_idle=30,
+                keepalives_interval=10,
+                keepalives_count=5,
+            )
+
         # Create connection pool
-        self.pool = psycopg2.pool.ThreadedConnectionPool(
-            minconn=2,
+        self.pool = _ConnectionPool(
+            _connect,
+            minconn=config.minconn,
             maxconn=config.maxconn,
-            host=config.host,
-            port=config.port,
-            user=config.user,
-            password=config.password,
-            dbname=config.db_name,
-            connect_timeout=30,
-            keepalives_idle=30,
-            keepalives_interval=10,
-            keepalives_count=5,
+            wait_timeout=config.connection_wait_timeout,
+            health_check_idle_seconds=config.health_check_idle_seconds,
         )
 
         # Initialize schema and tables
         self._init_schema()
 
     def _get_conn(self):
-        """Get connection from pool with health check."""
+        """Get connection from pool; the pool validates connections that sat idle too long."""
+        import psycopg2
+
         if self._pool_closed:
             raise RuntimeError("Connection pool is closed")
 
+        # Only broken or closed connections are worth retrying; pool exhaustion has
+        # already waited ``wait_timeout`` and a closed pool will not recover.
         for attempt in range(3):
             conn = None
             try:
                 conn = self.pool.getconn()
-                if conn.closed != 0:
-                    self.pool.putconn(conn, close=True)
-                    continue
                 conn.autocommit = True
-                # Health check
-                with conn.cursor() as cur:
-                    cur.execute("SELECT 1")
                 return conn
-            except Exception as e:
-                if conn:
-                    with suppress(Exception):
-                        self.pool.putconn(conn, close=True)
-                if attempt == 2:
+            except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+                if conn is not None:
+                    self.pool.putconn(conn, close=True)
+                if self._pool_closed or attempt == 2:
                     raise RuntimeError(f"Failed to get connection: {e}") from e
                 time.sleep(0.1)
         raise RuntimeError("Failed to get healthy connection")
@@ -113,6 +313,42 @@ class PostgresGraphDB(BaseGraphDB):
                 with suppress(Exception):
                     conn.close()
 
+    def pool_stats(self) -> dict[str, Any]:
+        """Connection pool utilization, checkout wait times and health-check counters."""
+        return self.pool.stats()
+
+    def _execute_prepared(self, conn, cur, sql: str, params: list | tuple) -> None:
+        """Execute ``sql`` as a server-side prepared statement on ``conn``.
+
+        Statements are named after a hash of their text and prepared once per
+        connection, so repeated hot queries skip parsing and planning.
+        """
+        import psycopg2
+
+        prepared = self.pool.prepared_statements(conn)
+        name = "memos_" + hashlib.sha1(sql.encode("utf-8")).hexdigest()[:16]
+        if not self._use_prepared_statements or (
+            name not in prepared and len(prepared) >= _MAX_PREPARED_PER_CONN
+        ):
+            cur.execute(sql, params)
+            return
+
+        positional_sql, count = _to_positional(sql)
+        execute_sql = f"EXECUTE {name}" + (f" ({', '.join(['%s'] * count)})" if count else "")
+        for attempt in range(2):
+            if name not in prepared:
+                cur.execute(f"PREPARE {name} AS {positional_sql}")
+                prepared.add(name)
+            try:
+                cur.execute(execute_sql, params)
+                return
+            except psycopg2.Error as e:
+                if attempt == 1 or e.pgcode not in _REPREPARE_PGCODES:
+                    raise
+                prepared.discard(name)
+                with suppress(psycopg2.Error):
+                    cur.execute(f"DEALLOCATE {name}")
+
     def _init_schema(self):
         """Create schema and tables if they don't exist."""
         conn = self._get_conn()
@@ -242,11 +478,11 @@ class PostgresGraphDB(BaseGraphDB):
         finally:
             self._put_conn(conn)
 
-    def add_node(
-        self, id: str, memory: str, metadata: dict[str, Any], user_name: str | None = None
-    ) -> None:
-        """Add a memory node."""
-        user_name = user_name or self.user_name
+    @staticmethod
+    def _node_row(
+        id: str, memory: str, metadata: dict[str, Any], user_name: str
+    ) -> tuple[str, str, str, list[float] | None, str, str, str]:
+        """Build the ``memories`` row (embedding may be None) for a node."""
         metadata = _prepare_node_metadata(metadata.copy())
 
         # Extract embedding
@@ -259,6 +495,16 @@ class PostgresGraphDB(BaseGraphDB):
             metadata["sources"] = [
                 json.dumps(s) if not isinstance(s, str) else s for s in metadata["sources"]
             ]
+        return id, memory, json.dumps(metadata), embedding, user_name, created_at, updated_at
+
+    def add_node(
+        self, id: str, memory: str, metadata: dict[str, Any], user_name: str | None = None
+    ) -> None:
+        """Add a memory node."""
+        user_name = user_name or self.user_name
+        id, memory, properties, embedding, user_name, created_at, updated_at = self._node_row(
+            id, memory, metadata, user_name
+        )
 
         conn = self._get_conn()
         try:
@@ -275,15 +521,7 @@ class PostgresGraphDB(BaseGraphDB):
                             embedding = EXCLUDED.embedding,
                             updated_at = EXCLUDED.updated_at
                     """,
-                        (
-                            id,
-                            memory,
-                            json.dumps(metadata),
-                            embedding,
-                            user_name,
-                            created_at,
-                            updated_at,
-                        ),
+                        (id, memory, properties, embedding, user_name, created_at, updated_at),
                     )
                 else:
                     cur.execute(
@@ -296,20 +534,72 @@ class PostgresGraphDB(BaseGraphDB):
                             properties = EXCLUDED.properties,
                             updated_at = EXCLUDED.updated_at
                     """,
-                        (id, memory, json.dumps(metadata), user_name, created_at, updated_at),
+                        (id, memory, properties, user_name, created_at, updated_at),
                     )
         finally:
             self._put_conn(conn)
 
-    def add_nodes_batch(self, nodes: list[dict[str, Any]], user_name: str | None = None) -> None:
-        """Batch add memory nodes."""
-        for node in nodes:
-            self.add_node(
-                id=node["id"],
-                memory=node["memory"],
-                metadata=node.get("metadata", {}),
-                user_name=user_name,
+    def add_nodes_batch(
+        self, nodes: list[dict[str, Any]], user_name: str | None = None, page_size: int = 500
+    ) -> None:
+        """Batch add memory nodes.
+
+        Rows are sent as multi-row upserts over a single connection, one round
+        trip per ``page_size`` nodes, instead of one checkout and statement per node.
+        """
+        if not nodes:
+            return
+        from psycopg2.extras import execute_values
+
+        user_name = user_name or self.user_name
+        # Keep the last occurrence of each id: one upsert cannot touch a row twice
+        rows = {
+            node["id"]: self._node_row(
+                node["id"], node["memory"], node.get("metadata", {}), user_name
             )
+            for node in nodes
+        }
+        with_embedding = [row for row in rows.values() if row[3]]
+        # Same columns minus the embedding, which add_node also leaves untouched on conflict
+        without_embedding = [row[:3] + row[4:] for row in rows.values() if not row[3]]
+
+        conn = self._get_conn()
+        try:
+            with conn.cursor() as cur:
+                if with_embedding:
+                    execute_values(
+                        cur,
+                        f"""
+                        INSERT INTO {self.schema}.memories
+                        (id, memory, properties, embedding, user_name, created_at, updated_at)
+                        VALUES %s
+                        ON CONFLICT (id) DO UPDATE SET
+                            memory = EXCLUDED.memory,
+                            properties = EXCLUDED.properties,
+                            embedding = EXCLUDED.embedding,
+                            updated_at = EXCLUDED.updated_at
+                    """,
+                        with_embedding,
+                        template="(%s, %s, %s, %s::vector, %s, %s, %s)",
+                        page_size=page_size,
+                    )
+                if without_embedding:
+                    execute_values(
+                        cur,
+                        f"""
+                        INSERT INTO {self.schema}.memories
+                        (id, memory, properties, user_name, created_at, updated_at)
+                        VALUES %s
+                        ON CONFLICT (id) DO UPDATE SET
+                            memory = EXCLUDED.memory,
+                            properties = EXCLUDED.properties,
+                            updated_at = EXCLUDED.updated_at
+                    """,
+                        without_embedding,
+                        page_size=page_size,
+                    )
+        finally:
+            self._put_conn(conn)
 
     def update_node(self, id: str, fields: dict[str, Any], user_name: str | None = None) -> None:
         """Update node fields."""
@@ -414,12 +704,14 @@ class PostgresGraphDB(BaseGraphDB):
                 cols = "id, memory, properties, created_at, updated_at"
                 if include_embedding:
                     cols += ", embedding"
-                cur.execute(
+                self._execute_prepared(
+                    conn,
+                    cur,
                     f"""
                     SELECT {cols} FROM {self.schema}.memories
                     WHERE id = ANY(%s) AND user_name = %s
                 """,
-                    (ids, user_name),
+                    (list(ids), user_name),
                 )
                 return [self._parse_row(row, include_embedding) for row in cur.fetchall()]
         finally:
@@ -807,9 +1099,93 @@ class PostgresGraphDB(BaseGraphDB):
         **kwargs,
     ) -> list[dict]:
         """Search nodes by vector similarity using pgvector."""
-        user_name = user_name or self.user_name
+        where_clause, params = self._embedding_search_conditions(
+            scope, status, search_filter, user_name or self.user_name
+        )
 
-        # Build WHERE clause
+        # pgvector cosine distance: 1 - (a <=> b) gives similarity score
+        conn = self._get_conn()
+        try:
+            with conn.cursor() as cur:
+                vector_literal = _vector_literal(vector)
+                self._execute_prepared(
+                    conn,
+                    cur,
+                    f"""
+                    SELECT id, 1 - (embedding <=> %s::vector) as score
+                    FROM {self.schema}.memories
+                    WHERE {where_clause}
+                    ORDER BY embedding <=> %s::vector
+                    LIMIT %s
+                """,
+                    (vector_literal, *params, vector_literal, top_k),
+                )
+
+                results = []
+                for row in cur.fetchall():
+                    score = float(row[1])
+                    if threshold is None or score >= threshold:
+                        results.append({"id": row[0], "score": score})
+                return results
+        finally:
+            self._put_conn(conn)
+
+    def search_batch(
+        self,
+        vectors: list[list[float]],
+        top_k: int = 5,
+        scope: str | None = None,
+        status: str | None = None,
+        threshold: float | None = None,
+        search_filter: dict | None = None,
+        user_name: str | None = None,
+        **kwargs,
+    ) -> list[list[dict]]:
+        """Search several query vectors in one round trip with a LATERAL top-k per vector."""
+        if not vectors:
+            return []
+        where_clause, params = self._embedding_search_conditions(
+            scope, status, search_filter, user_name or self.user_name
+        )
+
+        conn = self._get_conn()
+        try:
+            with conn.cursor() as cur:
+                self._execute_prepared(
+                    conn,
+                    cur,
+                    f"""
+                    SELECT q.idx, m.id, m.score
+                    FROM unnest(%s::text[]) WITH ORDINALITY AS q(vec, idx)
+                    CROSS JOIN LATERAL (
+                        SELECT id, 1 - (embedding <=> q.vec::vector) as score
+                        FROM {self.schema}.memories
+                        WHERE {where_clause}
+                        ORDER BY embedding <=> q.vec::vector
+                        LIMIT %s
+                    ) m
+                    ORDER BY q.idx, m.score DESC
+                """,
+                    ([_vector_literal(v) for v in vectors], *params, top_k),
+                )
+
+                results: list[list[dict]] = [[] for _ in vectors]
+                for idx, node_id, score in cur.fetchall():
+                    score = float(score)
+                    if threshold is None or score >= threshold:
+                        results[idx - 1].append({"id": node_id, "score": score})
+                return results
+        finally:
+            self._put_conn(conn)
+
+    def _embedding_search_conditions(
+        self,
+        scope: str | None,
+        status: str | None,
+        search_filter: dict | None,
+        user_name: str | None,
+    ) -> tuple[str, list[Any]]:
+        """WHERE clause and parameters shared by the vector search queries."""
         conditions = ["embedding IS NOT NULL"]
         params = []
 
@@ -834,31 +1210,7 @@ class PostgresGraphDB(BaseGraphDB):
                 conditions.append(f"properties->>'{k}' = %s")
                 params.append(str(v))
 
-        where_clause = " AND ".join(conditions)
-
-        # pgvector cosine distance: 1 - (a <=> b) gives similarity score
-        conn = self._get_conn()
-        try:
-            with conn.cursor() as cur:
-                cur.execute(
-                    f"""
-                    SELECT id, 1 - (embedding <=> %s::vector) as score
-                    FROM {self.schema}.memories
-                    WHERE {where_clause}
-                    ORDER BY embedding <=> %s::vector
-                    LIMIT %s
-                """,
-                    (vector, *params, vector, top_k),
-                )
-
-                results = []
-                for row in cur.fetchall():
-                    score = float(row[1])
-                    if threshold is None or score >= threshold:
-                        results.append({"id": row[0], "score": score})
-                return results
-        finally:
-            self._put_conn(conn)
+        return " AND ".join(conditions), params
 
     def get_by_metadata(
         self,
@@ -907,7 +1259,9 @@ class PostgresGraphDB(BaseGraphDB):
         conn = self._get_conn()
         try:
             with conn.cursor() as cur:
-                cur.execute(
+                self._execute_prepared(
+                    conn,
+                    cur,
                     f"""
                     SELECT id FROM {self.schema}.memories
                     WHERE {where_clause}
@@ -1147,6 +1501,90 @@ class PostgresGraphDB(BaseGraphDB):
         finally:
             self._put_conn(conn)
 
+    def iter_export_nodes(
+        self,
+        page_size: int = 1000,
+        include_embedding: bool = False,
+        after_id: str | None = None,
+        user_name: str | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield nodes in pages ordered by id, using the primary key as cursor."""
+        user_name = user_name or self.user_name
+        cols = "id, memory, properties, created_at, updated_at"
+        if include_embedding:
+            cols += ", embedding"
+        while True:
+            conn = self._get_conn()
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        f"""
+                        SELECT {cols} FROM {self.schema}.memories
+                        WHERE user_name = %s AND (%s IS NULL OR id > %s)
+                        ORDER BY id
+                        LIMIT %s
+                    """,
+                        (user_name, after_id, after_id, page_size),
+                    )
+                    rows = cur.fetchall()
+            finally:
+                self._put_conn(conn)
+            if not rows:
+                return
+            yield [self._parse_row(row, include_embedding) for row in rows]
+            if len(rows) < page_size:
+                return
+            after_id = rows[-1][0]
+
+    def iter_export_edges(
+        self,
+        page_size: int = 1000,
+        after: tuple[str, str, str] | None = None,
+        user_name: str | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield edges touching the user's nodes in pages keyed by (source, target, type)."""
+        user_name = user_name or self.user_name
+        while True:
+            source, target, edge_type = after or ("", "", "")
+            conn = self._get_conn()
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        f"""
+                        SELECT e.source_id, e.target_id, e.edge_type
+                        FROM {self.schema}.edges e
+                        WHERE (
+                            e.source_id IN (
+                                SELECT id FROM {self.schema}.memories WHERE user_name = %s
+                            )
+                            OR e.target_id IN (
+                                SELECT id FROM {self.schema}.memories WHERE user_name = %s
+                            )
+                        )
+                        AND (%s OR (e.source_id, e.target_id, e.edge_type) > (%s, %s, %s))
+                        ORDER BY e.source_id, e.target_id, e.edge_type
+                        LIMIT %s
+                    """,
+                        (
+                            user_name,
+                            user_name,
+                            after is None,
+                            source,
+                            target,
+                            edge_type,
+                            page_size,
+                        ),
+                    )
+                    rows = cur.fetchall()
+            finally:
+                self._put_conn(conn)
+            if not rows:
+                return
+            yield [{"source": row[0], "target": row[1], "type": row[2]} for row in rows]
+            if len(rows) < page_size:
+                return
+            after = tuple(rows[-1])
+
     def import_graph(self, data: dict[str, Any], user_name: str | None = None) -> None:
         """Import graph data."""
         user_name = user_name or self.user_name
@@ -0,0 +1,1669 @@
+"""
+Embedded SQLite backend for MemOS.
+
+Runs entirely in-process: no external database server is required.
+
+Tables:
+- memories: Memory nodes with JSON properties and float32 embedding blobs
+- edges: Relationships between memory nodes
+
+Vector search is served from an in-process cosine index (a NumPy matrix of
+normalized embeddings) that is loaded once at startup and kept in sync on
+every write. Metadata filters are evaluated by SQLite first, and similarity is
+then computed only over the surviving candidate rows.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Literal
+
+import numpy as np
+
+from memos.configs.graph_db import SQLiteGraphDBConfig
+from memos.graph_dbs.base import BaseGraphDB
+from memos.log import get_logger
+
+
+logger = get_logger(__name__)
+
+# Node properties promoted to real (indexed) columns; they are also kept in `properties`.
+_COLUMN_FIELDS = ("memory_type", "status")
+_DIRECT_COLUMNS = {"id", "memory", "user_name", "created_at", "updated_at", *_COLUMN_FIELDS}
+_ARRAY_FIELDS = {"tags", "sources", "file_ids"}
+_SAFE_FIELD_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_NODE_COLUMNS = "id, memory, properties, user_name, created_at, updated_at"
+
+
+def _prepare_node_metadata(metadata: dict[str, Any]) -> dict[str, Any]:
+    """Ensure metadata has proper datetime fields and normalized types."""
+    now = datetime.utcnow().isoformat()
+    metadata.setdefault("created_at", now)
+    metadata.setdefault("updated_at", now)
+
+    # Normalize embedding type
+    embedding = metadata.get("embedding")
+    if embedding is not None and not isinstance(embedding, list):
+        metadata["embedding"] = [float(x) for x in embedding]
+
+    return metadata
+
+
+def _to_iso(value: Any) -> str:
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+class _VectorIndex:
+    """In-process cosine index over normalized float32 embeddings.
+
+    Rows are addressed by node id. Deleted rows are recycled through a free list
+    so the matrix only grows when the live node count does.
+    """
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+        self._matrix = np.zeros((0, dimension), dtype=np.float32)
+        self._row_ids: list[str | None] = []
+        self._positions: dict[str, int] = {}
+        self._free_rows: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._positions
+
+    def _normalize(self, vector: Any) -> np.ndarray:
+        arr = np.asarray(vector, dtype=np.float32).reshape(-1)
+        if arr.shape[0] != self.dimension:
+            raise ValueError(
+                f"Embedding dimension mismatch: expected {self.dimension}, got {arr.shape[0]}"
+            )
+        norm = float(np.linalg.norm(arr))
+        return arr / norm if norm > 0 else arr
+
+    def upsert(self, node_id: str, vector: Any) -> None:
+        row = self._normalize(vector)
+        pos = self._positions.get(node_id)
+        if pos is None:
+            if self._free_rows:
+                pos = self._free_rows.pop()
+                self._row_ids[pos] = node_id
+            else:
+                pos = len(self._row_ids)
+                if pos >= self._matrix.shape[0]:
+                    grown = np.zeros((max(64, pos * 2), self.dimension), dtype=np.float32)
+                    grown[:pos] = self._matrix[:pos]
+                    self._matrix = grown
+                self._row_ids.append(node_id)
+            self._positions[node_id] = pos
+        self._matrix[pos] = row
+
+    def remove(self, node_id: str) -> None:
+        pos = self._positions.pop(node_id, None)
+        if pos is None:
+            return
+        self._matrix[pos] = 0.0
+        self._row_ids[pos] = None
+        self._free_rows.append(pos)
+
+    def clear(self) -> None:
+        self.__init__(self.dimension)
+
+    def search(
+        self, vector: Any, candidate_ids: list[str] | None, top_k: int
+    ) -> list[tuple[str, float]]:
+        """Return up to `top_k` (id, cosine score) pairs, best first.
+
+        If `candidate_ids` is given, only those rows are scored.
+        """
+        return self.search_batch([vector], candidate_ids, top_k)[0]
+
+    def search_batch(
+        self, vectors: list[Any], candidate_ids: list[str] | None, top_k: int
+    ) -> list[list[tuple[str, float]]]:
+        """`search` for several vectors, scoring all of them in one matrix product."""
+        if top_k <= 0 or not self._positions or not vectors:
+            return [[] for _ in vectors]
+        queries = np.stack([self._normalize(vector) for vector in vectors])
+        if candidate_ids is None:
+            rows = np.fromiter(self._positions.values(), dtype=np.int64)
+        else:
+            rows = np.fromiter(
+                (self._positions[i] for i in candidate_ids if i in self._positions),
+                dtype=np.int64,
+            )
+        if rows.size == 0:
+            return [[] for _ in vectors]
+
+        all_scores = self._matrix[rows] @ queries.T
+        k = min(top_k, rows.size)
+        results = []
+        for scores in all_scores.T:
+            if k < rows.size:
+                top = np.argpartition(-scores, k - 1)[:k]
+                top = top[np.argsort(-scores[top])]
+            else:
+                top = np.argsort(-scores)
+            results.append([(self._row_ids[rows[i]], float(scores[i])) for i in top])
+        return results
+
+
+class SQLiteGraphDB(BaseGraphDB):
+    """Embedded SQLite implementation of a graph memory store with an in-process vector index."""
+
+    def __init__(self, config: SQLiteGraphDBConfig):
+        """Open (or create) the SQLite database and load the vector index."""
+        self.config = config
+        self.user_name = config.user_name
+        self._lock = threading.RLock()
+
+        logger.info(f"Opening embedded SQLite graph store: {config.db_path}")
+        self.conn = sqlite3.connect(
+            config.db_path,
+            timeout=config.busy_timeout,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        if config.db_path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+
+        self._index = _VectorIndex(config.embedding_dimension)
+        # Vector index changes queued by the open transaction, applied on COMMIT.
+        self._index_ops: list[Callable[[], None]] | None = None
+        self._init_schema()
+        self._load_vector_index()
+
+    def _init_schema(self) -> None:
+        """Create tables and indexes if they don't exist."""
+        with self._lock:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS memories (
+                    id TEXT PRIMARY KEY,
+                    memory TEXT NOT NULL DEFAULT '',
+                    properties TEXT NOT NULL DEFAULT '{}',
+                    embedding BLOB,
+                    user_name TEXT,
+                    memory_type TEXT,
+                    status TEXT,
+                    created_at TEXT,
+                    updated_at TEXT
+                );
+                CREATE TABLE IF NOT EXISTS edges (
+                    source_id TEXT NOT NULL REFERENCES memories(id) ON DELETE CASCADE,
+                    target_id TEXT NOT NULL REFERENCES memories(id) ON DELETE CASCADE,
+                    edge_type TEXT NOT NULL,
+                    PRIMARY KEY (source_id, target_id, edge_type)
+                );
+                CREATE INDEX IF NOT EXISTS idx_memories_user_type_status
+                    ON memories(user_name, memory_type, status);
+                CREATE INDEX IF NOT EXISTS idx_memories_updated ON memories(updated_at);
+                CREATE INDEX IF NOT EXISTS idx_edges_target ON edges(target_id, edge_type);
+            """)
+
+    def _load_vector_index(self) -> None:
+        """Populate the in-process vector index from stored embeddings."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT id, embedding FROM memories WHERE embedding IS NOT NULL"
+            ).fetchall()
+            for node_id, blob in rows:
+                vector = np.frombuffer(blob, dtype=np.float32)
+                if vector.shape[0] != self._index.dimension:
+                    logger.warning(
+                        f"[SQLiteGraphDB] Skipping embedding of node {node_id}: "
+                        f"dimension {vector.shape[0]} != {self._index.dimension}"
+                    )
+                    continue
+                self._index.upsert(node_id, vector)
+        logger.info(f"[SQLiteGraphDB] Loaded {len(self._index)} embeddings into vector index")
+
+    @contextmanager
+    def _transaction(self):
+        """Run a block of statements atomically."""
+        with self._lock:
+            self.conn.execute("BEGIN")
+            self._index_ops = []
+            try:
+                yield self.conn
+            except Exception:
+                self._index_ops = None
+                self.conn.execute("ROLLBACK")
+                raise
+            ops, self._index_ops = self._index_ops, None
+            self.conn.execute("COMMIT")
+            # The in-memory index only follows the table once the rows are committed.
+            for op in ops:
+                op()
+
+    def _index_upsert(self, id: str, vector: np.ndarray) -> None:
+        self._queue_index_op(lambda: self._index.upsert(id, vector))
+
+    def _index_remove(self, id: str) -> None:
+        self._queue_index_op(lambda: self._index.remove(id))
+
+    def _queue_index_op(self, op: Callable[[], None]) -> None:
+        if self._index_ops is None:
+            op()
+        else:
+            self._index_ops.append(op)
+
+    def _query(self, sql: str, params: list | tuple = ()) -> list[tuple]:
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    # =========================================================================
+    # Row (de)serialization
+    # =========================================================================
+
+    def _write_node(
+        self, conn: sqlite3.Connection, id: str, memory: str, metadata: dict[str, Any], user_name
+    ) -> None:
+        """Upsert a single node inside an open transaction and sync the vector index."""
+        metadata = _prepare_node_metadata(dict(metadata))
+        embedding = metadata.pop("embedding", None)
+        created_at = _to_iso(metadata.pop("created_at"))
+        updated_at = _to_iso(metadata.pop("updated_at"))
+        metadata.pop("user_name", None)
+
+        blob = None
+        if embedding is not None and len(embedding):
+            vector = np.asarray(embedding, dtype=np.float32)
+            self._index_upsert(id, vector)
+            blob = vector.tobytes()
+        else:
+            self._index_remove(id)
+
+        conn.execute(
+            """
+            INSERT INTO memories
+                (id, memory, properties, embedding, user_name, memory_type, status,
+                 created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                memory = excluded.memory,
+                properties = excluded.properties,
+                embedding = excluded.embedding,
+                user_name = excluded.user_name,
+                memory_type = excluded.memory_type,
+                status = excluded.status,
+                updated_at = excluded.updated_at
+            """,
+            (
+                id,
+                memory or "",
+                json.dumps(metadata, ensure_ascii=False, default=str),
+                blob,
+                user_name,
+                metadata.get("memory_type"),
+                metadata.get("status"),
+                created_at,
+                updated_at,
+            ),
+        )
+
+    @staticmethod
+    def _parse_row(row: tuple) -> dict[str, Any]:
+        """Parse a `_NODE_COLUMNS` row (optionally followed by an embedding blob) into a node dict."""
+        props = json.loads(row[2] or "{}")
+        props["created_at"] = row[4]
+        props["updated_at"] = row[5]
+        if len(row) > 6 and row[6] is not None:
+            props["embedding"] = np.frombuffer(row[6], dtype=np.float32).tolist()
+        return {"id": row[0], "memory": row[1] or "", "metadata": props}
+
+    def _select_nodes(
+        self, where_clause: str, params: list, include_embedding: bool = False, suffix: str = ""
+    ) -> list[dict[str, Any]]:
+        cols = _NODE_COLUMNS + (", embedding" if include_embedding else "")
+        rows = self._query(
+            f"SELECT {cols} FROM memories WHERE {where_clause or '1 = 1'} {suffix}", params
+        )
+        return [self._parse_row(row if include_embedding else row[:6]) for row in rows]
+
+    # =========================================================================
+    # Filter building
+    # =========================================================================
+
+    @staticmethod
+    def _is_safe_field_name(field: str) -> bool:
+        """Validate field names used in dynamic SQL fragments."""
+        return bool(_SAFE_FIELD_RE.match(field))
+
+    def _field_expr(self, key: str) -> tuple[str, str]:
+        """
+        Build the SQL value expression and JSON path for a filter key.
+
+        Returns:
+            tuple[value_expr, json_path]
+        """
+        if key in _DIRECT_COLUMNS:
+            return key, f"$.{key}"
+
+        if key.startswith("info."):
+            sub_key = key[5:]
+            if not self._is_safe_field_name(sub_key):
+                raise ValueError(f"Invalid filter field: {key}")
+            path = f"$.info.{sub_key}"
+        else:
+            if not self._is_safe_field_name(key):
+                raise ValueError(f"Invalid filter field: {key}")
+            path = f"$.{key}"
+        return f"json_extract(properties, '{path}')", path
+
+    @staticmethod
+    def _array_contains(path: str, values: list[Any], params: list[Any]) -> str:
+        params.extend(values)
+        placeholders = ", ".join("?" * len(values))
+        return (
+            f"EXISTS (SELECT 1 FROM json_each(memories.properties, '{path}') "
+            f"WHERE json_each.value IN ({placeholders}))"
+        )
+
+    def _build_single_filter_condition(
+        self, condition_dict: dict[str, Any], params: list[Any]
+    ) -> str | None:
+        """Build SQL for a single filter condition dict."""
+        if not condition_dict:
+            return None
+
+        parts: list[str] = []
+        for key, value in condition_dict.items():
+            expr, path = self._field_expr(key)
+            raw_key = key[5:] if key.startswith("info.") else key
+
+            if isinstance(value, dict):
+                for op, op_value in value.items():
+                    if op in ("gt", "lt", "gte", "lte"):
+                        sql_op = {"gt": ">", "lt": "<", "gte": ">=", "lte": "<="}[op]
+                        if raw_key.endswith("_at"):
+                            parts.append(f"julianday({expr}) {sql_op} julianday(?)")
+                        else:
+                            parts.append(f"CAST({expr} AS REAL) {sql_op} ?")
+                        params.append(op_value)
+                    elif op == "contains":
+                        if raw_key in _ARRAY_FIELDS:
+                            parts.append(self._array_contains(path, [op_value], params))
+                        else:
+                            parts.append(f"instr({expr}, ?) > 0")
+                            params.append(str(op_value))
+                    elif op == "in":
+                        if not isinstance(op_value, list):
+                            raise ValueError(
+                                f"in operator expects list for '{key}', got {type(op_value).__name__}"
+                            )
+                        if not op_value:
+                            parts.append("0")
+                        elif raw_key in _ARRAY_FIELDS:
+                            parts.append(self._array_contains(path, op_value, params))
+                        else:
+                            parts.append(f"{expr} IN ({', '.join('?' * len(op_value))})")
+                            params.extend(op_value)
+                    elif op == "like":
+                        parts.append(f"{expr} LIKE ?")
+                        params.append(f"%{op_value}%")
+                    else:
+                        raise ValueError(f"Unsupported filter operator: {op}")
+            elif raw_key in _ARRAY_FIELDS:
+                values = value if isinstance(value, list) else [value]
+                for v in values:
+                    parts.append(self._array_contains(path, [v], params))
+            else:
+                parts.append(f"{expr} = ?")
+                params.append(value)
+
+        return " AND ".join(parts) if parts else None
+
+    def _build_filter_where_clause(self, filter_dict: dict[str, Any], params: list[Any]) -> str:
+        """Build SQL WHERE fragment from an `and`/`or` filter dict."""
+        if not filter_dict:
+            return ""
+
+        for logic in ("and", "or"):
+            if logic in filter_dict:
+                conditions = filter_dict.get(logic)
+                if not isinstance(conditions, list):
+                    raise ValueError(f"Invalid filter format: '{logic}' must be a list")
+                parts = []
+                for cond in conditions:
+                    if isinstance(cond, dict):
+                        cond_sql = self._build_single_filter_condition(cond, params)
+                        if cond_sql:
+                            parts.append(f"({cond_sql})")
+                if not parts:
+                    return ""
+                return f"({f' {logic.upper()} '.join(parts)})"
+
+        return self._build_single_filter_condition(filter_dict, params) or ""
+
+    def _build_user_name_and_kb_ids_conditions(
+        self,
+        user_name: str | None,
+        knowledgebase_ids: list[str] | None,
+        params: list[Any],
+    ) -> str | None:
+        """Build the `user_name` / knowledgebase_ids isolation condition (OR relationship)."""
+        user_names = []
+        effective_user_name = user_name or self.user_name
+        if effective_user_name:
+            user_names.append(effective_user_name)
+        if knowledgebase_ids:
+            user_names.extend(kb for kb in knowledgebase_ids if isinstance(kb, str))
+        if not user_names:
+            return None
+        params.extend(user_names)
+        return f"user_name IN ({', '.join('?' * len(user_names))})"
+
+    def _build_search_conditions(
+        self,
+        scope: str | None = None,
+        status: str | None = None,
+        search_filter: dict | None = None,
+        user_name: str | None = None,
+        filter: dict | None = None,
+        knowledgebase_ids: list[str] | None = None,
+        default_activated: bool = True,
+    ) -> tuple[str, list[Any]]:
+        conditions: list[str] = []
+        params: list[Any] = []
+
+        user_cond = self._build_user_name_and_kb_ids_conditions(
+            user_name, knowledgebase_ids, params
+        )
+        if user_cond:
+            conditions.append(user_cond)
+        if scope:
+            conditions.append("memory_type = ?")
+            params.append(scope)
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        elif default_activated:
+            conditions.append("(status = 'activated' OR status IS NULL)")
+        if search_filter:
+            for key, value in search_filter.items():
+                expr, _ = self._field_expr(key)
+                conditions.append(f"{expr} = ?")
+                params.append(value)
+        if filter:
+            filter_sql = self._build_filter_where_clause(filter, params)
+            if filter_sql:
+                conditions.append(filter_sql)
+
+        return " AND ".join(conditions), params
+
+    def _user_clause(self, user_name: str | None, alias: str = "") -> tuple[str, list[Any]]:
+        user_name = user_name or self.user_name
+        if not user_name:
+            return "1 = 1", []
+        return f"{alias}user_name = ?", [user_name]
+
+    # =========================================================================
+    # Node Management
+    # =========================================================================
+
+    def get_memory_count(self, memory_type: str, user_name: str | None = None) -> int:
+        user_clause, params = self._user_clause(user_name)
+        rows = self._query(
+            f"SELECT COUNT(*) FROM memories WHERE memory_type = ? AND {user_clause}",
+            [memory_type, *params],
+        )
+        return rows[0][0]
+
+    def node_not_exist(self, scope: str, user_name: str | None = None) -> bool:
+        user_clause, params = self._user_clause(user_name)
+        rows = self._query(
+            f"SELECT 1 FROM memories WHERE memory_type = ? AND {user_clause} LIMIT 1",
+            [scope, *params],
+        )
+        return not rows
+
+    def remove_oldest_memory(
+        self, memory_type: str, keep_latest: int, user_name: str | None = None
+    ) -> None:
+        """
+        Remove all memories of a given type except the latest `keep_latest` entries.
+
+        Args:
+            memory_type: Memory type (e.g., 'WorkingMemory', 'LongTermMemory').
+            keep_latest: Number of latest entries to keep.
+            user_name: User to filter by.
+        """
+        user_clause, params = self._user_clause(user_name)
+        with self._transaction() as conn:
+            ids = [
+                row[0]
+                for row in conn.execute(
+                    f"""
+                    SELECT id FROM memories
+                    WHERE memory_type = ? AND {user_clause}
+                    ORDER BY updated_at DESC
+                    LIMIT -1 OFFSET ?
+                    """,
+                    [memory_type, *params, int(keep_latest)],
+                ).fetchall()
+            ]
+            self._delete_ids(conn, ids)
+        if ids:
+            logger.info(f"Removed {len(ids)} oldest {memory_type} memories")
+
+    def _delete_ids(self, conn: sqlite3.Connection, ids: list[str]) -> int:
+        """Delete nodes (edges cascade) inside an open transaction."""
+        deleted = 0
+        for start in range(0, len(ids), 500):
+            chunk = ids[start : start + 500]
+            cur = conn.execute(
+                f"DELETE FROM memories WHERE id IN ({', '.join('?' * len(chunk))})", chunk
+            )
+            deleted += cur.rowcount
+            for node_id in chunk:
+                self._index_remove(node_id)
+        return deleted
+
+    def add_node(
+        self, id: str, memory: str, metadata: dict[str, Any], user_name: str | None = None
+    ) -> None:
+        """Add a memory node."""
+        with self._transaction() as conn:
+            self._write_node(conn, id, memory, metadata, user_name or self.user_name)
+
+    def add_nodes_batch(self, nodes: list[dict[str, Any]], user_name: str | None = None) -> None:
+        """
+        Batch add multiple memory nodes in a single transaction.
+
+        Args:
+            nodes: List of node dictionaries, each containing:
+                - id: str - Node ID
+                - memory: str - Memory content
+                - metadata: dict[str, Any] - Node metadata
+            user_name: Optional user name (will use config default if not provided)
+        """
+        if not nodes:
+            logger.warning("[add_nodes_batch] Empty nodes list, skipping")
+            return
+
+        effective_user_name = user_name or self.user_name
+        with self._transaction() as conn:
+            for node in nodes:
+                self._write_node(
+                    conn,
+                    node["id"],
+                    node.get("memory", ""),
+                    node.get("metadata", {}),
+                    effective_user_name,
+                )
+        logger.info(f"[add_nodes_batch] Successfully inserted {len(nodes)} nodes")
+
+    def update_node(self, id: str, fields: dict[str, Any], user_name: str | None = None) -> None:
+        """Update node fields, merging them into the stored properties."""
+        if not fields:
+            return
+        fields = dict(fields)
+        user_clause, params = self._user_clause(user_name)
+        with self._transaction() as conn:
+            row = conn.execute(
+                f"SELECT memory, properties FROM memories WHERE id = ? AND {user_clause}",
+                [id, *params],
+            ).fetchone()
+            if not row:
+                return
+
+            props = json.loads(row[1] or "{}")
+            memory = fields.pop("memory", row[0])
+            embedding = fields.pop("embedding", None)
+            created_at = fields.pop("created_at", None)
+            updated_at = _to_iso(fields.pop("updated_at", None) or datetime.utcnow().isoformat())
+            fields.pop("user_name", None)
+            props.update(fields)
+
+            conn.execute(
+                """
+                UPDATE memories
+                SET memory = ?, properties = ?, memory_type = ?, status = ?, updated_at = ?,
+                    created_at = COALESCE(?, created_at)
+                WHERE id = ?
+                """,
+                (
+                    memory,
+                    json.dumps(props, ensure_ascii=False, default=str),
+                    props.get("memory_type"),
+                    props.get("status"),
+                    updated_at,
+                    None if created_at is None else _to_iso(created_at),
+                    id,
+                ),
+            )
+            if embedding is not None and len(embedding):
+                vector = np.asarray(embedding, dtype=np.float32)
+                self._index_upsert(id, vector)
+                conn.execute(
+                    "UPDATE memories SET embedding = ? WHERE id = ?", (vector.tobytes(), id)
+                )
+
+    def delete_node(self, id: str, user_name: str | None = None) -> None:
+        """Delete a node and its edges."""
+        user_clause, params = self._user_clause(user_name)
+        with self._transaction() as conn:
+            cur = conn.execute(
+                f"DELETE FROM memories WHERE id = ? AND {user_clause}", [id, *params]
+            )
+            if cur.rowcount:
+                self._index_remove(id)
+
+    def get_node(self, id: str, include_embedding: bool = False, **kwargs) -> dict[str, Any] | None:
+        """Get a single node by ID."""
+        user_clause, params = self._user_clause(kwargs.get("user_name"))
+        nodes = self._select_nodes(
+            f"id = ? AND {user_clause}", [id, *params], include_embedding=include_embedding
+        )
+        return nodes[0] if nodes else None
+
+    def get_nodes(
+        self, ids: list, include_embedding: bool = False, **kwargs
+    ) -> list[dict[str, Any]]:
+        """Get multiple nodes by IDs."""
+        if not ids:
+            return []
+        user_clause, params = self._user_clause(kwargs.get("cube_name") or kwargs.get("user_name"))
+        nodes = []
+        for start in range(0, len(ids), 500):
+            chunk = list(ids[start : start + 500])
+            nodes.extend(
+                self._select_nodes(
+                    f"id IN ({', '.join('?' * len(chunk))}) AND {user_clause}",
+                    [*chunk, *params],
+                    include_embedding=include_embedding,
+                )
+            )
+        return nodes
+
+    def delete_node_by_prams(
+        self,
+        writable_cube_ids: list[str] | None = None,
+        memory_ids: list[str] | None = None,
+        file_ids: list[str] | None = None,
+        filter: dict | None = None,
+    ) -> int:
+        """Delete nodes by memory_ids, file_ids, or filter."""
+        logger.info(
+            "[delete_node_by_prams] memory_ids: %s, file_ids: %s, filter: %s, writable_cube_ids: %s",
+            memory_ids,
+            file_ids,
+            filter,
+            writable_cube_ids,
+        )
+        conditions: list[str] = []
+        params: list[Any] = []
+
+        if memory_ids:
+            conditions.append(f"id IN ({', '.join('?' * len(memory_ids))})")
+            params.extend(memory_ids)
+        if file_ids:
+            conditions.append(self._array_contains("$.file_ids", list(file_ids), params))
+        if filter:
+            filter_sql = self._build_filter_where_clause(filter, params)
+            if filter_sql:
+                conditions.append(filter_sql)
+
+        if not conditions:
+            logger.warning(
+                "[delete_node_by_prams] No nodes to delete (no memory_ids, file_ids, or filter provided)"
+            )
+            return 0
+
+        if writable_cube_ids:
+            conditions.append(f"user_name IN ({', '.join('?' * len(writable_cube_ids))})")
+            params.extend(writable_cube_ids)
+
+        with self._transaction() as conn:
+            ids = [
+                row[0]
+                for row in conn.execute(
+                    f"SELECT id FROM memories WHERE {' AND '.join(conditions)}", params
+                ).fetchall()
+            ]
+            deleted_count = self._delete_ids(conn, ids)
+        logger.info("[delete_node_by_prams] Deleted %s nodes", deleted_count)
+        return deleted_count
+
+    def delete_node_by_mem_cube_id(
+        self,
+        mem_cube_id: str | None = None,
+        delete_record_id: str | None = None,
+        hard_delete: bool = False,
+    ) -> int:
+        """Hard-delete or soft-delete (status='deleted') every node of a cube."""
+        if not mem_cube_id or not delete_record_id:
+            logger.warning(
+                "[delete_node_by_mem_cube_id] mem_cube_id and delete_record_id are required"
+            )
+            return 0
+
+        with self._transaction() as conn:
+            if hard_delete:
+                ids = [
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT id FROM memories WHERE user_name = ? "
+                        "AND json_extract(properties, '$.delete_record_id') = ?",
+                        (mem_cube_id, delete_record_id),
+                    ).fetchall()
+                ]
+                return self._delete_ids(conn, ids)
+
+            cur = conn.execute(
+                """
+                UPDATE memories
+                SET status = 'deleted',
+                    properties = json_set(properties, '$.status', 'deleted',
+                                          '$.delete_record_id', ?, '$.delete_time', ?)
+                WHERE user_name = ?
+                  AND COALESCE(json_extract(properties, '$.delete_time'), '') = ''
+                  AND COALESCE(json_extract(properties, '$.delete_record_id'), '') = ''
+                """,
+                (delete_record_id, datetime.utcnow().isoformat(), mem_cube_id),
+            )
+            return cur.rowcount
+
+    def recover_memory_by_mem_cube_id(
+        self,
+        mem_cube_id: str | None = None,
+        delete_record_id: str | None = None,
+    ) -> int:
+        """Undo a soft delete performed by `delete_node_by_mem_cube_id`."""
+        if not mem_cube_id or not delete_record_id:
+            logger.warning(
+                "[recover_memory_by_mem_cube_id] mem_cube_id and delete_record_id are required"
+            )
+            return 0
+
+        with self._transaction() as conn:
+            cur = conn.execute(
+                """
+                UPDATE memories
+                SET status = 'activated',
+                    properties = json_set(properties, '$.status', 'activated',
+                                          '$.delete_record_id', '', '$.delete_time', '')
+                WHERE user_name = ? AND json_extract(properties, '$.delete_record_id') = ?
+                """,
+                (mem_cube_id, delete_record_id),
+            )
+            return cur.rowcount
+
+    def get_user_names_by_memory_ids(self, memory_ids: list[str]) -> dict[str, str | None]:
+        """Map each memory id to its user_name (None if the id does not exist)."""
+        if not memory_ids:
+            return {}
+        result: dict[str, str | None] = dict.fromkeys(memory_ids)
+        rows = self._query(
+            f"SELECT id, user_name FROM memories WHERE id IN ({', '.join('?' * len(memory_ids))})",
+            list(memory_ids),
+        )
+        for node_id, user_name in rows:
+            result[node_id] = user_name or None
+        return result
+
+    def exist_user_name(self, user_name: str) -> dict[str, bool]:
+        """Check if user name exists in the graph."""
+        if not user_name:
+            return {user_name: False}
+        rows = self._query("SELECT 1 FROM memories WHERE user_name = ? LIMIT 1", (user_name,))
+        return {user_name: bool(rows)}
+
+    # =========================================================================
+    # Edge Management
+    # =========================================================================
+
+    def add_edge(
+        self, source_id: str, target_id: str, type: str, user_name: str | None = None
+    ) -> None:
+        """Create an edge between nodes (no-op if either endpoint is missing)."""
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO edges (source_id, target_id, edge_type)
+                SELECT ?, ?, ?
+                WHERE EXISTS (SELECT 1 FROM memories WHERE id = ?)
+                  AND EXISTS (SELECT 1 FROM memories WHERE id = ?)
+                """,
+                (source_id, target_id, type, source_id, target_id),
+            )
+
+    def delete_edge(
+        self, source_id: str, target_id: str, type: str, user_name: str | None = None
+    ) -> None:
+        """Delete an edge."""
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM edges WHERE source_id = ? AND target_id = ? AND edge_type = ?",
+                (source_id, target_id, type),
+            )
+
+    def edge_exists(
+        self,
+        source_id: str,
+        target_id: str,
+        type: str = "ANY",
+        direction: str = "OUTGOING",
+        user_name: str | None = None,
+    ) -> bool:
+        """
+        Check if an edge exists between two nodes.
+        Args:
+            source_id: ID of the source node.
+            target_id: ID of the target node.
+            type: Relationship type. Use "ANY" to match any relationship type.
+            direction: "OUTGOING" (default), "INCOMING", or "ANY".
+        """
+        if direction == "OUTGOING":
+            pairs = [(source_id, target_id)]
+        elif direction == "INCOMING":
+            pairs = [(target_id, source_id)]
+        elif direction == "ANY":
+            pairs = [(source_id, target_id), (target_id, source_id)]
+        else:
+            raise ValueError(
+                f"Invalid direction: {direction}. Must be 'OUTGOING', 'INCOMING', or 'ANY'."
+            )
+        type_clause = "" if type == "ANY" else " AND edge_type = ?"
+        for src, dst in pairs:
+            params = [src, dst] + ([] if type == "ANY" else [type])
+            rows = self._query(
+                f"SELECT 1 FROM edges WHERE source_id = ? AND target_id = ?{type_clause} LIMIT 1",
+                params,
+            )
+            if rows:
+                return True
+        return False
+
+    def get_edges(
+        self, id: str, type: str = "ANY", direction: str = "ANY", user_name: str | None = None
+    ) -> list[dict[str, str]]:
+        """
+        Get edges connected to a node, with optional type and direction filter.
+
+        Returns:
+            List of edges: [{"from": "source_id", "to": "target_id", "type": "RELATE"}, ...]
+        """
+        if direction == "OUTGOING":
+            where, params = "source_id = ?", [id]
+        elif direction == "INCOMING":
+            where, params = "target_id = ?", [id]
+        elif direction == "ANY":
+            where, params = "(source_id = ? OR target_id = ?)", [id, id]
+        else:
+            raise ValueError("Invalid direction. Must be 'OUTGOING', 'INCOMING', or 'ANY'.")
+        if type != "ANY":
+            where += " AND edge_type = ?"
+            params.append(type)
+        rows = self._query(
+            f"SELECT source_id, target_id, edge_type FROM edges WHERE {where}", params
+        )
+        return [{"from": s, "to": t, "type": et} for s, t, et in rows]
+
+    # =========================================================================
+    # Graph Queries
+    # =========================================================================
+
+    def get_neighbors(
+        self, id: str, type: str, direction: Literal["in", "out", "both"] = "out"
+    ) -> list[str]:
+        """Get neighboring node IDs."""
+        neighbors: list[str] = []
+        if direction in ("out", "both"):
+            neighbors += [
+                row[0]
+                for row in self._query(
+                    "SELECT target_id FROM edges WHERE source_id = ? AND edge_type = ?", (id, type)
+                )
+            ]
+        if direction in ("in", "both"):
+            neighbors += [
+                row[0]
+                for row in self._query(
+                    "SELECT source_id FROM edges WHERE target_id = ? AND edge_type = ?", (id, type)
+                )
+            ]
+        return list(dict.fromkeys(neighbors))
+
+    def get_neighbors_by_tag(
+        self,
+        tags: list[str],
+        exclude_ids: list[str],
+        top_k: int = 5,
+        min_overlap: int = 1,
+        include_embedding: bool = False,
+        user_name: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Find top-K activated, non-working nodes with maximum tag overlap."""
+        if not tags:
+            return []
+        user_clause, params = self._user_clause(user_name)
+        exclude_clause = ""
+        if exclude_ids:
+            exclude_clause = f"AND id NOT IN ({', '.join('?' * len(exclude_ids))})"
+            params.extend(exclude_ids)
+        tag_placeholders = ", ".join("?" * len(tags))
+        cols = _NODE_COLUMNS + (", embedding" if include_embedding else "")
+        rows = self._query(
+            f"""
+            SELECT {cols},
+                   (SELECT COUNT(DISTINCT value) FROM json_each(memories.properties, '$.tags')
+                    WHERE value IN ({tag_placeholders})) AS overlap
+            FROM memories
+            WHERE {user_clause} {exclude_clause}
+              AND status = 'activated'
+              AND memory_type <> 'WorkingMemory'
+              AND COALESCE(json_extract(properties, '$.type'), '') <> 'reasoning'
+              AND overlap >= ?
+            ORDER BY overlap DESC
+            LIMIT ?
+            """,
+            [*tags, *params, min_overlap, top_k],
+        )
+        return [self._parse_row(row if include_embedding else row[:6]) for row in rows]
+
+    def get_children_with_embeddings(
+        self, id: str, user_name: str | None = None
+    ) -> list[dict[str, Any]]:
+        user_clause, params = self._user_clause(user_name, alias="m.")
+        rows = self._query(
+            f"""
+            SELECT m.id, m.embedding, m.memory
+            FROM edges e JOIN memories m ON m.id = e.target_id
+            WHERE e.source_id = ? AND e.edge_type = 'PARENT' AND {user_clause}
+            """,
+            [id, *params],
+        )
+        return [
+            {
+                "id": node_id,
+                "embedding": None if blob is None else np.frombuffer(blob, np.float32).tolist(),
+                "memory": memory,
+            }
+            for node_id, blob, memory in rows
+        ]
+
+    def get_path(self, source_id: str, target_id: str, max_depth: int = 3) -> list[str]:
+        """Get the shortest directed path between nodes (BFS up to `max_depth` hops)."""
+        if source_id == target_id:
+            return [source_id]
+        parents: dict[str, str] = {source_id: ""}
+        frontier = [source_id]
+        for _ in range(max_depth):
+            next_frontier = []
+            for node_id in frontier:
+                for (nxt,) in self._query(
+                    "SELECT target_id FROM edges WHERE source_id = ?", (node_id,)
+                ):
+                    if nxt in parents:
+                        continue
+                    parents[nxt] = node_id
+                    if nxt == target_id:
+                        path = [nxt]
+                        while parents[path[-1]]:
+                            path.append(parents[path[-1]])
+                        return path[::-1]
+                    next_frontier.append(nxt)
+            frontier = next_frontier
+        return []
+
+    def get_subgraph(
+        self,
+        center_id: str,
+        depth: int = 2,
+        center_status: str = "activated",
+        user_name: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Retrieve a local subgraph centered at a given node.
+        Args:
+            center_id: The ID of the center node.
+            depth: The hop distance for neighbors.
+            center_status: Required status for center node.
+        Returns:
+            {
+                "core_node": {...},
+                "neighbors": [...],
+                "edges": [...]
+            }
+        """
+        user_clause, params = self._user_clause(user_name)
+        center_where = f"id = ? AND {user_clause}"
+        center_params = [center_id, *params]
+        if center_status:
+            center_where += " AND status = ?"
+            center_params.append(center_status)
+        centers = self._select_nodes(center_where, center_params)
+        if not centers:
+            return {"core_node": None, "neighbors": [], "edges": []}
+
+        visited = {center_id}
+        edges: dict[tuple[str, str, str], None] = {}
+        queue = deque([(center_id, 0)])
+        while queue:
+            node_id, level = queue.popleft()
+            if level >= depth:
+                continue
+            rows = self._query(
+                "SELECT source_id, target_id, edge_type FROM edges "
+                "WHERE source_id = ? OR target_id = ?",
+                (node_id, node_id),
+            )
+            for source, target, edge_type in rows:
+                edges[(source, target, edge_type)] = None
+                other = target if source == node_id else source
+                if other not in visited:
+                    visited.add(other)
+                    queue.append((other, level + 1))
+
+        neighbor_ids = [i for i in visited if i != center_id]
+        neighbors = self.get_nodes(neighbor_ids, user_name=user_name) if neighbor_ids else []
+        kept = {center_id} | {n["id"] for n in neighbors}
+        return {
+            "core_node": centers[0],
+            "neighbors": neighbors,
+            "edges": [
+                {"type": t, "source": s, "target": d}
+                for s, d, t in edges
+                if s in kept and d in kept
+            ],
+        }
+
+    def get_context_chain(self, id: str, type: str = "FOLLOWS") -> list[str]:
+        """Get the ordered chain of nodes reachable by following `type` edges."""
+        chain = [id]
+        seen = {id}
+        current = id
+        while True:
+            rows = self._query(
+                "SELECT target_id FROM edges WHERE source_id = ? AND edge_type = ? LIMIT 1",
+                (current, type),
+            )
+            if not rows or rows[0][0] in seen:
+                return chain
+            current = rows[0][0]
+            seen.add(current)
+            chain.append(current)
+
+    # =========================================================================
+    # Search Operations
+    # =========================================================================
+
+    def search_by_embedding(
+        self,
+        vector: list[float],
+        top_k: int = 5,
+        scope: str | None = None,
+        status: str | None = None,
+        threshold: float | None = None,
+        search_filter: dict | None = None,
+        user_name: str | None = None,
+        filter: dict | None = None,
+        knowledgebase_ids: list[str] | None = None,
+        return_fields: list[str] | None = None,
+        **kwargs,
+    ) -> list[dict]:
+        """
+        Retrieve node IDs based on vector similarity.
+
+        Metadata conditions are resolved by SQLite (using the user/type/status index),
+        then cosine similarity is computed in-process over the candidate rows only.
+
+        Returns:
+            list[dict]: A list of dicts with 'id' and 'score', ordered by similarity.
+                If return_fields is specified, each dict also includes the requested fields.
+        """
+        return self.search_batch(
+            [vector],
+            top_k=top_k,
+            scope=scope,
+            status=status,
+            threshold=threshold,
+            search_filter=search_filter,
+            user_name=user_name,
+            filter=filter,
+            knowledgebase_ids=knowledgebase_ids,
+            return_fields=return_fields,
+            **kwargs,
+        )[0]
+
+    def search_batch(
+        self,
+        vectors: list[list[float]],
+        top_k: int = 5,
+        scope: str | None = None,
+        status: str | None = None,
+        threshold: float | None = None,
+        search_filter: dict | None = None,
+        user_name: str | None = None,
+        filter: dict | None = None,
+        knowledgebase_ids: list[str] | None = None,
+        return_fields: list[str] | None = None,
+        **kwargs,
+    ) -> list[list[dict]]:
+        """
+        Vector search for several query vectors.
+
+        The candidate rows are selected once and every query is scored against
+        them in a single matrix product.
+        """
+        if not vectors:
+            return []
+        where_clause, params = self._build_search_conditions(
+            scope=scope,
+            status=status,
+            search_filter=search_filter,
+            user_name=kwargs.get("cube_name") or user_name,
+            filter=filter,
+            knowledgebase_ids=knowledgebase_ids,
+        )
+        with self._lock:
+            if where_clause:
+                candidate_ids = [
+                    row[0]
+                    for row in self.conn.execute(
+                        f"SELECT id FROM memories WHERE embedding IS NOT NULL AND {where_clause}",
+                        params,
+                    ).fetchall()
+                ]
+            else:
+                candidate_ids = None
+            batch_hits = self._index.search_batch(vectors, candidate_ids, top_k)
+
+        return [
+            self._attach_return_fields(
+                [
+                    {"id": node_id, "score": score}
+                    for node_id, score in hits
+                    if threshold is None or score >= threshold
+                ],
+                return_fields,
+            )
+            for hits in batch_hits
+        ]
+
+    def _attach_return_fields(
+        self, results: list[dict], return_fields: list[str] | None
+    ) -> list[dict]:
+        fields = [f for f in self._validate_return_fields(return_fields) if f != "id"]
+        if not fields or not results:
+            return results
+        ids = [r["id"] for r in results]
+        nodes = {
+            n["id"]: n for n in self._select_nodes(f"id IN ({', '.join('?' * len(ids))})", ids)
+        }
+        for item in results:
+            node = nodes.get(item["id"])
+            if not node:
+                continue
+            for field in fields:
+                item[field] = node["memory"] if field == "memory" else node["metadata"].get(field)
+        return results
+
+    def search_by_fulltext(
+        self,
+        query_words: list[str],
+        top_k: int = 10,
+        scope: str | None = None,
+        status: str | None = None,
+        threshold: float | None = None,
+        search_filter: dict | None = None,
+        user_name: str | None = None,
+        filter: dict | None = None,
+        knowledgebase_ids: list[str] | None = None,
+        return_fields: list[str] | None = None,
+        **kwargs,
+    ) -> list[dict]:
+        """
+        Keyword recall: score is the fraction of `query_words` contained in the memory text.
+        """
+        words = [w for w in dict.fromkeys(query_words or []) if w and w.strip()]
+        if not words:
+            return []
+        where_clause, params = self._build_search_conditions(
+            scope=scope,
+            status=status,
+            search_filter=search_filter,
+            user_name=kwargs.get("cube_name") or user_name,
+            filter=filter,
+            knowledgebase_ids=knowledgebase_ids,
+        )
+        hit_expr = " + ".join(["(instr(memory, ?) > 0)"] * len(words))
+        rows = self._query(
+            f"""
+            SELECT id, ({hit_expr}) AS hits FROM memories
+            WHERE {where_clause or "1 = 1"} AND hits > 0
+            ORDER BY hits DESC, updated_at DESC
+            LIMIT ?
+            """,
+            [*words, *params, top_k],
+        )
+        results = [
+            {"id": node_id, "score": hits / len(words)}
+            for node_id, hits in rows
+            if threshold is None or hits / len(words) >= threshold
+        ]
+        return self._attach_return_fields(results, return_fields)
+
+    def search_by_keywords_like(
+        self,
+        query_word: str,
+        scope: str | None = None,
+        status: str | None = None,
+        search_filter: dict | None = None,
+        user_name: str | None = None,
+        filter: dict | None = None,
+        knowledgebase_ids: list[str] | None = None,
+        return_fields: list[str] | None = None,
+        **kwargs,
+    ) -> list[dict]:
+        """Return nodes whose memory text matches a SQL LIKE pattern (e.g. '%word%')."""
+        where_clause, params = self._build_search_conditions(
+            scope=scope,
+            status=status,
+            search_filter=search_filter,
+            user_name=user_name,
+            filter=filter,
+            knowledgebase_ids=knowledgebase_ids,
+        )
+        rows = self._query(
+            f"SELECT id FROM memories WHERE {where_clause or '1 = 1'} AND memory LIKE ?",
+            [*params, query_word],
+        )
+        return self._attach_return_fields([{"id": row[0]} for row in rows], return_fields)
+
+    def search_by_keywords_tfidf(
+        self,
+        query_words: list[str],
+        scope: str | None = None,
+        status: str | None = None,
+        search_filter: dict | None = None,
+        user_name: str | None = None,
+        filter: dict | None = None,
+        knowledgebase_ids: list[str] | None = None,
+        return_fields: list[str] | None = None,
+        **kwargs,
+    ) -> list[dict]:
+        """Return nodes containing every term of the `&`-joined query expressions."""
+        terms = [t.strip() for q in query_words or [] for t in q.split("&") if t.strip()]
+        if not terms:
+            return []
+        where_clause, params = self._build_search_conditions(
+            scope=scope,
+            status=status,
+            search_filter=search_filter,
+            user_name=user_name,
+            filter=filter,
+            knowledgebase_ids=knowledgebase_ids,
+        )
+        term_clause = " AND ".join(["instr(memory, ?) > 0"] * len(terms))
+        rows = self._query(
+            f"SELECT id FROM memories WHERE {where_clause or '1 = 1'} AND {term_clause}",
+            [*params, *terms],
+        )
+        return self._attach_return_fields([{"id": row[0]} for row in rows], return_fields)
+
+    def get_by_metadata(
+        self,
+        filters: list[dict[str, Any]],
+        status: str | None = None,
+        user_name: str | None = None,
+        filter: dict | None = None,
+        knowledgebase_ids: list[str] | None = None,
+        user_name_flag: bool = True,
+    ) -> list[str]:
+        """
+        Retrieve node IDs that match given metadata filters (AND logic).
+
+        Args:
+            filters: List of filter dicts like:
+                [
+                    {"field": "key", "op": "in", "value": ["A", "B"]},
+                    {"field": "confidence", "op": ">=", "value": 80},
+                    {"field": "tags", "op": "contains", "value": "AI"},
+                ]
+            status (str, optional): Filter by status. If None, no status filter is applied.
+        """
+        conditions: list[str] = []
+        params: list[Any] = []
+
+        if user_name_flag:
+            user_cond = self._build_user_name_and_kb_ids_conditions(
+                user_name, knowledgebase_ids, params
+            )
+            if user_cond:
+                conditions.append(user_cond)
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+
+        for f in filters:
+            expr, path = self._field_expr(f["field"])
+            op = f.get("op", "=")
+            value = f["value"]
+            if op == "=":
+                conditions.append(f"{expr} = ?")
+                params.append(value)
+            elif op == "in":
+                if not value:
+                    conditions.append("0")
+                    continue
+                conditions.append(f"{expr} IN ({', '.join('?' * len(value))})")
+                params.extend(value)
+            elif op == "contains":
+                values = value if isinstance(value, list) else [value]
+                conditions.append(self._array_contains(path, values, params))
+            elif op == "starts_with":
+                conditions.append(f"substr({expr}, 1, length(?)) = ?")
+                params.extend([value, value])
+            elif op == "ends_with":
+                conditions.append(f"substr({expr}, -length(?)) = ?")
+                params.extend([value, value])
+            elif op in (">", ">=", "<", "<="):
+                if f["field"].endswith("_at"):
+                    conditions.append(f"julianday({expr}) {op} julianday(?)")
+                else:
+                    conditions.append(f"{expr} {op} ?")
+                params.append(value)
+            else:
+                raise ValueError(f"Unsupported operator: {op}")
+
+        if filter:
+            filter_sql = self._build_filter_where_clause(filter, params)
+            if filter_sql:
+                conditions.append(filter_sql)
+
+        where_clause = " AND ".join(conditions) or "1 = 1"
+        return [
+            row[0] for row in self._query(f"SELECT id FROM memories WHERE {where_clause}", params)
+        ]
+
+    def get_grouped_counts(
+        self,
+        group_fields: list[str],
+        where_clause: str = "",
+        params: dict[str, Any] | None = None,
+        user_name: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Count nodes grouped by specified fields.
+
+        Args:
+            group_fields: Fields to group by, e.g., ["memory_type", "status"]
+            where_clause: Extra SQL condition over the memories table, using
+                `:name` placeholders bound from `params`.
+            params: Parameters for WHERE clause
+            user_name: User to filter by
+
+        Returns:
+            list[dict]: e.g., [{'memory_type': 'WorkingMemory', 'count': 10}, ...]
+        """
+        if not group_fields:
+            raise ValueError("group_fields cannot be empty")
+
+        exprs = []
+        for field in group_fields:
+            expr, _ = self._field_expr(field)
+            exprs.append(expr)
+
+        bind: dict[str, Any] = dict(params or {})
+        conditions = []
+        effective_user_name = user_name or self.user_name
+        if effective_user_name:
+            conditions.append("user_name = :__user_name")
+            bind["__user_name"] = effective_user_name
+        if where_clause:
+            where_clause = where_clause.strip()
+            if where_clause.upper().startswith("WHERE"):
+                where_clause = where_clause[5:].strip()
+            if where_clause:
+                conditions.append(f"({where_clause})")
+
+        select = ", ".join(
+            f"{expr} AS {field}" for expr, field in zip(exprs, group_fields, strict=True)
+        )
+        rows = self._query(
+            f"""
+            SELECT {select}, COUNT(*) AS count FROM memories
+            WHERE {" AND ".join(conditions) or "1 = 1"}
+            GROUP BY {", ".join(exprs)}
+            """,
+            bind,
+        )
+        return [
+            {**dict(zip(group_fields, row[:-1], strict=True)), "count": row[-1]} for row in rows
+        ]
+
+    def get_all_memory_items(
+        self,
+        scope: str,
+        include_embedding: bool = False,
+        status: str | None = None,
+        filter: dict | None = None,
+        knowledgebase_ids: list[str] | None = None,
+        **kwargs,
+    ) -> list[dict]:
+        """Get all memory items of a specific memory_type."""
+        if scope not in {"WorkingMemory", "LongTermMemory", "UserMemory", "OuterMemory"}:
+            raise ValueError(f"Unsupported memory type scope: {scope}")
+        where_clause, params = self._build_search_conditions(
+            scope=scope,
+            status=status,
+            user_name=kwargs.get("user_name"),
+            filter=filter,
+            knowledgebase_ids=knowledgebase_ids,
+            default_activated=False,
+        )
+        return self._select_nodes(where_clause, params, include_embedding=include_embedding)
+
+    def get_structure_optimization_candidates(
+        self, scope: str, include_embedding: bool = False, **kwargs
+    ) -> list[dict]:
+        """Find activated nodes of `scope` without any PARENT edge in either direction."""
+        user_clause, params = self._user_clause(kwargs.get("user_name"))
+        return self._select_nodes(
+            f"""
+            memory_type = ? AND status = 'activated' AND {user_clause}
+            AND NOT EXISTS (
+                SELECT 1 FROM edges e
+                WHERE e.edge_type = 'PARENT' AND (e.source_id = memories.id OR e.target_id = memories.id)
+            )
+            """,
+            [scope, *params],
+            include_embedding=include_embedding,
+        )
+
+    # =========================================================================
+    # Maintenance
+    # =========================================================================
+
+    def deduplicate_nodes(self) -> None:
+        """Not implemented - handled at application level."""
+
+    def detect_conflicts(self) -> list[tuple[str, str]]:
+        """Not implemented."""
+        return []
+
+    def merge_nodes(self, id1: str, id2: str) -> str:
+        """Not implemented."""
+        raise NotImplementedError
+
+    def clear(self, user_name: str | None = None) -> None:
+        """Clear all data for the user (or the whole store when no user is configured)."""
+        user_clause, params = self._user_clause(user_name)
+        with self._transaction() as conn:
+            ids = [
+                row[0]
+                for row in conn.execute(
+                    f"SELECT id FROM memories WHERE {user_clause}", params
+                ).fetchall()
+            ]
+            self._delete_ids(conn, ids)
+        logger.info(f"Cleared {len(ids)} nodes from embedded graph store")
+
+    def drop_database(self) -> None:
+        """Delete every node and edge in the database file."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM edges")
+            conn.execute("DELETE FROM memories")
+            self._queue_index_op(self._index.clear)
+
+    def export_graph(
+        self,
+        include_embedding: bool = False,
+        page: int | None = None,
+        page_size: int | None = None,
+        memory_type: list[str] | None = None,
+        status: list[str] | None = None,
+        filter: dict | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """
+        Export graph nodes and edges in a structured form.
+
+        Args:
+            include_embedding: Whether to include embedding fields in node metadata.
+            page: Page number (starts from 1). If None, exports all data without pagination.
+            page_size: Number of items per page. If None, exports all data without pagination.
+            memory_type: Only export nodes whose memory_type is in this list.
+            status: If not provided, only nodes with status != 'deleted' are exported.
+            filter: Filter conditions with 'and' or 'or' logic.
+
+        Returns:
+            {"nodes": [...], "edges": [...], "total_nodes": int, "total_edges": int}
+        """
+        user_clause, params = self._user_clause(kwargs.get("user_name"))
+        conditions = [user_clause]
+        if memory_type:
+            conditions.append(f"memory_type IN ({', '.join('?' * len(memory_type))})")
+            params.extend(memory_type)
+        if status is None:
+            conditions.append("COALESCE(status, '') <> 'deleted'")
+        elif status:
+            conditions.append(f"status IN ({', '.join('?' * len(status))})")
+            params.extend(status)
+        if filter:
+            filter_sql = self._build_filter_where_clause(filter, params)
+            if filter_sql:
+                conditions.append(filter_sql)
+        where_clause = " AND ".join(conditions)
+
+        suffix = "ORDER BY created_at DESC, id DESC"
+        edge_suffix = "ORDER BY e.source_id, e.target_id, e.edge_type"
+        if page is not None and page_size is not None:
+            page, page_size = max(page, 1), page_size if page_size >= 1 else 10
+            limit = f" LIMIT {int(page_size)} OFFSET {int((page - 1) * page_size)}"
+            suffix += limit
+            edge_suffix += limit
+
+        total_nodes = self._query(f"SELECT COUNT(*) FROM memories WHERE {where_clause}", params)[0][
+            0
+        ]
+        nodes = self._select_nodes(where_clause, params, include_embedding, suffix=suffix)
+
+        selected = f"SELECT id FROM memories WHERE {where_clause}"
+        edge_where = f"e.source_id IN ({selected}) AND e.target_id IN ({selected})"
+        edge_params = [*params, *params]
+        total_edges = self._query(f"SELECT COUNT(*) FROM edges e WHERE {edge_where}", edge_params)[
+            0
+        ][0]
+        edges = [
+            {"source": s, "target": t, "type": et}
+            for s, t, et in self._query(
+                f"SELECT e.source_id, e.target_id, e.edge_type FROM edges e "
+                f"WHERE {edge_where} {edge_suffix}",
+                edge_params,
+            )
+        ]
+        return {
+            "nodes": nodes,
+            "edges": edges,
+            "total_nodes": total_nodes,
+            "total_edges": total_edges,
+        }
+
+    def iter_export_nodes(
+        self,
+        page_size: int = 1000,
+        include_embedding: bool = False,
+        after_id: str | None = None,
+        user_name: str | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield non-deleted nodes in pages ordered by id, using the primary key as cursor."""
+        user_clause, user_params = self._user_clause(user_name)
+        where_clause = f"{user_clause} AND COALESCE(status, '') <> 'deleted' AND id > ?"
+        while True:
+            nodes = self._select_nodes(
+                where_clause,
+                [*user_params, after_id or ""],
+                include_embedding,
+                suffix=f"ORDER BY id LIMIT {int(page_size)}",
+            )
+            if not nodes:
+                return
+            yield nodes
+            if len(nodes) < page_size:
+                return
+            after_id = nodes[-1]["id"]
+
+    def iter_export_edges(
+        self,
+        page_size: int = 1000,
+        after: tuple[str, str, str] | None = None,
+        user_name: str | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield edges between non-deleted nodes in pages keyed by (source, target, type)."""
+        user_clause, user_params = self._user_clause(user_name)
+        selected = (
+            f"SELECT id FROM memories WHERE {user_clause} AND COALESCE(status, '') <> 'deleted'"
+        )
+        sql = (
+            "SELECT e.source_id, e.target_id, e.edge_type FROM edges e "
+            f"WHERE e.source_id IN ({selected}) AND e.target_id IN ({selected}) "
+            "AND (e.source_id, e.target_id, e.edge_type) > (?, ?, ?) "
+            f"ORDER BY e.source_id, e.target_id, e.edge_type LIMIT {int(page_size)}"
+        )
+        while True:
+            rows = self._query(sql, [*user_params, *user_params, *(after or ("", "", ""))])
+            if not rows:
+                return
+            yield [{"source": s, "target": t, "type": et} for s, t, et in rows]
+            if len(rows) < page_size:
+                return
+            after = tuple(rows[-1])
+
+    def import_graph(self, data: dict[str, Any], user_name: str | None = None) -> None:
+        """Import graph data in a single transaction."""
+        effective_user_name = user_name or self.user_name
+        with self._transaction() as conn:
+            for node in data.get("nodes", []):
+                self._write_node(
+                    conn,
+                    node["id"],
+                    node.get("memory", ""),
+                    node.get("metadata", {}),
+                    effective_user_name,
+                )
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO edges (source_id, target_id, edge_type)
+                SELECT ?1, ?2, ?3
+                WHERE EXISTS (SELECT 1 FROM memories WHERE id = ?1)
+                  AND EXISTS (SELECT 1 FROM memories WHERE id = ?2)
+                """,
+                [(e["source"], e["target"], e["type"]) for e in data.get("edges", [])],
+            )
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self.conn.close()
@@ -1,5 +1,7 @@
+import asyncio
+
 from abc import ABC, abstractmethod
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 from memos.configs.llm import BaseLLMConfig
 from memos.types import MessageList
@@ -23,3 +25,24 @@ class BaseLLM(ABC):
         Subclasses should override this if they support streaming.
         By default, this raises NotImplementedError.
         """
+
+    async def agenerate(self, messages: MessageList, **kwargs) -> str:
+        """
+        Generate a response without blocking the event loop.
+        Backends with an async client override this; the default runs `generate`
+        in a worker thread.
+        """
+        return await asyncio.to_thread(self.generate, messages, **kwargs)
+
+    async def agenerate_stream(self, messages: MessageList, **kwargs) -> AsyncGenerator[str, None]:
+        """
+        Stream a response without blocking the event loop.
+        The default pulls chunks from `generate_stream` in a worker thread.
+        """
+        chunks = self.generate_stream(messages, **kwargs)
+        done = object()
+        while True:
+            chunk = await asyncio.to_thread(next, chunks, done)
+            if chunk is done:
+                break
+            yield chunk
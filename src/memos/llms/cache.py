@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import os
+import threading
+
+from collections import Counter
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any
+
+from memos.cache_store import env_enabled, env_float, env_int
+from memos.dependency import require_python_package
+from memos.llms.base import BaseLLM
+from memos.llms.cache_store import (
+    LLMResponseCacheStore,
+    SQLiteLLMResponseCacheStore,
+    llm_cache_key,
+)
+from memos.log import get_logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Generator
+
+    from cachetools import TTLCache
+
+    from memos.types import MessageList
+
+
+logger = get_logger(__name__)
+
+
+_CACHE_ENABLED_ENV = "MEMOS_LLM_CACHE_ENABLED"
+_CACHE_TTL_ENV = "MEMOS_LLM_CACHE_TTL_SECONDS"
+_CACHE_MAX_SIZE_ENV = "MEMOS_LLM_CACHE_MAX_SIZE"
+_PERSISTENT_CACHE_PATH_ENV = "MEMOS_LLM_CACHE_PATH"
+_PERSISTENT_CACHE_MAX_ENTRIES_ENV = "MEMOS_LLM_CACHE_MAX_ENTRIES"
+
+_DEFAULT_CACHE_TTL_SECONDS = 3600.0
+_DEFAULT_CACHE_MAX_SIZE = 1024
+_DEFAULT_PERSISTENT_CACHE_MAX_ENTRIES = 100_000
+
+# Config fields that change what a backend returns for the same messages.
+_SAMPLING_FIELDS = (
+    "temperature",
+    "max_tokens",
+    "top_p",
+    "top_k",
+    "enable_thinking",
+    "remove_think_prefix",
+    "extra_body",
+)
+
+
+def llm_cache_enabled() -> bool:
+    return env_enabled(_CACHE_ENABLED_ENV)
+
+
+def _persistent_store_from_env() -> LLMResponseCacheStore | None:
+    path = (os.getenv(_PERSISTENT_CACHE_PATH_ENV) or "").strip()
+    if not path:
+        return None
+    max_entries = env_int(_PERSISTENT_CACHE_MAX_ENTRIES_ENV, _DEFAULT_PERSISTENT_CACHE_MAX_ENTRIES)
+    try:
+        return SQLiteLLMResponseCacheStore(path, max_entries=max_entries)
+    except Exception as exc:
+        logger.warning("Persistent LLM response cache disabled path=%s error=%s", path, exc)
+        return None
+
+
+class CachingLLM(BaseLLM):
+    """Answer repeated deterministic prompts from an exact response cache.
+
+    A call is cacheable when its effective temperature is 0, or when the caller
+    passes ``cache=True`` (``cache=False`` always bypasses). Keys cover the
+    backend, model, messages and every sampling parameter. Lookups go through
+    an in-process TTL cache and, when ``MEMOS_LLM_CACHE_PATH`` is set, a durable
+    content-addressed store; concurrent identical prompts share one backend
+    call. Streaming calls are never cached.
+    """
+
+    @require_python_package(
+        import_name="cachetools",
+        install_command="pip install 'cachetools>=6.0.0'",
+    )
+    def __init__(self, backend: BaseLLM, persistent_store: LLMResponseCacheStore | None = None):
+        from cachetools import TTLCache
+
+        self._backend = backend
+        self.config = backend.config
+        self._backend_name = type(backend).__name__
+        self._lock = threading.RLock()
+        self._inflight: dict[str, Future[Any]] = {}
+        self._stats: Counter[str] = Counter()
+
+        cache_ttl = env_float(_CACHE_TTL_ENV, _DEFAULT_CACHE_TTL_SECONDS)
+        cache_max_size = env_int(_CACHE_MAX_SIZE_ENV, _DEFAULT_CACHE_MAX_SIZE)
+        self._cache: TTLCache[str, Any] | None = (
+            TTLCache(maxsize=cache_max_size, ttl=cache_ttl) if cache_ttl > 0 else None
+        )
+        self._persistent_store = (
+            persistent_store if persistent_store is not None else _persistent_store_from_env()
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._backend, name)
+
+    def _cache_key(self, messages: MessageList, kwargs: dict[str, Any]) -> str | None:
+        """Return the cache key for a call, or None if the call must not be cached."""
+        flag = kwargs.pop("cache", None)
+        if flag is False or kwargs.get("past_key_values") is not None:
+            return None
+        params = {name: getattr(self.config, name, None) for name in _SAMPLING_FIELDS}
+        params.update(kwargs)
+        if not flag and params.get("temperature") != 0:
+            return None
+        model = params.pop("model_name_or_path", getattr(self.config, "model_name_or_path", None))
+        return llm_cache_key(self._backend_name, model, messages, params)
+
+    def _lookup(self, key: str) -> tuple[Any | None, Future[Any] | None, Future[Any] | None]:
+        """Return ``(cached, joined, owned)``; exactly one of them is set."""
+        with self._lock:
+            if self._cache is not None and key in self._cache:
+                self._stats["memory_hits"] += 1
+                return copy.deepcopy(self._cache[key]), None, None
+            if key in self._inflight:
+                self._stats["singleflight_joins"] += 1
+                return None, self._inflight[key], None
+            future: Future[Any] = Future()
+            self._inflight[key] = future
+
+        stored = self._load_persisted(key)
+        with self._lock:
+            if stored is not None:
+                self._stats["persistent_hits"] += 1
+                if self._cache is not None:
+                    self._cache[key] = stored
+                self._inflight.pop(key, None)
+                future.set_result(stored)
+                return copy.deepcopy(stored), None, None
+            self._stats["misses"] += 1
+            self._stats["backend_calls"] += 1
+        return None, None, future
+
+    def _resolve(self, key: str, future: Future[Any], response: Any) -> None:
+        cacheable = bool(response)
+        with self._lock:
+            if cacheable and self._cache is not None:
+                self._cache[key] = response
+            self._inflight.pop(key, None)
+            future.set_result(response)
+        if cacheable:
+            self._store_persisted(key, response)
+
+    def _fail(self, key: str, future: Future[Any], exc: BaseException) -> None:
+        with self._lock:
+            self._stats["backend_errors"] += 1
+            self._inflight.pop(key, None)
+            future.set_exception(exc)
+
+    def generate(self, messages: MessageList, **kwargs) -> Any:
+        key = self._cache_key(messages, kwargs)
+        if key is None:
+            with self._lock:
+                self._stats["bypassed"] += 1
+            return self._backend.generate(messages, **kwargs)
+
+        cached, joined, owned = self._lookup(key)
+        if owned is None:
+            return cached if joined is None else copy.deepcopy(joined.result())
+        try:
+            response = self._backend.generate(messages, **kwargs)
+        except BaseException as exc:
+            self._fail(key, owned, exc)
+            raise
+        self._resolve(key, owned, response)
+        return response
+
+    async def agenerate(self, messages: MessageList, **kwargs) -> Any:
+        key = self._cache_key(messages, kwargs)
+        if key is None:
+            with self._lock:
+                self._stats["bypassed"] += 1
+            return await self._backend.agenerate(messages, **kwargs)
+
+        cached, joined, owned = await asyncio.to_thread(self._lookup, key)
+        if owned is None:
+            if joined is None:
+                return cached
+            return copy.deepcopy(await asyncio.wrap_future(joined))
+        try:
+            response = await self._backend.agenerate(messages, **kwargs)
+        except BaseException as exc:
+            self._fail(key, owned, exc)
+            raise
+        await asyncio.to_thread(self._resolve, key, owned, response)
+        return response
+
+    def generate_stream(self, messages: MessageList, **kwargs) -> Generator[str, None, None]:
+        kwargs.pop("cache", None)
+        return self._backend.generate_stream(messages, **kwargs)
+
+    def agenerate_stream(self, messages: MessageList, **kwargs) -> AsyncGenerator[str, None]:
+        kwargs.pop("cache", None)
+        return self._backend.agenerate_stream(messages, **kwargs)
+
+    def _load_persisted(self, key: str) -> Any | None:
+        if self._persistent_store is None:
+            return None
+        try:
+            return self._persistent_store.get(key)
+        except Exception as exc:
+            logger.warning("Persistent LLM response cache read failed: %s", exc)
+            with self._lock:
+                self._stats["persistent_errors"] += 1
+            return None
+
+    def _store_persisted(self, key: str, response: Any) -> None:
+        if self._persistent_store is None:
+            return
+        try:
+            self._persistent_store.set(key, response)
+        except Exception as exc:
+            logger.warning("Persistent LLM response cache write failed: %s", exc)
+            with self._lock:
+                self._stats["persistent_errors"] += 1
+            return
+        with self._lock:
+            self._stats["persistent_writes"] += 1
+
+    def cache_info(self) -> dict[str, int]:
+        with self._lock:
+            info = dict(self._stats)
+            for key in (
+                "memory_hits",
+                "persistent_hits",
+                "singleflight_joins",
+                "misses",
+                "bypassed",
+                "backend_calls",
+                "backend_errors",
+                "persistent_writes",
+                "persistent_errors",
+            ):
+                info.setdefault(key, 0)
+            info["memory_cache_size"] = len(self._cache) if self._cache is not None else 0
+            info["inflight"] = len(self._inflight)
+        info["persistent_cache_size"] = self._persistent_cache_size()
+        return info
+
+    def _persistent_cache_size(self) -> int:
+        if self._persistent_store is None:
+            return 0
+        try:
+            return len(self._persistent_store)
+        except Exception:
+            return 0
+
+    def clear_cache(self, include_persistent: bool = False) -> None:
+        with self._lock:
+            if self._cache is not None:
+                self._cache.clear()
+        if include_persistent and self._persistent_store is not None:
+            self._persistent_store.clear()
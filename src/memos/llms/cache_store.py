@@ -0,0 +1,88 @@
+"""Durable, content-addressed storage tiers for ``CachingLLM``.
+
+Responses are keyed by a hash of the backend, model, messages and sampling
+parameters, so a byte-identical deterministic prompt is answered once and then
+reused across retries, re-ingestion, worker restarts and any process that points
+at the same store.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+from memos.cache_store import SQLiteCacheStore
+
+
+def llm_cache_key(backend: str, model: str | None, messages: Any, params: dict[str, Any]) -> str:
+    """Return the content address of a chat completion request."""
+    payload = json.dumps(
+        {"backend": backend, "model": model, "messages": messages, "params": params},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=repr,
+    )
+    return hashlib.sha256(payload.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class LLMResponseCacheStore(ABC):
+    """Key/value tier that persists LLM responses by content address.
+
+    Values are JSON-serialisable (plain text or parsed tool calls).
+    Implementations must be safe to call from multiple threads. Errors may be
+    raised freely; ``CachingLLM`` treats any failure as a cache miss.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        """Return the stored response for ``key``, or None when absent."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """Store a response, evicting old entries if the store is bounded."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every stored response."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of stored responses."""
+
+    def close(self) -> None:  # noqa: B027
+        """Release resources held by the store."""
+
+
+class SQLiteLLMResponseCacheStore(SQLiteCacheStore, LLMResponseCacheStore):
+    """Size-bounded LLM response store in a local SQLite file.
+
+    Responses are stored as JSON text. Every read refreshes the entry's access
+    time; eviction and sharing follow ``SQLiteCacheStore``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 100_000,
+        evict_ratio: float = 0.9,
+        busy_timeout: float = 5.0,
+    ):
+        super().__init__(
+            path,
+            table="llm_response_cache",
+            value_columns={"response": "TEXT NOT NULL"},
+            max_entries=max_entries,
+            evict_ratio=evict_ratio,
+            busy_timeout=busy_timeout,
+            touch_interval=0.0,
+        )
+
+    def get(self, key: str) -> Any | None:
+        row = self.get_rows([key]).get(key)
+        return None if row is None else json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        self.set_rows({key: (json.dumps(value, ensure_ascii=False),)})
@@ -2,6 +2,7 @@ from typing import Any, ClassVar
 
 from memos.configs.llm import LLMConfigFactory
 from memos.llms.base import BaseLLM
+from memos.llms.cache import CachingLLM, llm_cache_enabled
 from memos.llms.deepseek import DeepSeekLLM
 from memos.llms.hf import HFLLM
 from memos.llms.hf_singleton import HFSingletonLLM
@@ -29,6 +30,16 @@ class LLMFactory(BaseLLM):
         "minimax": MinimaxLLM,
         "openai_new": OpenAIResponsesLLM,
     }
+    cacheable_backends: ClassVar[set[str]] = {
+        "openai",
+        "azure",
+        "ollama",
+        "vllm",
+        "qwen",
+        "deepseek",
+        "minimax",
+        "openai_new",
+    }
 
     @classmethod
     @singleton_factory()
@@ -37,4 +48,7 @@ class LLMFactory(BaseLLM):
         if backend not in cls.backend_to_class:
             raise ValueError(f"Invalid backend: {backend}")
         llm_class = cls.backend_to_class[backend]
-        return llm_class(config_factory.config)
+        llm = llm_class(config_factory.config)
+        if backend in cls.cacheable_backends and llm_cache_enabled():
+            return CachingLLM(llm)
+        return llm
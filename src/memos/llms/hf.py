@@ -351,6 +351,62 @@ class HFLLM(BaseLLM):
         eos_id = self.tokenizer.eos_token_id
         return eos_id is not None and token.item() == eos_id
 
+    def render_kv_prompt(self, content: str) -> str:
+        """
+        Render plain-text memory content into the chat prompt that `build_kv_cache` prefills.
+        Args:
+            content (str): Text placed in the system message.
+        Returns:
+            str: The prompt after applying the chat template.
+        """
+        messages = [
+            {
+                "role": "system",
+                "content": f"Below is some information about the user.\n{content}",
+            }
+        ]
+        return self.tokenizer.apply_chat_template(
+            messages, tokenize=False, add_generation_prompt=False
+        )
+
+    def extend_kv_cache(
+        self, segments: list[str], kv: DynamicCache | None = None
+    ) -> tuple[DynamicCache, list[int]]:
+        """
+        Prefill prompt segments on top of an existing KV cache in one forward pass.
+        Each segment is tokenized on its own so that its token span is known and the
+        cache can later be cropped back to any segment boundary.
+        Args:
+            segments (list[str]): Consecutive prompt pieces to append.
+            kv (DynamicCache | None): Cache holding the preceding tokens; None starts a new one.
+        Returns:
+            tuple[DynamicCache, list[int]]: (extended cache, token count of each segment)
+        """
+        import torch
+        import transformers
+
+        past_length = kv.get_seq_length() if kv is not None else 0
+        token_ids: list[int] = []
+        lengths: list[int] = []
+        for i, segment in enumerate(segments):
+            ids = self.tokenizer(segment, add_special_tokens=past_length == 0 and i == 0)[
+                "input_ids"
+            ]
+            token_ids.extend(ids)
+            lengths.append(len(ids))
+
+        kv = kv if kv is not None else transformers.DynamicCache()
+        if not token_ids:
+            return kv, lengths
+
+        input_ids = torch.tensor([token_ids], dtype=torch.long, device=self.model.device)
+        with torch.no_grad():
+            outputs = self.model(input_ids=input_ids, past_key_values=kv, use_cache=True)
+        kv = outputs.past_key_values
+        if isinstance(kv, tuple):
+            kv = transformers.DynamicCache.from_legacy_cache(kv)
+        return kv, lengths
+
     def build_kv_cache(self, messages) -> DynamicCache:
         """
         Build a KV cache from chat messages via one forward pass.
@@ -369,22 +425,13 @@ class HFLLM(BaseLLM):
 
         # Accept multiple input types and convert to standard chat messages
         if isinstance(messages, str):
-            messages = [
-                {
-                    "role": "system",
-                    "content": f"Below is some information about the user.\n{messages}",
-                }
-            ]
+            prompt = self.render_kv_prompt(messages)
         elif isinstance(messages, list) and messages and isinstance(messages[0], str):
-            messages = [
-                {
-                    "role": "system",
-                    "content": f"Below is some information about the user.\n{' '.join(messages)}",
-                }
-            ]
-        prompt = self.tokenizer.apply_chat_template(
-            messages, tokenize=False, add_generation_prompt=False
-        )
+            prompt = self.render_kv_prompt(" ".join(messages))
+        else:
+            prompt = self.tokenizer.apply_chat_template(
+                messages, tokenize=False, add_generation_prompt=False
+            )
         inputs = self.tokenizer(prompt, return_tensors="pt")
         inputs["input_ids"] = inputs["input_ids"].to(self.model.device, dtype=torch.long)
         seq_len = inputs["input_ids"].size(-1)
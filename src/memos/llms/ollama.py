@@ -1,11 +1,12 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from typing import Any
 
 from ollama import Client, Message
 
+from memos.async_utils import get_async_limiter, get_shared_async_ollama_client
 from memos.configs.llm import OllamaLLMConfig
 from memos.llms.base import BaseLLM
-from memos.llms.utils import remove_thinking_tags
+from memos.llms.utils import ThinkTagStream, remove_thinking_tags
 from memos.log import get_logger
 from memos.types import MessageList
 
@@ -54,28 +55,15 @@ class OllamaLLM(BaseLLM):
         except Exception as e:
             logger.warning(f"Could not verify model existence: {e}")
 
-    def generate(self, messages: MessageList, **kwargs) -> Any:
-        """
-        Generate a response from Ollama LLM.
-
-        Args:
-            messages: List of message dicts containing 'role' and 'content'.
+    def _build_options(self, **kwargs) -> dict:
+        return {
+            "temperature": kwargs.get("temperature", self.config.temperature),
+            "num_predict": kwargs.get("max_tokens", self.config.max_tokens),
+            "top_p": kwargs.get("top_p", self.config.top_p),
+            "top_k": kwargs.get("top_k", self.config.top_k),
+        }
 
-        Returns:
-            str: The generated response.
-        """
-        response = self.client.chat(
-            model=self.config.model_name_or_path,
-            messages=messages,
-            options={
-                "temperature": kwargs.get("temperature", self.config.temperature),
-                "num_predict": kwargs.get("max_tokens", self.config.max_tokens),
-                "top_p": kwargs.get("top_p", self.config.top_p),
-                "top_k": kwargs.get("top_k", self.config.top_k),
-            },
-            think=self.config.enable_thinking,
-            tools=kwargs.get("tools"),
-        )
+    def _parse_response(self, response) -> Any:
         logger.info(f"Raw response from Ollama: {response.model_dump_json()}")
         tool_calls = getattr(response.message, "tool_calls", None)
         if isinstance(tool_calls, list) and len(tool_calls) > 0:
@@ -92,6 +80,37 @@ class OllamaLLM(BaseLLM):
         else:
             return str_thinking + str_response
 
+    def generate(self, messages: MessageList, **kwargs) -> Any:
+        """
+        Generate a response from Ollama LLM.
+
+        Args:
+            messages: List of message dicts containing 'role' and 'content'.
+
+        Returns:
+            str: The generated response.
+        """
+        response = self.client.chat(
+            model=self.config.model_name_or_path,
+            messages=messages,
+            options=self._build_options(**kwargs),
+            think=self.config.enable_thinking,
+            tools=kwargs.get("tools"),
+        )
+        return self._parse_response(response)
+
+    async def agenerate(self, messages: MessageList, **kwargs) -> Any:
+        """Async variant of `generate` on a pooled client shared per event loop."""
+        async with get_async_limiter(("llm", self.api_base)):
+            response = await get_shared_async_ollama_client(self.api_base).chat(
+                model=self.config.model_name_or_path,
+                messages=messages,
+                options=self._build_options(**kwargs),
+                think=self.config.enable_thinking,
+                tools=kwargs.get("tools"),
+            )
+        return self._parse_response(response)
+
     def generate_stream(self, messages: MessageList, **kwargs) -> Generator[str, None, None]:
         if kwargs.get("tools"):
             logger.info("stream api not support tools")
@@ -100,29 +119,38 @@ class OllamaLLM(BaseLLM):
         response = self.client.chat(
             model=kwargs.get("model_name_or_path", self.config.model_name_or_path),
             messages=messages,
-            options={
-                "temperature": kwargs.get("temperature", self.config.temperature),
-                "num_predict": kwargs.get("max_tokens", self.config.max_tokens),
-                "top_p": kwargs.get("top_p", self.config.top_p),
-                "top_k": kwargs.get("top_k", self.config.top_k),
-            },
+            options=self._build_options(**kwargs),
             think=self.config.enable_thinking,
             stream=True,
         )
         # Streaming chunks of text
-        reasoning_started = False
+        think_tags = ThinkTagStream(self.config.remove_think_prefix)
         for chunk in response:
-            if hasattr(chunk.message, "thinking") and chunk.message.thinking:
-                if not reasoning_started and not self.config.remove_think_prefix:
-                    yield "<think>"
-                    reasoning_started = True
-                yield chunk.message.thinking
-
-            if hasattr(chunk.message, "content") and chunk.message.content:
-                if reasoning_started and not self.config.remove_think_prefix:
-                    yield "</think>"
-                    reasoning_started = False
-                yield chunk.message.content
+            yield from think_tags.feed(
+                getattr(chunk.message, "thinking", None), getattr(chunk.message, "content", None)
+            )
+
+    async def agenerate_stream(self, messages: MessageList, **kwargs) -> AsyncGenerator[str, None]:
+        """Async variant of `generate_stream` on a pooled client shared per event loop."""
+        if kwargs.get("tools"):
+            logger.info("stream api not support tools")
+            return
+
+        think_tags = ThinkTagStream(self.config.remove_think_prefix)
+        async with get_async_limiter(("llm", self.api_base)):
+            response = await get_shared_async_ollama_client(self.api_base).chat(
+                model=kwargs.get("model_name_or_path", self.config.model_name_or_path),
+                messages=messages,
+                options=self._build_options(**kwargs),
+                think=self.config.enable_thinking,
+                stream=True,
+            )
+            async for chunk in response:
+                for piece in think_tags.feed(
+                    getattr(chunk.message, "thinking", None),
+                    getattr(chunk.message, "content", None),
+                ):
+                    yield piece
 
     def tool_call_parser(self, tool_calls: list[Message.ToolCall]) -> list[dict]:
         """Parse tool calls from OpenAI response."""
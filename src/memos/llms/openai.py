@@ -1,7 +1,7 @@
 import json
 import time
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from typing import Any
 
 import openai
@@ -9,9 +9,14 @@ import openai
 from openai._types import NOT_GIVEN
 from openai.types.chat.chat_completion_message_tool_call import ChatCompletionMessageToolCall
 
+from memos.async_utils import (
+    get_async_limiter,
+    get_shared_async_azure_client,
+    get_shared_async_openai_client,
+)
 from memos.configs.llm import AzureLLMConfig, OpenAILLMConfig
 from memos.llms.base import BaseLLM
-from memos.llms.utils import remove_thinking_tags
+from memos.llms.utils import ThinkTagStream, remove_thinking_tags
 from memos.log import get_logger
 from memos.types import MessageList
 from memos.utils import timed_with_status
@@ -166,6 +171,79 @@ class OpenAILLM(BaseLLM):
         if reasoning_started and not self.config.remove_think_prefix:
             yield "</think>"
 
+    def _async_client(self):
+        return get_shared_async_openai_client(
+            self.config.api_key, self.config.api_base, self.config.default_headers
+        )
+
+    def _async_backup_client(self):
+        return get_shared_async_openai_client(
+            self.config.backup_api_key,
+            self.config.backup_api_base,
+            self.config.backup_headers,
+        )
+
+    async def agenerate(self, messages: MessageList, **kwargs) -> str:
+        """Async variant of `generate` on a pooled client shared per event loop."""
+        request_body = self._build_request_body(messages, **kwargs)
+        start_time = time.perf_counter()
+        logger.info(f"OpenAI LLM async Request body: {request_body}")
+
+        try:
+            async with get_async_limiter(("llm", self.config.api_base)):
+                response = await self._async_client().chat.completions.create(**request_body)
+            logger.info(
+                f"Response from OpenAI: {response.model_dump_json()}, "
+                f"Cost time: {time.perf_counter() - start_time}"
+            )
+            return self._parse_response(response)
+        except Exception as e:
+            if not self.use_backup_client:
+                logger.error(f"[OpenAI LLM] async generate failed: {type(e).__name__}: {e}")
+                raise
+            logger.warning(
+                f"Primary LLM request failed with {type(e).__name__}: {e}, "
+                f"falling back to backup client"
+            )
+            backup_body = {
+                **request_body,
+                "model": self.config.backup_model_name_or_path or request_body["model"],
+            }
+            async with get_async_limiter(("llm", self.config.backup_api_base)):
+                backup_response = await self._async_backup_client().chat.completions.create(
+                    **backup_body
+                )
+            logger.info(
+                f"Backup LLM request succeeded, Response: "
+                f"{backup_response.model_dump_json()}, "
+                f"Cost time: {time.perf_counter() - start_time}"
+            )
+            return self._parse_response(backup_response)
+
+    async def agenerate_stream(self, messages: MessageList, **kwargs) -> AsyncGenerator[str, None]:
+        """Async variant of `generate_stream` on a pooled client shared per event loop."""
+        if kwargs.get("tools"):
+            logger.info("stream api not support tools")
+            return
+
+        request_body = self._build_request_body(messages, **kwargs)
+        request_body["stream"] = True
+        logger.info(f"OpenAI LLM async Stream Request body: {request_body}")
+
+        think_tags = ThinkTagStream(self.config.remove_think_prefix)
+        async with get_async_limiter(("llm", self.config.api_base)):
+            response = await self._async_client().chat.completions.create(**request_body)
+            async for chunk in response:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                reasoning = getattr(delta, "reasoning_content", None)
+                content = None if reasoning else getattr(delta, "content", None)
+                for piece in think_tags.feed(reasoning, content):
+                    yield piece
+        for piece in think_tags.close():
+            yield piece
+
     def tool_call_parser(self, tool_calls: list[ChatCompletionMessageToolCall]) -> list[dict]:
         """Parse tool calls from OpenAI response."""
         return [
@@ -190,10 +268,9 @@ class AzureLLM(BaseLLM):
         )
         logger.info("Azure LLM instance initialized")
 
-    def generate(self, messages: MessageList, **kwargs) -> str:
-        """Generate a response from Azure OpenAI LLM."""
+    def _build_request_body(self, messages: MessageList, **kwargs) -> dict:
         enable_thinking = kwargs.get("enable_thinking", self.config.enable_thinking)
-        request_body = {
+        return {
             "model": self.config.model_name_or_path,
             "messages": messages,
             "temperature": kwargs.get("temperature", self.config.temperature),
@@ -204,7 +281,8 @@ class AzureLLM(BaseLLM):
                 kwargs.get("extra_body", self.config.extra_body), enable_thinking
             ),
         }
-        response = self.client.chat.completions.create(**request_body)
+
+    def _parse_response(self, response) -> str:
         logger.info(f"Response from Azure OpenAI: {response.model_dump_json()}")
         if not response.choices:
             logger.warning("Azure OpenAI response has no choices")
@@ -218,48 +296,74 @@ class AzureLLM(BaseLLM):
         else:
             return response_content or ""
 
+    def _async_client(self):
+        return get_shared_async_azure_client(
+            self.config.base_url, self.config.api_version, self.config.api_key
+        )
+
+    def generate(self, messages: MessageList, **kwargs) -> str:
+        """Generate a response from Azure OpenAI LLM."""
+        response = self.client.chat.completions.create(
+            **self._build_request_body(messages, **kwargs)
+        )
+        return self._parse_response(response)
+
+    async def agenerate(self, messages: MessageList, **kwargs) -> str:
+        """Async variant of `generate` on a pooled client shared per event loop."""
+        async with get_async_limiter(("llm", self.config.base_url)):
+            response = await self._async_client().chat.completions.create(
+                **self._build_request_body(messages, **kwargs)
+            )
+        return self._parse_response(response)
+
+    def _build_stream_body(self, messages: MessageList, **kwargs) -> dict:
+        request_body = self._build_request_body(messages, **kwargs)
+        del request_body["tools"]
+        request_body["stream"] = True
+        return request_body
+
     def generate_stream(self, messages: MessageList, **kwargs) -> Generator[str, None, None]:
         """Stream response from Azure OpenAI LLM with optional reasoning support."""
         if kwargs.get("tools"):
             logger.info("stream api not support tools")
             return
 
-        enable_thinking = kwargs.get("enable_thinking", self.config.enable_thinking)
-        request_body = {
-            "model": self.config.model_name_or_path,
-            "messages": messages,
-            "stream": True,
-            "temperature": kwargs.get("temperature", self.config.temperature),
-            "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
-            "top_p": kwargs.get("top_p", self.config.top_p),
-            "extra_body": _merge_enable_thinking(
-                kwargs.get("extra_body", self.config.extra_body), enable_thinking
-            ),
-        }
-        response = self.client.chat.completions.create(**request_body)
-
-        reasoning_started = False
+        response = self.client.chat.completions.create(
+            **self._build_stream_body(messages, **kwargs)
+        )
 
+        think_tags = ThinkTagStream(self.config.remove_think_prefix)
         for chunk in response:
             if not chunk.choices:
                 continue
             delta = chunk.choices[0].delta
-
             # Support for custom 'reasoning_content' (if present in OpenAI-compatible models like Qwen, DeepSeek)
-            if hasattr(delta, "reasoning_content") and delta.reasoning_content:
-                if not reasoning_started and not self.config.remove_think_prefix:
-                    yield "<think>"
-                    reasoning_started = True
-                yield delta.reasoning_content
-            elif hasattr(delta, "content") and delta.content:
-                if reasoning_started and not self.config.remove_think_prefix:
-                    yield "</think>"
-                    reasoning_started = False
-                yield delta.content
+            reasoning = getattr(delta, "reasoning_content", None)
+            content = None if reasoning else getattr(delta, "content", None)
+            yield from think_tags.feed(reasoning, content)
+        yield from think_tags.close()
 
-        # Ensure we close the <think> block if not already done
-        if reasoning_started and not self.config.remove_think_prefix:
-            yield "</think>"
+    async def agenerate_stream(self, messages: MessageList, **kwargs) -> AsyncGenerator[str, None]:
+        """Async variant of `generate_stream` on a pooled client shared per event loop."""
+        if kwargs.get("tools"):
+            logger.info("stream api not support tools")
+            return
+
+        think_tags = ThinkTagStream(self.config.remove_think_prefix)
+        async with get_async_limiter(("llm", self.config.base_url)):
+            response = await self._async_client().chat.completions.create(
+                **self._build_stream_body(messages, **kwargs)
+            )
+            async for chunk in response:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                reasoning = getattr(delta, "reasoning_content", None)
+                content = None if reasoning else getattr(delta, "content", None)
+                for piece in think_tags.feed(reasoning, content):
+                    yield piece
+        for piece in think_tags.close():
+            yield piece
 
     def tool_call_parser(self, tool_calls: list[ChatCompletionMessageToolCall]) -> list[dict]:
         """Parse tool calls from OpenAI response."""
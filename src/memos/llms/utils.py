@@ -12,3 +12,36 @@ def remove_thinking_tags(text: str) -> str:
         str: The cleaned text.
     """
     return re.sub(r"^<think>.*?</think>\s*", "", text, flags=re.DOTALL).strip()
+
+
+class ThinkTagStream:
+    """
+    Wrap streamed reasoning deltas in a single `<think>...</think>` block.
+
+    Feed each chunk's reasoning and content deltas in order; the returned pieces are
+    ready to yield. Call `close()` once the stream ends.
+    """
+
+    def __init__(self, remove_think_prefix: bool = False):
+        self.remove_think_prefix = remove_think_prefix
+        self.reasoning_started = False
+
+    def feed(self, reasoning: str | None = None, content: str | None = None) -> list[str]:
+        pieces = []
+        if reasoning:
+            if not self.reasoning_started and not self.remove_think_prefix:
+                pieces.append("<think>")
+                self.reasoning_started = True
+            pieces.append(reasoning)
+        if content:
+            if self.reasoning_started and not self.remove_think_prefix:
+                pieces.append("</think>")
+                self.reasoning_started = False
+            pieces.append(content)
+        return pieces
+
+    def close(self) -> list[str]:
+        if self.reasoning_started and not self.remove_think_prefix:
+            self.reasoning_started = False
+            return ["</think>"]
+        return []
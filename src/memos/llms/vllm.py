@@ -1,15 +1,16 @@
 import json
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from typing import Any, cast
 
 import openai
 
 from openai.types.chat.chat_completion_message_tool_call import ChatCompletionMessageToolCall
 
+from memos.async_utils import get_async_limiter, get_shared_async_openai_client
 from memos.configs.llm import VLLMLLMConfig
 from memos.llms.base import BaseLLM
-from memos.llms.utils import remove_thinking_tags
+from memos.llms.utils import ThinkTagStream, remove_thinking_tags
 from memos.log import get_logger
 from memos.types import MessageDict
 
@@ -101,47 +102,77 @@ class VLLMLLM(BaseLLM):
         else:
             raise RuntimeError("API client is not available")
 
+    def _completion_kwargs(self, messages: list[MessageDict], **kwargs) -> dict:
+        completion_kwargs = {
+            "model": kwargs.get("model_name_or_path", self.config.model_name_or_path),
+            "messages": messages,
+            "temperature": kwargs.get("temperature", self.config.temperature),
+            "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
+            "top_p": kwargs.get("top_p", self.config.top_p),
+            "extra_body": kwargs.get("extra_body", self.config.extra_body),
+        }
+        if kwargs.get("tools"):
+            completion_kwargs["tools"] = kwargs.get("tools")
+            completion_kwargs["tool_choice"] = kwargs.get("tool_choice", "auto")
+        return completion_kwargs
+
+    def _stream_kwargs(self, messages: list[MessageDict], **kwargs) -> dict:
+        return {
+            "model": self.config.model_name_or_path,
+            "messages": messages,
+            "temperature": kwargs.get("temperature", self.config.temperature),
+            "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
+            "top_p": kwargs.get("top_p", self.config.top_p),
+            "stream": True,
+            "extra_body": kwargs.get("extra_body", self.config.extra_body),
+        }
+
+    def _parse_response(self, response) -> str:
+        if not response.choices:
+            logger.warning("VLLM response has no choices")
+            return ""
+
+        if response.choices[0].message.tool_calls:
+            return self.tool_call_parser(response.choices[0].message.tool_calls)
+
+        reasoning_content = (
+            f"<think>{response.choices[0].message.reasoning}</think>"
+            if hasattr(response.choices[0].message, "reasoning")
+            else ""
+        )
+        response_text = response.choices[0].message.content or ""
+        logger.info(f"VLLM API response: {response_text}")
+        return (
+            remove_thinking_tags(response_text)
+            if getattr(self.config, "remove_think_prefix", False)
+            else reasoning_content + response_text
+        )
+
+    def _async_client(self):
+        return get_shared_async_openai_client(
+            self.client.api_key, str(self.client.base_url), self.config.default_headers
+        )
+
     def _generate_with_api_client(self, messages: list[MessageDict], **kwargs) -> str:
         """
         Generate response using vLLM API client. detail view https://docs.vllm.ai/en/latest/features/reasoning_outputs/
         """
         if self.client:
-            completion_kwargs = {
-                "model": kwargs.get("model_name_or_path", self.config.model_name_or_path),
-                "messages": messages,
-                "temperature": kwargs.get("temperature", self.config.temperature),
-                "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
-                "top_p": kwargs.get("top_p", self.config.top_p),
-                "extra_body": kwargs.get("extra_body", self.config.extra_body),
-            }
-            if kwargs.get("tools"):
-                completion_kwargs["tools"] = kwargs.get("tools")
-                completion_kwargs["tool_choice"] = kwargs.get("tool_choice", "auto")
-
-            response = self.client.chat.completions.create(**completion_kwargs)
-
-            if not response.choices:
-                logger.warning("VLLM response has no choices")
-                return ""
-
-            if response.choices[0].message.tool_calls:
-                return self.tool_call_parser(response.choices[0].message.tool_calls)
-
-            reasoning_content = (
-                f"<think>{response.choices[0].message.reasoning}</think>"
-                if hasattr(response.choices[0].message, "reasoning")
-                else ""
-            )
-            response_text = response.choices[0].message.content or ""
-            logger.info(f"VLLM API response: {response_text}")
-            return (
-                remove_thinking_tags(response_text)
-                if getattr(self.config, "remove_think_prefix", False)
-                else reasoning_content + response_text
+            response = self.client.chat.completions.create(
+                **self._completion_kwargs(messages, **kwargs)
             )
+            return self._parse_response(response)
         else:
             raise RuntimeError("API client is not available")
 
+    async def agenerate(self, messages: list[MessageDict], **kwargs) -> str:
+        """Async variant of `generate` on a pooled client shared per event loop."""
+        async with get_async_limiter(("llm", str(self.client.base_url))):
+            response = await self._async_client().chat.completions.create(
+                **self._completion_kwargs(messages, **kwargs)
+            )
+        return self._parse_response(response)
+
     def _messages_to_prompt(self, messages: list[MessageDict]) -> str:
         """
         Convert messages to prompt string.
@@ -163,41 +194,45 @@ class VLLMLLM(BaseLLM):
             return
 
         if self.client:
-            completion_kwargs = {
-                "model": self.config.model_name_or_path,
-                "messages": messages,
-                "temperature": kwargs.get("temperature", self.config.temperature),
-                "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
-                "top_p": kwargs.get("top_p", self.config.top_p),
-                "stream": True,
-                "extra_body": kwargs.get("extra_body", self.config.extra_body),
-            }
-
-            stream = self.client.chat.completions.create(**completion_kwargs)
+            stream = self.client.chat.completions.create(**self._stream_kwargs(messages, **kwargs))
 
-            reasoning_started = False
+            think_tags = ThinkTagStream(self.config.remove_think_prefix)
             for chunk in stream:
                 if not chunk.choices:
                     continue
                 delta = chunk.choices[0].delta
-                if hasattr(delta, "reasoning") and delta.reasoning:
-                    if not reasoning_started and not self.config.remove_think_prefix:
-                        yield "<think>"
-                        reasoning_started = True
-                    yield delta.reasoning
-
-                if hasattr(delta, "content") and delta.content:
-                    if reasoning_started and not self.config.remove_think_prefix:
-                        yield "</think>"
-                        reasoning_started = False
-                    yield delta.content
-
-            if reasoning_started and not self.config.remove_think_prefix:
-                yield "</think>"
+                yield from think_tags.feed(
+                    getattr(delta, "reasoning", None), getattr(delta, "content", None)
+                )
+            yield from think_tags.close()
 
         else:
             raise RuntimeError("API client is not available")
 
+    async def agenerate_stream(
+        self, messages: list[MessageDict], **kwargs
+    ) -> AsyncGenerator[str, None]:
+        """Async variant of `generate_stream` on a pooled client shared per event loop."""
+        if kwargs.get("tools"):
+            logger.info("stream api not support tools")
+            return
+
+        think_tags = ThinkTagStream(self.config.remove_think_prefix)
+        async with get_async_limiter(("llm", str(self.client.base_url))):
+            stream = await self._async_client().chat.completions.create(
+                **self._stream_kwargs(messages, **kwargs)
+            )
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                for piece in think_tags.feed(
+                    getattr(delta, "reasoning", None), getattr(delta, "content", None)
+                ):
+                    yield piece
+        for piece in think_tags.close():
+            yield piece
+
     def tool_call_parser(self, tool_calls: list[ChatCompletionMessageToolCall]) -> list[dict]:
         """Parse tool calls from OpenAI response."""
         return [
@@ -0,0 +1,324 @@
+"""Bounded, lazily loaded residency for registered MemCubes.
+
+``MemCubeResidency`` is a drop-in mapping for ``MOSCore.mem_cubes``. Keys are
+every registered cube id, but a cube is only loaded into memory on first access
+and the least recently used idle cubes are evicted once a count or byte budget
+is exceeded. Evicted cubes are reloaded from their source directory; cubes
+with unsaved changes (or without a source directory) are first dumped to a
+spill directory, and are kept resident when no spill directory is configured.
+"""
+
+import os
+import shutil
+import threading
+import time
+import uuid
+
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Iterator, MutableMapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from memos.log import get_logger
+from memos.mem_cube.general import GeneralMemCube
+
+
+logger = get_logger(__name__)
+
+
+def estimate_cube_bytes(cube: GeneralMemCube) -> int:
+    """Best-effort resident size of a cube, dominated by activation (KV-cache) tensors."""
+    total = 0
+    act_mem = cube.act_mem
+    for item in getattr(act_mem, "kv_cache_memories", {}).values():
+        for layer in getattr(getattr(item, "memory", None), "layers", None) or []:
+            for tensor in (getattr(layer, "keys", None), getattr(layer, "values", None)):
+                if hasattr(tensor, "element_size"):
+                    total += tensor.numel() * tensor.element_size()
+    return total
+
+
+@dataclass
+class _CubeEntry:
+    source: str | None = None
+    source_is_dir: bool = False
+    cube: GeneralMemCube | None = None
+    dirty: bool = False
+    pins: int = 0
+    evicting: bool = False
+    size: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class MemCubeResidency(MutableMapping):
+    """Mapping of registered cube ids to MemCubes with lazy loading and LRU eviction.
+
+    Args:
+        max_resident: Maximum number of cubes kept in memory, or None for no limit.
+        max_resident_bytes: Byte budget over ``size_of`` estimates, or None for no limit.
+        spill_dir: Directory for dumping dirty or source-less cubes before eviction.
+        is_busy: Returns True for cube ids that must not be evicted right now,
+            e.g. cubes with running scheduler tasks.
+        size_of: Size estimator used for the byte budget.
+    """
+
+    def __init__(
+        self,
+        max_resident: int | None = None,
+        max_resident_bytes: int | None = None,
+        spill_dir: str | None = None,
+        is_busy: Callable[[str], bool] | None = None,
+        size_of: Callable[[GeneralMemCube], int] = estimate_cube_bytes,
+    ):
+        self.max_resident = max_resident
+        self.max_resident_bytes = max_resident_bytes
+        self.spill_dir = spill_dir
+        self.is_busy = is_busy
+        self.size_of = size_of
+        self._entries: dict[str, _CubeEntry] = {}
+        self._resident: OrderedDict[str, None] = OrderedDict()
+        self._lock = threading.RLock()
+        # Signalled whenever an eviction finishes, so readers never see a half-evicted cube.
+        self._evicted = threading.Condition(self._lock)
+        self._stats: Counter[str] = Counter()
+
+    def register(self, cube_id: str, source: "str | GeneralMemCube") -> None:
+        """Register a cube by directory/remote repo name (loaded lazily) or by instance."""
+        with self._lock:
+            entry = _CubeEntry()
+            self._drop(cube_id)
+            if isinstance(source, str):
+                entry.source = source
+                entry.source_is_dir = os.path.isdir(source)
+            else:
+                entry.cube = source
+                entry.size = self._safe_size(source)
+                self._resident[cube_id] = None
+            self._entries[cube_id] = entry
+        self._enforce_budget(keep=cube_id)
+
+    def __setitem__(self, cube_id: str, cube: "str | GeneralMemCube") -> None:
+        self.register(cube_id, cube)
+
+    def __getitem__(self, cube_id: str) -> GeneralMemCube:
+        with self._lock:
+            entry = self._entries.get(cube_id)
+            if entry is None:
+                raise KeyError(cube_id)
+            self._wait_for_eviction(entry)
+            if entry.cube is not None:
+                self._resident.move_to_end(cube_id)
+                self._stats["hits"] += 1
+                return entry.cube
+
+        with entry.lock:
+            # Another thread may have loaded the cube while we waited.
+            if entry.cube is None:
+                cube = self._load(cube_id, entry)
+                with self._lock:
+                    entry.cube = cube
+                    entry.size = self._safe_size(cube)
+                    if self._entries.get(cube_id) is entry:
+                        self._resident[cube_id] = None
+            cube = entry.cube
+        self._enforce_budget(keep=cube_id)
+        return cube
+
+    def __delitem__(self, cube_id: str) -> None:
+        with self._lock:
+            if cube_id not in self._entries:
+                raise KeyError(cube_id)
+            self._drop(cube_id)
+
+    def __contains__(self, cube_id: object) -> bool:
+        return cube_id in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def is_resident(self, cube_id: str) -> bool:
+        return cube_id in self._resident
+
+    def resident_items(self) -> list[tuple[str, GeneralMemCube]]:
+        """Loaded cubes only, without triggering any loads."""
+        with self._lock:
+            return [(cube_id, self._entries[cube_id].cube) for cube_id in self._resident]
+
+    def mark_dirty(self, cube_id: str) -> None:
+        """Record that a resident cube has changes that must be dumped before eviction."""
+        with self._lock:
+            entry = self._entries.get(cube_id)
+            if entry is None or entry.cube is None:
+                return
+            entry.dirty = True
+            entry.size = self._safe_size(entry.cube)
+        self._enforce_budget(keep=cube_id)
+
+    @contextmanager
+    def pinned(self, cube_id: str):
+        """Keep ``cube_id`` resident (never evicted) for the duration of the block."""
+        with self._lock:
+            entry = self._entries.get(cube_id)
+            if entry is not None:
+                self._wait_for_eviction(entry)
+                entry.pins += 1
+        try:
+            yield self[cube_id]
+        finally:
+            if entry is not None:
+                with self._lock:
+                    entry.pins -= 1
+
+    def evict(self, cube_id: str) -> bool:
+        """Evict one idle cube now. Returns False if it is pinned, busy or cannot be saved."""
+        with self._lock:
+            entry = self._entries.get(cube_id)
+            if entry is None or entry.cube is None or not self._evictable(cube_id, entry):
+                return False
+        if not entry.lock.acquire(blocking=False):
+            return False
+        try:
+            with self._lock:
+                # A pin may have been taken between the check above and acquiring entry.lock.
+                if entry.cube is None or not self._evictable(cube_id, entry):
+                    return False
+                entry.evicting = True
+            if entry.dirty or not entry.source_is_dir:
+                self._spill(cube_id, entry)
+            self._close(cube_id, entry.cube)
+            with self._lock:
+                entry.cube = None
+                entry.size = 0
+                self._resident.pop(cube_id, None)
+                self._stats["evictions"] += 1
+        except Exception as e:
+            logger.warning(f"[MemCubeResidency] Failed to evict cube {cube_id}: {e}")
+            with self._lock:
+                self._stats["eviction_errors"] += 1
+            return False
+        finally:
+            with self._lock:
+                entry.evicting = False
+                self._evicted.notify_all()
+            entry.lock.release()
+        logger.info(f"[MemCubeResidency] Evicted cube {cube_id}")
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            info = dict(self._stats)
+            for key in ("hits", "loads", "load_errors", "evictions", "eviction_errors", "spills"):
+                info.setdefault(key, 0)
+            info.setdefault("load_seconds", 0.0)
+            info["registered"] = len(self._entries)
+            info["resident"] = len(self._resident)
+            info["resident_bytes"] = sum(self._entries[cube_id].size for cube_id in self._resident)
+            info["dirty"] = sum(1 for cube_id in self._resident if self._entries[cube_id].dirty)
+            info["pinned"] = sum(1 for cube_id in self._resident if self._entries[cube_id].pins > 0)
+        return info
+
+    def _load(self, cube_id: str, entry: _CubeEntry) -> GeneralMemCube:
+        started = time.perf_counter()
+        try:
+            if entry.source_is_dir:
+                cube = GeneralMemCube.init_from_dir(entry.source)
+            else:
+                logger.warning(
+                    f"MemCube {entry.source} does not exist, try to init from remote repo."
+                )
+                cube = GeneralMemCube.init_from_remote_repo(entry.source)
+        except Exception:
+            with self._lock:
+                self._stats["load_errors"] += 1
+            raise
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._stats["loads"] += 1
+            self._stats["load_seconds"] += elapsed
+        logger.info(f"[MemCubeResidency] Loaded cube {cube_id} in {elapsed:.3f}s")
+        return cube
+
+    def _wait_for_eviction(self, entry: _CubeEntry) -> None:
+        """Block (with ``_lock`` held) until an in-flight eviction of ``entry`` settles."""
+        while entry.evicting:
+            self._evicted.wait()
+
+    def _evictable(self, cube_id: str, entry: _CubeEntry) -> bool:
+        if entry.pins > 0:
+            return False
+        if (entry.dirty or not entry.source_is_dir) and not self.spill_dir:
+            return False
+        if self.is_busy is not None:
+            try:
+                if self.is_busy(cube_id):
+                    return False
+            except Exception as e:
+                logger.warning(f"[MemCubeResidency] is_busy check failed for {cube_id}: {e}")
+                return False
+        return True
+
+    def _over_budget(self) -> bool:
+        if self.max_resident is not None and len(self._resident) > self.max_resident:
+            return True
+        if self.max_resident_bytes is not None:
+            used = sum(self._entries[cube_id].size for cube_id in self._resident)
+            return used > self.max_resident_bytes
+        return False
+
+    def _enforce_budget(self, keep: str | None = None) -> None:
+        with self._lock:
+            if not self._over_budget():
+                return
+            candidates = [cube_id for cube_id in self._resident if cube_id != keep]
+        for cube_id in candidates:
+            with self._lock:
+                if not self._over_budget():
+                    return
+            self.evict(cube_id)
+        with self._lock:
+            if self._over_budget():
+                logger.warning(
+                    f"[MemCubeResidency] Over budget with {len(self._resident)} resident cubes; "
+                    "remaining cubes are pinned, busy or cannot be saved"
+                )
+
+    def _spill(self, cube_id: str, entry: _CubeEntry) -> None:
+        target = os.path.join(self.spill_dir, cube_id)
+        staging = f"{target}.tmp-{uuid.uuid4().hex}"
+        os.makedirs(staging)
+        try:
+            entry.cube.dump(staging)
+            if os.path.exists(target):
+                shutil.rmtree(target)
+            os.replace(staging, target)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        with self._lock:
+            entry.source = target
+            entry.source_is_dir = True
+            entry.dirty = False
+            self._stats["spills"] += 1
+
+    @staticmethod
+    def _close(cube_id: str, cube: GeneralMemCube) -> None:
+        text_mem = cube.text_mem
+        if text_mem is not None and getattr(text_mem, "is_reorganize", False):
+            logger.info(f"[MemCubeResidency] Closing reorganizer for evicted cube {cube_id}")
+            text_mem.memory_manager.close()
+
+    def _safe_size(self, cube: GeneralMemCube) -> int:
+        try:
+            return int(self.size_of(cube))
+        except Exception as e:
+            logger.warning(f"[MemCubeResidency] Failed to estimate cube size: {e}")
+            return 0
+
+    def _drop(self, cube_id: str) -> None:
+        self._entries.pop(cube_id, None)
+        self._resident.pop(cube_id, None)
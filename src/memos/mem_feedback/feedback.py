@@ -32,6 +32,7 @@ from memos.memories.textual.tree_text_memory.organize.manager import (
     MemoryManager,
     extract_working_binding_ids,
 )
+from memos.memories.textual.tree_text_memory.retrieve.result_cache import bump_cube_version
 from memos.memories.textual.tree_text_memory.retrieve.retrieve_utils import StopwordManager
 from memos.plugins.hook_defs import H
 from memos.plugins.hooks import trigger_single_hook
@@ -327,6 +328,7 @@ class MemFeedback(BaseMemFeedback):
             logger.info(
                 f"[Memory Feedback UPDATE] Updated:{item_id} | history appended | memory_type: {old_memory_item.metadata.memory_type}"
             )
+        bump_cube_version(user_name)
 
         return {
             "id": item_id,
@@ -429,6 +431,8 @@ class MemFeedback(BaseMemFeedback):
                 logger.warning(
                     f"[0107 Feedback Core:_del_working_binding] TreeTextMemory.delete_hard: failed to delete {mid}: {e}"
                 )
+        if delete_ids:
+            bump_cube_version(user_name)
         return bindings_to_delete
 
     def semantics_feedback(
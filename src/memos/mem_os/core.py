@@ -2,6 +2,7 @@ import json
 import os
 import time
 
+from contextlib import AbstractContextManager, nullcontext
 from datetime import datetime, timezone
 from pathlib import Path
 from threading import Lock
@@ -12,6 +13,7 @@ from memos.context.context import ContextThreadPoolExecutor
 from memos.llms.factory import LLMFactory
 from memos.log import get_logger
 from memos.mem_cube.general import GeneralMemCube
+from memos.mem_cube.residency import MemCubeResidency
 from memos.mem_reader.factory import MemReaderFactory
 from memos.mem_scheduler.general_scheduler import GeneralScheduler
 from memos.mem_scheduler.scheduler_factory import SchedulerFactory
@@ -53,6 +55,14 @@ class MOSCore:
         self.mem_cubes: OptimizedThreadSafeDict[str, GeneralMemCube] = (
             OptimizedThreadSafeDict() if user_manager is not None else {}
         )
+        if config.max_resident_cubes is not None or config.max_resident_cube_bytes is not None:
+            # bounded residency: cubes load lazily and idle ones are evicted (LRU)
+            self.mem_cubes = MemCubeResidency(
+                max_resident=config.max_resident_cubes,
+                max_resident_bytes=config.max_resident_cube_bytes,
+                spill_dir=config.cube_spill_dir,
+                is_busy=self._cube_has_scheduled_tasks,
+            )
         self._register_chat_history()
 
         # Use provided user_manager or create a new one
@@ -169,9 +179,54 @@ class MOSCore:
     def mem_reorganizer_on(self) -> bool:
         pass
 
+    def _cube_has_scheduled_tasks(self, mem_cube_id: str) -> bool:
+        """Whether the scheduler has queued or running tasks for the cube."""
+        scheduler = getattr(self, "_mem_scheduler", None)
+        if scheduler is None:
+            return False
+        dispatcher = getattr(scheduler, "dispatcher", None)
+        if dispatcher is not None and dispatcher.get_running_tasks(
+            lambda task: task.mem_cube_id == mem_cube_id
+        ):
+            return True
+        task_queue = getattr(scheduler, "memos_message_queue", None)
+        return task_queue is not None and task_queue.has_queued_messages(mem_cube_id)
+
+    def _pinned_cube(self, mem_cube_id: str) -> AbstractContextManager[GeneralMemCube]:
+        """Hold a cube for the duration of a block so a bounded residency cannot evict it."""
+        if isinstance(self.mem_cubes, MemCubeResidency):
+            return self.mem_cubes.pinned(mem_cube_id)
+        return nullcontext(self.mem_cubes[mem_cube_id])
+
+    def _loaded_mem_cubes(self) -> list[GeneralMemCube]:
+        """Cubes currently in memory; never triggers a lazy load."""
+        if isinstance(self.mem_cubes, MemCubeResidency):
+            return [mem_cube for _, mem_cube in self.mem_cubes.resident_items()]
+        return list(self.mem_cubes.values())
+
+    def _is_cube_loaded(self, mem_cube_id: str) -> bool:
+        if isinstance(self.mem_cubes, MemCubeResidency):
+            return self.mem_cubes.is_resident(mem_cube_id)
+        return mem_cube_id in self.mem_cubes
+
+    def _mark_cube_dirty(self, mem_cube_id: str, text_only: bool = True) -> None:
+        """Record unsaved changes so a bounded residency dumps the cube before eviction."""
+        if not isinstance(self.mem_cubes, MemCubeResidency):
+            return
+        if text_only and self.mem_cubes[mem_cube_id].config.text_mem.backend == "tree_text":
+            # tree_text memories live in the graph database; eviction loses nothing
+            return
+        self.mem_cubes.mark_dirty(mem_cube_id)
+
+    def mem_cube_residency_stats(self) -> dict[str, Any]:
+        """Residency metrics for loaded MemCubes."""
+        if isinstance(self.mem_cubes, MemCubeResidency):
+            return self.mem_cubes.stats()
+        return {"registered": len(self.mem_cubes), "resident": len(self.mem_cubes)}
+
     def mem_reorganizer_off(self) -> bool:
         """temporally implement"""
-        for mem_cube in self.mem_cubes.values():
+        for mem_cube in self._loaded_mem_cubes():
             logger.info(f"try to close reorganizer for {mem_cube.text_mem.config.cube_id}")
             if mem_cube.text_mem and mem_cube.text_mem.is_reorganize:
                 logger.info(f"close reorganizer for {mem_cube.text_mem.config.cube_id}")
@@ -179,7 +234,7 @@ class MOSCore:
                 mem_cube.text_mem.memory_manager.wait_reorganizer()
 
     def mem_reorganizer_wait(self) -> bool:
-        for mem_cube in self.mem_cubes.values():
+        for mem_cube in self._loaded_mem_cubes():
             logger.info(f"try to close reorganizer for {mem_cube.text_mem.config.cube_id}")
             if mem_cube.text_mem and mem_cube.text_mem.is_reorganize:
                 logger.info(f"close reorganizer for {mem_cube.text_mem.config.cube_id}")
@@ -272,32 +327,33 @@ class MOSCore:
 
         if self.config.enable_textual_memory and self.mem_cubes:
             memories_all = []
-            for mem_cube_id, mem_cube in self.mem_cubes.items():
+            for mem_cube_id in list(self.mem_cubes):
                 if mem_cube_id not in user_cube_ids:
                     continue
-                if not mem_cube.text_mem:
-                    continue
+                with self._pinned_cube(mem_cube_id) as mem_cube:
+                    if not mem_cube.text_mem:
+                        continue
 
-                # submit message to scheduler
-                if self.enable_mem_scheduler and self.mem_scheduler is not None:
-                    message_item = ScheduleMessageItem(
-                        user_id=target_user_id,
-                        mem_cube_id=mem_cube_id,
-                        label=QUERY_TASK_LABEL,
-                        content=query,
-                        timestamp=datetime.utcnow(),
-                    )
-                    self.mem_scheduler.submit_messages(messages=[message_item])
+                    # submit message to scheduler
+                    if self.enable_mem_scheduler and self.mem_scheduler is not None:
+                        message_item = ScheduleMessageItem(
+                            user_id=target_user_id,
+                            mem_cube_id=mem_cube_id,
+                            label=QUERY_TASK_LABEL,
+                            content=query,
+                            timestamp=datetime.utcnow(),
+                        )
+                        self.mem_scheduler.submit_messages(messages=[message_item])
 
-                memories = mem_cube.text_mem.search(
-                    query,
-                    top_k=self.config.top_k,
-                    info={
-                        "user_id": target_user_id,
-                        "session_id": self.session_id,
-                        "chat_history": chat_history.chat_history,
-                    },
-                )
+                    memories = mem_cube.text_mem.search(
+                        query,
+                        top_k=self.config.top_k,
+                        info={
+                            "user_id": target_user_id,
+                            "session_id": self.session_id,
+                            "chat_history": chat_history.chat_history,
+                        },
+                    )
                 memories_all.extend(memories)
             logger.info(f"🧠 [Memory] Searched memories:\n{self._str_memories(memories_all)}\n")
             system_prompt = self._build_system_prompt(memories_all, base_prompt=base_prompt)
@@ -311,23 +367,27 @@ class MOSCore:
         past_key_values = None
 
         if self.config.enable_activation_memory:
+            pinned_cube = nullcontext()
             if self.config.chat_model.backend not in ["huggingface", "huggingface_singleton"]:
                 logger.error(
                     "Activation memory only used for huggingface backend. Skipping activation memory."
                 )
             else:
                 # TODO this only one cubes
-                for mem_cube_id, mem_cube in self.mem_cubes.items():
+                for mem_cube_id in list(self.mem_cubes):
                     if mem_cube_id not in user_cube_ids:
                         continue
-                    if mem_cube.act_mem:
-                        kv_cache = next(iter(mem_cube.act_mem.get_all()), None)
-                        past_key_values = (
-                            kv_cache.memory if (kv_cache and hasattr(kv_cache, "memory")) else None
-                        )
+                    # keep the cube (and its KV cache) resident until generation is done
+                    pinned_cube = self._pinned_cube(mem_cube_id)
                     break
-            # Generate response
-            response = self.chat_llm.generate(current_messages, past_key_values=past_key_values)
+            with pinned_cube as mem_cube:
+                if mem_cube is not None and mem_cube.act_mem:
+                    kv_cache = next(iter(mem_cube.act_mem.get_all()), None)
+                    past_key_values = (
+                        kv_cache.memory if (kv_cache and hasattr(kv_cache, "memory")) else None
+                    )
+                # Generate response
+                response = self.chat_llm.generate(current_messages, past_key_values=past_key_values)
         else:
             response = self.chat_llm.generate(current_messages)
         logger.info(f"🤖 [Assistant] {response}\n")
@@ -338,7 +398,6 @@ class MOSCore:
         # submit message to scheduler
         for accessible_mem_cube in accessible_cubes:
             mem_cube_id = accessible_mem_cube.cube_id
-            mem_cube = self.mem_cubes[mem_cube_id]
             if self.enable_mem_scheduler and self.mem_scheduler is not None:
                 message_item = ScheduleMessageItem(
                     user_id=target_user_id,
@@ -481,6 +540,12 @@ class MOSCore:
 
         if mem_cube_id in self.mem_cubes:
             logger.info(f"MemCube with ID {mem_cube_id} already in MOS, skip install.")
+        elif isinstance(self.mem_cubes, MemCubeResidency) and not isinstance(
+            mem_cube_name_or_path, GeneralMemCube
+        ):
+            # loaded on first access
+            self.mem_cubes.register(mem_cube_id, mem_cube_name_or_path)
+            logger.info(f"register lazy cube {mem_cube_id} for user {target_user_id}")
         else:
             if isinstance(mem_cube_name_or_path, GeneralMemCube):
                 self.mem_cubes[mem_cube_id] = mem_cube_name_or_path
@@ -498,10 +563,11 @@ class MOSCore:
         existing_cube = self.user_manager.get_cube(mem_cube_id)
 
         # check the embedder is it consistent with MOSConfig
-        if hasattr(
-            self.mem_cubes[mem_cube_id].text_mem.config, "embedder"
-        ) and self.config.mem_reader.config.embedder != (
-            cube_embedder := self.mem_cubes[mem_cube_id].text_mem.config.embedder
+        if (
+            self._is_cube_loaded(mem_cube_id)
+            and hasattr(self.mem_cubes[mem_cube_id].text_mem.config, "embedder")
+            and self.config.mem_reader.config.embedder
+            != (cube_embedder := self.mem_cubes[mem_cube_id].text_mem.config.embedder)
         ):
             logger.warning(
                 f"Cube Embedder is not consistent with MOSConfig for cube: {mem_cube_id}, will use Cube Embedder: {cube_embedder}"
@@ -596,17 +662,16 @@ class MOSCore:
         }
         if install_cube_ids is None:
             install_cube_ids = user_cube_ids
-        # create exist dict in mem_cubes and avoid  one search slow
-        tmp_mem_cubes = {}
+        # registered cubes only; each is loaded and pinned while it is searched
         time_start_cube_get = time.time()
-        for mem_cube_id in install_cube_ids:
-            if mem_cube_id in self.mem_cubes:
-                tmp_mem_cubes[mem_cube_id] = self.mem_cubes.get(mem_cube_id)
+        search_cube_ids = [
+            mem_cube_id for mem_cube_id in install_cube_ids if mem_cube_id in self.mem_cubes
+        ]
         logger.info(
             f"time search: transform cube time user_id: {target_user_id} time is: {time.time() - time_start_cube_get}"
         )
 
-        for mem_cube_id, mem_cube in tmp_mem_cubes.items():
+        for mem_cube_id in search_cube_ids:
             # Define internal functions for parallel search execution
             def search_textual_memory(cube_id, cube):
                 if (
@@ -665,7 +730,10 @@ class MOSCore:
                 return None
 
             # Execute both search functions in parallel
-            with ContextThreadPoolExecutor(max_workers=2) as executor:
+            with (
+                self._pinned_cube(mem_cube_id) as mem_cube,
+                ContextThreadPoolExecutor(max_workers=2) as executor,
+            ):
                 text_future = executor.submit(search_textual_memory, mem_cube_id, mem_cube)
                 pref_future = executor.submit(search_preference_memory, mem_cube_id, mem_cube)
 
@@ -731,6 +799,30 @@ class MOSCore:
         if mem_cube_id not in self.mem_cubes:
             raise ValueError(f"MemCube '{mem_cube_id}' is not loaded. Please register.")
 
+        with self._pinned_cube(mem_cube_id):
+            self._add_to_cube(
+                mem_cube_id,
+                target_user_id,
+                target_session_id,
+                messages=messages,
+                memory_content=memory_content,
+                doc_path=doc_path,
+                task_id=task_id,
+            )
+            self._mark_cube_dirty(mem_cube_id)
+        logger.info(f"Add memory to {mem_cube_id} successfully")
+
+    def _add_to_cube(
+        self,
+        mem_cube_id: str,
+        target_user_id: str,
+        target_session_id: str,
+        messages: MessageList | None,
+        memory_content: str | None,
+        doc_path: str | None,
+        task_id: str | None,
+    ) -> None:
+        """Body of ``add`` once the target cube is resolved and pinned."""
         sync_mode = self.mem_cubes[mem_cube_id].text_mem.mode
         if sync_mode == "async":
             assert self.mem_scheduler is not None, (
@@ -920,8 +1012,6 @@ class MOSCore:
                 )
                 self.mem_scheduler.submit_messages(messages=[message_item])
 
-        logger.info(f"Add memory to {mem_cube_id} successfully")
-
     def get(
         self, mem_cube_id: str, memory_id: str, user_id: str | None = None
     ) -> TextualMemoryItem | ActivationMemoryItem | ParametricMemoryItem:
@@ -1025,13 +1115,15 @@ class MOSCore:
             mem_cube_id = accessible_cubes[0].cube_id  # TODO not only first
         else:
             self._validate_cube_access(target_user_id, mem_cube_id)
-        if self.mem_cubes[mem_cube_id].config.text_mem.backend != "tree_text":
-            self.mem_cubes[mem_cube_id].text_mem.update(memory_id, memories=text_memory_item)
-            logger.info(f"MemCube {mem_cube_id} updated memory {memory_id}")
-        else:
-            logger.warning(
-                f" {self.mem_cubes[mem_cube_id].config.text_mem.backend} does not support update memory"
-            )
+        with self._pinned_cube(mem_cube_id) as mem_cube:
+            if mem_cube.config.text_mem.backend != "tree_text":
+                mem_cube.text_mem.update(memory_id, memories=text_memory_item)
+                self._mark_cube_dirty(mem_cube_id)
+                logger.info(f"MemCube {mem_cube_id} updated memory {memory_id}")
+            else:
+                logger.warning(
+                    f" {mem_cube.config.text_mem.backend} does not support update memory"
+                )
 
     def delete(self, mem_cube_id: str, memory_id: str, user_id: str | None = None) -> None:
         """
@@ -1057,7 +1149,9 @@ class MOSCore:
             mem_cube_id = accessible_cubes[0].cube_id  # TODO not only first
         else:
             self._validate_cube_access(target_user_id, mem_cube_id)
-        self.mem_cubes[mem_cube_id].text_mem.delete(memory_id)
+        with self._pinned_cube(mem_cube_id) as mem_cube:
+            mem_cube.text_mem.delete(memory_id)
+            self._mark_cube_dirty(mem_cube_id)
         logger.info(f"MemCube {mem_cube_id} deleted memory {memory_id}")
 
     def delete_all(self, mem_cube_id: str | None = None, user_id: str | None = None) -> None:
@@ -1083,7 +1177,9 @@ class MOSCore:
             mem_cube_id = accessible_cubes[0].cube_id  # TODO not only first
         else:
             self._validate_cube_access(target_user_id, mem_cube_id)
-        self.mem_cubes[mem_cube_id].text_mem.delete_all()
+        with self._pinned_cube(mem_cube_id) as mem_cube:
+            mem_cube.text_mem.delete_all()
+            self._mark_cube_dirty(mem_cube_id)
         logger.info(f"MemCube {mem_cube_id} deleted all memories")
 
     def dump(
@@ -1127,7 +1223,9 @@ class MOSCore:
             mem_cube_id = accessible_cubes[0].cube_id
         if mem_cube_id not in self.mem_cubes:
             raise ValueError(f"MemCube with ID {mem_cube_id} does not exist. please regiester")
-        self.mem_cubes[mem_cube_id].load(load_dir, memory_types=memory_types)
+        with self._pinned_cube(mem_cube_id) as mem_cube:
+            mem_cube.load(load_dir, memory_types=memory_types)
+            self._mark_cube_dirty(mem_cube_id, text_only=False)
         logger.info(f"MemCube {mem_cube_id} loaded from {load_dir}")
 
     def get_user_info(self) -> dict[str, Any]:
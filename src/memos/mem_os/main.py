@@ -245,9 +245,10 @@ class MOS(MOSCore):
             return None
 
         # Get the first available text memory from user's accessible cubes
-        for mem_cube_id, mem_cube in self.mem_cubes.items():
+        for mem_cube_id in list(self.mem_cubes):
             if mem_cube_id not in user_cube_ids:
                 continue
+            mem_cube = self.mem_cubes[mem_cube_id]
             if mem_cube.text_mem:
                 return mem_cube.text_mem
 
@@ -320,9 +321,10 @@ class MOS(MOSCore):
                 accessible_cubes = self.user_manager.get_user_cubes(target_user_id)
                 user_cube_ids = [cube.cube_id for cube in accessible_cubes]
 
-                for mem_cube_id, mem_cube in self.mem_cubes.items():
+                for mem_cube_id in list(self.mem_cubes):
                     if mem_cube_id not in user_cube_ids:
                         continue
+                    mem_cube = self.mem_cubes[mem_cube_id]
                     if mem_cube.act_mem:
                         kv_cache = next(iter(mem_cube.act_mem.get_all()), None)
                         past_key_values = (
@@ -500,7 +500,7 @@ class MultiModalStructMemReader(SimpleStructMemReader):
 
         messages = [{"role": "user", "content": prompt}]
         try:
-            response_text = self.llm.generate(messages)
+            response_text = self.llm.generate(messages, cache=True)
             response_json = parse_json_result(response_text)
         except Exception as e:
             logger.error(f"[LLM] Exception during chat generation: {e}")
@@ -257,7 +257,7 @@ class SimpleStructMemReader(BaseMemReader, ABC):
 
     def _safe_generate(self, messages: list[dict]) -> str | None:
         try:
-            return self.llm.generate(messages)
+            return self.llm.generate(messages, cache=True)
         except Exception:
             logger.exception("[LLM] Generation failed")
             return None
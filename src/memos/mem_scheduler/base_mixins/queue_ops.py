@@ -165,10 +165,18 @@ class BaseSchedulerQueueMixin:
                 if self.enable_parallel_dispatch and self.dispatcher:
                     running_tasks = self.dispatcher.get_running_task_count()
                     if running_tasks >= self.dispatcher.max_workers:
-                        time.sleep(self._consume_interval)
+                        if self.event_driven_consumer:
+                            self.dispatcher.wait_for_free_slot(timeout=self._consume_block_timeout)
+                        else:
+                            time.sleep(self._consume_interval)
                         continue
 
-                messages = self.memos_message_queue.get_messages(batch_size=self.consume_batch)
+                if self.event_driven_consumer:
+                    messages = self.memos_message_queue.get_messages(
+                        batch_size=self.consume_batch, block_timeout=self._consume_block_timeout
+                    )
+                else:
+                    messages = self.memos_message_queue.get_messages(batch_size=self.consume_batch)
 
                 if messages:
                     now = time.time()
@@ -231,7 +239,8 @@ class BaseSchedulerQueueMixin:
                     except Exception as e:
                         logger.error("Error dispatching messages: %s", e)
 
-                time.sleep(self._consume_interval)
+                if not self.event_driven_consumer:
+                    time.sleep(self._consume_interval)
 
             except Exception as e:
                 if "No messages available in Redis queue" not in str(e):
@@ -239,6 +248,8 @@ class BaseSchedulerQueueMixin:
                 time.sleep(self._consume_interval)
 
     def _monitor_loop(self):
+        # (user_id, task_label) groups with a non-zero age gauge, so drained ones get reset
+        aged_groups: set[tuple[str, str]] = set()
         while self._running:
             try:
                 q_sizes = self.memos_message_queue.qsize()
@@ -258,6 +269,18 @@ class BaseSchedulerQueueMixin:
                         if ":" not in stream_key:
                             self.metrics.update_queue_length(queue_length, stream_key)
 
+                oldest_ages: dict[tuple[str, str], float] = {}
+                for stream_key, age in self.memos_message_queue.get_queue_ages().items():
+                    parts = stream_key.split(":")
+                    if len(parts) >= 3:
+                        group = (parts[-3], parts[-1])
+                        oldest_ages[group] = max(age, oldest_ages.get(group, 0.0))
+                for (user_id, task_label), age in oldest_ages.items():
+                    self.metrics.update_queue_age(age, user_id, task_label)
+                for user_id, task_label in aged_groups - oldest_ages.keys():
+                    self.metrics.update_queue_age(0.0, user_id, task_label)
+                aged_groups = set(oldest_ages)
+
             except Exception as e:
                 logger.error("Error in metrics monitor loop: %s", e, exc_info=True)
 
@@ -432,6 +455,11 @@ class BaseSchedulerQueueMixin:
                 )
             except Exception:
                 stats["unfinished_tasks"] = -1
+            try:
+                ages = memos_message_queue.get_queue_ages()
+                stats["oldest_message_age_seconds"] = max(ages.values(), default=0.0)
+            except Exception:
+                stats["oldest_message_age_seconds"] = -1
             stats["maxsize"] = int(self.max_internal_message_queue_size)
             try:
                 maxsize = int(self.max_internal_message_queue_size) or 1
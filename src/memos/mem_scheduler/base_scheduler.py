@@ -3,11 +3,14 @@ from __future__ import annotations
 import os
 import threading
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from memos.configs.mem_scheduler import AuthConfig, BaseSchedulerConfig
 from memos.log import get_logger
+from memos.mem_cube.residency import MemCubeResidency
 from memos.mem_scheduler.base_mixins import (
     BaseSchedulerMemoryMixin,
     BaseSchedulerQueueMixin,
@@ -28,8 +31,10 @@ from memos.mem_scheduler.monitors.task_schedule_monitor import TaskScheduleMonit
 from memos.mem_scheduler.schemas.general_schemas import (
     DEFAULT_ACT_MEM_DUMP_PATH,
     DEFAULT_CONSUME_BATCH,
+    DEFAULT_CONSUME_BLOCK_TIMEOUT_SECONDS,
     DEFAULT_CONSUME_INTERVAL_SECONDS,
     DEFAULT_CONTEXT_WINDOW_SIZE,
+    DEFAULT_EVENT_DRIVEN_CONSUMER,
     DEFAULT_MAX_INTERNAL_MESSAGE_QUEUE_SIZE,
     DEFAULT_MAX_WEB_LOG_QUEUE_SIZE,
     DEFAULT_STARTUP_MODE,
@@ -48,6 +53,8 @@ from memos.mem_scheduler.webservice_modules.redis_service import RedisSchedulerM
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     import redis
 
     from sqlalchemy.engine import Engine
@@ -65,6 +72,9 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Cube pinned for the handler batch running in the current thread, if any.
+_handler_mem_cube: ContextVar[BaseMemCube | None] = ContextVar("handler_mem_cube", default=None)
+
 
 class BaseScheduler(
     RabbitMQSchedulerModule,
@@ -115,6 +125,12 @@ class BaseScheduler(
             "consume_interval_seconds", DEFAULT_CONSUME_INTERVAL_SECONDS
         )
         self.consume_batch = self.config.get("consume_batch", DEFAULT_CONSUME_BATCH)
+        self.event_driven_consumer = self.config.get(
+            "event_driven_consumer", DEFAULT_EVENT_DRIVEN_CONSUMER
+        )
+        self._consume_block_timeout = self.config.get(
+            "consume_block_timeout_seconds", DEFAULT_CONSUME_BLOCK_TIMEOUT_SECONDS
+        )
 
         # message queue configuration
         self.use_redis_queue = self.config.get("use_redis_queue", DEFAULT_USE_REDIS_QUEUE)
@@ -239,6 +255,7 @@ class BaseScheduler(
                 monitor=self.monitor,
                 log_func_callback=self._submit_web_logs,
                 log_activation_memory_update_func=self.log_activation_memory_update,
+                on_activation_memory_updated=self._mark_mem_cube_dirty,
             )
 
             if mem_reader:
@@ -362,6 +379,34 @@ class BaseScheduler(
         """
         return self._mem_cubes
 
+    @contextmanager
+    def pinned_mem_cube(self, mem_cube_id: str) -> Iterator[BaseMemCube | None]:
+        """Keep ``mem_cube_id`` resident while a handler batch works on it.
+
+        Only applies when ``mem_cubes`` is a bounded ``MemCubeResidency``; inside
+        the block ``handler_mem_cube()`` returns the pinned cube.
+        """
+        mem_cubes = self._mem_cubes
+        if not isinstance(mem_cubes, MemCubeResidency) or mem_cube_id not in mem_cubes:
+            yield None
+            return
+        with mem_cubes.pinned(mem_cube_id) as mem_cube:
+            token = _handler_mem_cube.set(mem_cube)
+            try:
+                yield mem_cube
+            finally:
+                _handler_mem_cube.reset(token)
+
+    def handler_mem_cube(self) -> BaseMemCube:
+        """The cube pinned for the running handler batch, else the current cube."""
+        mem_cube = _handler_mem_cube.get()
+        return mem_cube if mem_cube is not None else self.mem_cube
+
+    def _mark_mem_cube_dirty(self, mem_cube_id: str) -> None:
+        """Make a bounded residency dump the cube's activation memory before evicting it."""
+        if isinstance(self._mem_cubes, MemCubeResidency):
+            self._mem_cubes.mark_dirty(mem_cube_id)
+
     @mem_cubes.setter
     def mem_cubes(self, value: dict[str, BaseMemCube]) -> None:
         self._mem_cubes = value or {}
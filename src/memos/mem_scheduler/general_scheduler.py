@@ -32,7 +32,7 @@ class GeneralScheduler(BaseScheduler):
             log_working_memory_replacement=self.log_working_memory_replacement,
         )
         scheduler_context = SchedulerHandlerContext(
-            get_mem_cube=lambda: self.mem_cube,
+            get_mem_cube=self.handler_mem_cube,
             get_monitor=lambda: self.monitor,
             get_retriever=lambda: self.retriever,
             get_mem_reader=lambda: self.mem_reader,
@@ -42,6 +42,7 @@ class GeneralScheduler(BaseScheduler):
             get_enable_activation_memory=lambda: self.enable_activation_memory,
             get_query_key_words_limit=lambda: self.query_key_words_limit,
             services=services,
+            pin_mem_cube=self.pinned_mem_cube,
         )
 
         self._handler_registry = SchedulerHandlerRegistry(scheduler_context)
@@ -22,11 +22,13 @@ class ActivationMemoryManager:
         monitor: SchedulerGeneralMonitor,
         log_func_callback: Callable,
         log_activation_memory_update_func: Callable,
+        on_activation_memory_updated: Callable[[str], None] | None = None,
     ):
         self.act_mem_dump_path = act_mem_dump_path
         self.monitor = monitor
         self.log_func_callback = log_func_callback
         self.log_activation_memory_update_func = log_activation_memory_update_func
+        self.on_activation_memory_updated = on_activation_memory_updated
 
     def update_activation_memory(
         self,
@@ -60,19 +62,17 @@ class ActivationMemoryManager:
                 logger.error("Not Implemented.")
                 return
 
-            new_text_memory = MEMORY_ASSEMBLY_TEMPLATE.format(
-                memory_text="".join(
-                    [
-                        f"{i + 1}. {sentence.strip()}\n"
-                        for i, sentence in enumerate(new_text_memories)
-                        if sentence.strip()  # Skip empty strings
-                    ]
-                )
-            )
+            memory_lines = [
+                f"{i + 1}. {sentence.strip()}\n"
+                for i, sentence in enumerate(new_text_memories)
+                if sentence.strip()  # Skip empty strings
+            ]
+            new_text_memory = MEMORY_ASSEMBLY_TEMPLATE.format(memory_text="".join(memory_lines))
 
             # huggingface or vllm kv cache
             original_cache_items: list[VLLMKVCacheItem] = act_mem.get_all()
             original_text_memories = []
+            pre_cache_item = None
             if len(original_cache_items) > 0:
                 pre_cache_item: VLLMKVCacheItem = original_cache_items[-1]
                 original_text_memories = pre_cache_item.records.text_memories
@@ -85,14 +85,33 @@ class ActivationMemoryManager:
                         else new_text_memory,
                     )
                     return
-                act_mem.delete_all()
 
-            cache_item = act_mem.extract(new_text_memory)
+            act_mem_config = getattr(act_mem, "config", None)
+            if isinstance(act_mem, KVCacheMemory) and getattr(
+                act_mem_config, "incremental_update", False
+            ):
+                # Keep the unchanged prefix of the previous cache and prefill only the delta
+                cache_item = act_mem.extend(
+                    memory_lines, template=MEMORY_ASSEMBLY_TEMPLATE, base=pre_cache_item
+                )
+                act_mem.delete_all()
+                logger.info(
+                    "Incremental activation memory update reused %s of %s segments",
+                    cache_item.metadata["reused_segments"],
+                    len(cache_item.records.segment_texts),
+                )
+            else:
+                if pre_cache_item is not None:
+                    act_mem.delete_all()
+                cache_item = act_mem.extract(new_text_memory)
             cache_item.records.text_memories = new_text_memories
+            cache_item.records.composed_text_memory = new_text_memory
             cache_item.records.timestamp = get_utc_now()
 
             act_mem.add([cache_item])
             act_mem.dump(self.act_mem_dump_path)
+            if self.on_activation_memory_updated is not None:
+                self.on_activation_memory_updated(mem_cube_id)
 
             self.log_activation_memory_update_func(
                 original_text_memories=original_text_memories,
@@ -17,6 +17,10 @@ DEFAULT_ACT_MEM_DUMP_PATH = f"{BASE_DIR}/outputs/mem_scheduler/mem_cube_schedule
 DEFAULT_THREAD_POOL_MAX_WORKERS = 50
 DEFAULT_CONSUME_INTERVAL_SECONDS = 0.01
 DEFAULT_CONSUME_BATCH = 3
+DEFAULT_EVENT_DRIVEN_CONSUMER = (
+    os.getenv("MEMSCHEDULER_EVENT_DRIVEN_CONSUMER", "False").lower() == "true"
+)
+DEFAULT_CONSUME_BLOCK_TIMEOUT_SECONDS = 1.0
 DEFAULT_DISPATCHER_MONITOR_CHECK_INTERVAL = 300
 DEFAULT_DISPATCHER_MONITOR_MAX_FAILURES = 2
 DEFAULT_STUCK_THREAD_TOLERANCE = 10
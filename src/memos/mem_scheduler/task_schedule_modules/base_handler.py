@@ -45,7 +45,8 @@ class BaseSchedulerHandler:
                 if not batch:
                     continue
                 try:
-                    message_handler(user_id, mem_cube_id, batch)
+                    with self.scheduler_context.pin_mem_cube(mem_cube_id):
+                        message_handler(user_id, mem_cube_id, batch)
                 except Exception as e:
                     self.handle_exception(
                         e, f"Error processing batch for user {user_id}, mem_cube {mem_cube_id}"
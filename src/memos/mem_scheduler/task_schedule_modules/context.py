@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from contextlib import AbstractContextManager
 
     from memos.mem_scheduler.schemas.message_schemas import ScheduleMessageItem
     from memos.mem_scheduler.schemas.monitor_schemas import MemoryMonitorItem
@@ -40,3 +42,4 @@ class SchedulerHandlerContext:
     get_enable_activation_memory: Callable[[], bool]
     get_query_key_words_limit: Callable[[], int]
     services: SchedulerHandlerServices
+    pin_mem_cube: Callable[[str], AbstractContextManager[Any]] = nullcontext
@@ -104,6 +104,8 @@ class SchedulerDispatcher(BaseSchedulerModule):
         # Task tracking for monitoring
         self._running_tasks: dict[str, RunningTaskItem] = {}
         self._task_lock = threading.Lock()
+        # Notified whenever a running task finishes, i.e. a worker slot frees up
+        self._slot_freed = threading.Condition(self._task_lock)
 
         # Configure shutdown wait behavior from config or default
         self.stop_wait = (
@@ -230,6 +232,7 @@ class SchedulerDispatcher(BaseSchedulerModule):
                     if task_item.item_id in self._running_tasks:
                         task_item.mark_completed(result)
                         del self._running_tasks[task_item.item_id]
+                        self._slot_freed.notify_all()
                 logger.debug(f"Task completed: {task_item.get_execution_info()}")
                 return result
 
@@ -266,6 +269,7 @@ class SchedulerDispatcher(BaseSchedulerModule):
                     if task_item.item_id in self._running_tasks:
                         task_item.mark_failed(str(e))
                         del self._running_tasks[task_item.item_id]
+                        self._slot_freed.notify_all()
                 logger.error(f"Task failed: {task_item.get_execution_info()}, Error: {e}")
 
                 raise
@@ -433,6 +437,21 @@ class SchedulerDispatcher(BaseSchedulerModule):
         with self._task_lock:
             return len(self._running_tasks)
 
+    def wait_for_free_slot(self, timeout: float | None = None) -> bool:
+        """
+        Block until fewer than max_workers tasks are running.
+
+        Args:
+            timeout: Maximum time to wait in seconds. None means wait forever.
+
+        Returns:
+            bool: True if a worker slot is free, False if the timeout expired.
+        """
+        with self._slot_freed:
+            return self._slot_freed.wait_for(
+                lambda: len(self._running_tasks) < self.max_workers, timeout=timeout
+            )
+
     def register_handler(
         self,
         label: str,
@@ -21,6 +21,7 @@ from memos.mem_scheduler.task_schedule_modules.base_handler import BaseScheduler
 from memos.mem_scheduler.utils.filter_utils import transform_name_to_key
 from memos.mem_scheduler.utils.misc_utils import is_playground_api
 from memos.memories.textual.tree import TreeTextMemory
+from memos.memories.textual.tree_text_memory.retrieve.result_cache import bump_cube_version
 
 
 logger = get_logger(__name__)
@@ -259,6 +260,7 @@ class MemReadMessageHandler(BaseSchedulerHandler):
                                                 old_id,
                                                 e,
                                             )
+                                    bump_cube_version(user_name)
                         else:
                             has_merged_from = any(
                                 (m.metadata.info or {}).get("merged_from") for m in summary_memories
@@ -4,6 +4,9 @@ This module provides a local-based queue implementation that can replace
 the local memos_message_queue functionality in BaseScheduler.
 """
 
+import threading
+
+from datetime import timezone
 from typing import TYPE_CHECKING
 
 
@@ -15,12 +18,15 @@ from memos.mem_scheduler.general_modules.misc import AutoDroppingQueue as Queue
 from memos.mem_scheduler.schemas.message_schemas import ScheduleMessageItem
 from memos.mem_scheduler.schemas.task_schemas import get_stream_key_prefix
 from memos.mem_scheduler.task_schedule_modules.orchestrator import SchedulerOrchestrator
+from memos.mem_scheduler.utils.db_utils import get_utc_now
 from memos.mem_scheduler.utils.status_tracker import TaskStatusTracker
 from memos.mem_scheduler.webservice_modules.redis_service import RedisSchedulerModule
 
 
 logger = get_logger(__name__)
 
+_MIN_STREAM_WEIGHT = 0.01
+
 
 class SchedulerLocalQueue(RedisSchedulerModule):
     def __init__(
@@ -37,7 +43,8 @@ class SchedulerLocalQueue(RedisSchedulerModule):
         Args:
             maxsize (int): Maximum number of messages allowed in each individual queue.
             stream_key_prefix (str): Prefix for stream keys (simulated).
-            orchestrator: SchedulerOrchestrator instance (ignored).
+            orchestrator: SchedulerOrchestrator providing per-stream weights for fair
+                scheduling; every stream weighs 1 when None.
             status_tracker: TaskStatusTracker instance (ignored).
         """
         super().__init__()
@@ -55,6 +62,16 @@ class SchedulerLocalQueue(RedisSchedulerModule):
         self._is_listening = False
         self._message_handler: Callable[[ScheduleMessageItem], None] | None = None
 
+        # Notified on every put so a blocking get_messages wakes up immediately
+        self._not_empty = threading.Condition()
+
+        # Deficit round-robin state: (user_id, task_label) per stream for weight lookups,
+        # unspent credit per backlogged stream, and the stream served last
+        self._stream_owners: dict[str, tuple[str, str]] = {}
+        self._deficits: dict[str, float] = {}
+        self._last_served_stream: str | None = None
+        self._schedule_lock = threading.Lock()
+
         logger.info(
             "SchedulerLocalQueue initialized with max_internal_message_queue_size=%s, stream_prefix=%s",
             self.max_internal_message_queue_size,
@@ -94,9 +111,12 @@ class SchedulerLocalQueue(RedisSchedulerModule):
         if stream_key not in self.queue_streams:
             logger.info(f"Creating new internal queue for stream: {stream_key}")
             self.queue_streams[stream_key] = Queue(maxsize=self.max_internal_message_queue_size)
+            self._stream_owners[stream_key] = (message.user_id, message.label)
 
         try:
             self.queue_streams[stream_key].put(item=message, block=block, timeout=timeout)
+            with self._not_empty:
+                self._not_empty.notify_all()
             logger.debug(
                 "Local queue enqueued. stream=%s size=%s label=%s item_id=%s",
                 stream_key,
@@ -155,41 +175,102 @@ class SchedulerLocalQueue(RedisSchedulerModule):
         logger.debug(f"get_nowait() called for {stream_key} with batch_size: {batch_size}")
         return self.get(stream_key=stream_key, block=False, batch_size=batch_size)
 
-    def get_messages(self, batch_size: int) -> list[ScheduleMessageItem]:
+    def get_messages(
+        self, batch_size: int, block_timeout: float | None = None
+    ) -> list[ScheduleMessageItem]:
         """
         Get messages from all streams in round-robin or sequential fashion.
         Equivalent to SchedulerRedisQueue.get_messages.
-        """
-        messages = []
-        # Snapshot keys to avoid runtime modification issues
-        stream_keys = list(self.queue_streams.keys())
-
-        # Simple strategy: try to get up to batch_size messages across all streams
-        # We can just iterate and collect.
-
-        # Calculate how many to get per stream to be fair?
-        # Or just greedy? Redis implementation uses a complex logic.
-        # For local, let's keep it simple: just iterate and take what's available (non-blocking)
 
-        for stream_key in stream_keys:
-            if len(messages) >= batch_size:
-                break
+        If nothing is queued and block_timeout is set, wait up to block_timeout
+        seconds for the next put() instead of returning an empty list.
+        """
+        messages = self._collect_messages(batch_size)
+        if messages or not block_timeout:
+            return messages
+        with self._not_empty:
+            if self.empty():
+                self._not_empty.wait(timeout=block_timeout)
+        return self._collect_messages(batch_size)
+
+    def _collect_messages(self, batch_size: int) -> list[ScheduleMessageItem]:
+        """
+        Assemble a batch with deficit round-robin across the backlogged streams.
 
-            needed = batch_size - len(messages)
-            # Use get_nowait to avoid blocking
-            fetched = self.get_nowait(stream_key=stream_key, batch_size=needed)
-            messages.extend(fetched)
+        Each round, every stream earns credit equal to its orchestrator weight and
+        dequeues as many whole messages as its credit covers, so a bulk import on
+        one stream cannot starve the others. Rounds resume after the stream served
+        last, and a stream that runs dry forfeits its leftover credit.
+        """
+        messages: list[ScheduleMessageItem] = []
+        with self._schedule_lock:
+            stream_keys = self._round_robin_order()
+            while len(messages) < batch_size and stream_keys:
+                for stream_key in stream_keys:
+                    needed = batch_size - len(messages)
+                    if needed <= 0:
+                        break
+                    deficit = self._deficits.get(stream_key, 0.0) + self._stream_weight(stream_key)
+                    quota = min(int(deficit), needed)
+                    fetched = []
+                    if quota > 0:
+                        fetched = self.get_nowait(stream_key=stream_key, batch_size=quota)
+                    messages.extend(fetched)
+                    if fetched:
+                        self._last_served_stream = stream_key
+                    self._deficits[stream_key] = deficit - len(fetched)
+                stream_keys = [key for key in stream_keys if self.queue_streams[key].qsize() > 0]
+                for stream_key in list(self._deficits):
+                    if stream_key not in stream_keys:
+                        del self._deficits[stream_key]
 
         if messages and len(messages) >= batch_size:
             logger.debug(
                 "Local queue dequeued batch. batch_size=%s requested_batch_size=%s active_streams=%s",
                 len(messages),
                 batch_size,
-                len(stream_keys),
+                len(self._deficits),
             )
 
         return messages
 
+    def _round_robin_order(self) -> list[str]:
+        """Backlogged streams, starting after the stream served last."""
+        # Snapshot keys to avoid runtime modification issues
+        stream_keys = list(self.queue_streams.keys())
+        if self._last_served_stream in self.queue_streams:
+            start = stream_keys.index(self._last_served_stream) + 1
+            stream_keys = stream_keys[start:] + stream_keys[:start]
+        return [key for key in stream_keys if self.queue_streams[key].qsize() > 0]
+
+    def _stream_weight(self, stream_key: str) -> float:
+        if self.orchestrator is None or stream_key not in self._stream_owners:
+            return 1.0
+        user_id, task_label = self._stream_owners[stream_key]
+        weight = self.orchestrator.get_stream_weight(user_id=user_id, task_label=task_label)
+        # A non-positive weight would never earn credit and stall the round loop
+        return max(weight, _MIN_STREAM_WEIGHT)
+
+    def get_queue_ages(self) -> dict[str, float]:
+        """
+        Return how long the oldest waiting message of each non-empty stream has waited.
+
+        Returns:
+            Dict[str, float]: Mapping from stream name to age in seconds.
+        """
+        now = get_utc_now()
+        ages = {}
+        for stream_key, queue in list(self.queue_streams.items()):
+            with queue.mutex:
+                head = queue.queue[0] if queue.queue else None
+            timestamp = getattr(head, "timestamp", None)
+            if timestamp is None:
+                continue
+            if timestamp.tzinfo is None:
+                timestamp = timestamp.replace(tzinfo=timezone.utc)
+            ages[stream_key] = max(0.0, (now - timestamp).total_seconds())
+        return ages
+
     def qsize(self) -> dict:
         """
         Return the current size of all internal queues as a dictionary.
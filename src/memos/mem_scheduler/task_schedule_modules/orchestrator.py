@@ -11,6 +11,11 @@ Stream format:
 
 Default behavior:
 - All users have priority 1, so fetch sizes are equal per user.
+
+Stream weights (used by the fair local queue):
+- A stream's weight is its task priority weight times its user weight, so
+  higher-priority labels and heavier-weighted users get proportionally more of
+  every batch while no backlogged stream is starved.
 """
 
 from __future__ import annotations
@@ -26,6 +31,13 @@ from memos.mem_scheduler.webservice_modules.redis_service import RedisSchedulerM
 
 logger = get_logger(__name__)
 
+# Relative share of a batch per task priority level
+DEFAULT_PRIORITY_WEIGHTS = {
+    TaskPriorityLevel.LEVEL_1: 4,
+    TaskPriorityLevel.LEVEL_2: 2,
+    TaskPriorityLevel.LEVEL_3: 1,
+}
+
 
 class SchedulerOrchestrator(RedisSchedulerModule):
     def __init__(self):
@@ -44,6 +56,10 @@ class SchedulerOrchestrator(RedisSchedulerModule):
             PREF_ADD_TASK_LABEL: 600_000,
         }
 
+        self.priority_weights = dict(DEFAULT_PRIORITY_WEIGHTS)
+        # Per-user weight multipliers; users not listed weigh 1
+        self.user_weights: dict[str, float] = {}
+
     def get_stream_priorities(self) -> None | dict:
         return None
 
@@ -81,6 +97,20 @@ class SchedulerOrchestrator(RedisSchedulerModule):
     def get_task_priority(self, task_label: str):
         return self.tasks_priorities.get(task_label, TaskPriorityLevel.LEVEL_3)
 
+    def set_user_weight(self, user_id: str, weight: float | None) -> None:
+        """Set a user's weight multiplier; None restores the default of 1."""
+        if weight is None:
+            self.user_weights.pop(user_id, None)
+        elif weight <= 0:
+            raise ValueError(f"User weight must be positive, got {weight}")
+        else:
+            self.user_weights[user_id] = weight
+
+    def get_stream_weight(self, user_id: str, task_label: str) -> float:
+        """Relative share of a `(user_id, mem_cube_id, task_label)` stream in fair scheduling."""
+        priority_weight = self.priority_weights.get(self.get_task_priority(task_label), 1)
+        return priority_weight * self.user_weights.get(user_id, 1)
+
     def get_task_idle_min(self, task_label: str) -> int:
         idle_min = self.tasks_min_idle_ms.get(task_label, DEFAULT_PENDING_CLAIM_MIN_IDLE_MS)
         return idle_min
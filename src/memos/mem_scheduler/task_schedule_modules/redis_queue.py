@@ -10,7 +10,7 @@ import re
 import threading
 import time
 
-from collections import deque
+from collections import OrderedDict, deque
 from collections.abc import Callable
 from uuid import uuid4
 
@@ -24,6 +24,15 @@ from memos.mem_scheduler.schemas.task_schemas import (
     get_stream_key_prefix,
 )
 from memos.mem_scheduler.task_schedule_modules.orchestrator import SchedulerOrchestrator
+from memos.mem_scheduler.utils import metrics
+from memos.mem_scheduler.utils.message_codec import (
+    DEFAULT_BLOB_THRESHOLD,
+    DEFAULT_COMPRESS_THRESHOLD,
+    decode_message,
+    encode_message,
+    encoded_size,
+    message_blob_refs,
+)
 from memos.mem_scheduler.utils.status_tracker import TaskStatusTracker
 from memos.mem_scheduler.webservice_modules.redis_service import RedisSchedulerModule
 
@@ -100,6 +109,34 @@ class SchedulerRedisQueue(RedisSchedulerModule):
             os.getenv("MEMSCHEDULER_REDIS_REFILL_TIMEOUT_SEC", "30") or 30
         )
 
+        # Side stream announcing newly created task streams, so a blocked consumer
+        # wakes up and starts reading the new stream. It has no ":" after the prefix,
+        # so stream key scans never mistake it for a task stream. Every consumer reads
+        # it with plain XREAD from its own last seen id, so all of them see each entry.
+        self.wakeup_stream_key = f"{self.stream_key_prefix}__wakeup"
+        self._wakeup_last_id = "$"
+
+        # Stream entry encoding: "json" (legacy, one field per attribute) or "compact"
+        # (see message_codec). Both are always readable, so consumers can be upgraded
+        # before producers switch.
+        self.message_format = (
+            os.getenv("MEMSCHEDULER_REDIS_MESSAGE_FORMAT", "json") or "json"
+        ).lower()
+        self._compress_threshold = int(
+            os.getenv("MEMSCHEDULER_REDIS_COMPRESS_THRESHOLD", DEFAULT_COMPRESS_THRESHOLD)
+            or DEFAULT_COMPRESS_THRESHOLD
+        )
+        self._blob_threshold = int(
+            os.getenv("MEMSCHEDULER_REDIS_BLOB_THRESHOLD", DEFAULT_BLOB_THRESHOLD)
+            or DEFAULT_BLOB_THRESHOLD
+        )
+        self._blob_ttl_sec = int(os.getenv("MEMSCHEDULER_REDIS_BLOB_TTL_SEC", "86400") or 86400)
+        # Like the wakeup stream, blob keys have no ":" after the prefix and are never
+        # mistaken for task streams.
+        self.blob_key_prefix = f"{self.stream_key_prefix}__blob"
+        self._recent_blobs: OrderedDict[str, float] = OrderedDict()
+        self._recent_blobs_lock = threading.Lock()
+
         # Track empty streams first-seen time to avoid zombie keys
         self._empty_stream_seen_times: dict[str, float] = {}
         self._empty_stream_seen_lock = threading.Lock()
@@ -315,23 +352,9 @@ class SchedulerRedisQueue(RedisSchedulerModule):
         self,
         consume_batch_size: int,
     ) -> list[list[ScheduleMessageItem]]:
-        stream_keys = self.get_stream_keys(stream_key_prefix=self.stream_key_prefix)
+        stream_keys = self._select_stream_keys()
         if not stream_keys:
             return []
-        stream_key_count = len(stream_keys)
-        if stream_key_count > self._cache_max_packs:
-            start = self._stream_read_offset % stream_key_count
-            end = start + self._cache_max_packs
-            if end <= stream_key_count:
-                stream_keys = stream_keys[start:end]
-            else:
-                stream_keys = stream_keys[start:] + stream_keys[: end % stream_key_count]
-            self._stream_read_offset = (start + self._cache_max_packs) % stream_key_count
-            logger.debug(
-                "[REDIS_QUEUE] Broker stream scan capped. scanned_streams=%s cache_max_packs=%s",
-                len(stream_keys),
-                self._cache_max_packs,
-            )
 
         # Determine per-stream quotas for this cycle
         stream_quotas = self.orchestrator.get_stream_quotas(
@@ -401,6 +424,32 @@ class SchedulerRedisQueue(RedisSchedulerModule):
         # return packed list without overwriting existing cache
         return packed
 
+    def _select_stream_keys(self, advance: bool = True) -> list[str]:
+        """
+        Return the streams the next broker cycle scans.
+
+        With more streams than cache_max_packs, a rotating window of that size is
+        returned. advance=False peeks at the window without moving it.
+        """
+        stream_keys = self.get_stream_keys(stream_key_prefix=self.stream_key_prefix)
+        stream_key_count = len(stream_keys)
+        if stream_key_count <= self._cache_max_packs:
+            return stream_keys
+        start = self._stream_read_offset % stream_key_count
+        end = start + self._cache_max_packs
+        if end <= stream_key_count:
+            stream_keys = stream_keys[start:end]
+        else:
+            stream_keys = stream_keys[start:] + stream_keys[: end % stream_key_count]
+        if advance:
+            self._stream_read_offset = (start + self._cache_max_packs) % stream_key_count
+            logger.debug(
+                "[REDIS_QUEUE] Broker stream scan capped. scanned_streams=%s cache_max_packs=%s",
+                len(stream_keys),
+                self._cache_max_packs,
+            )
+        return stream_keys
+
     def _async_refill_cache(self, batch_size: int) -> None:
         """Background thread to refill message cache without blocking get_messages."""
         try:
@@ -444,7 +493,21 @@ class SchedulerRedisQueue(RedisSchedulerModule):
             )
         return False
 
-    def get_messages(self, batch_size: int) -> list[ScheduleMessageItem]:
+    def get_messages(
+        self, batch_size: int, block_timeout: float | None = None
+    ) -> list[ScheduleMessageItem]:
+        """
+        Return the next batch of messages from the prefetch cache.
+
+        If nothing is available and block_timeout is set, wait up to block_timeout
+        seconds for new entries instead of returning an empty list right away.
+        """
+        batch = self._get_cached_messages(batch_size)
+        if batch or not block_timeout:
+            return batch
+        return self._blocking_read(batch_size, block_timeout)
+
+    def _get_cached_messages(self, batch_size: int) -> list[ScheduleMessageItem]:
         if self.message_pack_cache:
             if (
                 len(self.message_pack_cache) < self.task_broker_flush_bar
@@ -490,6 +553,59 @@ class SchedulerRedisQueue(RedisSchedulerModule):
                 )
             return batch
 
+    def _announce_stream(self, stream_key: str) -> None:
+        """Tell blocked consumers (in any process) that a new task stream exists."""
+        try:
+            self._redis_conn.xadd(
+                self.wakeup_stream_key, {"stream_key": stream_key}, maxlen=1000, approximate=True
+            )
+        except Exception as e:
+            logger.debug(f"Failed to announce stream {stream_key}: {e}")
+
+    def _blocking_read(self, batch_size: int, block_timeout: float) -> list[ScheduleMessageItem]:
+        """
+        Wait for new entries, then fetch through the regular broker cycle.
+
+        The wait is a plain XREAD over the streams the next broker cycle scans plus
+        the wakeup stream, so it consumes nothing. Once it returns, the broker reads
+        and claims with the usual stream cap and orchestrator quotas.
+        """
+        if not self._redis_conn:
+            return []
+
+        if self.socket_timeout:
+            # Stay below the socket timeout or redis-py aborts the blocked read
+            block_timeout = min(block_timeout, self.socket_timeout * 0.8)
+
+        # Entries added since the last broker cycle but before this call are only
+        # picked up once the wait times out; the timeout bounds that delay.
+        streams = dict.fromkeys(self._select_stream_keys(advance=False), "$")
+        streams[self.wakeup_stream_key] = self._wakeup_last_id
+        try:
+            result = self._redis_conn.xread(streams, block=max(1, int(block_timeout * 1000)))
+        except Exception as e:
+            logger.debug(f"Blocking xread failed: {e}")
+            return []
+        if not result:
+            return []
+
+        for stream_key, stream_messages in result:
+            if stream_key == self.wakeup_stream_key:
+                self._handle_wakeups(stream_messages)
+        return self._get_cached_messages(batch_size)
+
+    def _handle_wakeups(self, entries: list[tuple[str, dict]]) -> None:
+        """Register announced streams and remember the last wakeup entry seen."""
+        if not entries:
+            return
+        with self._stream_keys_lock:
+            for _message_id, fields in entries:
+                stream_key = (fields or {}).get("stream_key")
+                if stream_key and stream_key not in self._stream_keys_cache:
+                    self._stream_keys_cache.append(stream_key)
+                    self.seen_streams.add(stream_key)
+        self._wakeup_last_id = entries[-1][0]
+
     def _ensure_consumer_group(self, stream_key) -> None:
         """Ensure the consumer group exists for the stream."""
         if not self._redis_conn:
@@ -548,11 +664,12 @@ class SchedulerRedisQueue(RedisSchedulerModule):
 
             if need_create_group:
                 self._ensure_consumer_group(stream_key=stream_key)
+                self._announce_stream(stream_key)
 
             message.stream_key = stream_key
 
             # Convert message to dictionary for Redis storage
-            message_data = message.to_dict()
+            message_data = self._encode_message(message)
 
             # Add to Redis stream with automatic trimming
             message_id = self._redis_conn.xadd(
@@ -571,6 +688,50 @@ class SchedulerRedisQueue(RedisSchedulerModule):
             logger.error(f"Failed to add message to Redis queue: {e}")
             raise
 
+    def _encode_message(self, message: ScheduleMessageItem) -> dict:
+        """Encode a message in the configured format, storing referenced payloads first."""
+        if self.message_format == "compact":
+            fields, blobs = encode_message(
+                message,
+                compress_threshold=self._compress_threshold,
+                blob_threshold=self._blob_threshold,
+            )
+            for digest, payload in blobs.items():
+                self._store_blob(digest, payload, message.label)
+        else:
+            fields = message.to_dict()
+        metrics.observe_queue_message_size(encoded_size(fields), message.label, self.message_format)
+        return fields
+
+    def _store_blob(self, digest: str, payload: str, label: str) -> None:
+        """Store a content-addressed payload, skipping ones this producer wrote recently."""
+        now = time.time()
+        with self._recent_blobs_lock:
+            written_at = self._recent_blobs.get(digest)
+            if written_at is not None and now - written_at < self._blob_ttl_sec / 2:
+                return
+        self._redis_conn.set(f"{self.blob_key_prefix}:{digest}", payload, ex=self._blob_ttl_sec)
+        with self._recent_blobs_lock:
+            self._recent_blobs[digest] = now
+            self._recent_blobs.move_to_end(digest)
+            while len(self._recent_blobs) > 1024:
+                self._recent_blobs.popitem(last=False)
+        metrics.observe_queue_message_size(len(payload), label, "blob")
+
+    def _fetch_blobs(self, digests: set[str]) -> dict[str, str | None]:
+        if not digests or not self._redis_conn:
+            return {}
+        ordered = list(digests)
+        try:
+            values = self._redis_conn.mget([f"{self.blob_key_prefix}:{d}" for d in ordered])
+        except Exception as e:
+            logger.warning(f"[REDIS_QUEUE] Failed to fetch message payloads: {e}")
+            return {}
+        missing = [digest for digest, value in zip(ordered, values, strict=False) if value is None]
+        if missing:
+            logger.warning(f"[REDIS_QUEUE] Referenced chat histories expired or missing: {missing}")
+        return dict(zip(ordered, values, strict=False))
+
     def ack_message(
         self,
         user_id: str,
@@ -1061,10 +1222,19 @@ class SchedulerRedisQueue(RedisSchedulerModule):
     ) -> list[ScheduleMessageItem]:
         """Convert raw Redis messages into ScheduleMessageItem with metadata."""
         result: list[ScheduleMessageItem] = []
+        # Referenced payloads of the whole batch are fetched in one round trip.
+        blobs = self._fetch_blobs(
+            {
+                digest
+                for _stream, stream_messages in messages or []
+                for _message_id, fields in stream_messages
+                for digest in message_blob_refs(fields)
+            }
+        )
         for _stream, stream_messages in messages or []:
             for message_id, fields in stream_messages:
                 try:
-                    message = ScheduleMessageItem.from_dict(fields)
+                    message = decode_message(fields, blobs)
                     message.stream_key = _stream
                     message.redis_message_id = message_id
                     result.append(message)
@@ -45,7 +45,9 @@ class ScheduleTaskQueue:
                 status_tracker=self.status_tracker,  # Propagate status_tracker
             )
         else:
-            self.memos_message_queue = SchedulerLocalQueue(maxsize=self.maxsize)
+            self.memos_message_queue = SchedulerLocalQueue(
+                maxsize=self.maxsize, orchestrator=self.orchestrator
+            )
 
         self.disabled_handlers = disabled_handlers
         logger.info(
@@ -178,11 +180,35 @@ class ScheduleTaskQueue:
             len(messages),
         )
 
-    def get_messages(self, batch_size: int) -> list[ScheduleMessageItem]:
-        return self.memos_message_queue.get_messages(batch_size=batch_size)
+    def get_messages(
+        self, batch_size: int, block_timeout: float | None = None
+    ) -> list[ScheduleMessageItem]:
+        return self.memos_message_queue.get_messages(
+            batch_size=batch_size, block_timeout=block_timeout
+        )
 
     def clear(self):
         self.memos_message_queue.clear()
 
     def qsize(self):
         return self.memos_message_queue.qsize()
+
+    def has_queued_messages(self, mem_cube_id: str) -> bool:
+        """Whether any stream for ``mem_cube_id`` still holds messages.
+
+        Stream keys end in ``:{mem_cube_id}:{task_label}``. Redis streams kept
+        without ``auto_delete_acked`` also count acknowledged entries, so the
+        answer errs on the side of busy.
+        """
+        for stream_key, size in self.qsize().items():
+            if stream_key == "total_size" or not size:
+                continue
+            parts = stream_key.rsplit(":", 2)
+            if len(parts) == 3 and parts[1] == mem_cube_id:
+                return True
+        return False
+
+    def get_queue_ages(self) -> dict[str, float]:
+        """Age in seconds of the oldest waiting message per stream (local queue only)."""
+        get_ages = getattr(self.memos_message_queue, "get_queue_ages", None)
+        return get_ages() if get_ages is not None else {}
@@ -0,0 +1,192 @@
+"""Compact Redis stream encoding for ScheduleMessageItem.
+
+The legacy encoding (``ScheduleMessageItem.to_dict``) writes every field as its
+own stream field and JSON-encodes ``info``, ``chat_history`` and
+``user_context`` separately. The compact format (version 2) keeps the routing
+fields as plain stream fields and packs everything else into a single ``body``
+field:
+
+* ``j<json>`` for small bodies,
+* ``z<base85(zlib(json))>`` once the body reaches ``compress_threshold`` bytes.
+
+Redis connections in the scheduler decode responses as UTF-8, so the body must
+be text; base85 keeps the compressed form ASCII. Chat histories of at least
+``blob_threshold`` bytes are stored once under their sha256 digest (see
+``SchedulerRedisQueue``) and referenced by a stream field, so consecutive messages
+of one conversation do not resend the same history.
+
+``decode_message`` reads both formats, so entries written before the switch
+remain readable.
+"""
+
+import base64
+import hashlib
+import json
+import zlib
+
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
+
+from memos.mem_scheduler.schemas.message_schemas import ScheduleMessageItem
+from memos.mem_scheduler.utils.db_utils import get_utc_now
+from memos.types.general_types import UserContext
+
+
+COMPACT_FORMAT_VERSION = "2"
+FORMAT_FIELD = "_v"
+BODY_FIELD = "body"
+CHAT_HISTORY_REF_FIELD = "chat_history_ref"
+
+DEFAULT_COMPRESS_THRESHOLD = 4096
+DEFAULT_BLOB_THRESHOLD = 16384
+
+_JSON_PREFIX = "j"
+_ZLIB_PREFIX = "z"
+
+# Body keys, in the order the legacy encoding lists them.
+_BODY_FIELDS = (
+    "session_id",
+    "content",
+    "user_name",
+    "info",
+    "task_id",
+    "api_path",
+    "chat_history",
+    "user_context",
+)
+
+
+def _decode_text(value: Any) -> Any:
+    if isinstance(value, bytes | bytearray):
+        return value.decode("utf-8")
+    return value
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def pack_text(text: str, compress_threshold: int = DEFAULT_COMPRESS_THRESHOLD) -> str:
+    """Prefix-tag ``text``, compressing it when it is at least ``compress_threshold`` bytes."""
+    raw = text.encode("utf-8")
+    if len(raw) >= compress_threshold:
+        packed = base64.b85encode(zlib.compress(raw, 6)).decode("ascii")
+        if len(packed) + 1 < len(raw):
+            return _ZLIB_PREFIX + packed
+    return _JSON_PREFIX + text
+
+
+def unpack_text(packed: str) -> str:
+    """Inverse of ``pack_text``."""
+    packed = _decode_text(packed)
+    tag, data = packed[:1], packed[1:]
+    if tag == _JSON_PREFIX:
+        return data
+    if tag == _ZLIB_PREFIX:
+        return zlib.decompress(base64.b85decode(data)).decode("utf-8")
+    raise ValueError(f"Unknown compact message encoding tag: {tag!r}")
+
+
+def is_compact(fields: Mapping[str, Any]) -> bool:
+    return _decode_text(fields.get(FORMAT_FIELD)) == COMPACT_FORMAT_VERSION
+
+
+def encode_message(
+    message: ScheduleMessageItem,
+    compress_threshold: int = DEFAULT_COMPRESS_THRESHOLD,
+    blob_threshold: int | None = DEFAULT_BLOB_THRESHOLD,
+) -> tuple[dict[str, str], dict[str, str]]:
+    """
+    Encode a message into compact stream fields.
+
+    Args:
+        message: The message to encode.
+        compress_threshold: Minimum body size in bytes before zlib is applied.
+        blob_threshold: Minimum chat history size in bytes before it is stored by
+            reference, or None to always inline it.
+
+    Returns:
+        ``(fields, blobs)``: the stream fields and the referenced payloads keyed by
+        digest, which the caller must store before writing the fields.
+    """
+    body: dict[str, Any] = {}
+    blobs: dict[str, str] = {}
+    for name in _BODY_FIELDS:
+        value = getattr(message, name)
+        if value is None or value == "":
+            continue
+        if name == "user_context":
+            value = value.model_dump(exclude_none=True)
+        elif name == "chat_history" and blob_threshold is not None:
+            history = _dumps(value)
+            if len(history.encode("utf-8")) >= blob_threshold:
+                digest = hashlib.sha256(history.encode("utf-8")).hexdigest()
+                blobs[digest] = pack_text(history, compress_threshold)
+                continue
+        body[name] = value
+
+    fields = {
+        FORMAT_FIELD: COMPACT_FORMAT_VERSION,
+        "item_id": message.item_id,
+        "user_id": message.user_id,
+        "cube_id": message.mem_cube_id,
+        "label": message.label,
+        "trace_id": message.trace_id,
+        "timestamp": message.timestamp.isoformat(),
+        BODY_FIELD: pack_text(_dumps(body), compress_threshold),
+    }
+    if blobs:
+        fields[CHAT_HISTORY_REF_FIELD] = next(iter(blobs))
+    return fields, blobs
+
+
+def message_blob_refs(fields: Mapping[str, Any]) -> list[str]:
+    """Digests of the payloads a stream entry references (empty for legacy entries)."""
+    ref = _decode_text(fields.get(CHAT_HISTORY_REF_FIELD))
+    return [ref] if ref and is_compact(fields) else []
+
+
+def decode_message(
+    fields: Mapping[str, Any], blobs: Mapping[str, str | None] | None = None
+) -> ScheduleMessageItem:
+    """
+    Decode a stream entry written in either the legacy or the compact format.
+
+    Compact entries are produced by ``encode_message`` only, so they are rebuilt
+    without re-running pydantic validation. A referenced chat history missing from
+    ``blobs`` (e.g. expired) decodes as None.
+    """
+    if not is_compact(fields):
+        return ScheduleMessageItem.from_dict(dict(fields))
+
+    body = json.loads(unpack_text(fields[BODY_FIELD]))
+    ref = _decode_text(fields.get(CHAT_HISTORY_REF_FIELD))
+    if ref:
+        packed = (blobs or {}).get(ref)
+        body["chat_history"] = json.loads(unpack_text(packed)) if packed else None
+    if body.get("user_context") is not None:
+        body["user_context"] = UserContext.model_validate(body["user_context"])
+
+    raw_timestamp = _decode_text(fields.get("timestamp"))
+    return ScheduleMessageItem.model_construct(
+        item_id=_decode_text(fields["item_id"]),
+        user_id=_decode_text(fields["user_id"]),
+        mem_cube_id=_decode_text(fields["cube_id"]),
+        label=_decode_text(fields["label"]),
+        trace_id=_decode_text(fields["trace_id"]),
+        timestamp=datetime.fromisoformat(raw_timestamp) if raw_timestamp else get_utc_now(),
+        session_id=body.get("session_id", ""),
+        content=body.get("content", ""),
+        user_name=body.get("user_name", ""),
+        info=body.get("info"),
+        task_id=body.get("task_id"),
+        api_path=body.get("api_path"),
+        chat_history=body.get("chat_history"),
+        user_context=body.get("user_context"),
+    )
+
+
+def encoded_size(fields: Mapping[str, Any]) -> int:
+    """Approximate wire size of a stream entry in bytes."""
+    return sum(len(str(key)) + len(str(value).encode("utf-8")) for key, value in fields.items())
@@ -48,12 +48,25 @@ QUEUE_LENGTH = Gauge(
     "memos_scheduler_queue_length", "Current length of the task queue", ["user_id"]
 )
 
+QUEUE_OLDEST_AGE_SECONDS = Gauge(
+    "memos_scheduler_queue_oldest_age_seconds",
+    "Age of the oldest waiting task per user and task type",
+    ["user_id", "task_type"],
+)
+
 INTERNAL_SPAN_DURATION = Histogram(
     "memos_scheduler_internal_span_duration_seconds",
     "Duration of internal operations",
     ["span_name", "user_id", "task_id"],
 )
 
+QUEUE_MESSAGE_SIZE_BYTES = Histogram(
+    "memos_scheduler_queue_message_size_bytes",
+    "Encoded size of messages and referenced payloads written to the task queue",
+    ["task_type", "encoding"],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+)
+
 
 # --- Instrumentation Functions ---
 
@@ -86,6 +99,14 @@ def update_queue_length(length: int, user_id: str):
     QUEUE_LENGTH.labels(user_id=user_id).set(length)
 
 
+def update_queue_age(age: float, user_id: str, task_type: str):
+    QUEUE_OLDEST_AGE_SECONDS.labels(user_id=user_id, task_type=task_type).set(age)
+
+
+def observe_queue_message_size(size: int, task_type: str, encoding: str):
+    QUEUE_MESSAGE_SIZE_BYTES.labels(task_type=task_type, encoding=encoding).observe(size)
+
+
 def observe_internal_span(duration: float, span_name: str, user_id: str, task_id: str):
     INTERNAL_SPAN_DURATION.labels(span_name=span_name, user_id=user_id, task_id=task_id).observe(
         duration
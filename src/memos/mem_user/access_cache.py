@@ -0,0 +1,129 @@
+"""In-process cache of user access-control lookups.
+
+Every MOS call validates the user and its cube access, which costs one or two
+database round trips. ``UserAccessCache`` keeps, per user, whether the user is
+active and the ids of the active cubes it can access, so repeated checks are
+answered from memory. Entries expire after ``MOS_USER_ACCESS_CACHE_TTL``
+seconds (0 disables the cache) and are invalidated explicitly by the user
+manager's own writes; writes made by other processes become visible after the
+TTL.
+"""
+
+import os
+import threading
+import time
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from memos.log import get_logger
+
+
+logger = get_logger(__name__)
+
+_TTL_ENV = "MOS_USER_ACCESS_CACHE_TTL"
+_DEFAULT_TTL_SECONDS = 30.0
+_DEFAULT_MAX_USERS = 10_000
+
+
+def _ttl_from_env() -> float:
+    raw = os.getenv(_TTL_ENV)
+    if raw is None:
+        return _DEFAULT_TTL_SECONDS
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        logger.warning(f"Invalid {_TTL_ENV}={raw!r}; using default {_DEFAULT_TTL_SECONDS}")
+        return _DEFAULT_TTL_SECONDS
+
+
+@dataclass(frozen=True)
+class UserAccess:
+    """Access-control snapshot of one user."""
+
+    active: bool
+    cube_ids: frozenset[str]
+
+    def can_access(self, cube_id: str) -> bool:
+        return self.active and cube_id in self.cube_ids
+
+
+class UserAccessCache:
+    """Thread-safe TTL cache of ``UserAccess`` keyed by user id.
+
+    Args:
+        ttl: Seconds an entry stays valid. None reads ``MOS_USER_ACCESS_CACHE_TTL``;
+            0 disables caching.
+        max_users: Maximum number of cached users; the oldest entries are dropped first.
+    """
+
+    def __init__(self, ttl: float | None = None, max_users: int = _DEFAULT_MAX_USERS):
+        self.ttl = _ttl_from_env() if ttl is None else max(0.0, ttl)
+        self.max_users = max_users
+        self._entries: OrderedDict[str, tuple[float, UserAccess]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped on every invalidation so loads that raced with a write are not stored.
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, user_id: str) -> UserAccess | None:
+        with self._lock:
+            item = self._entries.get(user_id)
+            if item is None:
+                return None
+            expires_at, access = item
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                return None
+            return access
+
+    def store(self, user_id: str, access: UserAccess, generation: int) -> None:
+        """Cache ``access`` unless an invalidation happened since ``generation`` was read."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[user_id] = (time.monotonic() + self.ttl, access)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_users:
+                self._entries.popitem(last=False)
+
+    def lookup(self, user_id: str, loader: Callable[[], UserAccess]) -> UserAccess:
+        """Return the cached access of ``user_id``, loading and caching it on a miss."""
+        access = self.get(user_id)
+        if access is None:
+            generation = self._generation
+            access = loader()
+            self.store(user_id, access, generation)
+        return access
+
+    def invalidate_users(self, user_ids: Iterable[str]) -> None:
+        with self._lock:
+            self._generation += 1
+            for user_id in user_ids:
+                self._entries.pop(user_id, None)
+
+    def invalidate_user(self, user_id: str) -> None:
+        self.invalidate_users([user_id])
+
+    def invalidate_cube(self, cube_id: str) -> None:
+        """Drop every cached user that can access ``cube_id``."""
+        with self._lock:
+            self._generation += 1
+            stale = [
+                user_id
+                for user_id, (_, access) in self._entries.items()
+                if cube_id in access.cube_ids
+            ]
+            for user_id in stale:
+                del self._entries[user_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
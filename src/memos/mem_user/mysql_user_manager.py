@@ -22,6 +22,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, declarative_base, relationship, sessionmaker
 
 from memos.log import get_logger
+from memos.mem_user.access_cache import UserAccess, UserAccessCache
 
 
 logger = get_logger(__name__)
@@ -128,6 +129,7 @@ class MySQLUserManager:
         self.connection_url = connection_url
         self.engine = create_engine(connection_url, echo=False, pool_pre_ping=True)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self._access_cache = UserAccessCache()
 
         # Create tables
         Base.metadata.create_all(bind=self.engine)
@@ -141,6 +143,33 @@ class MySQLUserManager:
         """Get a database session."""
         return self.SessionLocal()
 
+    def _query_user_access(
+        self, session: Session, user: User | None, member_cubes: list[Cube] | None = None
+    ) -> UserAccess:
+        """Build the access snapshot of a user: active flag and accessible active cubes."""
+        if user is None:
+            return UserAccess(active=False, cube_ids=frozenset())
+        if member_cubes is None:
+            member_cubes = [cube for cube in user.cubes if cube.is_active]
+        owned = (
+            session.query(Cube.cube_id).filter(Cube.owner_id == user.user_id, Cube.is_active).all()
+        )
+        cube_ids = {cube.cube_id for cube in member_cubes} | {row[0] for row in owned}
+        return UserAccess(active=bool(user.is_active), cube_ids=frozenset(cube_ids))
+
+    def _get_user_access(self, user_id: str) -> UserAccess:
+        """Get the access snapshot of a user, served from the access cache when fresh."""
+
+        def load() -> UserAccess:
+            session = self._get_session()
+            try:
+                user = session.query(User).filter(User.user_id == user_id).first()
+                return self._query_user_access(session, user)
+            finally:
+                session.close()
+
+        return self._access_cache.lookup(user_id, load)
+
     def _init_root_user(self, user_id: str) -> None:
         """Initialize the root user if no users exist."""
         session = self._get_session()
@@ -186,6 +215,7 @@ class MySQLUserManager:
             user = User(user_name=user_name, role=role.value, user_id=user_id or str(uuid.uuid4()))
             session.add(user)
             session.commit()
+            self._access_cache.invalidate_user(user.user_id)
             logger.info(f"User '{user_name}' created with ID: {user.user_id}")
             return user.user_id
         except IntegrityError:
@@ -237,8 +267,7 @@ class MySQLUserManager:
         Returns:
             bool: True if user exists and is active, False otherwise.
         """
-        user = self.get_user(user_id)
-        return user is not None and user.is_active
+        return self._get_user_access(user_id).active
 
     def list_users(self) -> list[User]:
         """List all active users.
@@ -292,6 +321,7 @@ class MySQLUserManager:
             cube.users.append(owner)
 
             session.commit()
+            self._access_cache.invalidate_user(owner_id)
             logger.info(f"Cube '{cube_name}' created with ID: {cube.cube_id}")
             return cube.cube_id
         except Exception as e:
@@ -326,26 +356,7 @@ class MySQLUserManager:
         Returns:
             bool: True if user has access to cube, False otherwise.
         """
-        session = self._get_session()
-        try:
-            # Check if user exists and is active
-            user = session.query(User).filter(User.user_id == user_id, User.is_active).first()
-            if not user:
-                return False
-
-            # Check if cube exists and is active
-            cube = session.query(Cube).filter(Cube.cube_id == cube_id, Cube.is_active).first()
-            if not cube:
-                return False
-
-            # Check if user has access to cube (owner or in users list)
-            if cube.owner_id == user_id:
-                return True
-
-            # Check many-to-many relationship
-            return user in cube.users
-        finally:
-            session.close()
+        return self._get_user_access(user_id).can_access(cube_id)
 
     def get_user_cubes(self, user_id: str) -> list[Cube]:
         """Get all cubes accessible by a user.
@@ -356,6 +367,7 @@ class MySQLUserManager:
         Returns:
             list[Cube]: List of cubes accessible by the user.
         """
+        generation = self._access_cache.generation
         session = self._get_session()
         try:
             user = session.query(User).filter(User.user_id == user_id).first()
@@ -363,6 +375,10 @@ class MySQLUserManager:
                 return []
 
             active_cubes = [cube for cube in user.cubes if cube.is_active]
+            # preload the access cache so the following access checks skip the database
+            self._access_cache.store(
+                user_id, self._query_user_access(session, user, active_cubes), generation
+            )
             return sorted(active_cubes, key=lambda cube: cube.created_at, reverse=True)
         finally:
             session.close()
@@ -388,6 +404,7 @@ class MySQLUserManager:
             if user not in cube.users:
                 cube.users.append(user)
                 session.commit()
+                self._access_cache.invalidate_user(user_id)
                 logger.info(f"User '{user_id}' added to cube '{cube_id}'")
 
             return True
@@ -424,6 +441,7 @@ class MySQLUserManager:
             if user in cube.users:
                 cube.users.remove(user)
                 session.commit()
+                self._access_cache.invalidate_user(user_id)
                 logger.info(f"User '{user_id}' removed from cube '{cube_id}'")
 
             return True
@@ -456,6 +474,7 @@ class MySQLUserManager:
 
             user.is_active = False
             session.commit()
+            self._access_cache.invalidate_user(user_id)
             logger.info(f"User '{user_id}' deactivated")
             return True
         except Exception as e:
@@ -482,6 +501,7 @@ class MySQLUserManager:
 
             cube.is_active = False
             session.commit()
+            self._access_cache.invalidate_cube(cube_id)
             logger.info(f"Cube '{cube_id}' deactivated")
             return True
         except Exception as e:
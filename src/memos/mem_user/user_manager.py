@@ -27,6 +27,7 @@ from sqlalchemy.orm import Session, declarative_base, relationship, sessionmaker
 
 from memos import settings
 from memos.log import get_logger
+from memos.mem_user.access_cache import UserAccess, UserAccessCache
 
 
 logger = get_logger(__name__)
@@ -114,6 +115,7 @@ class UserManager:
         self.db_path = db_path
         self.engine = create_engine(f"sqlite:///{db_path}", echo=False)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self._access_cache = UserAccessCache()
 
         # Create tables
         Base.metadata.create_all(bind=self.engine)
@@ -127,6 +129,33 @@ class UserManager:
         """Get a database session."""
         return self.SessionLocal()
 
+    def _query_user_access(
+        self, session: Session, user: User | None, member_cubes: list[Cube] | None = None
+    ) -> UserAccess:
+        """Build the access snapshot of a user: active flag and accessible active cubes."""
+        if user is None:
+            return UserAccess(active=False, cube_ids=frozenset())
+        if member_cubes is None:
+            member_cubes = [cube for cube in user.cubes if cube.is_active]
+        owned = (
+            session.query(Cube.cube_id).filter(Cube.owner_id == user.user_id, Cube.is_active).all()
+        )
+        cube_ids = {cube.cube_id for cube in member_cubes} | {row[0] for row in owned}
+        return UserAccess(active=bool(user.is_active), cube_ids=frozenset(cube_ids))
+
+    def _get_user_access(self, user_id: str) -> UserAccess:
+        """Get the access snapshot of a user, served from the access cache when fresh."""
+
+        def load() -> UserAccess:
+            session = self._get_session()
+            try:
+                user = session.query(User).filter(User.user_id == user_id).first()
+                return self._query_user_access(session, user)
+            finally:
+                session.close()
+
+        return self._access_cache.lookup(user_id, load)
+
     def _init_root_user(self, user_id: str) -> None:
         """Initialize the root user if no users exist."""
         session = self._get_session()
@@ -172,6 +201,7 @@ class UserManager:
             user = User(user_name=user_name, role=role, user_id=user_id or str(uuid.uuid4()))
             session.add(user)
             session.commit()
+            self._access_cache.invalidate_user(user.user_id)
             logger.info(f"User '{user_name}' created with ID: {user.user_id}")
             return user.user_id
         except IntegrityError:
@@ -223,8 +253,7 @@ class UserManager:
         Returns:
             bool: True if user exists and is active, False otherwise.
         """
-        user = self.get_user(user_id)
-        return user is not None and user.is_active
+        return self._get_user_access(user_id).active
 
     def list_users(self) -> list[User]:
         """List all active users.
@@ -278,6 +307,7 @@ class UserManager:
             cube.users.append(owner)
 
             session.commit()
+            self._access_cache.invalidate_user(owner_id)
             logger.info(f"Cube '{cube_name}' created with ID: {cube.cube_id}")
             return cube.cube_id
         except Exception as e:
@@ -312,26 +342,7 @@ class UserManager:
         Returns:
             bool: True if user has access to cube, False otherwise.
         """
-        session = self._get_session()
-        try:
-            # Check if user exists and is active
-            user = session.query(User).filter(User.user_id == user_id, User.is_active).first()
-            if not user:
-                return False
-
-            # Check if cube exists and is active
-            cube = session.query(Cube).filter(Cube.cube_id == cube_id, Cube.is_active).first()
-            if not cube:
-                return False
-
-            # Check if user has access to cube (owner or in users list)
-            if cube.owner_id == user_id:
-                return True
-
-            # Check many-to-many relationship
-            return user in cube.users
-        finally:
-            session.close()
+        return self._get_user_access(user_id).can_access(cube_id)
 
     def get_user_cubes(self, user_id: str) -> list[Cube]:
         """Get all cubes accessible by a user.
@@ -342,6 +353,7 @@ class UserManager:
         Returns:
             list[Cube]: List of cubes accessible by the user.
         """
+        generation = self._access_cache.generation
         session = self._get_session()
         try:
             user = session.query(User).filter(User.user_id == user_id).first()
@@ -349,6 +361,10 @@ class UserManager:
                 return []
 
             active_cubes = [cube for cube in user.cubes if cube.is_active]
+            # preload the access cache so the following access checks skip the database
+            self._access_cache.store(
+                user_id, self._query_user_access(session, user, active_cubes), generation
+            )
             return sorted(active_cubes, key=lambda cube: cube.created_at, reverse=True)
         finally:
             session.close()
@@ -374,6 +390,7 @@ class UserManager:
             if user not in cube.users:
                 cube.users.append(user)
                 session.commit()
+                self._access_cache.invalidate_user(user_id)
                 logger.info(f"User '{user_id}' added to cube '{cube_id}'")
 
             return True
@@ -410,6 +427,7 @@ class UserManager:
             if user in cube.users:
                 cube.users.remove(user)
                 session.commit()
+                self._access_cache.invalidate_user(user_id)
                 logger.info(f"User '{user_id}' removed from cube '{cube_id}'")
 
             return True
@@ -442,6 +460,7 @@ class UserManager:
 
             user.is_active = False
             session.commit()
+            self._access_cache.invalidate_user(user_id)
             logger.info(f"User '{user_id}' deactivated")
             return True
         except Exception as e:
@@ -468,6 +487,7 @@ class UserManager:
 
             cube.is_active = False
             session.commit()
+            self._access_cache.invalidate_cube(cube_id)
             logger.info(f"Cube '{cube_id}' deactivated")
             return True
         except Exception as e:
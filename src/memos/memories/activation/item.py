@@ -27,6 +27,14 @@ class KVCacheRecords(BaseModel):
     timestamp: datetime = Field(
         default_factory=get_utc_now, description="submit time for schedule_messages"
     )
+    segment_texts: list[str] = Field(
+        default_factory=list,
+        description="Prompt pieces (head, one per memory, tail) prefilled into the cache in order.",
+    )
+    segment_lengths: list[int] = Field(
+        default_factory=list,
+        description="Token count of each entry in segment_texts.",
+    )
 
 
 class KVCacheItem(ActivationMemoryItem):
@@ -1,3 +1,5 @@
+import hashlib
+import json
 import os
 import pickle
 
@@ -13,6 +15,10 @@ from memos.memories.activation.item import KVCacheItem
 from memos.memories.textual.item import TextualMemoryItem
 
 
+# Stands in for the memory text while rendering, to split the prompt into head and tail.
+_SEGMENT_MARKER = "\x00MEMOS_KV_SEGMENTS\x00"
+
+
 class KVCacheMemory(BaseActMemory):
     """
     Key-Value Cache Memory for activation memories.
@@ -28,6 +34,9 @@ class KVCacheMemory(BaseActMemory):
         self.config = config
         self.llm = LLMFactory.from_config(config.extractor_llm)
         self.kv_cache_memories: dict[str, KVCacheItem] = {}
+        # Segment files of loaded caches that have not been read yet, and their directory
+        self._pending_segments: dict[str, list[str]] = {}
+        self._segment_root: str | None = None
 
     def extract(self, text: str) -> KVCacheItem:
         """Extract memory based on the text.
@@ -51,6 +60,68 @@ class KVCacheMemory(BaseActMemory):
 
         return cache_item
 
+    def extend(
+        self,
+        segments: list[str],
+        template: str = "{memory_text}",
+        base: KVCacheItem | None = None,
+    ) -> KVCacheItem:
+        """Build a KV cache for segmented text, reusing the unchanged prefix of `base`.
+
+        The prompt is split into a head (chat template and the part of `template` before
+        the memory text), one segment per entry of `segments` and a tail. The cache of `base`
+        is cropped to the longest run of leading segments it shares with the new prompt, and
+        only the remaining segments are prefilled, so appending memories costs as much as
+        the appended text. `base.memory` is modified in place.
+
+        Args:
+            segments: Memory text pieces, concatenated in order into `template`
+            template: Format string with a `{memory_text}` field
+            base: Previously built item to extend
+
+        Returns:
+            New KVCacheItem whose records describe its segment layout
+        """
+        prompt = self.llm.render_kv_prompt(template.format(memory_text=_SEGMENT_MARKER))
+        head, tail = prompt.split(_SEGMENT_MARKER, 1)
+        all_segments = [head, *segments, tail]
+
+        reused = 0
+        kv = None
+        if base is not None and base.records.segment_lengths:
+            # The old tail is always recomputed since it now follows different tokens.
+            for old, new in zip(base.records.segment_texts[:-1], all_segments[:-1], strict=False):
+                if old != new:
+                    break
+                reused += 1
+        if reused:
+            kv = base.memory
+            keep = sum(base.records.segment_lengths[:reused])
+            drop = kv.get_seq_length() - keep
+            if drop > 0:
+                kv.crop(-drop)
+
+        try:
+            kv, lengths = self.llm.extend_kv_cache(all_segments[reused:], kv)
+        except Exception:
+            if reused:
+                # The base cache was already cropped and must not be served any more.
+                self.kv_cache_memories.pop(base.id, None)
+            raise
+
+        cache_item = KVCacheItem(
+            memory=kv,
+            metadata={
+                "source_text": template.format(memory_text="".join(segments)),
+                "extracted_at": datetime.now().isoformat(),
+                "reused_segments": reused,
+            },
+        )
+        cache_item.records.segment_texts = all_segments
+        reused_lengths = base.records.segment_lengths[:reused] if reused else []
+        cache_item.records.segment_lengths = reused_lengths + lengths
+        return cache_item
+
     def add(self, memories: list[KVCacheItem]) -> None:
         """Add memories to the KV cache memory.
 
@@ -60,18 +131,22 @@ class KVCacheMemory(BaseActMemory):
         for memory in memories:
             self.kv_cache_memories[memory.id] = memory
 
-    def get_cache(self, cache_ids: list[str]) -> DynamicCache | None:
+    def get_cache(self, cache_ids: list[str], device: str | None = None) -> DynamicCache | None:
         """Merge multiple KV caches into a single cache.
 
+        Caches that were loaded lazily are read from disk here, so only the selected ones
+        become resident.
+
         Args:
             cache_ids: List of cache IDs to merge
+            device: Device to place the selected caches on before merging
 
         Returns:
             Merged DynamicCache or None if no caches found
         """
         caches_to_merge = []
         for cache_id in cache_ids:
-            cache_item = self.kv_cache_memories.get(cache_id)
+            cache_item = self._resolve(cache_id, device=device)
             if cache_item and cache_item.memory:
                 caches_to_merge.append(cache_item.memory)
 
@@ -89,7 +164,7 @@ class KVCacheMemory(BaseActMemory):
         Returns:
             Memory dictionary or None if not found
         """
-        return self.kv_cache_memories.get(memory_id)
+        return self._resolve(memory_id)
 
     def get_by_ids(self, memory_ids: list[str]) -> list[KVCacheItem | None]:
         """Get memories by their IDs.
@@ -112,7 +187,8 @@ class KVCacheMemory(BaseActMemory):
         Returns:
             List of all KVCacheItems in the memory
         """
-        return list(self.kv_cache_memories.values())
+        items = [self._resolve(memory_id) for memory_id in list(self.kv_cache_memories)]
+        return [item for item in items if item is not None]
 
     def delete(self, memory_ids: list[str]) -> None:
         """Delete memories by their IDs.
@@ -122,10 +198,12 @@ class KVCacheMemory(BaseActMemory):
         """
         for memory_id in memory_ids:
             self.kv_cache_memories.pop(memory_id, None)
+            self._pending_segments.pop(memory_id, None)
 
     def delete_all(self) -> None:
         """Delete all memories."""
         self.kv_cache_memories.clear()
+        self._pending_segments.clear()
 
     def from_textual_memory(self, mem: TextualMemoryItem) -> KVCacheItem:
         """
@@ -139,6 +217,8 @@ class KVCacheMemory(BaseActMemory):
     def load(self, dir: str) -> None:
         """Load memories from os.path.join(dir, self.config.memory_filename)
 
+        Caches stored as tensor files are not read here; each one is loaded on first use.
+
         Args:
             dir (str): The directory containing the memory files.
         """
@@ -150,7 +230,15 @@ class KVCacheMemory(BaseActMemory):
             # If file doesn't exist, start with empty memories
             return
 
+        self._pending_segments = {}
+        self._segment_root = dir
         try:
+            with open(file_path, "rb") as f:
+                is_index = f.read(1) == b"{"
+            if is_index:
+                self._load_index(file_path)
+                return
+
             # Allow loading DynamicCache and KVCacheItem types
             torch.serialization.add_safe_globals([DynamicCache, KVCacheItem])
 
@@ -176,26 +264,205 @@ class KVCacheMemory(BaseActMemory):
                 # Reset to empty if data format is unexpected
                 self.kv_cache_memories = {}
 
+            # Caches stored as per-segment tensor files are read on first use
+            segments = data.get("kv_cache_segments", {}) if isinstance(data, dict) else {}
+            self._pending_segments = {
+                item_id: names
+                for item_id, names in segments.items()
+                if item_id in self.kv_cache_memories
+            }
+
         except (EOFError, pickle.UnpicklingError, Exception):
             # If loading fails, start with empty memories
             self.kv_cache_memories = {}
+            self._pending_segments = {}
+
+    def _load_index(self, file_path: str) -> None:
+        with open(file_path, encoding="utf-8") as f:
+            index = json.load(f)
+
+        self.kv_cache_memories = {}
+        for item_id, entry in index.get("items", {}).items():
+            self.kv_cache_memories[item_id] = KVCacheItem.model_validate(entry["item"])
+            self._pending_segments[item_id] = entry["segments"]
 
     def dump(self, dir: str) -> None:
         """Dump memories to os.path.join(dir, self.config.memory_filename)
 
+        Caches built by `extend` are stored as one tensor file per segment, named by the
+        content of all segments up to it. Segments unchanged since the last dump already
+        exist on disk, so only appended segments are written. With the safetensors storage
+        format every cache goes to tensor files and the memory file becomes a JSON index.
+
         Args:
             dir (str): The directory where the memory files will be saved.
         """
         file_path = os.path.join(dir, self.config.memory_filename)
+        use_safetensors = self.config.storage_format == "safetensors"
+        same_root = self._segment_root is not None and os.path.abspath(
+            self._segment_root
+        ) == os.path.abspath(dir)
 
         # Create directory if it doesn't exist
         os.makedirs(dir, exist_ok=True)
 
         # Prepare data to save (only memories)
-        data = {"kv_cache_memories": self.kv_cache_memories}
+        memories = {}
+        segments = {}
+        for item_id in list(self.kv_cache_memories):
+            # Caches that were never loaded are still on disk and need no rewrite
+            names = self._pending_segments.get(item_id) if same_root else None
+            item = self._resolve(item_id) if names is None else self.kv_cache_memories[item_id]
+            if item is None:
+                continue
+            if names is None:
+                names = self._dump_segments(dir, item, whole=use_safetensors)
+            if names is None:
+                memories[item_id] = item
+            else:
+                memories[item_id] = item.model_copy(update={"memory": DynamicCache()})
+                segments[item_id] = names
+
+        if use_safetensors:
+            index = {
+                "format": "safetensors",
+                "items": {
+                    item_id: {
+                        "item": memories[item_id].model_dump(mode="json", exclude={"memory"}),
+                        "segments": names,
+                    }
+                    for item_id, names in segments.items()
+                },
+            }
+            with open(file_path, "w", encoding="utf-8") as f:
+                json.dump(index, f, ensure_ascii=False)
+        else:
+            data = {"kv_cache_memories": memories}
+            if segments:
+                data["kv_cache_segments"] = segments
 
-        with open(file_path, "wb") as f:
-            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            with open(file_path, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self._prune_segments(dir, {name for names in segments.values() for name in names})
+
+    def _resolve(self, memory_id: str, device: str | None = None) -> KVCacheItem | None:
+        """Return the item, reading its cache from disk if it was loaded lazily."""
+        item = self.kv_cache_memories.get(memory_id)
+        if item is None:
+            return None
+        names = self._pending_segments.pop(memory_id, None)
+        if names is not None:
+            try:
+                item.memory = self._load_segments(self._segment_root, names, device=device)
+            except FileNotFoundError:
+                self.kv_cache_memories.pop(memory_id, None)
+                return None
+        elif device is not None:
+            move_dynamic_cache_htod(item.memory, device)
+        return item
+
+    def _segment_dir(self, dir: str) -> str:
+        return os.path.join(dir, f"{self.config.memory_filename}.segments")
+
+    def _dump_segments(self, dir: str, item: KVCacheItem, whole: bool = False) -> list[str] | None:
+        """Write the not yet stored segments of `item` and return all its segment file names.
+
+        Caches without a segment layout are written as a single segment when `whole` is set,
+        and otherwise return None to be pickled inline. Segment files are named after their
+        content and written once; a whole-cache file is named after the item and is always
+        rewritten, since the item's cache may have changed since the last dump.
+        """
+        lengths = item.records.segment_lengths
+        seq_len = item.memory.get_seq_length()
+        content_addressed = True
+        if lengths and sum(lengths) == seq_len:
+            llm_config = getattr(self.config.extractor_llm, "config", None)
+            model = getattr(llm_config, "model_name_or_path", "")
+            digest = hashlib.sha256(str(model).encode("utf-8"))
+            spans = []
+            start = 0
+            for text, length in zip(item.records.segment_texts, lengths, strict=False):
+                # A segment's keys and values depend on every token before it.
+                digest.update(f"{len(text)}:{text}".encode())
+                spans.append((digest.hexdigest(), start, start + length))
+                start += length
+        elif whole:
+            spans = [(item.id, 0, seq_len)]
+            content_addressed = False
+        else:
+            return None
+
+        suffix = ".safetensors" if self.config.storage_format == "safetensors" else ".pt"
+        segment_dir = self._segment_dir(dir)
+        os.makedirs(segment_dir, exist_ok=True)
+        layers = _cache_layer_tensors(item.memory)
+        names = []
+        for stem, start, end in spans:
+            name = f"{stem}{suffix}"
+            path = os.path.join(segment_dir, name)
+            if not (content_addressed and os.path.exists(path)):
+                self._write_segment(path, layers, start, end)
+            names.append(name)
+        return names
+
+    @staticmethod
+    def _write_segment(path: str, layers: list[tuple], start: int, end: int) -> None:
+        import torch
+
+        keys = [k[:, :, start:end, :].detach().cpu().clone() for k, _ in layers]
+        values = [v[:, :, start:end, :].detach().cpu().clone() for _, v in layers]
+        tmp_path = f"{path}.tmp"
+        if path.endswith(".safetensors"):
+            from safetensors.torch import save_file
+
+            tensors = {f"keys.{i}": k for i, k in enumerate(keys)}
+            tensors.update({f"values.{i}": v for i, v in enumerate(values)})
+            save_file(tensors, tmp_path, metadata={"num_layers": str(len(layers))})
+        else:
+            torch.save({"keys": keys, "values": values}, tmp_path)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _read_segment(path: str, device: str | None = None) -> tuple[list, list]:
+        """Read one segment file; safetensors and torch files are both memory-mapped."""
+        import torch
+
+        if path.endswith(".safetensors"):
+            from safetensors import safe_open
+
+            with safe_open(path, framework="pt", device=str(device or "cpu")) as f:
+                num_layers = int(f.metadata()["num_layers"])
+                keys = [f.get_tensor(f"keys.{i}") for i in range(num_layers)]
+                values = [f.get_tensor(f"values.{i}") for i in range(num_layers)]
+            return keys, values
+
+        part = torch.load(path, map_location=device or "cpu", weights_only=True, mmap=True)
+        return part["keys"], part["values"]
+
+    def _load_segments(self, dir: str, names: list[str], device: str | None = None) -> DynamicCache:
+        import torch
+
+        segment_dir = self._segment_dir(dir)
+        parts = [self._read_segment(os.path.join(segment_dir, name), device) for name in names]
+        cache = DynamicCache()
+        for layer in range(len(parts[0][0])):
+            keys = [part_keys[layer] for part_keys, _ in parts]
+            values = [part_values[layer] for _, part_values in parts]
+            cache.update(
+                keys[0] if len(keys) == 1 else torch.cat(keys, dim=-2),
+                values[0] if len(values) == 1 else torch.cat(values, dim=-2),
+                layer,
+            )
+        return cache
+
+    def _prune_segments(self, dir: str, keep: set[str]) -> None:
+        segment_dir = self._segment_dir(dir)
+        if not os.path.isdir(segment_dir):
+            return
+        for name in os.listdir(segment_dir):
+            if name not in keep:
+                os.remove(os.path.join(segment_dir, name))
 
     def _concat_caches(self, caches: list[DynamicCache]) -> DynamicCache:
         """
@@ -255,6 +522,13 @@ class KVCacheMemory(BaseActMemory):
         return merged
 
 
+def _cache_layer_tensors(cache: DynamicCache) -> list[tuple]:
+    """Return (keys, values) per layer for both old and new DynamicCache layouts."""
+    if hasattr(cache, "layers"):
+        return [(layer.keys, layer.values) for layer in cache.layers]
+    return list(zip(cache.key_cache, cache.value_cache, strict=False))
+
+
 def move_dynamic_cache_htod(dynamic_cache: DynamicCache, device: str) -> DynamicCache:
     """
     Move DynamicCache from CPU to GPU device.
@@ -9,6 +9,8 @@ from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from memos.embedders.quantized import QuantizedEmbedding
+
 
 ALLOWED_ROLES = {"user", "assistant", "system"}
 
@@ -190,7 +192,7 @@ class TreeNodeTextualMemoryMetadata(TextualMemoryMetadata):
     sources: list[SourceMessage] | None = Field(
         default=None, description="Multiple origins of the memory (e.g., URLs, notes)."
     )
-    embedding: list[float] | None = Field(
+    embedding: list[float] | QuantizedEmbedding | None = Field(
         default=None,
         description="The vector embedding of the memory content, used for semantic search or clustering.",
     )
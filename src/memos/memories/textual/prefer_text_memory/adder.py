@@ -58,7 +58,7 @@ class NaiveAdder(BaseAdder):
         )
 
         try:
-            response = self.llm_provider.generate([{"role": "user", "content": prompt}])
+            response = self.llm_provider.generate([{"role": "user", "content": prompt}], cache=True)
             response = response.strip().replace("```json", "").replace("```", "").strip()
             result = json.loads(response)
             response = result.get("is_same", False)
@@ -75,7 +75,7 @@ class NaiveAdder(BaseAdder):
             "{retrieved_memories}", retrieved_mems
         )
         try:
-            response = self.llm_provider.generate([{"role": "user", "content": prompt}])
+            response = self.llm_provider.generate([{"role": "user", "content": prompt}], cache=True)
             response = response.strip().replace("```json", "").replace("```", "").strip()
             result = json.loads(response)
             return result
@@ -130,7 +130,7 @@ class NaiveAdder(BaseAdder):
             "{new_memories}", new_mems
         ).replace("{retrieved_memories}", retrieved_mems)
         try:
-            response = self.llm_provider.generate([{"role": "user", "content": prompt}])
+            response = self.llm_provider.generate([{"role": "user", "content": prompt}], cache=True)
             response = response.strip().replace("```json", "").replace("```", "").strip()
             result = json.loads(response)
             return result
@@ -21,6 +21,7 @@ from memos.memories.textual.prefer_text_memory.factory import (
     ExtractorFactory,
     RetrieverFactory,
 )
+from memos.memories.textual.tree_text_memory.retrieve.result_cache import bump_cube_version
 from memos.reranker.factory import RerankerFactory
 from memos.types import MessageList
 from memos.vec_dbs.factory import MilvusVecDB, QdrantVecDB, VecDBFactory
@@ -114,6 +115,7 @@ class PreferenceTextMemory(BaseTextMemory):
                 vec_db_items = [VecDBItem.from_dict(m) for m in items]
                 self.vector_db.add(collection_name, vec_db_items)
                 logger.info(f"Loaded {len(items)} memories from {collection_name} in {memory_file}")
+            bump_cube_version()
 
         except FileNotFoundError:
             logger.error(f"Memory file not found in directory: {dir}")
@@ -166,7 +168,30 @@ class PreferenceTextMemory(BaseTextMemory):
         Args:
             memories: List of TextualMemoryItem objects or dictionaries to add.
         """
-        return self.adder.add(memories)
+        added_ids = self.adder.add(memories)
+        self._bump_search_cache(memories)
+        return added_ids
+
+    @staticmethod
+    def _bump_search_cache(memories: list[TextualMemoryItem | dict[str, Any]]) -> None:
+        """Invalidate cached search results for the cubes the added memories belong to."""
+        cube_ids = set()
+        for memory in memories:
+            metadata = (
+                memory.get("metadata") if isinstance(memory, dict) else memory.metadata
+            ) or {}
+            cube_id = (
+                metadata.get("mem_cube_id")
+                if isinstance(metadata, dict)
+                else getattr(metadata, "mem_cube_id", None)
+            )
+            if cube_id is None:
+                # Unknown owner: fall back to invalidating every cube.
+                bump_cube_version()
+                return
+            cube_ids.add(cube_id)
+        for cube_id in cube_ids:
+            bump_cube_version(cube_id)
 
     def update(self, memory_id: str, new_memory: TextualMemoryItem | dict[str, Any]) -> None:
         """Update a memory by memory_id."""
@@ -313,6 +338,7 @@ class PreferenceTextMemory(BaseTextMemory):
         collection_list = self.vector_db.config.collection_name
         for collection_name in collection_list:
             self.vector_db.delete(collection_name, memory_ids)
+        bump_cube_version()
 
     def delete_by_filter(self, filter: dict[str, Any]) -> None:
         """Delete memories by filter.
@@ -322,6 +348,7 @@ class PreferenceTextMemory(BaseTextMemory):
         collection_list = self.vector_db.config.collection_name
         for collection_name in collection_list:
             self.vector_db.delete_by_filter(collection_name=collection_name, filter=filter)
+        bump_cube_version()
 
     def delete_with_collection_name(self, collection_name: str, memory_ids: list[str]) -> None:
         """Delete memories by their IDs and collection name.
@@ -330,12 +357,14 @@ class PreferenceTextMemory(BaseTextMemory):
             memory_ids (list[str]): List of memory IDs to delete.
         """
         self.vector_db.delete(collection_name, memory_ids)
+        bump_cube_version()
 
     def delete_all(self) -> None:
         """Delete all memories."""
         for collection_name in self.vector_db.config.collection_name:
             self.vector_db.delete_collection(collection_name)
         self.vector_db.create_collection()
+        bump_cube_version()
 
     def drop(
         self,
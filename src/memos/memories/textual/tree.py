@@ -14,6 +14,11 @@ from memos.configs.reranker import RerankerConfigFactory
 from memos.context.context import ContextThreadPoolExecutor
 from memos.dependency import require_python_package
 from memos.embedders.factory import EmbedderFactory, OllamaEmbedder
+from memos.graph_dbs.export_stream import (
+    export_graph_stream,
+    import_graph_stream,
+    is_graph_stream,
+)
 from memos.graph_dbs.factory import GraphStoreFactory, Neo4jGraphDB
 from memos.llms.factory import AzureLLM, LLMFactory, OllamaLLM, OpenAILLM
 from memos.log import get_logger
@@ -24,10 +29,12 @@ from memos.memories.textual.tree_text_memory.organize.manager import MemoryManag
 from memos.memories.textual.tree_text_memory.retrieve.advanced_searcher import (
     AdvancedSearcher as Searcher,
 )
+from memos.memories.textual.tree_text_memory.retrieve.bm25_index import get_shared_bm25_index
 from memos.memories.textual.tree_text_memory.retrieve.bm25_util import EnhancedBM25
 from memos.memories.textual.tree_text_memory.retrieve.internet_retriever_factory import (
     InternetRetrieverFactory,
 )
+from memos.memories.textual.tree_text_memory.retrieve.result_cache import bump_cube_version
 from memos.memories.textual.tree_text_memory.retrieve.retrieve_utils import StopwordManager
 from memos.reranker.factory import RerankerFactory
 from memos.types import MessageList
@@ -408,11 +415,17 @@ class TreeTextMemory(BaseTextMemory):
                 self.graph_store.delete_node(mid, user_name=user_name)
             except Exception as e:
                 logger.warning(f"TreeTextMemory.delete_hard: failed to delete {mid}: {e}")
+        get_shared_bm25_index().remove_nodes(
+            memory_ids, user_name=user_name, store=self.graph_store
+        )
+        bump_cube_version(user_name)
 
     def delete_by_memory_ids(self, memory_ids: list[str]) -> None:
         """Delete memories by memory_ids."""
         try:
             self.graph_store.delete_node_by_prams(memory_ids=memory_ids)
+            get_shared_bm25_index().remove_nodes(memory_ids, store=self.graph_store)
+            bump_cube_version()
         except Exception as e:
             logger.error(f"An error occurred while deleting memories by memory_ids: {e}")
 
@@ -420,6 +433,8 @@ class TreeTextMemory(BaseTextMemory):
         """Delete all memories and their relationships from the graph store."""
         try:
             self.graph_store.clear(user_name=user_name)
+            get_shared_bm25_index().invalidate(user_name, store=self.graph_store)
+            bump_cube_version(user_name)
             logger.info("All memories and edges have been deleted from the graph.")
         except Exception as e:
             logger.error(f"An error occurred while deleting all memories: {e}")
@@ -435,8 +450,15 @@ class TreeTextMemory(BaseTextMemory):
         self.graph_store.delete_node_by_prams(
             writable_cube_ids=writable_cube_ids, file_ids=file_ids, filter=filter
         )
+        get_shared_bm25_index().invalidate(store=self.graph_store)
+        bump_cube_version()
 
     def load(self, dir: str, user_name: str | None = None) -> None:
+        if is_graph_stream(dir):
+            import_graph_stream(self.graph_store, dir, user_name=user_name)
+            get_shared_bm25_index().invalidate(user_name, store=self.graph_store)
+            bump_cube_version(user_name)
+            return
         try:
             memory_file = os.path.join(dir, self.config.memory_filename)
 
@@ -457,8 +479,25 @@ class TreeTextMemory(BaseTextMemory):
         except Exception as e:
             logger.error(f"An error occurred while loading memories: {e}")
 
-    def dump(self, dir: str, include_embedding: bool = False, user_name: str | None = None) -> None:
-        """Dump memories to os.path.join(dir, self.config.memory_filename)"""
+    def dump(
+        self,
+        dir: str,
+        include_embedding: bool = False,
+        user_name: str | None = None,
+        streaming: bool = False,
+    ) -> None:
+        """Dump memories to os.path.join(dir, self.config.memory_filename).
+
+        With ``streaming=True`` the graph is instead exported page by page into
+        ``dir`` as JSONL plus a float32 embedding matrix (see
+        ``memos.graph_dbs.export_stream``); an interrupted streaming dump resumes
+        where it stopped. ``load`` detects either format.
+        """
+        if streaming:
+            export_graph_stream(
+                self.graph_store, dir, include_embedding=include_embedding, user_name=user_name
+            )
+            return
         try:
             json_memories = self.graph_store.export_graph(
                 include_embedding=include_embedding, user_name=user_name
@@ -646,4 +685,8 @@ class TreeTextMemory(BaseTextMemory):
             # Wait for all tasks to complete and raise any exceptions
             for future in futures:
                 future.result()
+        get_shared_bm25_index().remove_nodes(
+            memory_ids, user_name=user_name, store=self.graph_store
+        )
+        bump_cube_version(user_name)
         return
@@ -1,6 +1,7 @@
 import json
 import re
 
+from collections.abc import Callable
 from datetime import datetime
 
 from dateutil import parser
@@ -10,6 +11,7 @@ from memos.graph_dbs.neo4j import Neo4jGraphDB
 from memos.llms.base import BaseLLM
 from memos.log import get_logger
 from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
+from memos.memories.textual.tree_text_memory.retrieve.result_cache import bump_cube_version
 from memos.templates.tree_reorganize_prompts import (
     MEMORY_RELATION_DETECTOR_PROMPT,
     MEMORY_RELATION_RESOLVER_PROMPT,
@@ -22,10 +24,22 @@ logger = get_logger(__name__)
 class NodeHandler:
     EMBEDDING_THRESHOLD: float = 0.8  # Threshold for embedding similarity to consider conflict
 
-    def __init__(self, graph_store: Neo4jGraphDB, llm: BaseLLM, embedder: BaseEmbedder):
+    def __init__(
+        self,
+        graph_store: Neo4jGraphDB,
+        llm: BaseLLM,
+        embedder: BaseEmbedder,
+        on_nodes_removed: Callable[[list[TextualMemoryItem], str | None], None] | None = None,
+    ):
+        """
+        Args:
+            on_nodes_removed: Called with the nodes deleted or archived while resolving
+                a conflict, e.g. to drop them from the reorganizer's online clusters.
+        """
         self.graph_store = graph_store
         self.llm = llm
         self.embedder = embedder
+        self.on_nodes_removed = on_nodes_removed
 
     def detect(self, memory, top_k: int = 5, scope=None, user_name: str | None = None):
         # 1. Search for similar memories based on embedding
@@ -144,6 +158,9 @@ class NodeHandler:
         older_mem = memory_b if time_a >= time_b else memory_a
 
         self.graph_store.delete_node(older_mem.id, user_name=user_name)
+        bump_cube_version(user_name)
+        if self.on_nodes_removed is not None:
+            self.on_nodes_removed([older_mem], user_name)
         logger.warning(
             f"Delete older memory {older_mem.id}: <{older_mem.memory}> due to conflict with {newer_mem.id}: <{newer_mem.memory}>"
         )
@@ -185,6 +202,9 @@ class NodeHandler:
         self.graph_store.update_node(conflict_b.id, {"status": "archived"}, user_name=user_name)
         self.graph_store.add_edge(conflict_a.id, merged.id, type="MERGED_TO", user_name=user_name)
         self.graph_store.add_edge(conflict_b.id, merged.id, type="MERGED_TO", user_name=user_name)
+        bump_cube_version(user_name)
+        if self.on_nodes_removed is not None:
+            self.on_nodes_removed([conflict_a, conflict_b], user_name)
         logger.debug(
             f"Archive {conflict_a.id} and {conflict_b.id}, and inherit their edges to {merged.id}."
         )
@@ -15,6 +15,8 @@ from memos.memories.textual.tree_text_memory.organize.reorganizer import (
     GraphStructureReorganizer,
     QueueMessage,
 )
+from memos.memories.textual.tree_text_memory.retrieve.bm25_index import get_shared_bm25_index
+from memos.memories.textual.tree_text_memory.retrieve.result_cache import bump_cube_version
 
 
 logger = get_logger(__name__)
@@ -85,6 +87,7 @@ class MemoryManager:
             graph_store, llm, embedder, is_reorganize=is_reorganize
         )
         self._merged_threshold = merged_threshold
+        self.bm25_index = get_shared_bm25_index()
 
     def add(
         self,
@@ -114,6 +117,7 @@ class MemoryManager:
 
         if mode == "sync":
             self._cleanup_working_memory(user_name)
+        bump_cube_version(user_name)
 
         return added_ids
 
@@ -219,22 +223,26 @@ class MemoryManager:
 
             max_workers = min(8, max(1, len(nodes) // max(1, batch_size)))
             with ContextThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures: list[tuple[int, int, object]] = []
+                futures: list[tuple[int, list[dict], object]] = []
                 for batch_index, i in enumerate(range(0, len(nodes), batch_size), start=1):
                     batch = nodes[i : i + batch_size]
                     fut = executor.submit(
                         self.graph_store.add_nodes_batch, batch, user_name=user_name
                     )
-                    futures.append((batch_index, len(batch), fut))
+                    futures.append((batch_index, batch, fut))
 
-                for idx, size, fut in futures:
+                for idx, batch, fut in futures:
                     try:
                         fut.result()
                     except Exception as e:
                         logger.exception(
-                            f"Batch add {node_kind} nodes error (batch {idx}, size {size}): ",
+                            f"Batch add {node_kind} nodes error (batch {idx}, size {len(batch)}): ",
                             exc_info=e,
                         )
+                    else:
+                        self.bm25_index.index_nodes(
+                            batch, user_name=user_name, store=self.graph_store
+                        )
 
         # TODO: working id is same with item.id, need to fix, currently stop adding WorkingMemories here.
         #  here used to be: _submit_batches(working_nodes, "WorkingMemory")
@@ -285,6 +293,7 @@ class MemoryManager:
             keep_latest=self.memory_size["WorkingMemory"],
             user_name=user_name,
         )
+        bump_cube_version(user_name)
         self._refresh_memory_size(user_name=user_name)
 
     def get_current_memory_size(self, user_name: str | None = None) -> dict[str, int]:
@@ -417,6 +426,11 @@ class MemoryManager:
             metadata_dict,
             user_name=user_name,
         )
+        self.bm25_index.index_nodes(
+            [{"id": node_id, "memory": memory.memory, "metadata": metadata_dict}],
+            user_name=user_name,
+            store=self.graph_store,
+        )
         self.reorganizer.add_message(
             QueueMessage(
                 op="add",
@@ -0,0 +1,438 @@
+"""Incremental (online) clustering for the graph structure reorganizer.
+
+The batch reorganizer reloads every candidate node and re-runs KMeans on each
+cycle. ``OnlineClusterIndex`` instead keeps one running centroid per cluster:
+a new node is assigned to the nearest centroid, a cluster is split in two only
+when it grows past ``max_cluster_size`` or its spread passes ``max_spread``,
+and a cluster that shrinks below ``min_cluster_size`` is merged into its
+nearest neighbour. Clusters touched since their last summary are marked dirty,
+so only those are re-summarized.
+
+Only member ids and the running vector sum are kept per cluster; member
+embeddings are loaded through ``embedding_loader`` when a cluster has to be
+split or recomputed, which keeps the index small enough to persist as JSON.
+"""
+
+import json
+import os
+import re
+import threading
+import uuid
+
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from memos.log import get_logger
+
+
+logger = get_logger(__name__)
+
+EmbeddingLoader = Callable[[list[str]], dict[str, Sequence[float]]]
+
+_INCREMENTAL_ENV = "MOS_REORGANIZE_INCREMENTAL"
+_STATE_DIR_ENV = "MOS_REORGANIZE_CLUSTER_DIR"
+
+
+def incremental_reorganize_enabled() -> bool:
+    return os.getenv(_INCREMENTAL_ENV, "false").lower() == "true"
+
+
+def _unit(vector: Sequence[float] | np.ndarray | None) -> np.ndarray | None:
+    if vector is None or len(vector) == 0:
+        return None
+    values = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(values))
+    if norm == 0.0:
+        return None
+    return values / norm
+
+
+def _two_means(matrix: np.ndarray, iterations: int = 10) -> np.ndarray:
+    """Split unit row vectors into two groups; returns a 0/1 label per row."""
+    centroid = matrix.mean(axis=0)
+    first = matrix[int(np.argmin(matrix @ centroid))]
+    second = matrix[int(np.argmin(matrix @ first))]
+    centers = np.stack([first, second])
+    labels = None
+    for _ in range(iterations):
+        new_labels = np.argmax(matrix @ centers.T, axis=1)
+        if labels is not None and (new_labels == labels).all():
+            break
+        labels = new_labels
+        for label in (0, 1):
+            members = matrix[labels == label]
+            if len(members):
+                centers[label] = members.mean(axis=0)
+    return labels
+
+
+@dataclass
+class OnlineCluster:
+    """One cluster: its member ids, running vector sum and summary bookkeeping."""
+
+    id: str
+    member_ids: list[str] = field(default_factory=list)
+    vector_sum: np.ndarray | None = None
+    parent_id: str | None = None
+    dirty: bool = True
+    # Members added / removed since the cluster was last summarized.
+    new_member_ids: set[str] = field(default_factory=set)
+    stale_member_ids: set[str] = field(default_factory=set)
+    version: int = 0
+
+    @property
+    def size(self) -> int:
+        return len(self.member_ids)
+
+    @property
+    def centroid(self) -> np.ndarray | None:
+        if self.vector_sum is None or not self.member_ids:
+            return None
+        return self.vector_sum / self.size
+
+    @property
+    def spread(self) -> float:
+        """1 - mean cosine similarity of the members to the centroid direction."""
+        centroid = self.centroid
+        return 0.0 if centroid is None else 1.0 - float(np.linalg.norm(centroid))
+
+    def similarity(self, unit_vector: np.ndarray) -> float:
+        centroid = self.centroid
+        if centroid is None:
+            return -1.0
+        norm = float(np.linalg.norm(centroid))
+        return float(centroid @ unit_vector) / norm if norm else -1.0
+
+    def touch(self) -> None:
+        self.dirty = True
+        self.version += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "member_ids": self.member_ids,
+            "vector_sum": None if self.vector_sum is None else self.vector_sum.tolist(),
+            "parent_id": self.parent_id,
+            "dirty": self.dirty,
+            "new_member_ids": sorted(self.new_member_ids),
+            "stale_member_ids": sorted(self.stale_member_ids),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "OnlineCluster":
+        vector_sum = data.get("vector_sum")
+        return cls(
+            id=data["id"],
+            member_ids=list(data.get("member_ids", [])),
+            vector_sum=None if vector_sum is None else np.asarray(vector_sum, dtype=np.float32),
+            parent_id=data.get("parent_id"),
+            dirty=data.get("dirty", True),
+            new_member_ids=set(data.get("new_member_ids", [])),
+            stale_member_ids=set(data.get("stale_member_ids", [])),
+        )
+
+
+@dataclass(frozen=True)
+class ClusterSnapshot:
+    """Point-in-time copy of a dirty cluster, processed without holding the index lock."""
+
+    cluster_id: str
+    member_ids: tuple[str, ...]
+    new_member_ids: frozenset[str]
+    stale_member_ids: frozenset[str]
+    parent_id: str | None
+    version: int
+
+
+class OnlineClusterIndex:
+    """
+    Centroid-based online clustering of one user's memories in one scope.
+
+    Args:
+        max_cluster_size: Clusters growing past this size are split in two.
+        min_cluster_size: Clusters shrinking below this size are merged into their
+            nearest neighbour when it is similar enough.
+        assign_threshold: Minimum cosine similarity to join an existing cluster;
+            otherwise the node starts a new cluster.
+        max_spread: Clusters of at least ``2 * min_cluster_size`` members whose spread
+            (1 - mean similarity to the centroid) exceeds this are split.
+        merge_threshold: Minimum centroid similarity for merging a small cluster.
+        embedding_loader: Returns embeddings for member ids; used for splits and
+            after removals.
+    """
+
+    def __init__(
+        self,
+        max_cluster_size: int = 20,
+        min_cluster_size: int = 4,
+        assign_threshold: float = 0.5,
+        max_spread: float = 0.35,
+        merge_threshold: float = 0.7,
+        embedding_loader: EmbeddingLoader | None = None,
+    ):
+        self.max_cluster_size = max_cluster_size
+        self.min_cluster_size = min_cluster_size
+        self.assign_threshold = assign_threshold
+        self.max_spread = max_spread
+        self.merge_threshold = merge_threshold
+        self.embedding_loader = embedding_loader
+        self.clusters: dict[str, OnlineCluster] = {}
+        self.bootstrapped = False
+        self.lock = threading.RLock()
+        self._node_cluster: dict[str, str] = {}
+        # Summary nodes of clusters that were merged away or emptied.
+        self._retired_parent_ids: list[str] = []
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._node_cluster
+
+    def __len__(self) -> int:
+        return len(self._node_cluster)
+
+    def cluster_of(self, node_id: str) -> str | None:
+        return self._node_cluster.get(node_id)
+
+    def assign(self, node_id: str, embedding: Sequence[float] | None) -> str | None:
+        """Add ``node_id`` to its nearest cluster; returns the cluster id, or None without an embedding."""
+        with self.lock:
+            if node_id in self._node_cluster:
+                return self._node_cluster[node_id]
+            vector = _unit(embedding)
+            if vector is None:
+                return None
+
+            cluster = self._nearest(vector, self.assign_threshold)
+            if cluster is None:
+                cluster = OnlineCluster(id=str(uuid.uuid4()))
+                self.clusters[cluster.id] = cluster
+            self._add_member(cluster, node_id, vector)
+
+            if cluster.size > self.max_cluster_size or (
+                cluster.size >= 2 * self.min_cluster_size and cluster.spread > self.max_spread
+            ):
+                self._split(cluster, known={node_id: vector})
+            return self._node_cluster.get(node_id)
+
+    def remove(self, node_id: str) -> None:
+        with self.lock:
+            cluster_id = self._node_cluster.pop(node_id, None)
+            if cluster_id is None:
+                return
+            cluster = self.clusters[cluster_id]
+            cluster.member_ids.remove(node_id)
+            if node_id in cluster.new_member_ids:
+                cluster.new_member_ids.discard(node_id)
+            else:
+                cluster.stale_member_ids.add(node_id)
+            cluster.touch()
+
+            if not cluster.member_ids:
+                self._retire(cluster)
+                return
+            self._recompute(cluster, self._load(cluster.member_ids))
+            if cluster.size < self.min_cluster_size:
+                target = self._nearest_cluster_for(cluster)
+                if target is not None:
+                    self._merge(cluster, target)
+
+    def dirty_snapshots(self, min_size: int = 1) -> list[ClusterSnapshot]:
+        """Snapshots of the dirty clusters with at least ``min_size`` members."""
+        with self.lock:
+            return [
+                ClusterSnapshot(
+                    cluster_id=cluster.id,
+                    member_ids=tuple(cluster.member_ids),
+                    new_member_ids=frozenset(cluster.new_member_ids),
+                    stale_member_ids=frozenset(cluster.stale_member_ids),
+                    parent_id=cluster.parent_id,
+                    version=cluster.version,
+                )
+                for cluster in self.clusters.values()
+                if cluster.dirty and cluster.size >= min_size
+            ]
+
+    def mark_clean(self, snapshot: ClusterSnapshot, parent_id: str) -> None:
+        """Record that ``snapshot`` was summarized under ``parent_id``."""
+        with self.lock:
+            cluster = self.clusters.get(snapshot.cluster_id)
+            if cluster is None:
+                # Merged away while it was being summarized.
+                self._retired_parent_ids.append(parent_id)
+                return
+            cluster.parent_id = parent_id
+            cluster.new_member_ids -= snapshot.new_member_ids
+            cluster.stale_member_ids -= snapshot.stale_member_ids
+            if cluster.version == snapshot.version:
+                cluster.dirty = False
+
+    def take_retired_parents(self) -> list[str]:
+        with self.lock:
+            retired, self._retired_parent_ids = self._retired_parent_ids, []
+            return retired
+
+    def to_dict(self) -> dict[str, Any]:
+        with self.lock:
+            return {
+                "bootstrapped": self.bootstrapped,
+                "clusters": [cluster.to_dict() for cluster in self.clusters.values()],
+                "retired_parent_ids": list(self._retired_parent_ids),
+            }
+
+    def load_dict(self, data: dict[str, Any]) -> None:
+        with self.lock:
+            self.bootstrapped = data.get("bootstrapped", False)
+            self.clusters = {}
+            self._node_cluster = {}
+            for item in data.get("clusters", []):
+                cluster = OnlineCluster.from_dict(item)
+                self.clusters[cluster.id] = cluster
+                for node_id in cluster.member_ids:
+                    self._node_cluster[node_id] = cluster.id
+            self._retired_parent_ids = list(data.get("retired_parent_ids", []))
+
+    def _nearest(self, vector: np.ndarray, threshold: float) -> OnlineCluster | None:
+        best, best_score = None, threshold
+        for cluster in self.clusters.values():
+            score = cluster.similarity(vector)
+            if score >= best_score:
+                best, best_score = cluster, score
+        return best
+
+    def _nearest_cluster_for(self, cluster: OnlineCluster) -> OnlineCluster | None:
+        centroid = _unit(cluster.centroid)
+        if centroid is None:
+            return None
+        best, best_score = None, self.merge_threshold
+        for other in self.clusters.values():
+            if other is cluster or other.size + cluster.size > self.max_cluster_size:
+                continue
+            score = other.similarity(centroid)
+            if score >= best_score:
+                best, best_score = other, score
+        return best
+
+    def _add_member(self, cluster: OnlineCluster, node_id: str, vector: np.ndarray) -> None:
+        cluster.member_ids.append(node_id)
+        cluster.vector_sum = (
+            vector.copy() if cluster.vector_sum is None else cluster.vector_sum + vector
+        )
+        cluster.new_member_ids.add(node_id)
+        cluster.stale_member_ids.discard(node_id)
+        cluster.touch()
+        self._node_cluster[node_id] = cluster.id
+
+    def _load(
+        self, node_ids: Iterable[str], known: dict[str, np.ndarray] | None = None
+    ) -> dict[str, np.ndarray]:
+        known = dict(known or {})
+        missing = [node_id for node_id in node_ids if node_id not in known]
+        if missing and self.embedding_loader is not None:
+            for node_id, embedding in self.embedding_loader(missing).items():
+                vector = _unit(embedding)
+                if vector is not None:
+                    known[node_id] = vector
+        return known
+
+    def _recompute(self, cluster: OnlineCluster, vectors: dict[str, np.ndarray]) -> None:
+        present = [vectors[node_id] for node_id in cluster.member_ids if node_id in vectors]
+        if present:
+            cluster.vector_sum = np.sum(present, axis=0) * (cluster.size / len(present))
+
+    def _split(self, cluster: OnlineCluster, known: dict[str, np.ndarray]) -> None:
+        vectors = self._load(cluster.member_ids, known)
+        ids = [node_id for node_id in cluster.member_ids if node_id in vectors]
+        if len(ids) < 2:
+            return
+        labels = _two_means(np.stack([vectors[node_id] for node_id in ids]))
+        moved = [node_id for node_id, label in zip(ids, labels, strict=True) if label == 1]
+        if not moved or len(moved) == len(ids):
+            return
+
+        sibling = OnlineCluster(id=str(uuid.uuid4()))
+        self.clusters[sibling.id] = sibling
+        moved_set = set(moved)
+        cluster.member_ids = [node_id for node_id in cluster.member_ids if node_id not in moved_set]
+        for node_id in moved:
+            if node_id not in cluster.new_member_ids:
+                cluster.stale_member_ids.add(node_id)
+            cluster.new_member_ids.discard(node_id)
+            self._add_member(sibling, node_id, vectors[node_id])
+        self._recompute(cluster, vectors)
+        cluster.touch()
+        logger.info(
+            f"[OnlineCluster] Split cluster {cluster.id} into {cluster.size} + {sibling.size} nodes"
+        )
+
+    def _merge(self, source: OnlineCluster, target: OnlineCluster) -> None:
+        target.vector_sum = target.vector_sum + source.vector_sum
+        for node_id in source.member_ids:
+            target.member_ids.append(node_id)
+            target.new_member_ids.add(node_id)
+            target.stale_member_ids.discard(node_id)
+            self._node_cluster[node_id] = target.id
+        target.touch()
+        source.member_ids = []
+        self._retire(source)
+        logger.info(f"[OnlineCluster] Merged cluster {source.id} into {target.id}")
+
+    def _retire(self, cluster: OnlineCluster) -> None:
+        self.clusters.pop(cluster.id, None)
+        if cluster.parent_id:
+            self._retired_parent_ids.append(cluster.parent_id)
+
+
+class OnlineClusterStore:
+    """
+    ``OnlineClusterIndex`` per (user_name, scope), optionally persisted as JSON.
+
+    Args:
+        state_dir: Directory for the persisted indexes. None reads
+            ``MOS_REORGANIZE_CLUSTER_DIR``; when unset, indexes live in memory only.
+        index_factory: Builds an empty index for a (user_name, scope) pair.
+    """
+
+    def __init__(
+        self,
+        state_dir: str | None = None,
+        index_factory: Callable[[str | None, str], OnlineClusterIndex] | None = None,
+    ):
+        self.state_dir = state_dir if state_dir is not None else os.getenv(_STATE_DIR_ENV)
+        self.index_factory = index_factory or (lambda user_name, scope: OnlineClusterIndex())
+        self._indexes: dict[tuple[str | None, str], OnlineClusterIndex] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_name: str | None, scope: str) -> OnlineClusterIndex:
+        key = (user_name, scope)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = self.index_factory(user_name, scope)
+                path = self._path(user_name, scope)
+                if path and os.path.exists(path):
+                    try:
+                        with open(path, encoding="utf-8") as f:
+                            index.load_dict(json.load(f))
+                    except (OSError, ValueError, KeyError) as e:
+                        logger.warning(f"[OnlineCluster] Ignoring unreadable state {path}: {e}")
+                self._indexes[key] = index
+            return index
+
+    def save(self, user_name: str | None, scope: str) -> None:
+        path = self._path(user_name, scope)
+        index = self._indexes.get((user_name, scope))
+        if not path or index is None:
+            return
+        os.makedirs(self.state_dir, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index.to_dict(), f)
+        os.replace(tmp_path, path)
+
+    def _path(self, user_name: str | None, scope: str) -> str | None:
+        if not self.state_dir:
+            return None
+        name = re.sub(r"[^A-Za-z0-9_.-]", "_", f"{user_name or '_default'}__{scope}")
+        return os.path.join(self.state_dir, f"{name}.json")
@@ -3,6 +3,7 @@ import time
 import traceback
 
 from collections import defaultdict
+from collections.abc import Callable
 from concurrent.futures import as_completed
 from queue import PriorityQueue
 from typing import Literal
@@ -16,11 +17,22 @@ from memos.graph_dbs.item import GraphDBEdge, GraphDBNode
 from memos.graph_dbs.neo4j import Neo4jGraphDB
 from memos.llms.base import BaseLLM
 from memos.log import get_logger
-from memos.memories.textual.item import SourceMessage, TreeNodeTextualMemoryMetadata
+from memos.memories.textual.item import (
+    SourceMessage,
+    TextualMemoryItem,
+    TreeNodeTextualMemoryMetadata,
+)
 from memos.memories.textual.tree_text_memory.organize.handler import NodeHandler
+from memos.memories.textual.tree_text_memory.organize.online_clustering import (
+    ClusterSnapshot,
+    OnlineClusterIndex,
+    OnlineClusterStore,
+    incremental_reorganize_enabled,
+)
 from memos.memories.textual.tree_text_memory.organize.relation_reason_detector import (
     RelationAndReasoningDetector,
 )
+from memos.memories.textual.tree_text_memory.retrieve.result_cache import bump_cube_version
 from memos.templates.tree_reorganize_prompts import LOCAL_SUBCLUSTER_PROMPT, REORGANIZE_PROMPT
 
 
@@ -79,9 +91,22 @@ def extract_first_to_last_brace(text: str):
 
 
 class GraphStructureReorganizer:
+    _CLUSTERED_SCOPES = ("LongTermMemory", "UserMemory")
+
     def __init__(
-        self, graph_store: Neo4jGraphDB, llm: BaseLLM, embedder: OllamaEmbedder, is_reorganize: bool
+        self,
+        graph_store: Neo4jGraphDB,
+        llm: BaseLLM,
+        embedder: OllamaEmbedder,
+        is_reorganize: bool,
+        incremental: bool | None = None,
     ):
+        """
+        Args:
+            incremental: Keep persistent online clusters per user/scope and only
+                re-summarize clusters changed by new memories, instead of re-partitioning
+                every candidate each cycle. None reads ``MOS_REORGANIZE_INCREMENTAL``.
+        """
         self.queue = PriorityQueue()  # Min-heap
         self.graph_store = graph_store
         self.llm = llm
@@ -89,10 +114,19 @@ class GraphStructureReorganizer:
         self.relation_detector = RelationAndReasoningDetector(
             self.graph_store, self.llm, self.embedder
         )
-        self.resolver = NodeHandler(graph_store=graph_store, llm=llm, embedder=embedder)
 
         self.is_reorganize = is_reorganize
         self._reorganize_needed = True
+        self.incremental = incremental_reorganize_enabled() if incremental is None else incremental
+        self.cluster_store = (
+            OnlineClusterStore(index_factory=self._new_cluster_index) if self.incremental else None
+        )
+        self.resolver = NodeHandler(
+            graph_store=graph_store,
+            llm=llm,
+            embedder=embedder,
+            on_nodes_removed=self._remove_from_clusters if self.incremental else None,
+        )
         if self.is_reorganize:
             # ____ 1. For queue message driven thread ___________
             self.thread = ContextThread(target=self._run_message_consumer_loop)
@@ -203,10 +237,15 @@ class GraphStructureReorganizer:
                     added_node, existing_node, relation, user_name=message.user_name
                 )
 
+        if self.cluster_store is not None:
+            self._assign_to_clusters(message.after_node, message.user_name)
         self._reorganize_needed = True
 
     def handle_remove(self, message: QueueMessage):
         logger.debug(f"Handling remove operation: {str(message)[:50]}")
+        if self.cluster_store is not None and message.before_node:
+            self._remove_from_clusters(message.before_node, message.user_name)
+            self._reorganize_needed = True
 
     def optimize_structure(
         self,
@@ -253,6 +292,10 @@ class GraphStructureReorganizer:
                 f"[GraphStructureReorganize] Num of scope in self.graph_store is"
                 f" {self.graph_store.get_memory_count(scope, user_name=user_name)}"
             )
+            if self.cluster_store is not None:
+                self._optimize_incrementally(scope, min_cluster_size, _check_deadline, user_name)
+                return
+
             # Load candidate nodes
             if _check_deadline("[GraphStructureReorganize] Before loading candidates"):
                 return
@@ -309,6 +352,8 @@ class GraphStructureReorganizer:
 
         finally:
             self._is_optimizing[scope] = False
+            # parent nodes were added, refreshed or deleted for this scope
+            bump_cube_version(user_name)
             logger.info("[GraphStructureReorganize] Structure optimization finished.")
 
     def _process_cluster_and_write(
@@ -343,9 +388,15 @@ class GraphStructureReorganizer:
                 )
 
         logger.info("Adding relations/reasons")
-        nodes_to_check = cluster_nodes
-        exclude_ids = [n.id for n in nodes_to_check]
+        self._detect_relations(cluster_nodes, [n.id for n in cluster_nodes], user_name=user_name)
 
+    def _detect_relations(
+        self,
+        nodes_to_check: list[GraphDBNode],
+        exclude_ids: list[str],
+        user_name: str | None = None,
+    ) -> None:
+        """Detect and write relations, inferences, sequences and aggregates for nodes_to_check."""
         with ContextThreadPoolExecutor(max_workers=4) as executor:
             futures = []
             for node in nodes_to_check:
@@ -413,6 +464,136 @@ class GraphStructureReorganizer:
 
         logger.info("[Reorganizer] Cluster relation/reasoning done.")
 
+    def _new_cluster_index(self, user_name: str | None, scope: str) -> OnlineClusterIndex:
+        return OnlineClusterIndex(
+            embedding_loader=lambda ids: self._load_embeddings(ids, user_name=user_name)
+        )
+
+    def _load_embeddings(self, ids: list[str], user_name: str | None = None) -> dict[str, list]:
+        raw_nodes = self.graph_store.get_nodes(ids, include_embedding=True, user_name=user_name)
+        return {
+            n["id"]: n.get("metadata", {}).get("embedding")
+            for n in raw_nodes or []
+            if n and n.get("metadata", {}).get("embedding")
+        }
+
+    def _assign_to_clusters(self, nodes: list[GraphDBNode], user_name: str | None) -> None:
+        """Assign freshly added nodes to the nearest online cluster of their scope."""
+        for node in nodes:
+            scope = node.metadata.memory_type
+            if scope not in self._CLUSTERED_SCOPES or not node.metadata.embedding:
+                continue
+            self.cluster_store.get(user_name, scope).assign(node.id, node.metadata.embedding)
+
+    def _remove_from_clusters(
+        self, nodes: list[str] | list[TextualMemoryItem], user_name: str | None
+    ) -> None:
+        """Drop removed or archived nodes from the online clusters of their scope."""
+        for node in nodes:
+            if isinstance(node, str):
+                # A bare id does not say which scope it lived in
+                node_id, scopes = node, self._CLUSTERED_SCOPES
+            else:
+                node_id, scopes = node.id, (node.metadata.memory_type,)
+            for scope in scopes:
+                if scope in self._CLUSTERED_SCOPES:
+                    self.cluster_store.get(user_name, scope).remove(node_id)
+
+    def _optimize_incrementally(
+        self,
+        scope: str,
+        min_cluster_size: int,
+        check_deadline: Callable[[str], bool],
+        user_name: str | None = None,
+    ) -> None:
+        """
+        Re-summarize only the online clusters changed since the last cycle.
+
+        The first cycle for a user/scope seeds the index from the structure
+        optimization candidates; later cycles never reload the whole scope.
+        """
+        index = self.cluster_store.get(user_name, scope)
+        if not index.bootstrapped:
+            raw_nodes = self.graph_store.get_structure_optimization_candidates(
+                scope, include_embedding=True, user_name=user_name
+            )
+            seeded = sum(
+                index.assign(raw["id"], raw.get("metadata", {}).get("embedding")) is not None
+                for raw in raw_nodes
+            )
+            if raw_nodes and not seeded:
+                # Without embeddings nothing was clustered; retry seeding next cycle
+                logger.warning(
+                    f"[GraphStructureReorganize] None of {len(raw_nodes)} candidates for "
+                    f"scope={scope} had an embedding; online clusters not seeded."
+                )
+                return
+            index.bootstrapped = True
+            logger.info(
+                f"[GraphStructureReorganize] Seeded {len(index.clusters)} online clusters "
+                f"from {seeded}/{len(raw_nodes)} candidates for scope={scope}."
+            )
+
+        for parent_id in index.take_retired_parents():
+            self.graph_store.delete_node(parent_id, user_name=user_name)
+
+        snapshots = index.dirty_snapshots(min_size=min_cluster_size + 1)
+        logger.info(f"[GraphStructureReorganize] {len(snapshots)} dirty clusters in {scope}.")
+        try:
+            with ContextThreadPoolExecutor(max_workers=4) as executor:
+                futures = {
+                    executor.submit(self._refresh_cluster, snapshot, scope, user_name): snapshot
+                    for snapshot in snapshots
+                }
+                for f in as_completed(futures):
+                    if check_deadline("[GraphStructureReorganize] Waiting dirty clusters..."):
+                        for x in futures:
+                            x.cancel()
+                        return
+                    try:
+                        index.mark_clean(futures[f], f.result())
+                    except Exception as e:
+                        logger.warning(
+                            f"[GraphStructureReorganize] Cluster refresh failed: {e}, trace: {traceback.format_exc()}"
+                        )
+        finally:
+            self.cluster_store.save(user_name, scope)
+
+    def _refresh_cluster(
+        self, snapshot: ClusterSnapshot, scope: str, user_name: str | None = None
+    ) -> str:
+        """Summarize one dirty cluster into its parent node; returns the parent id."""
+        raw_nodes = self.graph_store.get_nodes(
+            list(snapshot.member_ids), include_embedding=False, user_name=user_name
+        )
+        cluster_nodes = [GraphDBNode(**n) for n in raw_nodes or [] if n]
+        if not cluster_nodes:
+            raise ValueError(f"No nodes found for cluster {snapshot.cluster_id}")
+
+        parent_node = self._summarize_cluster(cluster_nodes, scope)
+        if snapshot.parent_id is None:
+            self._create_parent_node(parent_node, user_name=user_name)
+            to_link = cluster_nodes
+        else:
+            parent_node = parent_node.model_copy(update={"id": snapshot.parent_id})
+            self.graph_store.update_node(
+                parent_node.id,
+                {
+                    "memory": parent_node.memory,
+                    **parent_node.metadata.model_dump(exclude_none=True),
+                },
+                user_name=user_name,
+            )
+            for child_id in snapshot.stale_member_ids:
+                self.graph_store.delete_edge(parent_node.id, child_id, "PARENT")
+            to_link = [n for n in cluster_nodes if n.id in snapshot.new_member_ids]
+        self._link_cluster_nodes(parent_node, to_link, user_name=user_name)
+
+        new_nodes = [n for n in cluster_nodes if n.id in snapshot.new_member_ids]
+        if new_nodes:
+            self._detect_relations(new_nodes, list(snapshot.member_ids), user_name=user_name)
+        return parent_node.id
+
     def _local_subcluster(
         self, cluster_nodes: list[GraphDBNode], max_length: int = 15000
     ) -> list[list[GraphDBNode]]:
@@ -565,7 +746,7 @@ class GraphStructureReorganizer:
         prompt = REORGANIZE_PROMPT.replace("{memory_items_text}", memories_items_text)
 
         messages = [{"role": "user", "content": prompt}]
-        response_text = self.llm.generate(messages)
+        response_text = self.llm.generate(messages, cache=True)
         response_json = self._parse_json_result(response_text)
 
         # Extract fields
@@ -0,0 +1,412 @@
+"""Incrementally maintained BM25 inverted index for tree text memory recall.
+
+Documents are partitioned by graph store, ``user_name`` and ``memory_type``, so
+cubes with their own store never share a partition even when no ``user_name`` is
+passed (as with ``MOSCore``). Each partition keeps
+postings with term frequencies and document lengths, so nodes are added,
+replaced and removed in time proportional to their own length. Queries use
+MaxScore-style pruning: query terms are visited from the highest to lowest
+score upper bound, and once the remaining bounds cannot beat the current
+k-th score the scan stops.
+
+A partition is bootstrapped from the graph store the first time it is queried
+and is afterwards updated by ``MemoryManager`` on writes. Writes made by other
+processes are picked up when the partition is rebuilt after
+``MEMOS_BM25_INDEX_REFRESH_SECONDS``; deletes and status changes made anywhere
+are also reconciled lazily when a recalled node turns out to be gone.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import os
+import threading
+import time
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from memos.log import get_logger
+from memos.memories.textual.tree_text_memory.retrieve.retrieve_utils import FastTokenizer
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+
+logger = get_logger(__name__)
+
+_MAX_PARTITIONS_ENV = "MEMOS_BM25_INDEX_MAX_PARTITIONS"
+_REFRESH_SECONDS_ENV = "MEMOS_BM25_INDEX_REFRESH_SECONDS"
+_DEFAULT_MAX_PARTITIONS = 1024
+_DEFAULT_REFRESH_SECONDS = 600.0
+
+# Metadata fields kept per document so equality filters can be applied in-index.
+FILTERABLE_FIELDS = ("user_id", "session_id")
+
+# (graph store identity, user_name, memory_type)
+PartitionKey = tuple[int, str, str]
+
+
+def node_bm25_text(node: dict[str, Any]) -> str:
+    """Return the text BM25 recall matches against: the node key plus its tags."""
+    metadata = node.get("metadata") or {}
+    return " ".join([metadata.get("key") or "", *(metadata.get("tags") or [])])
+
+
+class BM25Partition:
+    """Postings, document lengths and filter fields for one user and memory type."""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: dict[str, dict[str, int]] = {}
+        self.doc_terms: dict[str, dict[str, int]] = {}
+        self.doc_lengths: dict[str, int] = {}
+        self.doc_fields: dict[str, dict[str, Any]] = {}
+        self.total_length = 0
+        self.built_at = 0.0
+        self.loading = False
+        self.ready = threading.Event()
+        # Ids written or removed while the partition was being bootstrapped; the
+        # bootstrap snapshot must not overwrite them.
+        self._touched_while_loading: set[str] = set()
+        self.lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def upsert(self, doc_id: str, tokens: list[str], fields: dict[str, Any]) -> None:
+        with self.lock:
+            self._remove(doc_id)
+            term_freqs: dict[str, int] = {}
+            for token in tokens:
+                term_freqs[token] = term_freqs.get(token, 0) + 1
+            for term, freq in term_freqs.items():
+                self.postings.setdefault(term, {})[doc_id] = freq
+            self.doc_terms[doc_id] = term_freqs
+            self.doc_lengths[doc_id] = len(tokens)
+            self.doc_fields[doc_id] = fields
+            self.total_length += len(tokens)
+            if self.loading:
+                self._touched_while_loading.add(doc_id)
+
+    def remove(self, doc_id: str) -> bool:
+        with self.lock:
+            if self.loading:
+                self._touched_while_loading.add(doc_id)
+            return self._remove(doc_id)
+
+    def _remove(self, doc_id: str) -> bool:
+        term_freqs = self.doc_terms.pop(doc_id, None)
+        if term_freqs is None:
+            return False
+        for term in term_freqs:
+            posting = self.postings.get(term)
+            if posting is None:
+                continue
+            posting.pop(doc_id, None)
+            if not posting:
+                del self.postings[term]
+        self.total_length -= self.doc_lengths.pop(doc_id, 0)
+        self.doc_fields.pop(doc_id, None)
+        return True
+
+    def begin_load(self) -> None:
+        with self.lock:
+            self.loading = True
+            self._touched_while_loading.clear()
+
+    def finish_load(self, docs: Iterable[tuple[str, list[str], dict[str, Any]]]) -> None:
+        """Install a bootstrap snapshot without clobbering writes made meanwhile."""
+        with self.lock:
+            touched = set(self._touched_while_loading)
+            self.loading = False
+            self._touched_while_loading.clear()
+            for doc_id, tokens, fields in docs:
+                if doc_id not in touched:
+                    self.upsert(doc_id, tokens, fields)
+            self.built_at = time.monotonic()
+        self.ready.set()
+
+    def _idf(self, doc_freq: int, doc_count: int) -> float:
+        # Lucene-style IDF stays positive, which keeps the per-term bounds valid.
+        return math.log(1.0 + (doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
+
+    def search(
+        self,
+        query_terms: list[str],
+        top_k: int,
+        filters: dict[str, Any] | None = None,
+    ) -> list[tuple[str, float]]:
+        """Return up to ``top_k`` ``(doc_id, score)`` pairs, best first."""
+        with self.lock:
+            doc_count = len(self.doc_lengths)
+            if not doc_count or top_k <= 0:
+                return []
+            avg_length = self.total_length / doc_count or 1.0
+
+            terms = []
+            for term in dict.fromkeys(query_terms):
+                posting = self.postings.get(term)
+                if posting:
+                    idf = self._idf(len(posting), doc_count)
+                    # tf * (k1 + 1) / (tf + k1 * norm) < k1 + 1 for any tf and length.
+                    terms.append((idf * (self.k1 + 1), idf, posting))
+            if not terms:
+                return []
+            terms.sort(key=lambda item: item[0], reverse=True)
+            remaining_bound = [0.0] * (len(terms) + 1)
+            for index in range(len(terms) - 1, -1, -1):
+                remaining_bound[index] = remaining_bound[index + 1] + terms[index][0]
+
+            heap: list[tuple[float, str]] = []
+            seen: set[str] = set()
+            for first, (_, _, posting) in enumerate(terms):
+                if len(heap) >= top_k and remaining_bound[first] <= heap[0][0]:
+                    # Unseen documents only contain terms from here on.
+                    break
+                for doc_id in posting:
+                    if doc_id in seen:
+                        continue
+                    seen.add(doc_id)
+                    if filters and not self._matches(doc_id, filters):
+                        continue
+                    norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / avg_length)
+                    score = 0.0
+                    for index in range(first, len(terms)):
+                        if len(heap) >= top_k and score + remaining_bound[index] <= heap[0][0]:
+                            score = -1.0
+                            break
+                        tf = terms[index][2].get(doc_id)
+                        if tf:
+                            score += terms[index][1] * tf * (self.k1 + 1) / (tf + norm)
+                    if score <= 0:
+                        continue
+                    if len(heap) < top_k:
+                        heapq.heappush(heap, (score, doc_id))
+                    elif score > heap[0][0]:
+                        heapq.heapreplace(heap, (score, doc_id))
+            return [(doc_id, score) for score, doc_id in sorted(heap, reverse=True)]
+
+    def _matches(self, doc_id: str, filters: dict[str, Any]) -> bool:
+        fields = self.doc_fields.get(doc_id, {})
+        return all(fields.get(key) == value for key, value in filters.items())
+
+
+class BM25Index:
+    """Per-store, per-user BM25 partitions kept in an LRU bounded by partition count.
+
+    ``store`` is the graph store the documents come from; ``None`` is a store of
+    its own. In ``remove_nodes``/``invalidate`` a ``None`` store or user matches
+    every store or user.
+    """
+
+    def __init__(
+        self,
+        tokenize: Callable[[str], list[str]] | None = None,
+        max_partitions: int = _DEFAULT_MAX_PARTITIONS,
+        refresh_seconds: float = _DEFAULT_REFRESH_SECONDS,
+    ):
+        if tokenize is None:
+            tokenizer = FastTokenizer()
+            tokenize = lambda text: tokenizer.tokenize_mixed(text, lang="auto")  # noqa: E731
+        self._tokenize = tokenize
+        self.max_partitions = max(1, max_partitions)
+        self.refresh_seconds = refresh_seconds
+        self.build_wait_seconds = 30.0
+        self._partitions: OrderedDict[PartitionKey, BM25Partition] = OrderedDict()
+        self._building: dict[PartitionKey, BM25Partition] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _store_id(store: Any) -> int:
+        return 0 if store is None else id(store)
+
+    @classmethod
+    def _key(cls, user_name: str | None, memory_type: str, store: Any = None) -> PartitionKey:
+        return (cls._store_id(store), user_name or "", memory_type)
+
+    def _matching_keys(
+        self, registry: dict[PartitionKey, BM25Partition], user_name: str | None, store: Any
+    ) -> list[PartitionKey]:
+        store_id = None if store is None else self._store_id(store)
+        return [
+            key
+            for key in registry
+            if (store_id is None or key[0] == store_id)
+            and (user_name is None or key[1] == user_name)
+        ]
+
+    def _document(self, node: dict[str, Any]) -> tuple[str, list[str], dict[str, Any]]:
+        metadata = node.get("metadata") or {}
+        fields = {field: metadata.get(field) for field in FILTERABLE_FIELDS}
+        return node["id"], self._tokenize(node_bm25_text(node)), fields
+
+    def _live_partitions(self, key: PartitionKey) -> list[BM25Partition]:
+        with self._lock:
+            partitions = [self._partitions.get(key), self._building.get(key)]
+        return [partition for partition in partitions if partition is not None]
+
+    def _is_stale(self, partition: BM25Partition) -> bool:
+        return self.refresh_seconds > 0 and (
+            time.monotonic() - partition.built_at > self.refresh_seconds
+        )
+
+    def ensure_partition(
+        self,
+        user_name: str | None,
+        memory_type: str,
+        load_nodes: Callable[[], list[dict[str, Any]]],
+        store: Any = None,
+    ) -> BM25Partition:
+        """Return the partition, bootstrapping it with ``load_nodes`` when cold or stale.
+
+        A stale partition keeps serving queries while its replacement is built;
+        callers that find no partition at all wait for the build in flight.
+        """
+        key = self._key(user_name, memory_type, store)
+        with self._lock:
+            current = self._partitions.get(key)
+            if current is not None:
+                self._partitions.move_to_end(key)
+                if not self._is_stale(current) or key in self._building:
+                    return current
+            building = self._building.get(key)
+            if building is None:
+                fresh = BM25Partition()
+                fresh.begin_load()
+                self._building[key] = fresh
+
+        if building is not None:
+            building.ready.wait(timeout=self.build_wait_seconds)
+            return self._partitions.get(key) or building
+
+        started_at = time.perf_counter()
+        try:
+            docs = [
+                self._document(node)
+                for node in load_nodes()
+                if node.get("id")
+                and (node.get("metadata") or {}).get("status", "activated") == "activated"
+            ]
+        except Exception:
+            with self._lock:
+                self._building.pop(key, None)
+            fresh.ready.set()
+            raise
+        fresh.finish_load(docs)
+        with self._lock:
+            if self._building.get(key) is not fresh:
+                # Invalidated while loading; serve this query but do not cache it.
+                return fresh
+            del self._building[key]
+            self._partitions[key] = fresh
+            self._partitions.move_to_end(key)
+            while len(self._partitions) > self.max_partitions:
+                self._partitions.popitem(last=False)
+        logger.info(
+            "[BM25Index] Built partition user_name=%s memory_type=%s docs=%d elapsed_ms=%.2f",
+            user_name,
+            memory_type,
+            len(fresh),
+            (time.perf_counter() - started_at) * 1000,
+        )
+        return fresh
+
+    def index_nodes(
+        self, nodes: list[dict[str, Any]], user_name: str | None = None, store: Any = None
+    ) -> None:
+        """Apply added or updated nodes to partitions that are already built.
+
+        Partitions that were never queried are skipped; they are bootstrapped
+        from the graph store on first use, so writes cost nothing when BM25
+        recall is not in use.
+        """
+        for node in nodes:
+            metadata = node.get("metadata") or {}
+            memory_type = metadata.get("memory_type")
+            if not node.get("id") or not memory_type:
+                continue
+            partitions = self._live_partitions(self._key(user_name, memory_type, store))
+            if not partitions:
+                continue
+            if metadata.get("status", "activated") == "activated":
+                document = self._document(node)
+                for partition in partitions:
+                    partition.upsert(*document)
+            else:
+                for partition in partitions:
+                    partition.remove(node["id"])
+
+    def remove_nodes(
+        self, node_ids: Iterable[str], user_name: str | None = None, store: Any = None
+    ) -> None:
+        """Remove node ids from the partitions matching ``store`` and ``user_name``."""
+        node_ids = list(node_ids)
+        with self._lock:
+            partitions = [
+                registry[key]
+                for registry in (self._partitions, self._building)
+                for key in self._matching_keys(registry, user_name, store)
+            ]
+        for partition in partitions:
+            for node_id in node_ids:
+                partition.remove(node_id)
+
+    def invalidate(self, user_name: str | None = None, store: Any = None) -> None:
+        """Drop the partitions matching ``store`` and ``user_name``."""
+        with self._lock:
+            for registry in (self._partitions, self._building):
+                for key in self._matching_keys(registry, user_name, store):
+                    del registry[key]
+
+    def search(
+        self,
+        query: str,
+        user_name: str | None,
+        memory_type: str,
+        load_nodes: Callable[[], list[dict[str, Any]]],
+        top_k: int = 20,
+        filters: dict[str, Any] | None = None,
+        store: Any = None,
+    ) -> list[tuple[str, float]]:
+        partition = self.ensure_partition(user_name, memory_type, load_nodes, store=store)
+        return partition.search(self._tokenize(query), top_k, filters=filters)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            partitions = list(self._partitions.values())
+        return {
+            "partitions": len(partitions),
+            "documents": sum(len(partition) for partition in partitions),
+            "terms": sum(len(partition.postings) for partition in partitions),
+        }
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning("Invalid %s=%r; using default %s", name, raw, default)
+        return default
+
+
+_SHARED_INDEX: BM25Index | None = None
+_SHARED_INDEX_LOCK = threading.Lock()
+
+
+def get_shared_bm25_index() -> BM25Index:
+    """Return the process-wide index shared by retrievers and memory managers."""
+    global _SHARED_INDEX
+    with _SHARED_INDEX_LOCK:
+        if _SHARED_INDEX is None:
+            _SHARED_INDEX = BM25Index(
+                max_partitions=int(_env_number(_MAX_PARTITIONS_ENV, _DEFAULT_MAX_PARTITIONS)),
+                refresh_seconds=_env_number(_REFRESH_SECONDS_ENV, _DEFAULT_REFRESH_SECONDS),
+            )
+        return _SHARED_INDEX
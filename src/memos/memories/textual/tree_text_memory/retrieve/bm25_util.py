@@ -6,6 +6,10 @@ from sklearn.feature_extraction.text import TfidfVectorizer
 
 from memos.dependency import require_python_package
 from memos.log import get_logger
+from memos.memories.textual.tree_text_memory.retrieve.bm25_index import (
+    BM25Index,
+    get_shared_bm25_index,
+)
 from memos.memories.textual.tree_text_memory.retrieve.retrieve_utils import FastTokenizer
 from memos.utils import timed
 
@@ -28,6 +32,8 @@ class EnhancedBM25:
         else:
             self.tokenizer = tokenizer
         self._current_tfidf = None
+        # Incremental per-user index used by recall; `search` below rebuilds per corpus.
+        self.index: BM25Index = get_shared_bm25_index()
 
         global _BM25_CACHE
         from cachetools import LRUCache
@@ -6,6 +6,7 @@ from memos.embedders.factory import OllamaEmbedder
 from memos.graph_dbs.neo4j import Neo4jGraphDB
 from memos.log import get_logger
 from memos.memories.textual.item import TextualMemoryItem
+from memos.memories.textual.tree_text_memory.retrieve.bm25_index import FILTERABLE_FIELDS
 from memos.memories.textual.tree_text_memory.retrieve.bm25_util import EnhancedBM25
 from memos.memories.textual.tree_text_memory.retrieve.retrieval_mid_structs import ParsedTaskGoal
 
@@ -394,62 +395,37 @@ class GraphMemoryRetriever:
         if self.include_embedding:
             lightweight_return_fields.append("embedding")
 
-        def search_single(vec, search_priority=None, search_filter=None):
-            search_kwargs = {}
-            if use_lightweight_search:
-                search_kwargs = {
-                    "light_weight_mode": True,
-                    "return_fields": lightweight_return_fields,
-                }
-            return (
-                self.graph_store.search_by_embedding(
-                    vector=vec,
-                    top_k=top_k,
-                    status=status,
-                    scope=memory_scope,
-                    cube_name=cube_name,
-                    search_filter=search_priority,
-                    filter=search_filter,
-                    user_name=user_name,
-                    **search_kwargs,
-                )
-                or []
+        search_kwargs = {}
+        if use_lightweight_search:
+            search_kwargs = {
+                "light_weight_mode": True,
+                "return_fields": lightweight_return_fields,
+            }
+        vectors = query_embedding[:max_num]
+
+        def search_path(priority_filter):
+            """One batched search over all query vectors for a path."""
+            batches = self.graph_store.search_batch(
+                vectors,
+                top_k=top_k,
+                status=status,
+                scope=memory_scope,
+                cube_name=cube_name,
+                search_filter=priority_filter,
+                filter=search_filter,
+                user_name=user_name,
+                **search_kwargs,
             )
-
-        def search_path_a():
-            """Path A: search without priority"""
-            path_a_hits = []
-            with ContextThreadPoolExecutor() as executor:
-                futures = [
-                    executor.submit(search_single, vec, None, search_filter)
-                    for vec in query_embedding[:max_num]
-                ]
-                for f in concurrent.futures.as_completed(futures):
-                    path_a_hits.extend(f.result() or [])
-            return path_a_hits
-
-        def search_path_b():
-            """Path B: search with priority"""
-            if not search_priority:
-                return []
-            path_b_hits = []
-            with ContextThreadPoolExecutor() as executor:
-                futures = [
-                    executor.submit(search_single, vec, search_priority, search_filter)
-                    for vec in query_embedding[:max_num]
-                ]
-                for f in concurrent.futures.as_completed(futures):
-                    path_b_hits.extend(f.result() or [])
-            return path_b_hits
-
-        # Execute both paths concurrently
-        all_hits = []
-        with ContextThreadPoolExecutor(max_workers=2) as executor:
-            path_a_future = executor.submit(search_path_a)
-            path_b_future = executor.submit(search_path_b)
-
-            all_hits.extend(path_a_future.result())
-            all_hits.extend(path_b_future.result())
+            return [hit for hits in batches for hit in hits or []]
+
+        # Path A searches without priority, path B with it; run both concurrently if needed
+        if search_priority:
+            with ContextThreadPoolExecutor(max_workers=2) as executor:
+                path_a_future = executor.submit(search_path, None)
+                path_b_future = executor.submit(search_path, search_priority)
+                all_hits = path_a_future.result() + path_b_future.result()
+        else:
+            all_hits = search_path(None)
 
         if not all_hits:
             return []
@@ -541,33 +517,82 @@ class GraphMemoryRetriever:
         search_filter: dict | None = None,
     ) -> list[TextualMemoryItem]:
         """
-        Perform BM25-based retrieval.
+        Perform BM25-based retrieval against the incremental per-user index.
+
+        The index partition is built from the graph store only when it is cold
+        or stale; afterwards only the recalled nodes are fetched.
         """
-        if not self.bm25_retriever:
+        if not self.bm25_retriever or top_k <= 0:
             return []
-        key_filters = [
-            {"field": "memory_type", "op": "=", "value": memory_scope},
-        ]
-        # corpus_name is user_name + user_id
-        corpus_name = f"{user_name}" if user_name else ""
-        if search_filter is not None:
-            for key in search_filter:
-                value = search_filter[key]
-                key_filters.append({"field": key, "op": "=", "value": value})
-            corpus_name += "".join(list(search_filter.values()))
-        candidate_ids = self.graph_store.get_by_metadata(
-            key_filters, user_name=user_name, status="activated"
-        )
-        node_dicts = self.graph_store.get_nodes(
-            list(candidate_ids), include_embedding=self.include_embedding, user_name=user_name
-        )
+        search_filter = search_filter or {}
+        index_filters = {
+            key: value for key, value in search_filter.items() if key in FILTERABLE_FIELDS
+        }
+        node_filters = {
+            key: value for key, value in search_filter.items() if key not in index_filters
+        }
 
-        bm25_query = " ".join(list({query, *parsed_goal.keys}))
-        bm25_results = self.bm25_retriever.search(
-            bm25_query, node_dicts, top_k=top_k, corpus_name=corpus_name
-        )
+        def load_partition_nodes() -> list[dict]:
+            candidate_ids = self.graph_store.get_by_metadata(
+                [{"field": "memory_type", "op": "=", "value": memory_scope}],
+                user_name=user_name,
+                status="activated",
+            )
+            return self.graph_store.get_nodes(
+                list(candidate_ids), include_embedding=False, user_name=user_name
+            )
 
-        return [TextualMemoryItem.from_dict(n) for n in bm25_results]
+        bm25_query = " ".join(list({query, *parsed_goal.keys}))
+        index = self.bm25_retriever.index
+        stale_ids: list[str] = []
+        bm25_results: list[dict] = []
+        checked_ids: set[str] = set()
+        # Over-fetch: hits deleted or archived elsewhere, and hits failing filters the
+        # index does not hold, are dropped below. Widen the fetch until top_k survive
+        # or the index has no more matches.
+        fetch_k = top_k * 2
+        while True:
+            hits = index.search(
+                bm25_query,
+                user_name=user_name,
+                memory_type=memory_scope,
+                load_nodes=load_partition_nodes,
+                top_k=fetch_k,
+                filters=index_filters,
+                store=self.graph_store,
+            )
+            hit_ids = [node_id for node_id, _ in hits if node_id not in checked_ids]
+            checked_ids.update(hit_ids)
+            nodes_by_id = (
+                {
+                    node["id"]: node
+                    for node in self.graph_store.get_nodes(
+                        hit_ids, include_embedding=self.include_embedding, user_name=user_name
+                    )
+                }
+                if hit_ids
+                else {}
+            )
+            for node_id in hit_ids:
+                node = nodes_by_id.get(node_id)
+                metadata = (node or {}).get("metadata") or {}
+                if (
+                    node is None
+                    or metadata.get("status", "activated") != "activated"
+                    or metadata.get("memory_type", memory_scope) != memory_scope
+                ):
+                    stale_ids.append(node_id)
+                    continue
+                if any(metadata.get(key) != value for key, value in node_filters.items()):
+                    continue
+                bm25_results.append(node)
+            if len(bm25_results) >= top_k or len(hits) < fetch_k:
+                break
+            fetch_k *= 2
+        if stale_ids:
+            index.remove_nodes(stale_ids, user_name=user_name, store=self.graph_store)
+
+        return [TextualMemoryItem.from_dict(n) for n in bm25_results[:top_k]]
 
     def _fulltext_recall(
         self,
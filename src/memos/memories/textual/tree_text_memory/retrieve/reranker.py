@@ -1,6 +1,7 @@
 import numpy as np
 
 from memos.embedders.factory import OllamaEmbedder
+from memos.embedders.quantized import embedding_matrix
 from memos.llms.factory import AzureLLM, OllamaLLM, OpenAILLM
 from memos.memories.textual.item import TextualMemoryItem
 from memos.memories.textual.tree_text_memory.retrieve.retrieval_mid_structs import ParsedTaskGoal
@@ -19,8 +20,8 @@ def batch_cosine_similarity(
     Returns:
         list[float]: Cosine similarity scores for each candidate.
     """
-    query = np.array(query_vec)
-    candidates = np.array(candidate_vecs)
+    query = embedding_matrix([query_vec])[0]
+    candidates = embedding_matrix(candidate_vecs)
 
     # Normalize query and candidates
     query_norm = np.linalg.norm(query)
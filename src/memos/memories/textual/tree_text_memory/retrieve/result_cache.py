@@ -0,0 +1,287 @@
+"""Opt-in cache for finished search results.
+
+Entries are keyed by cube, a scope describing everything that shapes the result
+(the graph store searched, mode, memory type, top_k, filters, flags) and the
+normalized query text. When
+``MEMOS_SEARCH_RESULT_CACHE_SEMANTIC_THRESHOLD`` is set, a query that misses
+exactly can still hit an entry of the same cube and scope whose query embedding
+has a cosine similarity at or above the threshold.
+
+Every cube has a version counter that is bumped on writes (``MemoryManager.add``
+and the ``TreeTextMemory`` delete paths). A bump drops the cube's entries, and a
+result computed against an older version is never stored. Writes made by other
+processes are not seen, so ``MEMOS_SEARCH_RESULT_CACHE_TTL_SECONDS`` bounds how
+stale a hit can be.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import threading
+import time
+
+from collections import Counter, OrderedDict
+from typing import Any
+
+import numpy as np
+
+from memos.log import get_logger
+
+
+logger = get_logger(__name__)
+
+_ENABLED_ENV = "MEMOS_SEARCH_RESULT_CACHE_ENABLED"
+_MAX_SIZE_ENV = "MEMOS_SEARCH_RESULT_CACHE_MAX_SIZE"
+_TTL_SECONDS_ENV = "MEMOS_SEARCH_RESULT_CACHE_TTL_SECONDS"
+_SEMANTIC_THRESHOLD_ENV = "MEMOS_SEARCH_RESULT_CACHE_SEMANTIC_THRESHOLD"
+_DEFAULT_MAX_SIZE = 1024
+_DEFAULT_TTL_SECONDS = 60.0
+_DEFAULT_SEMANTIC_THRESHOLD = 0.0
+
+_DEFAULT_CUBE = ""
+
+CacheKey = tuple[str, str, str]
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace so trivially different queries share an entry."""
+    return " ".join((query or "").split()).lower()
+
+
+def make_scope(**parts: Any) -> str:
+    """Serialize the non-query parts of a search into a stable, hashable string."""
+    return json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+
+
+class _Entry:
+    __slots__ = ("embedding", "expires_at", "results")
+
+    def __init__(self, results: Any, expires_at: float, embedding: np.ndarray | None):
+        self.results = results
+        self.expires_at = expires_at
+        self.embedding = embedding
+
+
+class SearchResultCache:
+    """LRU + TTL cache of search results with per-cube version invalidation.
+
+    Args:
+        max_size: Maximum number of cached results.
+        ttl_seconds: Lifetime of an entry.
+        semantic_threshold: Minimum query-embedding cosine for a semantic hit;
+            ``0`` disables semantic lookups.
+        enabled: When False, lookups always miss and nothing is stored, but
+            cube versions are still tracked.
+    """
+
+    def __init__(
+        self,
+        max_size: int = _DEFAULT_MAX_SIZE,
+        ttl_seconds: float = _DEFAULT_TTL_SECONDS,
+        semantic_threshold: float = _DEFAULT_SEMANTIC_THRESHOLD,
+        enabled: bool = True,
+    ):
+        self.max_size = max(1, max_size)
+        self.ttl_seconds = max(0.0, ttl_seconds)
+        self.semantic_threshold = semantic_threshold
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._versions: dict[str, int] = {}
+        self._global_version = 0
+        self._stats: Counter[str] = Counter()
+
+    @property
+    def semantic_enabled(self) -> bool:
+        return self.enabled and self.semantic_threshold > 0
+
+    def embed_query(self, embedder: Any, query: str) -> list[float] | None:
+        """Embed ``query`` for semantic lookups; None when unused or when embedding fails."""
+        if not self.semantic_enabled or embedder is None:
+            return None
+        try:
+            return embedder.embed([query])[0]
+        except Exception as e:
+            logger.warning(f"Search result cache query embedding failed: {e}")
+            return None
+
+    def version(self, cube: str | None) -> tuple[int, int]:
+        """Return the current version of ``cube``; pass it back to :meth:`put`."""
+        with self._lock:
+            return self._global_version, self._versions.get(cube or _DEFAULT_CUBE, 0)
+
+    def bump(self, cube: str | None = None) -> None:
+        """Invalidate results of ``cube``, or of every cube when ``cube`` is None."""
+        with self._lock:
+            if cube is None:
+                self._global_version += 1
+                dropped = len(self._entries)
+                self._entries.clear()
+            else:
+                cube = cube or _DEFAULT_CUBE
+                self._versions[cube] = self._versions.get(cube, 0) + 1
+                stale = [key for key in self._entries if key[0] == cube]
+                for key in stale:
+                    del self._entries[key]
+                dropped = len(stale)
+            self._stats["invalidations"] += 1
+            self._stats["invalidated_entries"] += dropped
+
+    def get(
+        self,
+        cube: str | None,
+        scope: str,
+        query: str,
+        query_embedding: list[float] | None = None,
+    ) -> Any | None:
+        """Return a copy of the cached results, or None on a miss."""
+        if not self.enabled:
+            return None
+        cube = cube or _DEFAULT_CUBE
+        key = (cube, scope, normalize_query(query))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                del self._entries[key]
+                self._stats["expired"] += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return copy.deepcopy(entry.results)
+
+            if self.semantic_enabled and query_embedding is not None:
+                entry = self._semantic_lookup(cube, scope, query_embedding, now)
+                if entry is not None:
+                    self._stats["semantic_hits"] += 1
+                    return copy.deepcopy(entry.results)
+            self._stats["misses"] += 1
+            return None
+
+    def _semantic_lookup(
+        self, cube: str, scope: str, query_embedding: list[float], now: float
+    ) -> _Entry | None:
+        candidates = [
+            (key, entry)
+            for key, entry in self._entries.items()
+            if key[0] == cube
+            and key[1] == scope
+            and entry.embedding is not None
+            and entry.expires_at > now
+        ]
+        if not candidates:
+            return None
+        query = _unit(query_embedding)
+        if query is None:
+            return None
+        matrix = np.stack([entry.embedding for _, entry in candidates])
+        if matrix.shape[1] != query.shape[0]:
+            return None
+        scores = matrix @ query
+        best = int(np.argmax(scores))
+        if scores[best] < self.semantic_threshold:
+            return None
+        key, entry = candidates[best]
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(
+        self,
+        cube: str | None,
+        scope: str,
+        query: str,
+        results: Any,
+        version: tuple[int, int],
+        query_embedding: list[float] | None = None,
+    ) -> None:
+        """Store ``results`` unless the cube changed since ``version`` was read."""
+        if not self.enabled:
+            return
+        cube = cube or _DEFAULT_CUBE
+        key = (cube, scope, normalize_query(query))
+        embedding = _unit(query_embedding) if self.semantic_enabled else None
+        entry = _Entry(copy.deepcopy(results), time.monotonic() + self.ttl_seconds, embedding)
+        with self._lock:
+            if version != (self._global_version, self._versions.get(cube, 0)):
+                self._stats["stale_puts"] += 1
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            hits = self._stats["hits"] + self._stats["semantic_hits"]
+            lookups = hits + self._stats["misses"]
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "hits": self._stats["hits"],
+                "semantic_hits": self._stats["semantic_hits"],
+                "misses": self._stats["misses"],
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "expired": self._stats["expired"],
+                "evictions": self._stats["evictions"],
+                "invalidations": self._stats["invalidations"],
+                "invalidated_entries": self._stats["invalidated_entries"],
+                "stale_puts": self._stats["stale_puts"],
+            }
+
+
+def _unit(vector: list[float] | None) -> np.ndarray | None:
+    if vector is None:
+        return None
+    array = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(array))
+    if array.ndim != 1 or norm == 0.0:
+        return None
+    return array / norm
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning("Invalid %s=%r; using default %s", name, raw, default)
+        return default
+
+
+def _env_enabled(name: str) -> bool:
+    return os.getenv(name, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+_SHARED_CACHE: SearchResultCache | None = None
+_SHARED_CACHE_LOCK = threading.Lock()
+
+
+def get_shared_search_result_cache() -> SearchResultCache:
+    """Return the process-wide cache used by searchers and cube views."""
+    global _SHARED_CACHE
+    with _SHARED_CACHE_LOCK:
+        if _SHARED_CACHE is None:
+            _SHARED_CACHE = SearchResultCache(
+                max_size=int(_env_number(_MAX_SIZE_ENV, _DEFAULT_MAX_SIZE)),
+                ttl_seconds=_env_number(_TTL_SECONDS_ENV, _DEFAULT_TTL_SECONDS),
+                semantic_threshold=_env_number(
+                    _SEMANTIC_THRESHOLD_ENV, _DEFAULT_SEMANTIC_THRESHOLD
+                ),
+                enabled=_env_enabled(_ENABLED_ENV),
+            )
+        return _SHARED_CACHE
+
+
+def bump_cube_version(cube: str | None = None) -> None:
+    """Invalidate cached search results after a write to ``cube`` (None = all cubes)."""
+    get_shared_search_result_cache().bump(cube)
@@ -8,6 +8,7 @@ from typing import Any
 import numpy as np
 
 from memos.dependency import require_python_package
+from memos.embedders.quantized import embedding_matrix
 from memos.log import get_logger
 
 
@@ -592,8 +593,8 @@ def find_best_unrelated_subgroup(sentences: list, similarity_matrix: list, bar:
     return selected_sentences, selected_indices
 
 
-def cosine_similarity_matrix(embeddings: list[list[float]]) -> list[list[float]]:
-    embeddings_array = np.asarray(embeddings)
+def cosine_similarity_matrix(embeddings: list[list[float]] | np.ndarray) -> list[list[float]]:
+    embeddings_array = embedding_matrix(embeddings)
     norms = np.linalg.norm(embeddings_array, axis=1, keepdims=True)
     # Handle zero vectors to avoid division by zero
     norms[norms == 0] = 1.0
@@ -602,3 +603,74 @@ def cosine_similarity_matrix(embeddings: list[list[float]]) -> list[list[float]]
     # Handle any NaN or Inf values
     similarity_matrix = np.nan_to_num(similarity_matrix, nan=0.0, posinf=0.0, neginf=0.0)
     return similarity_matrix
+
+
+def _incidence_matrix(features: list[dict[str, int]]) -> np.ndarray:
+    vocab: dict[str, int] = {}
+    for counts in features:
+        for feature in counts:
+            vocab.setdefault(feature, len(vocab))
+    matrix = np.zeros((len(features), max(len(vocab), 1)), dtype=np.float64)
+    for row, counts in enumerate(features):
+        for feature, count in counts.items():
+            matrix[row, vocab[feature]] = count
+    return matrix
+
+
+def char_similarity_matrices(texts: list[str]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pairwise character-level Dice, TF-IDF cosine and 2-gram Jaccard similarities.
+
+    Features are extracted once per text and every pair is scored with matrix
+    products, giving the same values as comparing each pair separately. The
+    TF-IDF weighting is the pairwise one used by the search dedup: a character
+    weighs 1.0 when both texts contain it and 1.5 otherwise.
+
+    Args:
+        texts: Texts to compare; empty texts are dissimilar to everything.
+
+    Returns:
+        (dice, tfidf, bigram) matrices of shape (len(texts), len(texts)).
+    """
+    char_counts = []
+    bigram_sets = []
+    for text in texts:
+        counts: dict[str, int] = {}
+        for char in text:
+            counts[char] = counts.get(char, 0) + 1
+        char_counts.append(counts)
+        if len(text) >= 2:
+            bigrams = {text[i : i + 2] for i in range(len(text) - 1)}
+        else:
+            bigrams = {text} if text else set()
+        bigram_sets.append(dict.fromkeys(bigrams, 1))
+
+    counts = _incidence_matrix(char_counts)
+    presence = (counts > 0).astype(np.float64)
+    bigrams = _incidence_matrix(bigram_sets)
+    non_empty = np.array([bool(text) for text in texts])
+    valid = np.outer(non_empty, non_empty)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sizes = presence.sum(axis=1)
+        shared_chars = presence @ presence.T
+        dice = 2 * shared_chars / (sizes[:, None] + sizes[None, :])
+
+        bigram_sizes = bigrams.sum(axis=1)
+        shared_bigrams = bigrams @ bigrams.T
+        bigram_union = bigram_sizes[:, None] + bigram_sizes[None, :] - shared_bigrams
+        bigram = shared_bigrams / bigram_union
+
+        # Shared characters weigh 1.0 and the rest 1.5, so for the pair (i, j):
+        # |v_i|^2 = shared_sq[i, j] + 2.25 * (total_sq[i] - shared_sq[i, j]).
+        squares = counts * counts
+        total_sq = squares.sum(axis=1)
+        shared_sq = squares @ presence.T
+        norm_sq = shared_sq + 2.25 * (total_sq[:, None] - shared_sq)
+        tfidf = (counts @ counts.T) / np.sqrt(norm_sq * norm_sq.T)
+
+    results = []
+    for matrix in (dice, tfidf, bigram):
+        matrix = np.nan_to_num(matrix, nan=0.0, posinf=0.0, neginf=0.0)
+        results.append(np.where(valid, matrix, 0.0))
+    return tuple(results)
@@ -12,6 +12,10 @@ from memos.llms.factory import AzureLLM, OllamaLLM, OpenAILLM
 from memos.log import get_logger, summarize_textual_memories
 from memos.memories.textual.item import SearchedTreeNodeTextualMemoryMetadata, TextualMemoryItem
 from memos.memories.textual.tree_text_memory.retrieve.bm25_util import EnhancedBM25
+from memos.memories.textual.tree_text_memory.retrieve.result_cache import (
+    get_shared_search_result_cache,
+    make_scope,
+)
 from memos.memories.textual.tree_text_memory.retrieve.retrieve_utils import (
     FastTokenizer,
     StopwordManager,
@@ -234,6 +238,77 @@ class Searcher:
         else:
             logger.debug(f"[SEARCH] Received info dict: {info}")
 
+        result_cache = get_shared_search_result_cache()
+        if result_cache.enabled:
+            cache_scope = make_scope(
+                source="searcher",
+                # Searchers over different cubes may all search with user_name=None
+                graph_store=id(self.graph_store),
+                top_k=top_k,
+                info=info,
+                mode=mode,
+                memory_type=memory_type,
+                search_filter=search_filter,
+                search_priority=search_priority,
+                search_tool_memory=search_tool_memory,
+                tool_mem_top_k=tool_mem_top_k,
+                include_skill_memory=include_skill_memory,
+                skill_mem_top_k=skill_mem_top_k,
+                include_preference_memory=include_preference_memory,
+                pref_mem_top_k=pref_mem_top_k,
+                dedup=dedup,
+                **kwargs,
+            )
+            cache_version = result_cache.version(user_name)
+            query_embedding = result_cache.embed_query(self.embedder, query)
+            cached = result_cache.get(user_name, cache_scope, query, query_embedding)
+            if cached is not None:
+                logger.info("[SEARCH] Result cache hit: %d results", len(cached))
+                return cached
+
+        final_results = self._search_uncached(
+            query=query,
+            top_k=top_k,
+            info=info,
+            mode=mode,
+            memory_type=memory_type,
+            search_filter=search_filter,
+            search_priority=search_priority,
+            user_name=user_name,
+            search_tool_memory=search_tool_memory,
+            tool_mem_top_k=tool_mem_top_k,
+            include_skill_memory=include_skill_memory,
+            skill_mem_top_k=skill_mem_top_k,
+            include_preference_memory=include_preference_memory,
+            pref_mem_top_k=pref_mem_top_k,
+            dedup=dedup,
+            **kwargs,
+        )
+        if result_cache.enabled:
+            result_cache.put(
+                user_name, cache_scope, query, final_results, cache_version, query_embedding
+            )
+        return final_results
+
+    def _search_uncached(
+        self,
+        query: str,
+        top_k: int,
+        info: dict,
+        mode: str,
+        memory_type: str,
+        search_filter: dict | None,
+        search_priority: dict | None,
+        user_name: str | None,
+        search_tool_memory: bool,
+        tool_mem_top_k: int,
+        include_skill_memory: bool,
+        skill_mem_top_k: int,
+        include_preference_memory: bool,
+        pref_mem_top_k: int,
+        dedup: str | None,
+        **kwargs,
+    ) -> list[TextualMemoryItem]:
         if kwargs.get("plugin", False):
             logger.info(f"[SEARCH] Retrieve from plugin: {query}")
             retrieved_results = self._retrieve_simple(
@@ -21,6 +21,11 @@ from memos.mem_scheduler.schemas.task_schemas import (
     MEM_READ_TASK_LABEL,
 )
 from memos.memories.textual.item import TextualMemoryItem
+from memos.memories.textual.tree_text_memory.retrieve.result_cache import (
+    bump_cube_version,
+    get_shared_search_result_cache,
+    make_scope,
+)
 from memos.multi_mem_cube.views import MemCubeView
 from memos.search import resolve_filter_for_cube, search_text_memories
 from memos.templates.mem_reader_prompts import PROMPT_MAPPING
@@ -119,6 +124,22 @@ class SingleCubeView(MemCubeView):
         # Determine search mode
         search_mode = self._get_search_mode(search_req.mode)
 
+        result_cache = get_shared_search_result_cache()
+        if result_cache.enabled:
+            cache_scope = make_scope(
+                source="cube_view",
+                search_mode=search_mode,
+                request=search_req.model_dump(mode="json", exclude={"query"}),
+            )
+            cache_version = result_cache.version(self.cube_id)
+            query_embedding = result_cache.embed_query(
+                getattr(self.searcher, "embedder", None), search_req.query
+            )
+            cached = result_cache.get(self.cube_id, cache_scope, search_req.query, query_embedding)
+            if cached is not None:
+                self.logger.info(f"[SingleCubeView] cube={self.cube_id} search result cache hit")
+                return cached
+
         # Unified search through _search_text (includes all memory types)
         all_formatted_memories = self._search_text(search_req, user_context, search_mode)
 
@@ -128,6 +149,16 @@ class SingleCubeView(MemCubeView):
             all_formatted_memories,
             self.cube_id,
         )
+        # _search_text swallows errors and returns [], so empty results are not cached.
+        if result_cache.enabled and all_formatted_memories:
+            result_cache.put(
+                self.cube_id,
+                cache_scope,
+                search_req.query,
+                memories_result,
+                cache_version,
+                query_embedding,
+            )
 
         self.logger.info("Search result summary: %s", summarize_search_results(memories_result))
         return memories_result
@@ -798,6 +829,7 @@ class SingleCubeView(MemCubeView):
                                     self.logger.warning(
                                         f"[SingleCubeView] Failed to archive merged_from memory {old_id}: {e}"
                                     )
+                            bump_cube_version(user_context.mem_cube_id)
                         else:
                             self.logger.warning(
                                 "[SingleCubeView] merged_from provided but graph_db is unavailable; skip archiving."
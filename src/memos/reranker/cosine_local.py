@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 try:
     import numpy as _np
 
+    from memos.embedders.quantized import embedding_matrix
+
     _HAS_NUMPY = True
 except Exception:
     _HAS_NUMPY = False
@@ -41,8 +43,9 @@ def _cosine_one_to_many(q: list[float], m: list[list[float]]) -> list[float]:
             sims.append(dot(q, v) / (qn * vn))
         return sims
 
-    qv = _np.asarray(q, dtype=float)  # lowercase
-    mv = _np.asarray(m, dtype=float)  # lowercase
+    # float32 matrices straight from lists, arrays or quantized embeddings
+    qv = embedding_matrix([q])[0]  # lowercase
+    mv = embedding_matrix(m)  # lowercase
     qn = _np.linalg.norm(qv) or 1e-10
     mn = _np.linalg.norm(mv, axis=1)  # lowercase
     dots = mv @ qv
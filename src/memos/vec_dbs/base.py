@@ -38,6 +38,8 @@ class BaseVecDB(ABC):
         query_vector: list[float],
         top_k: int,
         filter: dict[str, Any] | None = None,
+        return_vector: bool = True,
+        payload_fields: list[str] | None = None,
     ) -> list[VecDBItem]:
         """
         Search for similar items in the vector database.
@@ -46,26 +48,76 @@ class BaseVecDB(ABC):
             query_vector: Single vector to search
             top_k: Number of results to return
             filter: payload filters (may not be supported by all implementations)
+            return_vector: Whether to fetch the stored vector of each hit
+            payload_fields: Payload keys to fetch; None fetches the whole payload and
+                an empty list fetches none
 
         Returns:
             List of search results with distance scores and payloads.
         """
 
+    def search_batch(
+        self,
+        query_vectors: list[list[float]],
+        top_k: int,
+        filter: dict[str, Any] | None = None,
+        return_vector: bool = True,
+        payload_fields: list[str] | None = None,
+    ) -> list[list[VecDBItem]]:
+        """
+        Search for several query vectors with the same top_k and filter.
+
+        Backends with a native batch endpoint override this to answer all queries
+        in one round trip; the default runs :meth:`search` once per vector.
+
+        Args:
+            query_vectors: Vectors to search
+            top_k: Number of results to return per vector
+            filter: payload filters applied to every query
+            return_vector: Whether to fetch the stored vector of each hit
+            payload_fields: Payload keys to fetch, as in :meth:`search`
+
+        Returns:
+            One list of search results per query vector, in input order.
+        """
+        return [
+            self.search(
+                vector,
+                top_k,
+                filter,
+                return_vector=return_vector,
+                payload_fields=payload_fields,
+            )
+            for vector in query_vectors
+        ]
+
     @abstractmethod
     def get_by_id(self, id: str) -> VecDBItem | None:
         """Get an item from the vector database."""
 
     @abstractmethod
-    def get_by_ids(self, ids: list[str]) -> list[VecDBItem]:
-        """Get multiple items by their IDs."""
+    def get_by_ids(
+        self,
+        ids: list[str],
+        return_vector: bool = True,
+        payload_fields: list[str] | None = None,
+    ) -> list[VecDBItem]:
+        """Get multiple items by their IDs, optionally projecting vector and payload."""
 
     @abstractmethod
-    def get_by_filter(self, filter: dict[str, Any]) -> list[VecDBItem]:
+    def get_by_filter(
+        self,
+        filter: dict[str, Any],
+        return_vector: bool = True,
+        payload_fields: list[str] | None = None,
+    ) -> list[VecDBItem]:
         """
         Retrieve all items that match the given filter criteria.
 
         Args:
             filter: Payload filters to match against stored items
+            return_vector: Whether to fetch the stored vectors
+            payload_fields: Payload keys to fetch, as in :meth:`search`
 
         Returns:
             List of items including vectors and payloads that match the filter
@@ -131,6 +131,7 @@ class MilvusVecDB(BaseVecDB):
         query_vector: list[float],
         top_k: int,
         filter: str = "",
+        output_fields: list[str] | None = None,
         **kwargs: Any,
     ) -> list[list[dict]]:
         """Dense search for similar items in the database."""
@@ -139,7 +140,7 @@ class MilvusVecDB(BaseVecDB):
             data=[query_vector],
             limit=top_k,
             filter=filter,
-            output_fields=["*"],
+            output_fields=output_fields or ["*"],
             anns_field="vector",
         )
         return results
@@ -150,6 +151,7 @@ class MilvusVecDB(BaseVecDB):
         query: str,
         top_k: int,
         filter: str = "",
+        output_fields: list[str] | None = None,
         **kwargs: Any,
     ) -> list[list[dict]]:
         """Sparse search for similar items in the database."""
@@ -158,7 +160,7 @@ class MilvusVecDB(BaseVecDB):
             data=[query],
             limit=top_k,
             filter=filter,
-            output_fields=["*"],
+            output_fields=output_fields or ["*"],
             anns_field="sparse_vector",
         )
         return results
@@ -173,6 +175,7 @@ class MilvusVecDB(BaseVecDB):
         ranker_type: str = "rrf",  # rrf, weighted
         sparse_weight=1.0,
         dense_weight=1.0,
+        output_fields: list[str] | None = None,
         **kwargs: Any,
     ) -> list[list[dict]]:
         """Hybrid search for similar items in the database."""
@@ -203,7 +206,7 @@ class MilvusVecDB(BaseVecDB):
             reqs=[sparse_request, dense_request],
             ranker=ranker,
             limit=top_k,
-            output_fields=["*"],
+            output_fields=output_fields or ["*"],
         )
         return results
 
@@ -215,6 +218,8 @@ class MilvusVecDB(BaseVecDB):
         top_k: int,
         filter: dict[str, Any] | None = None,
         search_type: str = "dense",  # dense, sparse, hybrid
+        return_vector: bool = True,
+        payload_fields: list[str] | None = None,
     ) -> list[MilvusVecDBItem]:
         """
         Search for similar items in the database.
@@ -224,6 +229,8 @@ class MilvusVecDB(BaseVecDB):
             collection_name: Name of the collection to search
             top_k: Number of results to return
             filter: Payload filters
+            return_vector: Whether to fetch the stored vector of each hit
+            payload_fields: Payload keys to fetch; None fetches all, [] fetches none
 
         Returns:
             List of search results with distance scores and payloads.
@@ -244,22 +251,10 @@ class MilvusVecDB(BaseVecDB):
                 query=query,
                 top_k=top_k,
                 filter=expr,
+                output_fields=self._output_fields(return_vector, payload_fields),
             )
 
-            items = []
-            for hit in results[0]:
-                entity = hit.get("entity", {})
-
-                items.append(
-                    MilvusVecDBItem(
-                        id=str(entity.get("id")),
-                        memory=entity.get("memory"),
-                        original_text=entity.get("original_text"),
-                        vector=entity.get("vector"),
-                        payload=entity.get("payload", {}),
-                        score=1 - float(hit["distance"]),
-                    )
-                )
+            items = [self._hit_to_item(hit, payload_fields) for hit in results[0]]
         except Exception as e:
             logger.error("Error in _%s_search: %s", search_type, e)
             return []
@@ -267,6 +262,91 @@ class MilvusVecDB(BaseVecDB):
         logger.info(f"Milvus search completed with {len(items)} results.")
         return items
 
+    def search_batch(
+        self,
+        query_vectors: list[list[float]],
+        top_k: int,
+        filter: dict[str, Any] | None = None,
+        return_vector: bool = True,
+        payload_fields: list[str] | None = None,
+        collection_name: str | None = None,
+    ) -> list[list[MilvusVecDBItem]]:
+        """
+        Dense search for several vectors in a single multi-vector request.
+
+        Args:
+            query_vectors: Vectors to search
+            top_k: Number of results to return per vector
+            filter: Payload filters applied to every query
+            return_vector: Whether to fetch the stored vector of each hit
+            payload_fields: Payload keys to fetch, as in `search`
+            collection_name: Collection to search; defaults to the first configured one
+
+        Returns:
+            One list of search results per query vector, in input order.
+        """
+        if not query_vectors:
+            return []
+        collection_name = collection_name or self.config.collection_name[0]
+        expr = self._dict_to_expr(filter) if filter else ""
+        try:
+            results = self.client.search(
+                collection_name=collection_name,
+                data=query_vectors,
+                limit=top_k,
+                filter=expr,
+                output_fields=self._output_fields(return_vector, payload_fields),
+                anns_field="vector",
+            )
+        except Exception as e:
+            logger.error("Error in batch dense search: %s", e)
+            return [[] for _ in query_vectors]
+
+        logger.info(f"Milvus batch search completed for {len(query_vectors)} queries.")
+        return [[self._hit_to_item(hit, payload_fields) for hit in hits] for hits in results]
+
+    @staticmethod
+    def _output_fields(return_vector: bool, payload_fields: list[str] | None) -> list[str]:
+        """
+        Milvus output fields for a projection.
+
+        The payload is a single JSON column, so a key subset still fetches the column and is
+        narrowed client-side by `_project_payload`.
+        """
+        if return_vector and payload_fields is None:
+            return ["*"]
+        fields = ["id", "memory", "original_text"]
+        if return_vector:
+            fields.append("vector")
+        if payload_fields is None or payload_fields:
+            fields.append("payload")
+        return fields
+
+    @staticmethod
+    def _project_payload(payload: dict | None, payload_fields: list[str] | None) -> dict:
+        if payload_fields is None:
+            return payload or {}
+        return {key: payload[key] for key in payload_fields if payload and key in payload}
+
+    @classmethod
+    def _entity_to_item(
+        cls, entity: dict, payload_fields: list[str] | None = None, **extra: Any
+    ) -> MilvusVecDBItem:
+        return MilvusVecDBItem(
+            id=str(entity.get("id")),
+            memory=entity.get("memory"),
+            original_text=entity.get("original_text"),
+            vector=entity.get("vector"),
+            payload=cls._project_payload(entity.get("payload"), payload_fields),
+            **extra,
+        )
+
+    @classmethod
+    def _hit_to_item(cls, hit: dict, payload_fields: list[str] | None = None) -> MilvusVecDBItem:
+        return cls._entity_to_item(
+            hit.get("entity", {}), payload_fields, score=1 - float(hit["distance"])
+        )
+
     def _dict_to_expr(self, filter_dict: dict[str, Any]) -> str:
         """Convert a dictionary filter to a Milvus expression string.
 
@@ -498,32 +578,35 @@ class MilvusVecDB(BaseVecDB):
             payload=entity.get("payload", {}),
         )
 
-    def get_by_ids(self, collection_name: str, ids: list[str]) -> list[MilvusVecDBItem]:
-        """Get multiple items by their IDs."""
+    def get_by_ids(
+        self,
+        collection_name: str,
+        ids: list[str],
+        return_vector: bool = True,
+        payload_fields: list[str] | None = None,
+    ) -> list[MilvusVecDBItem]:
+        """Get multiple items by their IDs, optionally projecting vector and payload."""
+        kwargs = {}
+        if not return_vector or payload_fields is not None:
+            kwargs["output_fields"] = self._output_fields(return_vector, payload_fields)
         results = self.client.get(
             collection_name=collection_name,
             ids=ids,
+            **kwargs,
         )
 
         if not results:
             return []
 
-        items = []
-        for entity in results:
-            items.append(
-                MilvusVecDBItem(
-                    id=entity["id"],
-                    memory=entity.get("memory"),
-                    original_text=entity.get("original_text"),
-                    vector=entity.get("vector"),
-                    payload=entity.get("payload", {}),
-                )
-            )
-
-        return items
+        return [self._entity_to_item(entity, payload_fields) for entity in results]
 
     def get_by_filter(
-        self, collection_name: str, filter: dict[str, Any], scroll_limit: int = 100
+        self,
+        collection_name: str,
+        filter: dict[str, Any],
+        scroll_limit: int = 100,
+        return_vector: bool = True,
+        payload_fields: list[str] | None = None,
     ) -> list[MilvusVecDBItem]:
         """
         Retrieve all items that match the given filter criteria using query_iterator.
@@ -531,6 +614,8 @@ class MilvusVecDB(BaseVecDB):
         Args:
             filter: Payload filters to match against stored items
             scroll_limit: Maximum number of items to retrieve per batch (batch_size)
+            return_vector: Whether to fetch the stored vectors
+            payload_fields: Payload keys to fetch; None fetches all, [] fetches none
 
         Returns:
             List of items including vectors and payload that match the filter
@@ -545,7 +630,7 @@ class MilvusVecDB(BaseVecDB):
             collection_name=collection_name,
             filter=expr,
             batch_size=scroll_limit,
-            output_fields=["*"],  # Include all fields including payload
+            output_fields=self._output_fields(return_vector, payload_fields),
         )
 
         # Iterate through all batches
@@ -557,18 +642,9 @@ class MilvusVecDB(BaseVecDB):
                     break
 
                 # Convert batch results to MilvusVecDBItem objects
-                for entity in batch_results:
-                    # Extract the actual payload from Milvus entity
-                    payload = entity.get("payload", {})
-                    all_items.append(
-                        MilvusVecDBItem(
-                            id=entity["id"],
-                            memory=entity.get("memory"),
-                            original_text=entity.get("original_text"),
-                            vector=entity.get("vector"),
-                            payload=payload,
-                        )
-                    )
+                all_items.extend(
+                    self._entity_to_item(entity, payload_fields) for entity in batch_results
+                )
         except Exception as e:
             logger.warning(
                 f"Error during Milvus query iteration: {e}. Returning {len(all_items)} items found so far."
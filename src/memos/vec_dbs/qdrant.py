@@ -124,7 +124,12 @@ class QdrantVecDB(BaseVecDB):
             return False
 
     def search(
-        self, query_vector: list[float], top_k: int, filter: dict[str, Any] | None = None
+        self,
+        query_vector: list[float],
+        top_k: int,
+        filter: dict[str, Any] | None = None,
+        return_vector: bool = True,
+        payload_fields: list[str] | None = None,
     ) -> list[VecDBItem]:
         """
         Search for similar items in the database.
@@ -133,6 +138,8 @@ class QdrantVecDB(BaseVecDB):
             query_vector: Single vector to search
             top_k: Number of results to return
             filter: Payload filters
+            return_vector: Whether to fetch the stored vector of each hit
+            payload_fields: Payload keys to fetch; None fetches all, [] fetches none
 
         Returns:
             List of search results with distance scores and payloads.
@@ -143,10 +150,63 @@ class QdrantVecDB(BaseVecDB):
             query=query_vector,
             limit=top_k,
             query_filter=qdrant_filter,
-            with_vectors=True,
-            with_payload=True,
+            with_vectors=return_vector,
+            with_payload=self._with_payload(payload_fields),
         ).points
         logger.info(f"Qdrant search completed with {len(response)} results.")
+        return self._points_to_items(response)
+
+    def search_batch(
+        self,
+        query_vectors: list[list[float]],
+        top_k: int,
+        filter: dict[str, Any] | None = None,
+        return_vector: bool = True,
+        payload_fields: list[str] | None = None,
+    ) -> list[list[VecDBItem]]:
+        """
+        Search for several vectors in a single `query_batch_points` request.
+
+        Args:
+            query_vectors: Vectors to search
+            top_k: Number of results to return per vector
+            filter: Payload filters applied to every query
+            return_vector: Whether to fetch the stored vector of each hit
+            payload_fields: Payload keys to fetch, as in `search`
+
+        Returns:
+            One list of search results per query vector, in input order.
+        """
+        if not query_vectors:
+            return []
+        from qdrant_client.http import models
+
+        qdrant_filter = self._dict_to_filter(filter) if filter else None
+        responses = self.client.query_batch_points(
+            collection_name=self.config.collection_name,
+            requests=[
+                models.QueryRequest(
+                    query=vector,
+                    limit=top_k,
+                    filter=qdrant_filter,
+                    with_vector=return_vector,
+                    with_payload=self._with_payload(payload_fields),
+                )
+                for vector in query_vectors
+            ],
+        )
+        logger.info(f"Qdrant batch search completed for {len(query_vectors)} queries.")
+        return [self._points_to_items(response.points) for response in responses]
+
+    @staticmethod
+    def _with_payload(payload_fields: list[str] | None) -> bool | list[str]:
+        """Translate a payload projection into Qdrant's `with_payload` argument."""
+        if payload_fields is None:
+            return True
+        return list(payload_fields) or False
+
+    @staticmethod
+    def _points_to_items(points: list[Any]) -> list[VecDBItem]:
         return [
             VecDBItem(
                 id=point.id,
@@ -154,7 +214,7 @@ class QdrantVecDB(BaseVecDB):
                 payload=point.payload,
                 score=point.score,
             )
-            for point in response
+            for point in points
         ]
 
     def _dict_to_filter(self, filter_dict: dict[str, Any]) -> Any:
@@ -191,13 +251,18 @@ class QdrantVecDB(BaseVecDB):
             payload=point.payload,
         )
 
-    def get_by_ids(self, ids: list[str]) -> list[VecDBItem]:
-        """Get multiple items by their IDs."""
+    def get_by_ids(
+        self,
+        ids: list[str],
+        return_vector: bool = True,
+        payload_fields: list[str] | None = None,
+    ) -> list[VecDBItem]:
+        """Get multiple items by their IDs, optionally projecting vector and payload."""
         response = self.client.retrieve(
             collection_name=self.config.collection_name,
             ids=ids,
-            with_payload=True,
-            with_vectors=True,
+            with_payload=self._with_payload(payload_fields),
+            with_vectors=return_vector,
         )
 
         if not response:
@@ -212,13 +277,21 @@ class QdrantVecDB(BaseVecDB):
             for point in response
         ]
 
-    def get_by_filter(self, filter: dict[str, Any], scroll_limit: int = 100) -> list[VecDBItem]:
+    def get_by_filter(
+        self,
+        filter: dict[str, Any],
+        scroll_limit: int = 100,
+        return_vector: bool = True,
+        payload_fields: list[str] | None = None,
+    ) -> list[VecDBItem]:
         """
         Retrieve all items that match the given filter criteria.
 
         Args:
             filter: Payload filters to match against stored items
             scroll_limit: Maximum number of items to retrieve per scroll request
+            return_vector: Whether to fetch the stored vectors
+            payload_fields: Payload keys to fetch; None fetches all, [] fetches none
 
         Returns:
             List of items including vectors and payload that match the filter
@@ -234,8 +307,8 @@ class QdrantVecDB(BaseVecDB):
                 limit=scroll_limit,
                 scroll_filter=qdrant_filter,
                 offset=offset,
-                with_vectors=True,
-                with_payload=True,
+                with_vectors=return_vector,
+                with_payload=self._with_payload(payload_fields),
             )
 
             if not points:
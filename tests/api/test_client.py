@@ -64,6 +64,13 @@ class DummyStreamResponse:
         self.closed = True
 
 
+def _patch_session(monkeypatch, client_module, method: str, fake) -> None:
+    """Route the client's pooled ``requests.Session`` calls to ``fake(url, **kwargs)``."""
+    monkeypatch.setattr(
+        client_module.requests.Session, method, lambda session, url, **kwargs: fake(url, **kwargs)
+    )
+
+
 def _response_for(url: str) -> dict:
     if url.endswith("/get/message"):
         return {"code": 200, "message": "ok", "data": {"message_detail_list": []}}
@@ -129,7 +136,7 @@ def posted_requests(monkeypatch, client_module):
         calls.append({"url": url, **kwargs})
         return DummyResponse(_response_for(url))
 
-    monkeypatch.setattr(client_module.requests, "post", fake_post)
+    _patch_session(monkeypatch, client_module, "post", fake_post)
     return calls
 
 
@@ -147,7 +154,7 @@ def fetched_requests(monkeypatch, client_module):
             }
         )
 
-    monkeypatch.setattr(client_module.requests, "get", fake_get)
+    _patch_session(monkeypatch, client_module, "get", fake_get)
     return calls
 
 
@@ -486,7 +493,7 @@ def test_get_task_status_normalizes_legacy_list_response(
             }
         )
 
-    monkeypatch.setattr(client_module.requests, "post", fake_post)
+    _patch_session(monkeypatch, client_module, "post", fake_post)
 
     response = client.get_task_status("task-legacy")
 
@@ -692,7 +699,7 @@ def test_chat_stream_yields_sse_data_and_closes_response(monkeypatch, client_mod
         calls.append({"url": url, **kwargs})
         return stream_response
 
-    monkeypatch.setattr(client_module.requests, "post", fake_post)
+    _patch_session(monkeypatch, client_module, "post", fake_post)
     client = client_module.MemOSClient(
         api_key="test-key", base_url="https://example.test/openmem/v1"
     )
@@ -710,3 +717,115 @@ def test_chat_stream_yields_sse_data_and_closes_response(monkeypatch, client_mod
     assert chunks == ['{"response":"first"}', "[DONE]"]
     assert stream_response.json_called is False
     assert stream_response.closed is True
+
+
+def test_client_reuses_one_pooled_session(client_module: Any) -> None:
+    client = client_module.MemOSClient(
+        api_key="test-key",
+        base_url="https://example.test/openmem/v1",
+        pool_connections=4,
+        pool_maxsize=32,
+    )
+
+    adapter = client.session.get_adapter("https://example.test/openmem/v1/search/memory")
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_connections == 4
+
+    client.close()
+
+
+def test_request_retries_with_backoff(monkeypatch, client_module: Any) -> None:
+    attempts: list[str] = []
+    sleeps: list[float] = []
+
+    def flaky_post(url: str, **kwargs):
+        attempts.append(url)
+        if len(attempts) < 3:
+            raise client_module.requests.ConnectionError("reset")
+        return DummyResponse(_response_for(url))
+
+    _patch_session(monkeypatch, client_module, "post", flaky_post)
+    monkeypatch.setattr(client_module.time, "sleep", sleeps.append)
+    client = client_module.MemOSClient(
+        api_key="test-key", base_url="https://example.test/openmem/v1", retry_backoff=0.5
+    )
+
+    response = client.search_memory(query="hello", user_id="user-1")
+
+    assert response is not None
+    assert len(attempts) == 3
+    assert sleeps == [0.5, 1.0]
+
+    attempts.clear()
+    client = client_module.MemOSClient(
+        api_key="test-key", base_url="https://example.test/openmem/v1", max_retries=1
+    )
+    with pytest.raises(client_module.requests.ConnectionError):
+        client.search_memory(query="hello", user_id="user-1")
+    assert len(attempts) == 1
+
+
+def test_search_memory_batch_keeps_order(client: Any, posted_requests: list[dict]) -> None:
+    responses = client.search_memory_batch(
+        [{"query": f"q{i}", "user_id": "user-1"} for i in range(5)], max_workers=3
+    )
+
+    assert len(responses) == 5
+    assert sorted(_json_payload(call)["query"] for call in posted_requests) == [
+        f"q{i}" for i in range(5)
+    ]
+
+
+def _async_client(client_module: Any, calls: list, **kwargs) -> Any:
+    import httpx
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.url.path.endswith("/chat"):
+            return httpx.Response(200, text='event: message\ndata: {"response":"a"}\n\n')
+        return httpx.Response(200, json=_response_for(str(request.url)))
+
+    session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client_module.AsyncMemOSClient(
+        api_key="test-key", base_url="https://example.test/openmem/v1", session=session, **kwargs
+    )
+
+
+def test_async_client_has_same_surface(client_module: Any) -> None:
+    import asyncio
+
+    calls: list = []
+
+    async def run():
+        async with _async_client(client_module, calls) as client:
+            search = await client.search_memory(query="hello", user_id="user-1")
+            added = await client.add_message_batch(
+                [
+                    {"messages": [{"role": "user", "content": f"m{i}"}], "user_id": "user-1"}
+                    for i in range(4)
+                ],
+                max_workers=2,
+            )
+            chunks = [
+                chunk
+                async for chunk in await client.chat(
+                    user_id="user-1", conversation_id="c1", query="hi", stream=True
+                )
+            ]
+            return search, added, chunks
+
+    search, added, chunks = asyncio.run(run())
+
+    assert search.data is not None
+    assert [response.data.task_id for response in added] == ["task-1"] * 4
+    assert chunks == ['{"response":"a"}']
+    assert json.loads(calls[0].content)["query"] == "hello"
+    assert calls[0].headers["Authorization"] == "Token test-key"
+    assert len(calls) == 6
+
+
+def test_async_client_rejects_sync_with(client_module: Any) -> None:
+    client = _async_client(client_module, [])
+
+    with pytest.raises(TypeError, match="async with"), client:
+        pass
@@ -0,0 +1,51 @@
+from unittest.mock import Mock
+
+import pytest
+
+from memos.api.handlers.search_handler import SearchHandler
+from memos.memories.textual.tree_text_memory.retrieve.retrieve_utils import (
+    char_similarity_matrices,
+)
+
+
+TEXTS = ["用户喜欢咖啡", "user likes coffee", "user likes tea", "a", "", "咖啡咖啡", "aaaa"]
+
+
+def _memory(memory_id: str, text: str, score: float, embedding: list[float]) -> dict:
+    return {
+        "id": memory_id,
+        "memory": text,
+        "metadata": {"relativity": score, "embedding": embedding},
+    }
+
+
+def test_char_similarity_matrices_match_pairwise_helpers():
+    dice, tfidf, bigram = char_similarity_matrices(TEXTS)
+
+    for i, left in enumerate(TEXTS):
+        for j, right in enumerate(TEXTS):
+            assert dice[i, j] == pytest.approx(SearchHandler._dice_similarity(left, right))
+            assert tfidf[i, j] == pytest.approx(SearchHandler._tfidf_similarity(left, right))
+            assert bigram[i, j] == pytest.approx(SearchHandler._bigram_similarity(left, right))
+
+
+def test_mmr_dedup_drops_near_duplicate_text_and_keeps_diverse_items():
+    handler = SearchHandler.__new__(SearchHandler)
+    handler.logger = Mock()
+    results = {
+        "text_mem": [
+            {
+                "memories": [
+                    _memory("a", "user likes coffee in the morning", 0.9, [1.0, 0.0]),
+                    _memory("b", "user likes coffee in the mornings", 0.85, [0.999, 0.01]),
+                    _memory("c", "meeting on friday", 0.5, [0.0, 1.0]),
+                    _memory("d", "user likes coffee in the morning", 0.4, [1.0, 0.0]),
+                ]
+            }
+        ],
+        "pref_mem": [],
+    }
+
+    handler._mmr_dedup_text_memories(results, text_top_k=3, pref_top_k=1)
+
+    assert [item["id"] for item in results["text_mem"][0]["memories"]] == ["a", "c"]
@@ -52,7 +52,12 @@ def test_kv_cache_memory_config():
         KVCacheMemoryConfig,
         factory_fields=["extractor_llm"],
         required_fields=[],
-        optional_fields=["cube_id", "memory_filename"],
+        optional_fields=[
+            "cube_id",
+            "memory_filename",
+            "incremental_update",
+            "storage_format",
+        ],
     )
 
     check_config_instantiation_valid(
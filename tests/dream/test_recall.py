@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import threading
+
+from memos.dream.pipeline.recall import DirectRecall
+from memos.dream.types import DreamCluster, DreamMotive
+
+
+class FakeGraphDB:
+    def __init__(self, embeddings, hits):
+        self.embeddings = embeddings
+        self.hits = hits
+        self.get_nodes_calls: list[list[str]] = []
+        self.searches: list[tuple[tuple, str]] = []
+        self.batch_calls = 0
+        self._lock = threading.Lock()
+
+    def get_nodes(self, ids, include_embedding=False, user_name=None):
+        self.get_nodes_calls.append(list(ids))
+        return [
+            {"id": mid, "memory": mid, "metadata": {"embedding": self.embeddings[mid]}}
+            for mid in ids
+            if mid in self.embeddings
+        ]
+
+    def search_by_embedding(self, vector, *, top_k, scope, **kwargs):
+        with self._lock:
+            self.searches.append((tuple(vector), scope))
+        return [dict(hit) for hit in self.hits.get((tuple(vector), scope), [])]
+
+    def search_batch(self, vectors, *, top_k, scope, **kwargs):
+        with self._lock:
+            self.batch_calls += 1
+        return [
+            self.search_by_embedding(vector, top_k=top_k, scope=scope, **kwargs)
+            for vector in vectors
+        ]
+
+
+def _cluster(cluster_id: str, memory_ids: list[str]) -> DreamCluster:
+    return DreamCluster(
+        cluster_id=cluster_id,
+        motive=DreamMotive(
+            motive_id=cluster_id, motive_type="newness", description="", memory_ids=memory_ids
+        ),
+    )
+
+
+def _recall(graph_db, **kwargs) -> DirectRecall:
+    recall = DirectRecall(**kwargs)
+    recall.bind_context({"shared": {"graph_db": graph_db}})
+    return recall
+
+
+def test_gather_batches_fetches_and_shares_near_identical_searches():
+    embeddings = {
+        "a": [1.0, 0.0, 0.0],
+        "a2": [1.0, 0.001, 0.0],  # near-identical to "a"
+        "b": [0.0, 1.0, 0.0],
+        "b2": [0.0, 1.0, 0.0],  # identical to "b"
+    }
+    hits = {
+        ((1.0, 0.0, 0.0), "UserMemory"): [
+            {"id": "x", "memory": "x", "score": 0.9},
+            {"id": "b", "memory": "b", "score": 0.8},
+        ],
+        ((1.0, 0.0, 0.0), "LongTermMemory"): [{"id": "x", "memory": "x", "score": 0.95}],
+        ((0.0, 1.0, 0.0), "LongTermMemory"): [
+            {"id": "y", "memory": "y", "score": 0.7},
+            {"id": "a", "memory": "a", "score": 0.6},
+        ],
+    }
+    graph_db = FakeGraphDB(embeddings, hits)
+    clusters = [_cluster("c1", ["a", "a2"]), _cluster("c2", ["b", "a2"])]
+
+    _recall(graph_db, dedup_similarity=0.98).gather(
+        clusters=clusters, text_mem=None, cube_id="cube"
+    )
+
+    assert graph_db.get_nodes_calls == [["a", "a2", "b"]]
+    assert graph_db.batch_calls == 2  # one batch per scope
+    assert len(graph_db.searches) == 4  # 2 distinct embeddings x 2 scopes
+    assert [(h["id"], h["score"]) for h in clusters[0].recalled_items] == [("x", 0.95), ("b", 0.8)]
+    # each cluster excludes its own sources and keeps the best score per hit
+    assert [(h["id"], h["score"]) for h in clusters[1].recalled_items] == [
+        ("x", 0.95),
+        ("y", 0.7),
+        ("a", 0.6),
+    ]
+
+
+def test_gather_by_default_only_shares_identical_embeddings():
+    embeddings = {"a": [1.0, 0.0], "a2": [1.0, 0.001], "a3": [1.0, 0.0]}
+    graph_db = FakeGraphDB(embeddings, {})
+
+    _recall(graph_db).gather(
+        clusters=[_cluster("c1", list(embeddings))], text_mem=None, cube_id="cube"
+    )
+
+    assert sorted({vector for vector, _scope in graph_db.searches}) == [(1.0, 0.0), (1.0, 0.001)]
+
+
+def test_gather_keeps_top_k_and_tolerates_failed_searches():
+    class FlakyGraphDB(FakeGraphDB):
+        def search_by_embedding(self, vector, *, top_k, scope, **kwargs):
+            if scope == "UserMemory":
+                raise RuntimeError("search failed")
+            return super().search_by_embedding(vector, top_k=top_k, scope=scope, **kwargs)
+
+    hits = {
+        ((1.0, 0.0), "LongTermMemory"): [
+            {"id": f"m{i}", "memory": "", "score": i / 10} for i in range(5)
+        ]
+    }
+    graph_db = FlakyGraphDB({"a": [1.0, 0.0]}, hits)
+    clusters = [_cluster("c1", ["a"]), _cluster("c2", [])]
+
+    _recall(graph_db, recall_top_k=2).gather(clusters=clusters, text_mem=None, cube_id="cube")
+
+    assert [h["id"] for h in clusters[0].recalled_items] == ["m4", "m3"]
+    assert clusters[1].recalled_items == []
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from memos.dream.signal_store import (
+    DreamSignalStore,
+    InMemorySignalBackend,
+    RedisSignalBackend,
+    SQLiteSignalBackend,
+)
+
+
+class FakeRedis:
+    """Just enough of the redis-py client for RedisSignalBackend."""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.lists: dict[str, list[str]] = {}
+        self.lock = threading.Lock()
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def rpush(self, key, *values):
+        self.lists.setdefault(key, []).extend(values)
+        return len(self.lists[key])
+
+    def llen(self, key):
+        return len(self.lists.get(key, []))
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def lrange(self, key, start, end):
+        return list(self.lists.get(key, []))
+
+    def ltrim(self, key, start, end):
+        assert end == -1
+        self.lists[key] = self.lists.get(key, [])[start:]
+
+    def delete(self, *keys):
+        for key in keys:
+            self.hashes.pop(key, None)
+            self.lists.pop(key, None)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    def execute(self):
+        # MULTI/EXEC: queued commands run without interleaving
+        with self.client.lock:
+            return [
+                getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.calls
+            ]
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return InMemorySignalBackend(num_shards=4)
+    if request.param == "sqlite":
+        return SQLiteSignalBackend(tmp_path / "signals.db")
+    return RedisSignalBackend(FakeRedis())
+
+
+def test_record_add_triggers_once_per_threshold_crossing(backend):
+    store = DreamSignalStore(trigger_threshold=3, backend=backend)
+
+    assert store.record_add(mem_cube_id="cube", user_id="u1", memory_ids=["m1", "m2"]) is None
+    snapshot = store.record_add(
+        mem_cube_id="cube", user_name="alice", session_id="s1", memory_ids=["m3", "m4"]
+    )
+    assert snapshot is not None
+    assert snapshot.pending_memory_ids == ("m1", "m2", "m3", "m4")
+    assert (snapshot.user_id, snapshot.user_name, snapshot.session_id) == ("u1", "alice", "s1")
+    assert store.should_trigger(mem_cube_id="cube")
+
+    # already triggered for this batch; the next trigger needs another threshold of ids
+    assert store.record_add(mem_cube_id="cube", memory_ids=["m5"]) is None
+    assert store.record_add(mem_cube_id="cube", memory_ids=["m6"]) is not None
+
+    store.reset(mem_cube_id="cube")
+    assert not store.should_trigger(mem_cube_id="cube")
+    assert store.snapshot(mem_cube_id="cube").pending_memory_ids == ()
+    assert store.record_add(mem_cube_id="other", memory_ids=["x"]) is None
+
+
+def test_reset_with_snapshot_keeps_later_adds(backend):
+    store = DreamSignalStore(trigger_threshold=2, backend=backend)
+    snapshot = store.record_add(mem_cube_id="cube", user_name="alice", memory_ids=["m1", "m2"])
+    assert snapshot is not None
+
+    # added while the Dream run for ``snapshot`` is in flight
+    store.record_add(mem_cube_id="cube", memory_ids=["m3"])
+    store.reset(mem_cube_id="cube", snapshot=snapshot)
+
+    assert store.snapshot(mem_cube_id="cube").pending_memory_ids == ("m3",)
+    assert not store.should_trigger(mem_cube_id="cube")
+    assert store.record_add(mem_cube_id="cube", memory_ids=["m4"]) is not None
+
+
+def test_snapshot_is_immutable_and_records_metadata(backend):
+    store = DreamSignalStore(backend=backend)
+    store.record_add(mem_cube_id="cube", memory_ids=["m1"])
+
+    snapshot = store.snapshot(mem_cube_id="cube", user_id="u1")
+    assert snapshot.user_id == "u1"
+    with pytest.raises(Exception):  # noqa: B017
+        snapshot.user_id = "u2"
+
+    store.record_add(mem_cube_id="cube", memory_ids=["m2"])
+    assert snapshot.pending_memory_ids == ("m1",)
+    assert store.snapshot(mem_cube_id="cube").pending_memory_ids == ("m1", "m2")
+
+
+def test_in_memory_snapshots_are_shared_until_next_append():
+    store = DreamSignalStore(backend=InMemorySignalBackend())
+    store.record_add(mem_cube_id="cube", memory_ids=["m1"])
+
+    first = store.snapshot(mem_cube_id="cube")
+    assert store.snapshot(mem_cube_id="cube") is first
+    store.record_add(mem_cube_id="cube", memory_ids=["m2"])
+    assert store.snapshot(mem_cube_id="cube") is not first
+
+
+def test_concurrent_adds_trigger_exactly_once(backend):
+    store = DreamSignalStore(trigger_threshold=50, backend=backend)
+    triggered = []
+
+    def add(worker: int):
+        for i in range(10):
+            snapshot = store.record_add(mem_cube_id="cube", memory_ids=[f"{worker}-{i}"])
+            if snapshot is not None:
+                triggered.append(snapshot)
+
+    threads = [threading.Thread(target=add, args=(worker,)) for worker in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(triggered) == 1
+    assert len(triggered[0].pending_memory_ids) == 50
+
+
+def test_sqlite_signals_survive_reopen(tmp_path):
+    path = tmp_path / "signals.db"
+    DreamSignalStore(trigger_threshold=3, backend=SQLiteSignalBackend(path)).record_add(
+        mem_cube_id="cube", user_name="alice", memory_ids=["m1", "m2"]
+    )
+
+    store = DreamSignalStore(trigger_threshold=3, backend=SQLiteSignalBackend(path))
+    snapshot = store.record_add(mem_cube_id="cube", memory_ids=["m3"])
+    assert snapshot is not None
+    assert snapshot.user_name == "alice"
+    assert snapshot.pending_memory_ids == ("m1", "m2", "m3")
@@ -0,0 +1,59 @@
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from memos.embedders.batcher import EmbeddingBatcher, estimate_tokens
+
+
+def _embed_fn():
+    return MagicMock(side_effect=lambda texts: [[float(len(text))] for text in texts])
+
+
+def test_concurrent_calls_share_one_backend_batch():
+    embed_fn = _embed_fn()
+    batcher = EmbeddingBatcher(embed_fn, window_seconds=0.5, max_batch_size=8)
+    barrier = threading.Barrier(4)
+
+    def call(texts):
+        barrier.wait()
+        return batcher.embed(texts)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(call, [f"text-{i}", "shared"]) for i in range(4)]
+        results = [future.result(timeout=2) for future in futures]
+
+    assert results == [[[6.0], [6.0]]] * 4
+    embed_fn.assert_called_once()
+    assert sorted(embed_fn.call_args.args[0]) == ["shared", "text-0", "text-1", "text-2", "text-3"]
+    assert batcher.stats()["batcher_requests"] == 4
+
+
+def test_batches_respect_size_and_token_limits():
+    embed_fn = _embed_fn()
+    batcher = EmbeddingBatcher(embed_fn, window_seconds=0.0, max_batch_size=2, max_batch_tokens=4)
+
+    assert batcher.embed(["a" * 40]) == [[40.0]]
+    assert batcher.embed(["a", "bb", "ccc"]) == [[1.0], [2.0], [3.0]]
+    assert embed_fn.call_count == 2
+    assert estimate_tokens("记忆") == 2 + 1
+
+
+def test_backend_error_reaches_every_caller_in_batch():
+    release = threading.Event()
+
+    def failing(texts):
+        release.wait(timeout=2)
+        raise ValueError("provider down")
+
+    batcher = EmbeddingBatcher(failing, window_seconds=0.1)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(batcher.embed, [text]) for text in ("a", "b")]
+        release.set()
+        for future in futures:
+            with pytest.raises(ValueError, match="provider down"):
+                future.result(timeout=2)
+
+    assert batcher.stats()["batcher_queued"] == 0
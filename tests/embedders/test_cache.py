@@ -13,6 +13,7 @@ import pytest
 from memos.configs.embedder import EmbedderConfigFactory
 from memos.context.context import RequestContext, set_request_context
 from memos.embedders.cache import CachingEmbedder
+from memos.embedders.cache_store import SQLiteEmbeddingCacheStore, embedding_cache_key
 from memos.embedders.factory import EmbedderFactory
 
 
@@ -95,6 +96,32 @@ def test_short_ttl_cache_reuses_text_across_requests(monkeypatch):
     assert embedder.cache_info()["ttl_hits"] == 1
 
 
+def test_quantized_in_process_tiers(monkeypatch):
+    _enable_optimization(monkeypatch, ttl_seconds="60")
+    monkeypatch.setenv("MEMOS_EMBEDDING_QUANTIZATION", "float16")
+    backend = _backend()
+    embedder = CachingEmbedder(backend)
+
+    first = embedder.embed(["same"])
+    second = embedder.embed(["same"])
+
+    assert first == second == [[4.0, 0.0]]
+    backend.embed.assert_called_once_with(["same"])
+    assert type(embedder._cache["same"]).__name__ == "QuantizedEmbedding"
+
+
+def test_quantized_miss_returns_full_precision(monkeypatch):
+    _enable_optimization(monkeypatch, ttl_seconds="60")
+    monkeypatch.setenv("MEMOS_EMBEDDING_QUANTIZATION", "int8")
+    backend = _backend(side_effect=lambda texts: [[0.1234567, -1.0] for _ in texts])
+    embedder = CachingEmbedder(backend)
+
+    assert embedder.embed(["same"]) == [[0.1234567, -1.0]]
+    hit = embedder.embed(["same"])[0]
+    assert hit != [0.1234567, -1.0]
+    assert hit == pytest.approx([0.1234567, -1.0], abs=1e-2)
+
+
 def test_partial_cache_hit_preserves_input_order(monkeypatch):
     _enable_optimization(monkeypatch, ttl_seconds="60")
     backend = _backend()
@@ -168,6 +195,102 @@ def test_backend_failure_is_not_cached(monkeypatch):
     assert backend.embed.call_count == 2
 
 
+def test_batch_window_coalesces_concurrent_misses(monkeypatch):
+    _enable_optimization(monkeypatch)
+    monkeypatch.setenv("MEMOS_EMBEDDING_BATCH_WINDOW_MS", "500")
+    monkeypatch.setenv("MEMOS_EMBEDDING_BATCH_MAX_SIZE", "3")
+    backend = _backend()
+    embedder = CachingEmbedder(backend)
+    barrier = threading.Barrier(3)
+
+    def embed_after_barrier(text):
+        barrier.wait()
+        return embedder.embed([text])
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(embed_after_barrier, ["a", "bb", "ccc"]))
+
+    assert [result[0][0] for result in results] == [1.0, 2.0, 3.0]
+    backend.embed.assert_called_once()
+    info = embedder.cache_info()
+    assert info["batcher_requests"] == 3
+    assert info["batcher_batches"] == 1
+
+
+def test_persistent_store_survives_restart(monkeypatch, tmp_path):
+    _enable_optimization(monkeypatch)
+    monkeypatch.setenv("MEMOS_EMBEDDING_PERSISTENT_CACHE_PATH", str(tmp_path / "emb.db"))
+    first_backend = _backend()
+    CachingEmbedder(first_backend).embed(["same", "other"])
+
+    second_backend = _backend()
+    embedder = CachingEmbedder(second_backend)
+    result = embedder.embed(["other", "new", "same"])
+
+    assert result == [[5.0, 1.0], [3.0, 0.0], [4.0, 0.0]]
+    second_backend.embed.assert_called_once_with(["new"])
+    info = embedder.cache_info()
+    assert info["persistent_hits"] == 2
+    assert info["persistent_writes"] == 1
+    assert info["misses"] == 1
+    assert info["persistent_cache_size"] == 3
+
+
+def test_persistent_store_is_namespaced_by_model(monkeypatch):
+    _enable_optimization(monkeypatch)
+    store = SQLiteEmbeddingCacheStore(":memory:")
+    CachingEmbedder(_backend(), persistent_store=store).embed(["same"])
+
+    other_backend = _backend()
+    other_backend.config = SimpleNamespace(model_name_or_path="other-model", embedding_dims=2)
+    CachingEmbedder(other_backend, persistent_store=store).embed(["same"])
+
+    other_backend.embed.assert_called_once_with(["same"])
+    assert embedding_cache_key("embedding-model", None, "same") != embedding_cache_key(
+        "other-model", 2, "same"
+    )
+
+
+def test_persistent_store_failure_falls_back_to_backend(monkeypatch):
+    _enable_optimization(monkeypatch)
+    store = MagicMock()
+    store.get_many.side_effect = OSError("disk gone")
+    store.set_many.side_effect = OSError("disk gone")
+    backend = _backend()
+    embedder = CachingEmbedder(backend, persistent_store=store)
+
+    assert embedder.embed(["same"]) == [[4.0, 0.0]]
+    assert embedder.cache_info()["persistent_errors"] == 2
+
+
+def test_sqlite_store_float16_and_eviction():
+    store = SQLiteEmbeddingCacheStore(":memory:", max_entries=3, dtype="float16", evict_ratio=1.0)
+    store.set_many({"b": [0.1, 0.2]})
+    store.set_many({"a": [0.5, 1.0]})
+    assert store.get_many(["b"])["b"] == pytest.approx((0.1, 0.2), abs=1e-3)
+    assert store.get_many(["a", "missing"]) == {"a": (0.5, 1.0)}
+
+    store.set_many({"c": [1.0], "d": [1.0]})
+
+    assert len(store) == 3
+    assert set(store.get_many(["a", "b", "c", "d"])) == {"a", "c", "d"}
+    store.clear()
+    assert len(store) == 0
+
+
+def test_sqlite_store_refreshes_access_time_lazily():
+    store = SQLiteEmbeddingCacheStore(":memory:")
+    store.set_many({"a": [1.0], "b": [2.0]})
+    writes = store._conn.total_changes
+
+    assert set(store.get_many(["a", "b"])) == {"a", "b"}
+    assert store._conn.total_changes == writes
+
+    store.touch_interval = 0.0
+    store.get_many(["a", "b"])
+    assert store._conn.total_changes == writes + 2
+
+
 def test_factory_wraps_remote_embedder_when_enabled(monkeypatch):
     _enable_optimization(monkeypatch)
     backend = _backend()
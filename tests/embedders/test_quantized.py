@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from memos.embedders.quantized import (
+    QuantizedEmbedding,
+    embedding_matrix,
+    embedding_quantization,
+    quantize_embedding,
+)
+from memos.memories.textual.item import TextualMemoryItem, TreeNodeTextualMemoryMetadata
+from memos.memories.textual.tree_text_memory.retrieve.retrieve_utils import (
+    cosine_similarity_matrix,
+)
+
+
+def _vectors(count=8, dims=256):
+    return np.random.default_rng(0).normal(size=(count, dims)).tolist()
+
+
+@pytest.mark.parametrize("mode, max_bytes", [("float16", 2), ("int8", 1)])
+def test_quantized_vectors_are_compact_and_close(mode, max_bytes):
+    vector = _vectors(1)[0]
+    quantized = QuantizedEmbedding.from_vector(vector, mode)
+
+    assert quantized.nbytes == len(vector) * max_bytes
+    assert len(quantized) == len(vector)
+    np.testing.assert_allclose(quantized.to_numpy(), vector, atol=0.03)
+    assert QuantizedEmbedding.from_bytes(quantized.to_bytes()) == quantized
+
+
+def test_cosine_similarity_matches_float_lists():
+    vectors = _vectors()
+    quantized = [QuantizedEmbedding.from_vector(v, "int8") for v in vectors]
+
+    np.testing.assert_allclose(
+        cosine_similarity_matrix(quantized), cosine_similarity_matrix(vectors), atol=0.01
+    )
+    mixed = [quantized[0], vectors[1], np.asarray(vectors[2])]
+    assert embedding_matrix(mixed).shape == (3, 256)
+    assert embedding_matrix(mixed).dtype == np.float32
+
+
+def test_metadata_serializes_quantized_embedding_as_list():
+    quantized = QuantizedEmbedding.from_vector([0.5, -1.0, 0.25], "float16")
+    item = TextualMemoryItem(
+        memory="hello", metadata=TreeNodeTextualMemoryMetadata(embedding=quantized)
+    )
+
+    assert item.metadata.embedding is quantized
+    assert item.model_dump()["metadata"]["embedding"] == [0.5, -1.0, 0.25]
+    restored = TextualMemoryItem.model_validate_json(item.model_dump_json())
+    assert restored.metadata.embedding == [0.5, -1.0, 0.25]
+
+
+def test_quantization_mode_from_env(monkeypatch):
+    monkeypatch.delenv("MEMOS_EMBEDDING_QUANTIZATION", raising=False)
+    assert embedding_quantization() is None
+    assert quantize_embedding([1.0, 2.0]) == [1.0, 2.0]
+
+    monkeypatch.setenv("MEMOS_EMBEDDING_QUANTIZATION", "int8")
+    assert isinstance(quantize_embedding([1.0, 2.0]), QuantizedEmbedding)
+
+    monkeypatch.setenv("MEMOS_EMBEDDING_QUANTIZATION", "int4")
+    assert embedding_quantization() is None
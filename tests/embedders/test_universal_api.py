@@ -1,7 +1,9 @@
 """Tests for UniversalAPIEmbedder."""
 
+import asyncio
+
 from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
@@ -249,3 +251,26 @@ class TestUniversalAPIEmbedderFallback:
         assert "dimensions" not in mock_create.call_args.kwargs
         assert mock_create.call_args.kwargs["timeout"] == 5
         assert result == [[0.1]]
+
+
+class TestUniversalAPIEmbedderAsync:
+    def test_aembed_retries_without_dimensions_on_async_client(self):
+        embedder = UniversalAPIEmbedder(_make_config(embedding_dims=256))
+        async_client = MagicMock()
+        async_client.embeddings.create = AsyncMock(
+            side_effect=[
+                _bad_request_error("dimensions is not supported"),
+                _mock_embedding_response(),
+            ]
+        )
+
+        with patch(
+            "memos.embedders.universal_api.get_shared_async_openai_client",
+            return_value=async_client,
+        ):
+            result = asyncio.run(embedder.aembed(["hello"]))
+
+        assert result == [[0.1, 0.2]]
+        first, second = async_client.embeddings.create.call_args_list
+        assert first.kwargs["dimensions"] == 256
+        assert "dimensions" not in second.kwargs
@@ -0,0 +1,143 @@
+import json
+
+import pytest
+
+from memos.configs.graph_db import SQLiteGraphDBConfig
+from memos.graph_dbs.export_stream import (
+    EMBEDDINGS_FILE,
+    NODES_FILE,
+    export_graph_stream,
+    import_graph_stream,
+    is_graph_stream,
+)
+from memos.graph_dbs.sqlite import SQLiteGraphDB
+
+
+def _meta(i):
+    return {
+        "memory_type": "LongTermMemory",
+        "status": "activated",
+        "embedding": [float(i), 1.0, 0.0],
+        "tags": [f"t{i}"],
+    }
+
+
+@pytest.fixture
+def source_db():
+    db = SQLiteGraphDB(SQLiteGraphDBConfig(user_name="alice", embedding_dimension=3))
+    for i in range(7):
+        db.add_node(f"n{i}", f"memory {i}", _meta(i))
+    db.add_node("gone", "deleted", {**_meta(9), "status": "deleted"})
+    for i in range(6):
+        db.add_edge(f"n{i}", f"n{i + 1}", "RELATE_TO")
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def target_db():
+    db = SQLiteGraphDB(SQLiteGraphDBConfig(user_name="bob", embedding_dimension=3))
+    yield db
+    db.close()
+
+
+def _snapshot(db, user_name):
+    data = db.export_graph(include_embedding=True, user_name=user_name)
+    nodes = {
+        n["id"]: (n["memory"], n["metadata"]["embedding"], n["metadata"]["tags"])
+        for n in data["nodes"]
+    }
+    edges = sorted((e["source"], e["target"], e["type"]) for e in data["edges"])
+    return nodes, edges
+
+
+def test_export_pages_match_export_graph(source_db):
+    pages = list(source_db.iter_export_nodes(page_size=3))
+    assert [len(page) for page in pages] == [3, 3, 1]
+    ids = [node["id"] for page in pages for node in page]
+    assert ids == sorted(ids) and "gone" not in ids
+
+    resumed = list(source_db.iter_export_nodes(page_size=3, after_id="n3"))
+    assert [node["id"] for page in resumed for node in page] == ["n4", "n5", "n6"]
+
+    edges = [e for page in source_db.iter_export_edges(page_size=4) for e in page]
+    assert len(edges) == 6
+
+
+def test_stream_round_trip_with_embedding_matrix(source_db, target_db, tmp_path):
+    manifest = export_graph_stream(
+        source_db, str(tmp_path), include_embedding=True, user_name="alice", page_size=3
+    )
+    assert is_graph_stream(str(tmp_path))
+    assert manifest["nodes"]["count"] == 7 and manifest["edges"]["count"] == 6
+    assert manifest["embedding_dim"] == 3 and manifest["embedding_rows"] == 7
+    assert (tmp_path / EMBEDDINGS_FILE).stat().st_size == 7 * 3 * 4
+    first = json.loads((tmp_path / NODES_FILE).read_text().splitlines()[0])
+    assert "embedding" not in first["metadata"] and first["embedding_row"] == 0
+
+    result = import_graph_stream(target_db, str(tmp_path), user_name="bob", page_size=2)
+    assert result == {"nodes": 7, "edges": 6}
+    assert _snapshot(target_db, "bob") == _snapshot(source_db, "alice")
+
+    # A finished import leaves no progress behind, so a later import runs in full.
+    assert not list(tmp_path.glob("import_progress*"))
+    other = SQLiteGraphDB(SQLiteGraphDBConfig(user_name="carol", embedding_dimension=3))
+    try:
+        assert import_graph_stream(other, str(tmp_path), user_name="carol", resume=True) == {
+            "nodes": 7,
+            "edges": 6,
+        }
+    finally:
+        other.close()
+
+
+def test_interrupted_import_resumes_only_for_the_same_target(source_db, target_db, tmp_path):
+    export_graph_stream(source_db, str(tmp_path), include_embedding=True, user_name="alice")
+    original = target_db.add_edge
+    calls = []
+
+    def failing_add_edge(*args, **kwargs):
+        calls.append(args)
+        if len(calls) == 3:
+            raise RuntimeError("connection lost")
+        return original(*args, **kwargs)
+
+    target_db.add_edge = failing_add_edge
+    with pytest.raises(RuntimeError):
+        import_graph_stream(target_db, str(tmp_path), user_name="bob", page_size=2)
+    target_db.add_edge = original
+    assert len(list(tmp_path.glob("import_progress*"))) == 1
+
+    # another cube starts from scratch and does not consume bob's progress
+    other = SQLiteGraphDB(SQLiteGraphDBConfig(user_name="dave", embedding_dimension=3))
+    try:
+        assert import_graph_stream(other, str(tmp_path), user_name="dave")["nodes"] == 7
+    finally:
+        other.close()
+    resumed = import_graph_stream(target_db, str(tmp_path), user_name="bob", resume=True)
+    assert resumed["nodes"] == 0
+    assert _snapshot(target_db, "bob") == _snapshot(source_db, "alice")
+    assert not list(tmp_path.glob("import_progress*"))
+
+
+def test_interrupted_export_resumes_from_last_page(source_db, target_db, tmp_path):
+    original = source_db.iter_export_nodes
+
+    def failing_pages(**kwargs):
+        pages = original(**kwargs)
+        yield next(pages)
+        raise RuntimeError("connection lost")
+
+    source_db.iter_export_nodes = failing_pages
+    with pytest.raises(RuntimeError):
+        export_graph_stream(source_db, str(tmp_path), include_embedding=True, page_size=3)
+    with pytest.raises(ValueError):
+        import_graph_stream(target_db, str(tmp_path))
+
+    source_db.iter_export_nodes = original
+    manifest = export_graph_stream(source_db, str(tmp_path), include_embedding=True, page_size=3)
+    assert manifest["nodes"]["count"] == 7
+    assert len((tmp_path / NODES_FILE).read_text().splitlines()) == 7
+
+    import_graph_stream(target_db, str(tmp_path), user_name="bob")
+    assert _snapshot(target_db, "bob") == _snapshot(source_db, "alice")
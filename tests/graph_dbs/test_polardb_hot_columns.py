@@ -0,0 +1,129 @@
+import threading
+import weakref
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from memos.graph_dbs.polardb import HOT_FILTER_FIELDS, PolarDBGraphDB
+
+
+def _executed(cursor) -> list[str]:
+    return [" ".join(c.args[0].split()) for c in cursor.execute.call_args_list]
+
+
+@pytest.fixture
+def polardb():
+    with patch.object(PolarDBGraphDB, "__init__", return_value=None):
+        db = PolarDBGraphDB.__new__(PolarDBGraphDB)
+    db.db_name = "test_db"
+    db.config = {"user_name": "default_user"}
+    return db
+
+
+@pytest.fixture
+def cursor(polardb):
+    cursor = MagicMock()
+    cursor.fetchall.return_value = []
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+
+    @contextmanager
+    def fake_connection():
+        yield conn
+
+    polardb._get_connection = fake_connection
+    return cursor
+
+
+def test_filters_use_property_access_by_default(polardb):
+    conditions = polardb._build_filter_conditions_sql({"and": [{"memory_type": "LongTermMemory"}]})
+
+    expected = (
+        "agtype_access_operator(properties, '\"memory_type\"'::agtype) = '\"LongTermMemory\"'"
+    )
+    assert len(conditions) == 1
+    assert expected in conditions[0]
+
+
+def test_filters_use_hot_columns_when_enabled(polardb):
+    polardb._hot_filter_columns = True
+
+    conditions = polardb._build_filter_conditions_sql(
+        {
+            "and": [
+                {"status": {"in": ["activated", "archived"]}},
+                {"session_id": "s'1"},
+                {"info.source": "chat"},
+            ]
+        }
+    )
+    user_conditions = polardb._build_user_name_and_kb_ids_conditions_sql(
+        user_name="alice", knowledgebase_ids=["kb1"]
+    )
+
+    assert conditions[0] == "((hot_status = 'activated' OR hot_status = 'archived'))"
+    assert conditions[1] == "(hot_session_id = 's''1')"
+    # fields without a hot column keep the agtype lookup
+    assert "agtype_access_operator(VARIADIC ARRAY[properties, '\"info\"'" in conditions[2]
+    assert user_conditions == ["hot_user_name = 'alice'", "hot_user_name = 'kb1'"]
+
+
+def test_search_by_embedding_filters_on_hot_columns(polardb, cursor):
+    polardb._hot_filter_columns = True
+
+    polardb.search_by_embedding(vector=[0.1] * 1024, user_name="alice", scope="LongTermMemory")
+
+    query = cursor.execute.call_args[0][0]
+    assert "hot_memory_type = 'LongTermMemory'" in query
+    assert "hot_status = 'activated'" in query
+    assert "hot_user_name = 'alice'" in query
+    assert "'\"status\"'::agtype" not in query
+
+
+def test_ensure_hot_filter_columns_creates_columns_and_indexes(polardb, cursor):
+    polardb.ensure_hot_filter_columns()
+
+    statements = _executed(cursor)
+    for field in HOT_FILTER_FIELDS:
+        assert any(
+            f"ADD COLUMN IF NOT EXISTS hot_{field} TEXT GENERATED ALWAYS AS "
+            f"(ag_catalog.agtype_object_field_text(properties, '{field}')) STORED" in statement
+            for statement in statements
+        )
+        assert (
+            f'CREATE INDEX IF NOT EXISTS idx_memory_hot_{field} ON "test_db_graph"."Memory" (hot_{field});'
+            in statements
+        )
+    assert "(hot_user_name, hot_memory_type, hot_status)" in statements[-1]
+
+
+@pytest.mark.parametrize("skip_health_check", [False, True])
+def test_session_state_is_set_once_per_pooled_connection(polardb, skip_health_check):
+    class Connection:
+        def __init__(self):
+            self.cursor_obj = MagicMock()
+            self.autocommit = False
+
+        def cursor(self):
+            cursor = MagicMock()
+            cursor.__enter__.return_value = self.cursor_obj
+            return cursor
+
+    conn = Connection()
+    polardb._connection_wait_timeout = 1
+    polardb._skip_connection_health_check = skip_health_check
+    polardb._semaphore = threading.BoundedSemaphore(1)
+    polardb._initialized_connections = weakref.WeakSet()
+    polardb.connection_pool = MagicMock()
+    polardb.connection_pool.getconn.return_value = conn
+
+    for _ in range(3):
+        with polardb._get_connection() as checked_out:
+            assert checked_out is conn
+
+    statements = _executed(conn.cursor_obj)
+    assert statements[0].startswith("SET search_path = test_db_graph")
+    assert statements[1:] == ([] if skip_health_check else ["SELECT 1", "SELECT 1"])
+    assert conn.autocommit is True
@@ -0,0 +1,168 @@
+import threading
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from memos.configs.graph_db import PostgresGraphDBConfig
+from memos.graph_dbs import postgres as postgres_module
+from memos.graph_dbs.postgres import PostgresGraphDB, _ConnectionPool, _to_positional
+
+
+def _fake_connection():
+    conn = MagicMock()
+    conn.closed = 0
+    return conn
+
+
+def _executed(conn) -> list[str]:
+    cur = conn.cursor.return_value.__enter__.return_value
+    return [" ".join(c.args[0].split()) for c in cur.execute.call_args_list]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(postgres_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_pool_pings_only_connections_idle_past_threshold(clock):
+    pool = _ConnectionPool(
+        _fake_connection, minconn=1, maxconn=2, wait_timeout=1, health_check_idle_seconds=30
+    )
+    conn = pool.getconn()
+    pool.putconn(conn)
+    assert pool.getconn() is conn
+    assert _executed(conn) == []
+
+    pool.putconn(conn)
+    clock[0] += 31
+    assert pool.getconn() is conn
+    assert _executed(conn) == ["SELECT 1"]
+    assert pool.stats()["pings"] == 1
+
+
+def test_pool_discards_dead_connections_and_keeps_returned_ones_open(clock):
+    pool = _ConnectionPool(
+        _fake_connection, minconn=0, maxconn=3, wait_timeout=1, health_check_idle_seconds=30
+    )
+    conns = [pool.getconn() for _ in range(3)]
+    for conn in conns:
+        pool.putconn(conn)
+    stats = pool.stats()
+    assert (stats["size"], stats["idle"], stats["opened"]) == (3, 3, 3)
+    assert not any(conn.close.called for conn in conns)
+
+    conns[-1].closed = 1
+    fresh = pool.getconn()
+    assert fresh is conns[1]
+    assert pool.stats()["discarded"] == 1
+
+
+def test_pool_waits_for_returned_connection_then_times_out():
+    pool = _ConnectionPool(
+        _fake_connection, minconn=0, maxconn=1, wait_timeout=5, health_check_idle_seconds=30
+    )
+    conn = pool.getconn()
+    timer = threading.Timer(0.1, pool.putconn, args=(conn,))
+    timer.start()
+    assert pool.getconn() is conn
+    timer.join()
+    assert pool.stats()["waits"] == 1
+
+    pool.wait_timeout = 0.05
+    with pytest.raises(RuntimeError, match="exhausted"):
+        pool.getconn()
+    assert pool.stats()["timeouts"] == 1
+
+
+def test_to_positional_numbers_placeholders():
+    sql, count = _to_positional("SELECT 1 WHERE a = %s AND b LIKE 'x%%' AND c = ANY(%s)")
+    assert sql == "SELECT 1 WHERE a = $1 AND b LIKE 'x%' AND c = ANY($2)"
+    assert count == 2
+
+
+@pytest.fixture
+def graph_db():
+    config = PostgresGraphDBConfig(
+        host="localhost", user="u", password="p", db_name="db", user_name="alice", minconn=1
+    )
+    with patch("psycopg2.connect", side_effect=lambda **kwargs: _fake_connection()):
+        db = PostgresGraphDB(config)
+    yield db
+    db.close()
+
+
+def test_get_conn_retries_broken_connections_but_not_exhaustion(graph_db):
+    import psycopg2
+
+    graph_db.pool.maxconn, graph_db.pool.wait_timeout = 1, 0.01
+    with patch.object(graph_db.pool, "getconn", wraps=graph_db.pool.getconn) as getconn:
+        held = graph_db._get_conn()
+        with pytest.raises(RuntimeError, match="exhausted"):
+            graph_db._get_conn()
+        assert getconn.call_count == 2
+    graph_db._put_conn(held)
+
+    broken = _fake_connection()
+    type(broken).autocommit = property(
+        fset=MagicMock(side_effect=psycopg2.InterfaceError("connection already closed"))
+    )
+    with (
+        patch.object(graph_db.pool, "getconn", side_effect=[broken, held]),
+        patch.object(postgres_module.time, "sleep"),
+    ):
+        assert graph_db._get_conn() is held
+    broken.close.assert_called_once()
+
+
+def test_hot_queries_are_prepared_once_per_connection(graph_db):
+    conn = graph_db._get_conn()
+    graph_db._put_conn(conn)
+    conn.cursor.return_value.__enter__.return_value.execute.reset_mock()
+
+    graph_db.get_nodes(["a", "b"])
+    graph_db.get_nodes(["c"])
+
+    executed = _executed(conn)
+    assert len(executed) == 3
+    assert executed[0].startswith("PREPARE memos_")
+    assert "WHERE id = ANY($1) AND user_name = $2" in executed[0]
+    name = executed[0].split()[1]
+    assert executed[1:] == [f"EXECUTE {name} (%s, %s)"] * 2
+    assert graph_db.pool_stats()["prepared_statements"] == 1
+
+
+def test_add_nodes_batch_upserts_in_one_checkout(graph_db):
+    nodes = [
+        {"id": "n1", "memory": "one", "metadata": {"embedding": [1, 0]}},
+        {"id": "n2", "memory": "two", "metadata": {}},
+        {"id": "n1", "memory": "one again", "metadata": {"embedding": [0, 1]}},
+    ]
+    checkouts = graph_db.pool_stats()["checkouts"]
+    with patch("psycopg2.extras.execute_values") as execute_values:
+        graph_db.add_nodes_batch(nodes)
+
+    assert graph_db.pool_stats()["checkouts"] == checkouts + 1
+    assert execute_values.call_count == 2
+    (with_embedding_call, without_embedding_call) = execute_values.call_args_list
+    rows = with_embedding_call.args[2]
+    assert [(row[0], row[1], row[3]) for row in rows] == [("n1", "one again", [0.0, 1.0])]
+    assert with_embedding_call.kwargs["template"] == "(%s, %s, %s, %s::vector, %s, %s, %s)"
+    assert [row[:2] for row in without_embedding_call.args[2]] == [("n2", "two")]
+
+
+def test_search_batch_runs_one_lateral_query(graph_db):
+    conn = graph_db._get_conn()
+    graph_db._put_conn(conn)
+    cur = conn.cursor.return_value.__enter__.return_value
+    cur.execute.reset_mock()
+    cur.fetchall.return_value = [(1, "a", 0.9), (1, "b", 0.4), (2, "c", 0.8)]
+
+    results = graph_db.search_batch([[1.0, 0.0], [0.0, 1.0], [0.5, 0.5]], top_k=2, threshold=0.5)
+
+    assert results == [[{"id": "a", "score": 0.9}], [{"id": "c", "score": 0.8}], []]
+    executed = _executed(conn)
+    assert len(executed) == 2
+    assert "CROSS JOIN LATERAL" in executed[0]
@@ -373,3 +373,16 @@ class TestNeo4jCommunitySearchReturnFields:
         query = session_mock.run.call_args[0][0]
         assert "memory}" not in query
         assert "n.valid_field AS valid_field" in query
+
+    def test_search_by_embedding_skips_vectors_and_payloads(self, neo4j_community_db):
+        """Vector DB hits are only used for id and score, so nothing else is fetched."""
+        neo4j_community_db.config = MagicMock(user_name="alice")
+        neo4j_community_db.vec_db = MagicMock()
+        neo4j_community_db.vec_db.search.return_value = [MagicMock(id="node-1", score=0.9)]
+
+        results = neo4j_community_db.search_by_embedding([0.1, 0.2], top_k=3)
+
+        assert results == [{"id": "node-1", "score": 0.9}]
+        kwargs = neo4j_community_db.vec_db.search.call_args.kwargs
+        assert kwargs["return_vector"] is False
+        assert kwargs["payload_fields"] == []
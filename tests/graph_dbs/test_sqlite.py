@@ -0,0 +1,209 @@
+import pytest
+
+from memos.configs.graph_db import GraphDBConfigFactory, SQLiteGraphDBConfig
+from memos.graph_dbs.factory import GraphStoreFactory
+from memos.graph_dbs.sqlite import SQLiteGraphDB
+
+
+def _meta(memory_type="LongTermMemory", embedding=(1.0, 0.0, 0.0), **extra):
+    meta = {
+        "memory_type": memory_type,
+        "status": "activated",
+        "embedding": list(embedding),
+        "tags": ["work"],
+    }
+    meta.update(extra)
+    return meta
+
+
+@pytest.fixture
+def graph_db():
+    db = SQLiteGraphDB(SQLiteGraphDBConfig(user_name="alice", embedding_dimension=3))
+    yield db
+    db.close()
+
+
+def test_factory_creates_sqlite_backend():
+    config = GraphDBConfigFactory(
+        backend="sqlite", config={"user_name": "alice", "embedding_dimension": 3}
+    )
+    db = GraphStoreFactory.from_config(config)
+    assert isinstance(db, SQLiteGraphDB)
+
+
+def test_add_get_update_delete_node(graph_db):
+    graph_db.add_node("n1", "hello world", _meta(sources=[{"type": "chat"}]))
+
+    node = graph_db.get_node("n1")
+    assert node["memory"] == "hello world"
+    assert node["metadata"]["memory_type"] == "LongTermMemory"
+    assert node["metadata"]["sources"] == [{"type": "chat"}]
+    assert "embedding" not in node["metadata"]
+    assert graph_db.get_node("n1", include_embedding=True)["metadata"]["embedding"] == [
+        1.0,
+        0.0,
+        0.0,
+    ]
+
+    graph_db.update_node("n1", {"memory": "updated", "status": "archived"})
+    node = graph_db.get_node("n1", include_embedding=True)
+    assert node["memory"] == "updated"
+    assert node["metadata"]["status"] == "archived"
+    assert node["metadata"]["embedding"] == [1.0, 0.0, 0.0]
+
+    graph_db.delete_node("n1")
+    assert graph_db.get_node("n1") is None
+    assert graph_db.search_by_embedding([1.0, 0.0, 0.0], status="archived") == []
+
+
+def test_user_isolation(graph_db):
+    graph_db.add_node("a", "alice memory", _meta())
+    graph_db.add_node("b", "bob memory", _meta(), user_name="bob")
+
+    assert graph_db.get_node("b") is None
+    assert graph_db.get_node("b", user_name="bob")["memory"] == "bob memory"
+    assert [r["id"] for r in graph_db.search_by_embedding([1.0, 0.0, 0.0], top_k=5)] == ["a"]
+    hits = graph_db.search_by_embedding([1.0, 0.0, 0.0], top_k=5, knowledgebase_ids=["bob"])
+    assert {r["id"] for r in hits} == {"a", "b"}
+
+
+def test_search_by_embedding_filters_and_ranks(graph_db):
+    graph_db.add_nodes_batch(
+        [
+            {"id": "x", "memory": "x", "metadata": _meta(embedding=(1.0, 0.0, 0.0))},
+            {"id": "y", "memory": "y", "metadata": _meta(embedding=(0.6, 0.8, 0.0))},
+            {
+                "id": "w",
+                "memory": "w",
+                "metadata": _meta("WorkingMemory", embedding=(1.0, 0.0, 0.0)),
+            },
+        ]
+    )
+
+    results = graph_db.search_by_embedding(
+        [1.0, 0.0, 0.0], top_k=2, scope="LongTermMemory", return_fields=["memory"]
+    )
+    assert [r["id"] for r in results] == ["x", "y"]
+    assert results[0]["score"] == pytest.approx(1.0)
+    assert results[1]["memory"] == "y"
+
+    above = graph_db.search_by_embedding([1.0, 0.0, 0.0], top_k=5, threshold=0.9)
+    assert {r["id"] for r in above} == {"x", "w"}
+    filtered = graph_db.search_by_embedding(
+        [1.0, 0.0, 0.0], top_k=5, filter={"and": [{"tags": {"contains": "work"}}, {"id": "y"}]}
+    )
+    assert [r["id"] for r in filtered] == ["y"]
+
+
+def test_get_by_metadata_and_grouped_counts(graph_db):
+    graph_db.add_node("a", "a", _meta(tags=["ai", "ml"], confidence=90))
+    graph_db.add_node("b", "b", _meta(tags=["db"], confidence=50))
+    graph_db.add_node("c", "c", _meta("WorkingMemory"))
+
+    assert graph_db.get_by_metadata([{"field": "tags", "op": "contains", "value": "ai"}]) == ["a"]
+    assert graph_db.get_by_metadata([{"field": "confidence", "op": ">=", "value": 80}]) == ["a"]
+    assert sorted(
+        graph_db.get_by_metadata([{"field": "memory_type", "op": "=", "value": "LongTermMemory"}])
+    ) == ["a", "b"]
+
+    counts = {r["memory_type"]: r["count"] for r in graph_db.get_grouped_counts(["memory_type"])}
+    assert counts == {"LongTermMemory": 2, "WorkingMemory": 1}
+    assert graph_db.get_memory_count("WorkingMemory") == 1
+
+
+def test_edges_subgraph_and_candidates(graph_db):
+    for node_id in ("p", "c1", "c2", "lonely"):
+        graph_db.add_node(node_id, node_id, _meta())
+    graph_db.add_edge("p", "c1", "PARENT")
+    graph_db.add_edge("p", "c2", "PARENT")
+    graph_db.add_edge("c1", "missing", "PARENT")
+
+    assert graph_db.edge_exists("p", "c1", "PARENT")
+    assert graph_db.edge_exists("c1", "p", "ANY", direction="ANY")
+    assert not graph_db.edge_exists("c1", "missing", "PARENT")
+    assert {e["to"] for e in graph_db.get_edges("p", type="PARENT", direction="OUTGOING")} == {
+        "c1",
+        "c2",
+    }
+
+    subgraph = graph_db.get_subgraph("c1", depth=2)
+    assert subgraph["core_node"]["id"] == "c1"
+    assert {n["id"] for n in subgraph["neighbors"]} == {"p", "c2"}
+    assert len(subgraph["edges"]) == 2
+
+    candidates = graph_db.get_structure_optimization_candidates("LongTermMemory")
+    assert [n["id"] for n in candidates] == ["lonely"]
+
+    graph_db.delete_node("p")
+    assert graph_db.get_edges("c1") == []
+
+
+def test_remove_oldest_memory_and_fulltext(graph_db):
+    for i in range(5):
+        graph_db.add_node(
+            f"w{i}",
+            f"working note {i}",
+            _meta("WorkingMemory", updated_at=f"2025-01-0{i + 1}T00:00:00"),
+        )
+    graph_db.remove_oldest_memory("WorkingMemory", keep_latest=2)
+    remaining = graph_db.get_all_memory_items("WorkingMemory")
+    assert sorted(n["id"] for n in remaining) == ["w3", "w4"]
+
+    hits = graph_db.search_by_fulltext(["note", "4"], top_k=5)
+    assert hits[0] == {"id": "w4", "score": 1.0}
+
+
+def test_export_import_roundtrip_and_persistence(tmp_path):
+    path = str(tmp_path / "graph.db")
+    config = SQLiteGraphDBConfig(db_path=path, user_name="alice", embedding_dimension=3)
+    db = SQLiteGraphDB(config)
+    db.add_node("a", "a", _meta())
+    db.add_node("b", "b", _meta(embedding=(0.0, 1.0, 0.0)))
+    db.add_edge("a", "b", "RELATE_TO")
+    exported = db.export_graph(include_embedding=True)
+    db.close()
+
+    assert exported["total_nodes"] == 2
+    assert exported["edges"] == [{"source": "a", "target": "b", "type": "RELATE_TO"}]
+
+    reopened = SQLiteGraphDB(config)
+    assert reopened.search_by_embedding([0.0, 1.0, 0.0], top_k=1)[0]["id"] == "b"
+    reopened.clear()
+    assert reopened.get_nodes(["a", "b"]) == []
+    reopened.import_graph(exported)
+    assert reopened.edge_exists("a", "b", "RELATE_TO")
+    assert reopened.search_by_embedding([0.0, 1.0, 0.0], top_k=1)[0]["id"] == "b"
+    reopened.close()
+
+
+def test_search_batch_matches_per_vector_search(graph_db):
+    graph_db.add_nodes_batch(
+        [
+            {"id": "x", "memory": "x", "metadata": _meta(embedding=(1.0, 0.0, 0.0))},
+            {"id": "y", "memory": "y", "metadata": _meta(embedding=(0.0, 1.0, 0.0))},
+            {"id": "z", "memory": "z", "metadata": _meta(embedding=(0.6, 0.8, 0.0))},
+        ]
+    )
+    vectors = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]
+
+    batched = graph_db.search_batch(vectors, top_k=2)
+
+    assert batched == [graph_db.search_by_embedding(vector, top_k=2) for vector in vectors]
+    assert [r["id"] for r in batched[1]] == ["y", "z"]
+    assert graph_db.search_batch([], top_k=2) == []
+
+
+def test_vector_index_follows_committed_rows_only(graph_db):
+    import numpy as np
+
+    graph_db.add_node("n1", "kept", _meta())
+    with pytest.raises(RuntimeError), graph_db._transaction() as conn:
+        graph_db._write_node(conn, "n2", "rolled back", _meta(), "alice")
+        graph_db._delete_ids(conn, ["n1"])
+        raise RuntimeError("abort")
+
+    hits = graph_db.search_by_embedding([1.0, 0.0, 0.0], top_k=5)
+    assert [hit["id"] for hit in hits] == ["n1"]
+
+    graph_db.update_node("n1", {"embedding": np.array([0.0, 1.0, 0.0], dtype=np.float32)})
+    assert [hit["id"] for hit in graph_db.search_by_embedding([0.0, 1.0, 0.0], top_k=1)] == ["n1"]
@@ -0,0 +1,159 @@
+import asyncio
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from memos.configs.llm import LLMConfigFactory
+from memos.llms.cache import CachingLLM
+from memos.llms.cache_store import SQLiteLLMResponseCacheStore
+from memos.llms.factory import LLMFactory
+
+
+MESSAGES = [{"role": "user", "content": "Extract memories from: hello"}]
+
+
+def _backend(temperature=0.0, side_effect=None):
+    backend = MagicMock()
+    backend.config = SimpleNamespace(
+        model_name_or_path="chat-model", temperature=temperature, max_tokens=1024, top_p=0.9
+    )
+    backend.generate.side_effect = side_effect or (
+        lambda messages, **kwargs: f"answer {len(messages[0]['content'])}"
+    )
+    return backend
+
+
+@pytest.fixture(autouse=True)
+def cache_env(monkeypatch):
+    monkeypatch.setenv("MEMOS_LLM_CACHE_TTL_SECONDS", "60")
+    monkeypatch.setenv("MEMOS_LLM_CACHE_MAX_SIZE", "32")
+    monkeypatch.delenv("MEMOS_LLM_CACHE_PATH", raising=False)
+
+
+def test_caches_only_deterministic_or_flagged_calls():
+    backend = _backend(temperature=0.7)
+    llm = CachingLLM(backend)
+
+    llm.generate(MESSAGES)
+    llm.generate(MESSAGES)
+    assert backend.generate.call_count == 2
+
+    assert llm.generate(MESSAGES, cache=True) == llm.generate(MESSAGES, cache=True)
+    assert backend.generate.call_count == 3
+    backend.generate.assert_called_with(MESSAGES)
+
+    llm.generate(MESSAGES, temperature=0)
+    llm.generate(MESSAGES, temperature=0)
+    assert backend.generate.call_count == 4
+
+    llm.generate(MESSAGES, temperature=0, cache=False)
+    assert backend.generate.call_count == 5
+
+    info = llm.cache_info()
+    assert (info["memory_hits"], info["misses"], info["bypassed"]) == (2, 2, 3)
+
+
+def test_key_covers_model_and_sampling_params():
+    backend = _backend()
+    llm = CachingLLM(backend)
+
+    llm.generate(MESSAGES)
+    llm.generate(MESSAGES, max_tokens=16)
+    llm.generate(MESSAGES, model_name_or_path="other-model")
+    llm.generate([{"role": "user", "content": "different"}])
+
+    assert backend.generate.call_count == 4
+
+
+def test_concurrent_identical_prompts_share_one_backend_call():
+    def slow_generate(messages, **kwargs):
+        time.sleep(0.1)
+        return "shared"
+
+    backend = _backend(side_effect=slow_generate)
+    llm = CachingLLM(backend)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(llm.generate, MESSAGES) for _ in range(4)]
+        results = [future.result() for future in futures]
+
+    assert results == ["shared"] * 4
+    assert backend.generate.call_count == 1
+    assert llm.cache_info()["singleflight_joins"] + llm.cache_info()["memory_hits"] == 3
+
+
+def test_failures_and_empty_responses_are_not_cached():
+    backend = _backend(side_effect=[RuntimeError("boom"), "", "ok"])
+    llm = CachingLLM(backend)
+
+    with pytest.raises(RuntimeError):
+        llm.generate(MESSAGES)
+    assert llm.generate(MESSAGES) == ""
+    assert llm.generate(MESSAGES) == "ok"
+    assert llm.generate(MESSAGES) == "ok"
+    assert backend.generate.call_count == 3
+    assert llm.cache_info()["backend_errors"] == 1
+
+
+def test_persistent_store_survives_restart(tmp_path):
+    path = str(tmp_path / "llm_cache.sqlite")
+    tool_calls = [{"function_name": "search", "arguments": {"q": "x"}}]
+    backend = _backend(side_effect=lambda messages, **kwargs: tool_calls)
+    CachingLLM(backend, SQLiteLLMResponseCacheStore(path)).generate(MESSAGES)
+
+    restarted_backend = _backend()
+    restarted = CachingLLM(restarted_backend, SQLiteLLMResponseCacheStore(path))
+
+    assert restarted.generate(MESSAGES) == tool_calls
+    restarted_backend.generate.assert_not_called()
+    assert restarted.cache_info()["persistent_hits"] == 1
+
+
+def test_agenerate_uses_cache_and_native_async_backend():
+    backend = _backend()
+    backend.agenerate = AsyncMock(return_value="async answer")
+    llm = CachingLLM(backend)
+
+    async def run():
+        return [await llm.agenerate(MESSAGES), await llm.agenerate(MESSAGES)]
+
+    assert asyncio.run(run()) == ["async answer", "async answer"]
+    backend.agenerate.assert_awaited_once_with(MESSAGES)
+    assert llm.generate(MESSAGES) == "async answer"
+    backend.generate.assert_not_called()
+
+
+def test_sqlite_store_evicts_least_recently_read():
+    store = SQLiteLLMResponseCacheStore(":memory:", max_entries=3, evict_ratio=0.67)
+    for key in ("a", "b", "c"):
+        store.set(key, key.upper())
+        time.sleep(0.01)
+    assert store.get("a") == "A"
+    time.sleep(0.01)
+    store.set("d", "D")
+
+    assert len(store) == 2
+    assert [store.get(key) for key in ("a", "b", "c", "d")] == ["A", None, None, "D"]
+
+
+def test_factory_wraps_remote_llm_when_enabled(monkeypatch):
+    monkeypatch.setenv("MEMOS_LLM_CACHE_ENABLED", "true")
+    config = LLMConfigFactory.model_validate(
+        {
+            "backend": "openai",
+            "config": {
+                "model_name_or_path": "cache-test-model",
+                "api_key": "sk-cache-test",
+                "api_base": "http://cache-test.invalid/v1",
+            },
+        }
+    )
+
+    llm = LLMFactory.from_config(config)
+
+    assert isinstance(llm, CachingLLM)
+    assert llm.config.model_name_or_path == "cache-test-model"
@@ -1,7 +1,8 @@
+import asyncio
 import unittest
 
 from types import SimpleNamespace
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from memos.configs.llm import LLMConfigFactory
 from memos.llms.factory import LLMFactory
@@ -101,3 +102,78 @@ class TestLLMFactoryWithOpenAIBackend(unittest.TestCase):
         self.assertEqual(response_parts[0], "<think>")
         self.assertTrue(response.startswith("<think>I am thinking"))
         self.assertTrue(response.endswith("Hello, world!"))
+
+    def test_agenerate_falls_back_to_backup_async_client(self):
+        """Async generate uses pooled async clients and the backup on failure."""
+        response = MagicMock()
+        response.model_dump_json.return_value = "{}"
+        response.choices[0].message.content = "Hello"
+        response.choices[0].message.reasoning_content = None
+        response.choices[0].message.tool_calls = None
+        primary, backup = MagicMock(), MagicMock()
+        primary.chat.completions.create = AsyncMock(side_effect=RuntimeError("down"))
+        backup.chat.completions.create = AsyncMock(return_value=response)
+
+        config = LLMConfigFactory.model_validate(
+            {
+                "backend": "openai",
+                "config": {
+                    "model_name_or_path": "gpt-4.1-nano",
+                    "api_key": "sk-xxxx",
+                    "api_base": "https://api.openai.com/v1",
+                    "backup_client": True,
+                    "backup_api_key": "sk-backup",
+                    "backup_api_base": "https://backup.example.com/v1",
+                    "backup_model_name_or_path": "backup-model",
+                },
+            }
+        )
+        llm = LLMFactory.from_config(config)
+        clients = {"sk-xxxx": primary, "sk-backup": backup}
+        with patch(
+            "memos.llms.openai.get_shared_async_openai_client",
+            side_effect=lambda api_key, *args: clients[api_key],
+        ):
+            result = asyncio.run(llm.agenerate([{"role": "user", "content": "Hi"}]))
+
+        self.assertEqual(result, "Hello")
+        self.assertEqual(backup.chat.completions.create.call_args.kwargs["model"], "backup-model")
+
+    def test_agenerate_stream_wraps_reasoning(self):
+        """Async streaming emits the same think-tag layout as the sync stream."""
+
+        def make_chunk(delta_dict):
+            delta = SimpleNamespace(**delta_dict)
+            return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+        async def stream():
+            for chunk in (
+                make_chunk({"reasoning_content": "I am thinking"}),
+                make_chunk({"content": "Hello"}),
+                make_chunk({"content": ", world!"}),
+            ):
+                yield chunk
+
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(return_value=stream())
+        config = LLMConfigFactory.model_validate(
+            {
+                "backend": "openai",
+                "config": {
+                    "model_name_or_path": "gpt-4.1-nano",
+                    "api_key": "sk-xxxx",
+                    "api_base": "https://api.openai.com/v1",
+                },
+            }
+        )
+        llm = LLMFactory.from_config(config)
+
+        async def collect():
+            messages = [{"role": "user", "content": "Hi"}]
+            return [part async for part in llm.agenerate_stream(messages)]
+
+        with patch("memos.llms.openai.get_shared_async_openai_client", return_value=client):
+            parts = asyncio.run(collect())
+
+        self.assertEqual(parts, ["<think>", "I am thinking", "</think>", "Hello", ", world!"])
+        self.assertTrue(client.chat.completions.create.call_args.kwargs["stream"])
@@ -0,0 +1,224 @@
+import os
+import threading
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from memos.mem_cube.general import GeneralMemCube
+from memos.mem_cube.residency import MemCubeResidency
+
+
+def _cube(name="cube"):
+    cube = MagicMock(spec=GeneralMemCube)
+    cube.name = name
+    cube.text_mem = MagicMock(is_reorganize=False)
+    cube.dump.side_effect = lambda dump_dir: open(
+        os.path.join(dump_dir, "config.json"), "w"
+    ).close()
+    return cube
+
+
+@pytest.fixture
+def cube_dirs(tmp_path):
+    dirs = {}
+    for cube_id in ("a", "b", "c"):
+        path = tmp_path / "cubes" / cube_id
+        path.mkdir(parents=True)
+        dirs[cube_id] = str(path)
+    return dirs
+
+
+@pytest.fixture
+def init_from_dir():
+    with patch.object(
+        GeneralMemCube, "init_from_dir", side_effect=lambda path: _cube(path)
+    ) as mock_init:
+        yield mock_init
+
+
+def test_registered_cubes_load_lazily_on_first_access(cube_dirs, init_from_dir):
+    cubes = MemCubeResidency(max_resident=2)
+    for cube_id, path in cube_dirs.items():
+        cubes.register(cube_id, path)
+
+    assert set(cubes) == {"a", "b", "c"}
+    assert "a" in cubes and not cubes.is_resident("a")
+    init_from_dir.assert_not_called()
+
+    assert cubes["a"] is cubes["a"]
+    init_from_dir.assert_called_once_with(cube_dirs["a"])
+    stats = cubes.stats()
+    assert (stats["loads"], stats["hits"], stats["resident"]) == (1, 1, 1)
+
+
+def test_least_recently_used_clean_cube_is_evicted_and_reloaded(cube_dirs, init_from_dir):
+    cubes = MemCubeResidency(max_resident=2)
+    for cube_id, path in cube_dirs.items():
+        cubes.register(cube_id, path)
+
+    first_a = cubes["a"]
+    cubes["b"]
+    cubes["a"]
+    cubes["c"]
+
+    assert [cube_id for cube_id, _ in cubes.resident_items()] == ["a", "c"]
+    assert cubes.stats()["evictions"] == 1
+    assert cubes["a"] is first_a
+
+    cubes["b"]
+    assert init_from_dir.call_count == 4
+    first_a.dump.assert_not_called()
+
+
+def test_pinned_and_busy_cubes_are_never_evicted(cube_dirs, init_from_dir):
+    busy = {"b"}
+    cubes = MemCubeResidency(max_resident=1, is_busy=lambda cube_id: cube_id in busy)
+    for cube_id, path in cube_dirs.items():
+        cubes.register(cube_id, path)
+
+    with cubes.pinned("a"):
+        cubes["b"]
+        assert cubes.is_resident("a")
+    cubes["c"]
+
+    assert not cubes.is_resident("a")
+    assert cubes.is_resident("b") and cubes.is_resident("c")
+    busy.clear()
+    cubes["a"]
+    assert [cube_id for cube_id, _ in cubes.resident_items()] == ["a"]
+
+
+def test_eviction_rechecks_and_blocks_readers_until_it_settles(cube_dirs, init_from_dir, tmp_path):
+    busy_checks = iter([False, True])
+    cubes = MemCubeResidency(is_busy=lambda cube_id: next(busy_checks, False))
+    cubes.register("a", cube_dirs["a"])
+    cube_a = cubes["a"]
+    # Became busy after the first check but before entry.lock was taken.
+    assert not cubes.evict("a")
+    assert cubes["a"] is cube_a
+
+    cubes = MemCubeResidency(spill_dir=str(tmp_path / "spill"))
+    cubes.register("a", cube_dirs["a"])
+    cube_a = cubes["a"]
+    cubes.mark_dirty("a")
+    dumping, release = threading.Event(), threading.Event()
+
+    def slow_dump(dump_dir):
+        dumping.set()
+        release.wait(5)
+        open(os.path.join(dump_dir, "config.json"), "w").close()
+
+    cube_a.dump.side_effect = slow_dump
+    evictor = threading.Thread(target=cubes.evict, args=("a",))
+    evictor.start()
+    assert dumping.wait(5)
+
+    seen = []
+
+    def reader():
+        with cubes.pinned("a") as cube:
+            seen.append(cube)
+
+    pinner = threading.Thread(target=reader)
+    pinner.start()
+    pinner.join(0.2)
+    assert pinner.is_alive() and not seen
+
+    release.set()
+    evictor.join(5)
+    pinner.join(5)
+    assert seen and seen[0] is not cube_a
+    assert cubes.stats()["evictions"] == 1
+
+
+def test_dirty_cube_is_spilled_before_eviction(cube_dirs, init_from_dir, tmp_path):
+    spill_dir = tmp_path / "spill"
+    cubes = MemCubeResidency(max_resident=1, spill_dir=str(spill_dir))
+    cubes.register("a", cube_dirs["a"])
+    cubes.register("b", cube_dirs["b"])
+
+    cube_a = cubes["a"]
+    cubes.mark_dirty("a")
+    cubes["b"]
+
+    cube_a.dump.assert_called_once()
+    assert os.listdir(spill_dir) == ["a"]
+    assert cubes.stats()["spills"] == 1
+
+    cubes["a"]
+    init_from_dir.assert_called_with(str(spill_dir / "a"))
+
+
+def test_unsaved_cubes_stay_resident_without_spill_dir(cube_dirs, init_from_dir):
+    cubes = MemCubeResidency(max_resident=1)
+    instance = _cube()
+    cubes["obj"] = instance
+    cubes.register("a", cube_dirs["a"])
+    cubes["a"]
+    cubes.mark_dirty("a")
+    cubes.register("b", cube_dirs["b"])
+    cubes["b"]
+
+    assert cubes.is_resident("obj") and cubes.is_resident("a")
+    stats = cubes.stats()
+    assert (stats["resident"], stats["dirty"], stats["evictions"]) == (3, 1, 0)
+    instance.dump.assert_not_called()
+
+
+def test_byte_budget_and_reorganizer_close(cube_dirs, init_from_dir):
+    cubes = MemCubeResidency(max_resident_bytes=150, size_of=lambda cube: 100)
+    cubes.register("a", cube_dirs["a"])
+    cubes.register("b", cube_dirs["b"])
+
+    cube_a = cubes["a"]
+    cube_a.text_mem.is_reorganize = True
+    cubes["b"]
+
+    assert not cubes.is_resident("a")
+    assert cubes.stats()["resident_bytes"] == 100
+    cube_a.text_mem.memory_manager.close.assert_called_once()
+
+
+def test_scheduler_handlers_pin_the_cube_of_each_batch(cube_dirs, init_from_dir):
+    from memos.mem_scheduler.schemas.message_schemas import ScheduleMessageItem
+    from memos.mem_scheduler.task_schedule_modules.base_handler import BaseSchedulerHandler
+    from memos.mem_scheduler.task_schedule_modules.context import SchedulerHandlerContext
+
+    cubes = MemCubeResidency(max_resident=1)
+    for cube_id, path in cube_dirs.items():
+        cubes.register(cube_id, path)
+    seen = []
+
+    class RecordingHandler(BaseSchedulerHandler):
+        expected_task_label = "test"
+
+        def batch_handler(self, user_id, mem_cube_id, batch):
+            cubes["c"]  # loading another cube must not evict the pinned one
+            seen.append((mem_cube_id, cubes.is_resident(mem_cube_id)))
+
+    context = SchedulerHandlerContext(*(MagicMock() for _ in range(10)), pin_mem_cube=cubes.pinned)
+    messages = [
+        ScheduleMessageItem(user_id="u", mem_cube_id=cube_id, label="test", content="x")
+        for cube_id in ("a", "b")
+    ]
+    RecordingHandler(context)(messages)
+
+    assert seen == [("a", True), ("b", True)]
+    assert cubes.stats()["pinned"] == 0
+
+
+def test_queued_scheduler_messages_keep_cube_busy():
+    from memos.mem_scheduler.task_schedule_modules.task_queue import ScheduleTaskQueue
+
+    task_queue = object.__new__(ScheduleTaskQueue)
+    task_queue.memos_message_queue = MagicMock()
+    task_queue.memos_message_queue.qsize.return_value = {
+        "memos:stream:u1:a:add": 2,
+        "memos:stream:u1:b:add": 0,
+        "total_size": 2,
+    }
+
+    assert task_queue.has_queued_messages("a")
+    assert not task_queue.has_queued_messages("b")
+    assert not task_queue.has_queued_messages("u1")
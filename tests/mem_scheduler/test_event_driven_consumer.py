@@ -0,0 +1,103 @@
+import threading
+import time
+
+from unittest.mock import MagicMock, patch
+
+from memos.mem_scheduler.schemas.message_schemas import ScheduleMessageItem
+from memos.mem_scheduler.task_schedule_modules.dispatcher import SchedulerDispatcher
+from memos.mem_scheduler.task_schedule_modules.local_queue import SchedulerLocalQueue
+from memos.mem_scheduler.task_schedule_modules.redis_queue import SchedulerRedisQueue
+
+
+def _message(item_id: str) -> ScheduleMessageItem:
+    return ScheduleMessageItem(
+        item_id=item_id,
+        user_id="user1",
+        mem_cube_id="cube1",
+        label="label1",
+        content="content",
+        timestamp=123456789,
+    )
+
+
+def test_local_queue_blocking_get_wakes_on_put():
+    queue = SchedulerLocalQueue(stream_key_prefix="test")
+    assert queue.get_messages(batch_size=3) == []
+
+    timer = threading.Timer(0.1, queue.put, args=(_message("m1"),))
+    timer.start()
+    start = time.monotonic()
+    messages = queue.get_messages(batch_size=3, block_timeout=5.0)
+    elapsed = time.monotonic() - start
+    timer.join()
+
+    assert [m.item_id for m in messages] == ["m1"]
+    assert elapsed < 2.0
+
+
+def test_local_queue_blocking_get_times_out_empty():
+    queue = SchedulerLocalQueue(stream_key_prefix="test")
+    start = time.monotonic()
+    assert queue.get_messages(batch_size=3, block_timeout=0.1) == []
+    assert time.monotonic() - start >= 0.09
+
+
+def test_dispatcher_wait_for_free_slot():
+    dispatcher = SchedulerDispatcher(max_workers=2, enable_parallel_dispatch=False)
+    assert dispatcher.wait_for_free_slot(timeout=0.01)
+
+    dispatcher._running_tasks = {"a": MagicMock(), "b": MagicMock()}
+    assert not dispatcher.wait_for_free_slot(timeout=0.05)
+
+    def finish():
+        with dispatcher._slot_freed:
+            del dispatcher._running_tasks["a"]
+            dispatcher._slot_freed.notify_all()
+
+    timer = threading.Timer(0.1, finish)
+    timer.start()
+    assert dispatcher.wait_for_free_slot(timeout=5.0)
+    timer.join()
+
+
+def test_redis_blocking_read_waits_then_uses_broker():
+    with patch.object(SchedulerRedisQueue, "auto_initialize_redis", return_value=False):
+        queue = SchedulerRedisQueue(stream_key_prefix="test")
+    queue._redis_conn = MagicMock()
+    queue.socket_timeout = 1.0
+    queue.get_stream_keys = MagicMock(return_value=["test:a"])
+    queue.task_broker = MagicMock(side_effect=[[], [[_message("m1")]], [], []])
+    queue._redis_conn.xread.return_value = [
+        (queue.wakeup_stream_key, [("1-0", {"stream_key": "test:b"})]),
+    ]
+
+    messages = queue.get_messages(batch_size=3, block_timeout=5.0)
+
+    assert [m.item_id for m in messages] == ["m1"]
+    args, kwargs = queue._redis_conn.xread.call_args
+    assert args[0] == {"test:a": "$", queue.wakeup_stream_key: "$"}
+    assert kwargs["block"] == 800
+    assert "test:b" in queue._stream_keys_cache
+    queue._redis_conn.xreadgroup.assert_not_called()
+
+    # the next wait resumes the wakeup stream after the last entry this consumer saw
+    queue._redis_conn.xread.return_value = []
+    assert queue.get_messages(batch_size=3, block_timeout=5.0) == []
+    args, _kwargs = queue._redis_conn.xread.call_args
+    assert args[0][queue.wakeup_stream_key] == "1-0"
+
+
+def test_redis_blocking_read_honors_stream_cap():
+    with patch.object(SchedulerRedisQueue, "auto_initialize_redis", return_value=False):
+        queue = SchedulerRedisQueue(stream_key_prefix="test")
+    queue._redis_conn = MagicMock()
+    queue._cache_max_packs = 2
+    queue._stream_read_offset = 1
+    queue.get_stream_keys = MagicMock(return_value=["test:a", "test:b", "test:c"])
+    queue.task_broker = MagicMock(return_value=[])
+    queue._redis_conn.xread.return_value = []
+
+    assert queue.get_messages(batch_size=3, block_timeout=0.1) == []
+    args, _kwargs = queue._redis_conn.xread.call_args
+    assert list(args[0]) == ["test:b", "test:c", queue.wakeup_stream_key]
+    assert queue._stream_read_offset == 1
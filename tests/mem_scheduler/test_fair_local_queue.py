@@ -0,0 +1,111 @@
+from collections import Counter
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from memos.mem_scheduler.base_mixins.queue_ops import BaseSchedulerQueueMixin
+from memos.mem_scheduler.schemas.message_schemas import ScheduleMessageItem
+from memos.mem_scheduler.schemas.task_schemas import TaskPriorityLevel
+from memos.mem_scheduler.task_schedule_modules.local_queue import SchedulerLocalQueue
+from memos.mem_scheduler.task_schedule_modules.orchestrator import SchedulerOrchestrator
+from memos.mem_scheduler.utils.db_utils import get_utc_now
+
+
+def _message(user_id: str, label: str, index: int, **kwargs) -> ScheduleMessageItem:
+    return ScheduleMessageItem(
+        item_id=f"{user_id}-{label}-{index}",
+        user_id=user_id,
+        mem_cube_id=f"{user_id}_cube",
+        label=label,
+        content="content",
+        **kwargs,
+    )
+
+
+def _drain_counts(queue: SchedulerLocalQueue, batch_size: int, batches: int) -> Counter:
+    counts = Counter()
+    for _ in range(batches):
+        for msg in queue.get_messages(batch_size=batch_size):
+            counts[(msg.user_id, msg.label)] += 1
+    return counts
+
+
+def test_heavy_stream_does_not_starve_light_users():
+    queue = SchedulerLocalQueue(stream_key_prefix="test", orchestrator=SchedulerOrchestrator())
+    for i in range(100):
+        queue.put(_message("bulk", "mem_read", i))
+    for user_id in ("alice", "bob"):
+        queue.put(_message(user_id, "mem_read", 0))
+
+    first = queue.get_messages(batch_size=3)
+    assert {msg.user_id for msg in first} == {"bulk", "alice", "bob"}
+    assert queue.size() == 99
+
+
+def test_batches_are_shared_in_proportion_to_weights():
+    orchestrator = SchedulerOrchestrator()
+    orchestrator.set_task_config("mem_read", priority=TaskPriorityLevel.LEVEL_2)
+    orchestrator.set_user_weight("vip", 3)
+    queue = SchedulerLocalQueue(stream_key_prefix="test", orchestrator=orchestrator)
+    for i in range(200):
+        queue.put(_message("vip", "mem_organize", i))
+        queue.put(_message("plain", "mem_read", i))
+        queue.put(_message("plain", "mem_organize", i))
+
+    counts = _drain_counts(queue, batch_size=6, batches=10)
+
+    # Weights: vip mem_organize 1*3, plain mem_read 2*1, plain mem_organize 1*1
+    assert counts == {
+        ("vip", "mem_organize"): 30,
+        ("plain", "mem_read"): 20,
+        ("plain", "mem_organize"): 10,
+    }
+
+
+def test_drained_stream_forfeits_credit_and_rest_continue():
+    queue = SchedulerLocalQueue(stream_key_prefix="test", orchestrator=SchedulerOrchestrator())
+    queue.put(_message("alice", "mem_read", 0))
+    for i in range(5):
+        queue.put(_message("bob", "mem_read", i))
+
+    messages = queue.get_messages(batch_size=10)
+    assert [msg.user_id for msg in messages].count("bob") == 5
+    assert queue.empty()
+    assert queue._deficits == {}
+
+
+def test_queue_ages_report_oldest_waiting_message():
+    queue = SchedulerLocalQueue(stream_key_prefix="test")
+    queue.put(_message("alice", "mem_read", 0, timestamp=get_utc_now() - timedelta(seconds=30)))
+    queue.put(_message("alice", "mem_read", 1))
+    queue.put(_message("bob", "mem_read", 0))
+
+    ages = queue.get_queue_ages()
+    alice_key = queue.get_stream_key("alice", "alice_cube", "mem_read")
+    bob_key = queue.get_stream_key("bob", "bob_cube", "mem_read")
+    assert 29 < ages[alice_key] < 60
+    assert ages[bob_key] < 5
+
+    queue.get_messages(batch_size=10)
+    assert queue.get_queue_ages() == {}
+
+
+def test_monitor_resets_age_gauge_of_drained_streams():
+    queue = SchedulerLocalQueue(stream_key_prefix="test")
+    queue.put(_message("alice", "mem_read", 0))
+    scheduler = SimpleNamespace(_running=True, memos_message_queue=queue, metrics=MagicMock())
+    cycles = []
+
+    def next_cycle(_seconds):
+        cycles.append(1)
+        if len(cycles) == 1:
+            queue.get_messages(batch_size=10)
+        else:
+            scheduler._running = False
+
+    with patch("memos.mem_scheduler.base_mixins.queue_ops.time.sleep", side_effect=next_cycle):
+        BaseSchedulerQueueMixin._monitor_loop(scheduler)
+
+    first, last = scheduler.metrics.update_queue_age.call_args_list
+    assert first.args[1:] == ("alice", "mem_read")
+    assert last.args == (0.0, "alice", "mem_read")
@@ -0,0 +1,108 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from memos.mem_scheduler.schemas.message_schemas import ScheduleMessageItem
+from memos.mem_scheduler.task_schedule_modules.redis_queue import SchedulerRedisQueue
+from memos.mem_scheduler.utils.message_codec import (
+    BODY_FIELD,
+    CHAT_HISTORY_REF_FIELD,
+    decode_message,
+    encode_message,
+    encoded_size,
+    message_blob_refs,
+)
+from memos.types.general_types import UserContext
+
+
+def _message(chat_turns: int = 1, content: str = "hello") -> ScheduleMessageItem:
+    return ScheduleMessageItem(
+        item_id="m1",
+        user_id="user1",
+        mem_cube_id="cube1",
+        session_id="s1",
+        label="add",
+        content=content,
+        timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        info={"source": "test"},
+        chat_history=[
+            {"role": "user", "content": f"turn {i}: 你好, tell me about memory"}
+            for i in range(chat_turns)
+        ],
+        user_context=UserContext(user_id="user1", project_id="p1"),
+    )
+
+
+def _assert_same(decoded: ScheduleMessageItem, message: ScheduleMessageItem) -> None:
+    assert decoded.model_dump(exclude={"redis_message_id", "stream_key"}) == message.model_dump(
+        exclude={"redis_message_id", "stream_key"}
+    )
+
+
+def test_compact_round_trip_small_message():
+    message = _message()
+    fields, blobs = encode_message(message)
+
+    assert blobs == {}
+    assert fields[BODY_FIELD].startswith("j")
+    assert encoded_size(fields) < encoded_size(message.to_dict())
+    _assert_same(decode_message(fields), message)
+
+
+def test_large_body_is_compressed():
+    message = _message(content="memory " * 2000)
+    fields, _ = encode_message(message, compress_threshold=1024)
+
+    assert fields[BODY_FIELD].startswith("z")
+    assert encoded_size(fields) < encoded_size(message.to_dict()) / 5
+    _assert_same(decode_message(fields), message)
+
+
+def test_legacy_entries_still_decode():
+    message = _message()
+    legacy = {
+        key: value.encode() if isinstance(value, str) else value
+        for key, value in message.to_dict().items()
+    }
+
+    assert message_blob_refs(legacy) == []
+    # the legacy encoding writes a missing api_path as ""
+    _assert_same(decode_message(legacy), message.model_copy(update={"api_path": ""}))
+
+
+def test_large_chat_history_is_stored_by_reference():
+    message = _message(chat_turns=200)
+    fields, blobs = encode_message(message, blob_threshold=1024)
+
+    (digest,) = blobs
+    assert fields[CHAT_HISTORY_REF_FIELD] == digest
+    assert message_blob_refs(fields) == [digest]
+    _assert_same(decode_message(fields, blobs), message)
+    assert decode_message(fields, {}).chat_history is None
+
+
+def test_redis_queue_compact_put_and_read(monkeypatch):
+    monkeypatch.setenv("MEMSCHEDULER_REDIS_MESSAGE_FORMAT", "compact")
+    monkeypatch.setenv("MEMSCHEDULER_REDIS_BLOB_THRESHOLD", "1024")
+    with patch.object(SchedulerRedisQueue, "auto_initialize_redis", return_value=False):
+        queue = SchedulerRedisQueue(stream_key_prefix="test")
+    queue._redis_conn = MagicMock()
+
+    message = _message(chat_turns=200)
+    queue.put(message)
+    queue.put(message.model_copy(update={"item_id": "m2"}))
+
+    entries = [call.args[1] for call in queue._redis_conn.xadd.call_args_list if call.args]
+    entries = [fields for fields in entries if BODY_FIELD in fields]
+    assert len(entries) == 2
+    # the shared chat history is written once and referenced by both entries
+    queue._redis_conn.set.assert_called_once()
+    blob_key, payload = queue._redis_conn.set.call_args.args
+    assert blob_key.startswith("test__blob:")
+
+    queue._redis_conn.mget.return_value = [payload]
+    decoded = queue._convert_messages([("test:a", [("1-0", entries[0]), ("2-0", entries[1])])])
+
+    queue._redis_conn.mget.assert_called_once_with([blob_key])
+    assert [m.item_id for m in decoded] == ["m1", "m2"]
+    assert decoded[1].chat_history == message.chat_history
+    assert decoded[0].redis_message_id == "1-0"
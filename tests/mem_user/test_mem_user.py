@@ -14,6 +14,7 @@ from pathlib import Path
 
 import pytest
 
+from memos.mem_user.access_cache import UserAccess, UserAccessCache
 from memos.mem_user.user_manager import UserManager, UserRole
 
 
@@ -610,3 +611,88 @@ class TestDatabaseIntegrity:
             else:  # Active users/cubes
                 assert user_active is True
                 assert cube.is_active is True
+
+
+class TestAccessCache:
+    """Test cases for the in-process access-control cache."""
+
+    @pytest.fixture
+    def user_manager(self, tmp_path):
+        manager = UserManager(db_path=str(tmp_path / "test_memos.db"))
+        yield manager
+        manager.close()
+
+    def _count_sessions(self, manager, monkeypatch):
+        calls = []
+        get_session = manager._get_session
+
+        def counting_get_session():
+            calls.append(1)
+            return get_session()
+
+        monkeypatch.setattr(manager, "_get_session", counting_get_session)
+        return calls
+
+    def test_repeated_checks_skip_database(self, user_manager, monkeypatch):
+        user_id = user_manager.create_user("alice", UserRole.USER)
+        cube_id = user_manager.create_cube("alice_cube", user_id)
+        sessions = self._count_sessions(user_manager, monkeypatch)
+
+        for _ in range(5):
+            assert user_manager.validate_user(user_id) is True
+            assert user_manager.validate_user_cube_access(user_id, cube_id) is True
+            assert user_manager.validate_user_cube_access(user_id, "other_cube") is False
+
+        assert len(sessions) == 1
+
+    def test_get_user_cubes_preloads_access(self, user_manager, monkeypatch):
+        user_id = user_manager.create_user("bob", UserRole.USER)
+        cube_id = user_manager.create_cube("bob_cube", user_id)
+        sessions = self._count_sessions(user_manager, monkeypatch)
+
+        assert [cube.cube_id for cube in user_manager.get_user_cubes(user_id)] == [cube_id]
+        assert user_manager.validate_user_cube_access(user_id, cube_id) is True
+        assert len(sessions) == 1
+
+    def test_writes_invalidate_cached_access(self, user_manager):
+        owner_id = user_manager.create_user("owner", UserRole.USER)
+        member_id = user_manager.create_user("member", UserRole.USER)
+        cube_id = user_manager.create_cube("shared", owner_id)
+
+        assert user_manager.validate_user_cube_access(member_id, cube_id) is False
+        user_manager.add_user_to_cube(member_id, cube_id)
+        assert user_manager.validate_user_cube_access(member_id, cube_id) is True
+        user_manager.remove_user_from_cube(member_id, cube_id)
+        assert user_manager.validate_user_cube_access(member_id, cube_id) is False
+
+        assert user_manager.validate_user(owner_id) is True
+        user_manager.delete_cube(cube_id)
+        assert user_manager.validate_user_cube_access(owner_id, cube_id) is False
+        user_manager.delete_user(owner_id)
+        assert user_manager.validate_user(owner_id) is False
+
+        assert user_manager.validate_user("late_user") is False
+        user_manager.create_user("late_user", UserRole.USER, user_id="late_user")
+        assert user_manager.validate_user("late_user") is True
+
+    def test_ttl_zero_disables_cache(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("MOS_USER_ACCESS_CACHE_TTL", "0")
+        manager = UserManager(db_path=str(tmp_path / "test_memos.db"))
+        sessions = self._count_sessions(manager, monkeypatch)
+
+        manager.validate_user("root")
+        manager.validate_user("root")
+
+        assert len(sessions) == 2
+        manager.close()
+
+    def test_load_racing_invalidation_is_not_stored(self):
+        cache = UserAccessCache(ttl=60)
+        stale = UserAccess(active=True, cube_ids=frozenset({"cube"}))
+
+        def load_during_write():
+            cache.invalidate_cube("cube")
+            return stale
+
+        assert cache.lookup("alice", load_during_write) is stale
+        assert cache.get("alice") is None
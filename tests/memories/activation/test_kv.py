@@ -1,3 +1,5 @@
+import json
+
 from unittest.mock import MagicMock
 
 import pytest
@@ -7,7 +9,7 @@ from transformers import DynamicCache
 
 from memos.configs.memory import KVCacheMemoryConfig
 from memos.memories.activation.item import KVCacheItem
-from memos.memories.activation.kv import KVCacheMemory
+from memos.memories.activation.kv import KVCacheMemory, _cache_layer_tensors
 
 
 @pytest.fixture
@@ -16,6 +18,7 @@ def dummy_config():
     config = MagicMock(spec=KVCacheMemoryConfig)
     config.extractor_llm = MagicMock()
     config.memory_filename = "test_kv_cache.pkl"
+    config.storage_format = "pickle"
     return config
 
 
@@ -84,3 +87,122 @@ def test_from_textual_memory(kv_memory):
     item = kv_memory.from_textual_memory(DummyTextualMemory())
     assert isinstance(item, KVCacheItem)
     assert item.metadata["bar"] == 1
+
+
+class SegmentLLM:
+    """Fake LLM whose cache stores one token per character."""
+
+    def __init__(self):
+        self.prefilled = []
+
+    def render_kv_prompt(self, content):
+        return f"<sys>{content}</sys>"
+
+    def extend_kv_cache(self, segments, kv=None):
+        kv = kv if kv is not None else DynamicCache()
+        for segment in segments:
+            tokens = torch.tensor([float(ord(c)) for c in segment]).reshape(1, 1, -1, 1)
+            kv.update(tokens, tokens * 2, 0)
+            self.prefilled.append(segment)
+        return kv, [len(segment) for segment in segments]
+
+
+def cache_keys(cache):
+    return _cache_layer_tensors(cache)[0][0].flatten().tolist()
+
+
+def test_extend_prefills_only_appended_segments(kv_memory):
+    kv_memory.llm = SegmentLLM()
+    first = kv_memory.extend(["1. a\n", "2. b\n"], template="Memories: {memory_text}")
+    assert kv_memory.llm.prefilled == ["<sys>Memories: ", "1. a\n", "2. b\n", "</sys>"]
+
+    kv_memory.llm.prefilled.clear()
+    second = kv_memory.extend(
+        ["1. a\n", "2. b\n", "3. c\n"], template="Memories: {memory_text}", base=first
+    )
+
+    assert kv_memory.llm.prefilled == ["3. c\n", "</sys>"]
+    assert second.metadata["reused_segments"] == 3
+    expected = "<sys>Memories: 1. a\n2. b\n3. c\n</sys>"
+    assert cache_keys(second.memory) == [float(ord(c)) for c in expected]
+    assert second.records.segment_lengths == [15, 5, 5, 5, 6]
+
+    kv_memory.llm.prefilled.clear()
+    third = kv_memory.extend(["1. z\n"], template="Memories: {memory_text}", base=second)
+    assert kv_memory.llm.prefilled == ["1. z\n", "</sys>"]
+    assert cache_keys(third.memory) == [float(ord(c)) for c in "<sys>Memories: 1. z\n</sys>"]
+
+
+def test_dump_writes_only_new_segments(kv_memory, tmp_path, monkeypatch):
+    kv_memory.llm = SegmentLLM()
+    first = kv_memory.extend(["1. a\n"])
+    kv_memory.add([first])
+    kv_memory.dump(str(tmp_path))
+
+    saved = []
+    original_save = torch.save
+
+    def counting_save(obj, path):
+        saved.append(path)
+        original_save(obj, path)
+
+    monkeypatch.setattr(torch, "save", counting_save)
+    second = kv_memory.extend(["1. a\n", "2. b\n"], base=first)
+    kv_memory.delete_all()
+    kv_memory.add([second])
+    kv_memory.dump(str(tmp_path))
+
+    # Only the new memory and the re-prefilled tail are written; the stale tail is removed.
+    assert len(saved) == 2
+    segment_dir = tmp_path / "test_kv_cache.pkl.segments"
+    assert len(list(segment_dir.iterdir())) == 4
+
+    loaded = KVCacheMemory(kv_memory.config)
+    loaded.load(str(tmp_path))
+    restored = loaded.get(second.id)
+    assert cache_keys(restored.memory) == cache_keys(second.memory)
+    assert restored.records.segment_lengths == second.records.segment_lengths
+
+
+def test_safetensors_storage_loads_only_selected_caches(kv_memory, tmp_path):
+    kv_memory.config.storage_format = "safetensors"
+    kv_memory.llm = SegmentLLM()
+    plain = KVCacheItem(memory=kv_memory.llm.extend_kv_cache(["plain"])[0])
+    segmented = kv_memory.extend(["1. a\n", "2. b\n"])
+    kv_memory.add([plain, segmented])
+    kv_memory.dump(str(tmp_path))
+
+    index = json.loads((tmp_path / "test_kv_cache.pkl").read_text())
+    assert index["items"][plain.id]["segments"] == [f"{plain.id}.safetensors"]
+    assert len(index["items"][segmented.id]["segments"]) == 4
+
+    loaded = KVCacheMemory(kv_memory.config)
+    loaded.load(str(tmp_path))
+    assert set(loaded._pending_segments) == {plain.id, segmented.id}
+
+    merged = loaded.get_cache([plain.id], device="cpu")
+    assert cache_keys(merged) == cache_keys(plain.memory)
+    assert set(loaded._pending_segments) == {segmented.id}
+    assert loaded.get(segmented.id).records.segment_lengths == segmented.records.segment_lengths
+    assert cache_keys(loaded.get(segmented.id).memory) == cache_keys(segmented.memory)
+
+    # Caches that are never touched stay on disk when dumped back to the same place.
+    reloaded = KVCacheMemory(kv_memory.config)
+    reloaded.load(str(tmp_path))
+    reloaded.dump(str(tmp_path))
+    assert json.loads((tmp_path / "test_kv_cache.pkl").read_text()) == index
+
+
+def test_safetensors_dump_rewrites_changed_whole_caches(kv_memory, tmp_path):
+    kv_memory.config.storage_format = "safetensors"
+    kv_memory.llm = SegmentLLM()
+    item = KVCacheItem(memory=kv_memory.llm.extend_kv_cache(["old"])[0])
+    kv_memory.add([item])
+    kv_memory.dump(str(tmp_path))
+
+    item.memory = kv_memory.llm.extend_kv_cache(["new cache"])[0]
+    kv_memory.dump(str(tmp_path))
+
+    loaded = KVCacheMemory(kv_memory.config)
+    loaded.load(str(tmp_path))
+    assert cache_keys(loaded.get(item.id).memory) == cache_keys(item.memory)
@@ -0,0 +1,151 @@
+import math
+import threading
+
+import pytest
+
+from memos.memories.textual.tree_text_memory.retrieve.bm25_index import BM25Index, BM25Partition
+
+
+def _node(node_id, key, tags=(), memory_type="LongTermMemory", **metadata):
+    return {
+        "id": node_id,
+        "memory": key,
+        "metadata": {"key": key, "tags": list(tags), "memory_type": memory_type, **metadata},
+    }
+
+
+def _index(**kwargs):
+    return BM25Index(tokenize=lambda text: text.lower().split(), **kwargs)
+
+
+def _brute_force(partition, terms, top_k):
+    doc_count = len(partition.doc_lengths)
+    avg_length = partition.total_length / doc_count
+    scores = {}
+    for doc_id, term_freqs in partition.doc_terms.items():
+        norm = partition.k1 * (
+            1 - partition.b + partition.b * partition.doc_lengths[doc_id] / avg_length
+        )
+        score = 0.0
+        for term in terms:
+            tf = term_freqs.get(term, 0)
+            if tf:
+                idf = math.log(
+                    1
+                    + (doc_count - len(partition.postings[term]) + 0.5)
+                    / (len(partition.postings[term]) + 0.5)
+                )
+                score += idf * tf * (partition.k1 + 1) / (tf + norm)
+        if score > 0:
+            scores[doc_id] = score
+    return sorted(scores.items(), key=lambda item: (item[1], item[0]), reverse=True)[:top_k]
+
+
+def test_partition_pruned_search_matches_exhaustive_ranking():
+    partition = BM25Partition()
+    words = ["alpha", "beta", "gamma", "delta", "epsilon"]
+    for i in range(200):
+        tokens = [words[j % len(words)] for j in range(i % 7 + 1)] + [f"doc{i}"]
+        partition.upsert(f"n{i}", tokens, {})
+    query = ["epsilon", "delta", "doc42", "alpha"]
+
+    exhaustive = _brute_force(partition, query, top_k=5)
+    pruned = partition.search(query, top_k=5)
+
+    # Many synthetic documents tie, so compare the score profile and the unique winner.
+    assert [score for _, score in pruned] == pytest.approx([score for _, score in exhaustive])
+    assert pruned[0][0] == "n42"
+
+
+def test_upsert_and_remove_keep_postings_consistent():
+    partition = BM25Partition()
+    partition.upsert("a", ["coffee", "morning"], {})
+    partition.upsert("a", ["tea"], {})
+
+    assert "coffee" not in partition.postings
+    assert partition.total_length == 1
+    assert partition.search(["tea"], top_k=3)[0][0] == "a"
+
+    assert partition.remove("a") is True
+    assert partition.postings == {}
+    assert partition.total_length == 0
+
+
+def test_index_bootstraps_once_and_then_updates_incrementally():
+    index = _index()
+    loads = []
+
+    def load_nodes():
+        loads.append(1)
+        return [_node("a", "coffee habits", ["drink"]), _node("b", "tea", status="archived")]
+
+    hits = index.search("coffee", "alice", "LongTermMemory", load_nodes, top_k=5)
+    assert [doc_id for doc_id, _ in hits] == ["a"]
+
+    index.index_nodes([_node("c", "coffee beans")], user_name="alice")
+    index.index_nodes([_node("d", "coffee")], user_name="bob")
+    index.remove_nodes(["a"], user_name="alice")
+    hits = index.search("coffee", "alice", "LongTermMemory", load_nodes, top_k=5)
+
+    assert [doc_id for doc_id, _ in hits] == ["c"]
+    assert len(loads) == 1
+    assert index.stats()["partitions"] == 1
+
+
+def test_filters_and_partitions_isolate_users_and_sessions():
+    index = _index()
+    nodes = [
+        _node("s1", "project deadline", session_id="s-1"),
+        _node("s2", "project deadline", session_id="s-2"),
+    ]
+
+    hits = index.search(
+        "deadline", "alice", "LongTermMemory", lambda: nodes, filters={"session_id": "s-2"}
+    )
+
+    assert [doc_id for doc_id, _ in hits] == ["s2"]
+    assert index.search("deadline", "bob", "LongTermMemory", list) == []
+
+
+def test_partitions_isolate_graph_stores_without_user_name():
+    index = _index()
+    store_a, store_b = object(), object()
+    nodes_a = [_node("a1", "garden roses")]
+    nodes_b = [_node("b1", "garden tomatoes")]
+
+    hits_a = index.search("garden", None, "LongTermMemory", lambda: nodes_a, store=store_a)
+    hits_b = index.search("garden", None, "LongTermMemory", lambda: nodes_b, store=store_b)
+    assert [doc_id for doc_id, _ in hits_a] == ["a1"]
+    assert [doc_id for doc_id, _ in hits_b] == ["b1"]
+
+    index.index_nodes([_node("a2", "garden tulips")], store=store_a)
+    index.invalidate(store=store_b)
+    assert index.stats()["partitions"] == 1
+    hits_a = index.search("garden", None, "LongTermMemory", list, store=store_a)
+    assert sorted(doc_id for doc_id, _ in hits_a) == ["a1", "a2"]
+
+
+def test_writes_during_bootstrap_are_not_overwritten_by_snapshot():
+    index = _index()
+    loading = threading.Event()
+    release = threading.Event()
+
+    def slow_load():
+        loading.set()
+        assert release.wait(timeout=2)
+        return [_node("a", "old text"), _node("b", "removed text")]
+
+    worker = threading.Thread(
+        target=index.ensure_partition, args=("alice", "LongTermMemory", slow_load)
+    )
+    worker.start()
+    assert loading.wait(timeout=2)
+    index.index_nodes([_node("a", "new text")], user_name="alice")
+    index.remove_nodes(["b"], user_name="alice")
+    release.set()
+    worker.join(timeout=2)
+
+    partition = index.ensure_partition("alice", "LongTermMemory", list)
+    assert set(partition.doc_lengths) == {"a"}
+    assert "new" in partition.postings
+    assert "old" not in partition.postings
@@ -0,0 +1,201 @@
+import json
+import uuid
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from memos.memories.textual.tree_text_memory.organize.online_clustering import (
+    OnlineClusterIndex,
+    OnlineClusterStore,
+)
+from memos.memories.textual.tree_text_memory.organize.reorganizer import (
+    GraphStructureReorganizer,
+    QueueMessage,
+)
+
+
+def _vector(axis: int, noise: float = 0.0, dims: int = 8) -> list[float]:
+    vector = np.full(dims, noise, dtype=np.float32)
+    vector[axis] = 1.0
+    return vector.tolist()
+
+
+def _embeddings(count: int, axis: int) -> dict[str, list[float]]:
+    return {f"{axis}-{i}": _vector(axis, noise=0.01 * i) for i in range(count)}
+
+
+def test_nodes_join_nearest_cluster_or_start_a_new_one():
+    index = OnlineClusterIndex()
+    first = index.assign("a", _vector(0))
+    assert index.assign("b", _vector(0, noise=0.1)) == first
+    assert index.assign("c", _vector(3)) != first
+    assert index.assign("a", _vector(5)) == first
+    assert index.assign("no-embedding", None) is None
+    assert len(index) == 3 and len(index.clusters) == 2
+
+
+def test_oversized_cluster_is_split_by_embedding():
+    embeddings = {**_embeddings(4, axis=0), **_embeddings(3, axis=1)}
+    # both groups are close enough to share a cluster until it overflows
+    embeddings = {
+        node_id: (np.asarray(v) + np.asarray(_vector(2))).tolist()
+        for node_id, v in embeddings.items()
+    }
+    index = OnlineClusterIndex(
+        max_cluster_size=6, embedding_loader=lambda ids: {i: embeddings[i] for i in ids}
+    )
+    for node_id, vector in embeddings.items():
+        index.assign(node_id, vector)
+
+    groups = sorted(sorted(c.member_ids) for c in index.clusters.values())
+    assert groups == [sorted(_embeddings(4, 0)), sorted(_embeddings(3, 1))]
+
+
+def test_dirty_tracking_and_merge_of_shrunk_cluster():
+    embeddings = {**_embeddings(4, axis=0)}
+    embeddings["x"] = (np.asarray(_vector(0)) + np.asarray(_vector(1))).tolist()
+    embeddings["y"] = (np.asarray(_vector(0)) + np.asarray(_vector(1, noise=0.05))).tolist()
+    index = OnlineClusterIndex(
+        assign_threshold=0.9,
+        merge_threshold=0.5,
+        embedding_loader=lambda ids: {i: embeddings[i] for i in ids},
+    )
+    for node_id, vector in embeddings.items():
+        index.assign(node_id, vector)
+    assert len(index.clusters) == 2
+
+    for snapshot in index.dirty_snapshots():
+        index.mark_clean(snapshot, parent_id=f"parent-{snapshot.cluster_id}")
+    assert index.dirty_snapshots() == []
+
+    small_parent = f"parent-{index.cluster_of('x')}"
+    index.remove("y")
+    (snapshot,) = index.dirty_snapshots()
+    assert set(snapshot.member_ids) == set(_embeddings(4, 0)) | {"x"}
+    assert snapshot.new_member_ids == {"x"}
+    assert index.take_retired_parents() == [small_parent]
+
+
+def test_changes_during_summary_keep_cluster_dirty():
+    index = OnlineClusterIndex()
+    index.assign("a", _vector(0))
+    (snapshot,) = index.dirty_snapshots()
+    index.assign("b", _vector(0, noise=0.1))
+    index.mark_clean(snapshot, parent_id="p1")
+
+    (again,) = index.dirty_snapshots()
+    assert again.parent_id == "p1"
+    assert again.new_member_ids == {"b"}
+
+
+def test_store_persists_indexes_per_user_and_scope(tmp_path):
+    store = OnlineClusterStore(state_dir=str(tmp_path))
+    index = store.get("alice", "LongTermMemory")
+    index.assign("a", _vector(0))
+    index.bootstrapped = True
+    store.save("alice", "LongTermMemory")
+
+    assert store.get("bob", "LongTermMemory") is not index
+    reloaded = OnlineClusterStore(state_dir=str(tmp_path)).get("alice", "LongTermMemory")
+    assert reloaded.bootstrapped and "a" in reloaded
+    assert json.loads((tmp_path / "alice__LongTermMemory.json").read_text())["clusters"]
+
+
+@pytest.fixture
+def reorganizer():
+    graph_store = MagicMock()
+    graph_store.node_not_exist.return_value = False
+    graph_store.edge_exists.return_value = False
+    llm = MagicMock()
+    llm.generate.return_value = '{"key": "topic", "value": "summary", "tags": [], "summary": ""}'
+    embedder = MagicMock()
+    embedder.embed.side_effect = lambda texts: [_vector(0) for _ in texts]
+    reorganizer = GraphStructureReorganizer(
+        graph_store, llm, embedder, is_reorganize=False, incremental=True
+    )
+    reorganizer._is_optimizing = {"LongTermMemory": False, "UserMemory": False}
+    reorganizer._detect_relations = MagicMock()
+    return reorganizer
+
+
+def _raw_node(node_id: str, embedding: list[float]) -> dict:
+    return {
+        "id": node_id,
+        "memory": f"memory {node_id}",
+        "metadata": {"memory_type": "LongTermMemory", "embedding": embedding},
+    }
+
+
+def test_incremental_optimize_only_summarizes_dirty_clusters(reorganizer):
+    graph_store = reorganizer.graph_store
+    ids = [str(uuid.uuid4()) for _ in range(6)]
+    nodes = {
+        node_id: _raw_node(node_id, _vector(0, noise=0.01 * i)) for i, node_id in enumerate(ids)
+    }
+    graph_store.get_structure_optimization_candidates.return_value = [nodes[i] for i in ids[:5]]
+    graph_store.get_nodes.side_effect = lambda node_ids, **kwargs: [nodes[i] for i in node_ids]
+
+    reorganizer.optimize_structure(scope="LongTermMemory", user_name="alice")
+
+    graph_store.add_node.assert_called_once()
+    parent_id = graph_store.add_node.call_args.args[0]
+    assert graph_store.add_edge.call_count == 5
+
+    # no new memories: nothing to do, and the scope is not reloaded
+    graph_store.reset_mock()
+    reorganizer.optimize_structure(scope="LongTermMemory", user_name="alice")
+    graph_store.get_structure_optimization_candidates.assert_not_called()
+    graph_store.get_nodes.assert_not_called()
+
+    # one new memory: the existing parent is updated and linked to the new child only
+    added = MagicMock(id=ids[5])
+    added.metadata.memory_type = "LongTermMemory"
+    added.metadata.embedding = nodes[ids[5]]["metadata"]["embedding"]
+    reorganizer._assign_to_clusters([added], "alice")
+    reorganizer.optimize_structure(scope="LongTermMemory", user_name="alice")
+
+    graph_store.add_node.assert_not_called()
+    assert graph_store.update_node.call_args.args[0] == parent_id
+    graph_store.add_edge.assert_called_once_with(parent_id, ids[5], "PARENT", user_name="alice")
+    new_nodes = reorganizer._detect_relations.call_args.args[0]
+    assert [n.id for n in new_nodes] == [ids[5]]
+
+
+def test_removed_and_conflict_deleted_nodes_leave_their_clusters(reorganizer):
+    index = reorganizer.cluster_store.get("alice", "LongTermMemory")
+    for node_id in ("a", "b", "c"):
+        index.assign(node_id, _vector(0))
+
+    reorganizer.handle_remove(QueueMessage(op="remove", before_node=["a"], user_name="alice"))
+    assert "a" not in index
+
+    older = MagicMock(id="b", memory="older")
+    older.metadata.memory_type = "LongTermMemory"
+    older.metadata.updated_at = "2024-01-01T00:00:00"
+    newer = MagicMock(id="c", memory="newer")
+    newer.metadata.updated_at = "2025-01-01T00:00:00"
+    reorganizer.resolver._hard_update(newer, older, user_name="alice")
+
+    reorganizer.graph_store.delete_node.assert_called_once_with("b", user_name="alice")
+    assert "b" not in index and "c" in index
+
+
+def test_seeding_requests_embeddings_and_retries_when_none_arrive(reorganizer):
+    graph_store = reorganizer.graph_store
+    graph_store.get_structure_optimization_candidates.return_value = [
+        {"id": "a", "memory": "a", "metadata": {"memory_type": "LongTermMemory"}}
+    ]
+
+    reorganizer.optimize_structure(scope="LongTermMemory", user_name="alice")
+
+    graph_store.get_structure_optimization_candidates.assert_called_once_with(
+        "LongTermMemory", include_embedding=True, user_name="alice"
+    )
+    assert not reorganizer.cluster_store.get("alice", "LongTermMemory").bootstrapped
+
+    graph_store.get_structure_optimization_candidates.return_value = [_raw_node("a", _vector(0))]
+    reorganizer.optimize_structure(scope="LongTermMemory", user_name="alice")
+    index = reorganizer.cluster_store.get("alice", "LongTermMemory")
+    assert index.bootstrapped and "a" in index
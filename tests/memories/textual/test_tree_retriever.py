@@ -68,7 +68,7 @@ def test_vector_recall_combines_and_dedups(retriever, mock_graph_store):
     n2_id = str(uuid.uuid4())
 
     vec = [[0.1] * 5]
-    mock_graph_store.search_by_embedding.return_value = [{"id": n1_id}, {"id": n2_id}]
+    mock_graph_store.search_batch.return_value = [[{"id": n1_id}, {"id": n2_id}]]
 
     mock_graph_store.get_nodes.return_value = [
         {"id": n1_id, "memory": "m1", "metadata": {}},
@@ -86,18 +86,20 @@ def test_vector_recall_uses_lightweight_hits_without_get_nodes(
     monkeypatch.setenv("MEMOS_POLARDB_LIGHTWEIGHT_SEARCH_ENABLED", "true")
     mock_graph_store.supports_lightweight_vector_search = True
     node_id = str(uuid.uuid4())
-    mock_graph_store.search_by_embedding.return_value = [
-        {
-            "id": node_id,
-            "score": 0.91,
-            "memory": "remembered content",
-            "memory_type": "LongTermMemory",
-            "user_name": "cube-a",
-            "key": "topic",
-            "tags": ["tag-a"],
-            "reasoning": "User explicitly chose this option.",
-            "internet_info": {"title": "reference", "url": "https://example.com"},
-        }
+    mock_graph_store.search_batch.return_value = [
+        [
+            {
+                "id": node_id,
+                "score": 0.91,
+                "memory": "remembered content",
+                "memory_type": "LongTermMemory",
+                "user_name": "cube-a",
+                "key": "topic",
+                "tags": ["tag-a"],
+                "reasoning": "User explicitly chose this option.",
+                "internet_info": {"title": "reference", "url": "https://example.com"},
+            }
+        ]
     ]
 
     results = retriever._vector_recall([[0.1] * 5], "LongTermMemory", top_k=5, user_name="cube-a")
@@ -114,7 +116,7 @@ def test_vector_recall_uses_lightweight_hits_without_get_nodes(
     }
     assert results[0].metadata.relativity == pytest.approx(0.91)
     mock_graph_store.get_nodes.assert_not_called()
-    search_kwargs = mock_graph_store.search_by_embedding.call_args.kwargs
+    search_kwargs = mock_graph_store.search_batch.call_args.kwargs
     assert search_kwargs["light_weight_mode"] is True
     assert "memory" in search_kwargs["return_fields"]
     assert "memory_type" in search_kwargs["return_fields"]
@@ -130,7 +132,7 @@ def test_vector_recall_falls_back_when_lightweight_hit_lacks_required_fields(
     monkeypatch.setenv("MEMOS_POLARDB_LIGHTWEIGHT_SEARCH_ENABLED", "true")
     mock_graph_store.supports_lightweight_vector_search = True
     node_id = str(uuid.uuid4())
-    mock_graph_store.search_by_embedding.return_value = [{"id": node_id, "score": 0.8}]
+    mock_graph_store.search_batch.return_value = [[{"id": node_id, "score": 0.8}]]
     mock_graph_store.get_nodes.return_value = [
         {
             "id": node_id,
@@ -172,3 +174,59 @@ def test_retrieve_merges_graph_and_vector(retriever, mock_graph_store):
     assert len(results) == 2
     ids = [r.id for r in results]
     assert g1_id in ids and v1_id in ids
+
+
+def test_bm25_recall_uses_index_and_drops_stale_hits(mock_graph_store, mock_embedder):
+    from memos.memories.textual.tree_text_memory.retrieve.bm25_index import BM25Index
+
+    bm25_retriever = MagicMock()
+    bm25_retriever.index = BM25Index(tokenize=lambda text: text.lower().split())
+    retriever = GraphMemoryRetriever(mock_graph_store, mock_embedder, bm25_retriever)
+    kept_id, gone_id = str(uuid.uuid4()), str(uuid.uuid4())
+    nodes = [
+        {"id": kept_id, "memory": "m1", "metadata": {"key": "coffee", "tags": ["drink"]}},
+        {"id": gone_id, "memory": "m2", "metadata": {"key": "coffee", "tags": []}},
+    ]
+    mock_graph_store.get_by_metadata.return_value = [kept_id, gone_id]
+    mock_graph_store.get_nodes.side_effect = [nodes, nodes[:1], nodes[:1]]
+
+    parsed_goal = ParsedTaskGoal(keys=["coffee"], tags=[])
+    first = retriever._bm25_recall("coffee", parsed_goal, "LongTermMemory", user_name="u")
+    second = retriever._bm25_recall("coffee", parsed_goal, "LongTermMemory", user_name="u")
+
+    assert [item.id for item in first] == [kept_id]
+    assert [item.id for item in second] == [kept_id]
+    mock_graph_store.get_by_metadata.assert_called_once()
+    assert mock_graph_store.get_nodes.call_args.args[0] == [kept_id]
+
+
+def test_bm25_recall_widens_fetch_for_selective_filters(mock_graph_store, mock_embedder):
+    from memos.memories.textual.tree_text_memory.retrieve.bm25_index import BM25Index
+
+    bm25_retriever = MagicMock()
+    bm25_retriever.index = BM25Index(tokenize=lambda text: text.lower().split())
+    retriever = GraphMemoryRetriever(mock_graph_store, mock_embedder, bm25_retriever)
+    ids = [str(uuid.uuid4()) for _ in range(6)]
+    nodes = {
+        node_id: {
+            "id": node_id,
+            # the only node matching the filter has the weakest BM25 score
+            "memory": f"m{i}",
+            "metadata": {"key": "coffee" + " filler" * i, "tags": [], "source": "file"},
+        }
+        for i, node_id in enumerate(ids)
+    }
+    nodes[ids[-1]]["metadata"]["source"] = "conversation"
+    mock_graph_store.get_by_metadata.return_value = ids
+    mock_graph_store.get_nodes.side_effect = lambda node_ids, **kwargs: [nodes[i] for i in node_ids]
+
+    results = retriever._bm25_recall(
+        "coffee",
+        ParsedTaskGoal(keys=["coffee"], tags=[]),
+        "LongTermMemory",
+        top_k=1,
+        user_name="u",
+        search_filter={"source": "conversation"},
+    )
+
+    assert [item.id for item in results] == [ids[-1]]
@@ -0,0 +1,151 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from memos.memories.textual.item import TextualMemoryItem
+from memos.memories.textual.tree_text_memory.retrieve import result_cache as result_cache_module
+from memos.memories.textual.tree_text_memory.retrieve.result_cache import (
+    SearchResultCache,
+    make_scope,
+)
+from memos.memories.textual.tree_text_memory.retrieve.searcher import Searcher
+from memos.reranker.base import BaseReranker
+
+
+SCOPE = make_scope(mode="fast", top_k=5, search_filter={"session_id": "s1"})
+
+
+def test_exact_hit_normalizes_query_and_returns_copies():
+    cache = SearchResultCache(max_size=4, ttl_seconds=60)
+    results = [{"id": "a", "memory": "cats"}]
+    cache.put("cube", SCOPE, "Tell me  about Cats", results, cache.version("cube"))
+
+    hit = cache.get("cube", SCOPE, "tell me about cats")
+    assert hit == results
+    hit[0]["memory"] = "changed"
+    assert cache.get("cube", SCOPE, "tell me about cats")[0]["memory"] == "cats"
+
+    assert cache.get("cube", make_scope(mode="fine"), "tell me about cats") is None
+    assert cache.get("other", SCOPE, "tell me about cats") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 2)
+    assert stats["hit_rate"] == pytest.approx(0.5)
+
+
+def test_bump_invalidates_only_that_cube_and_rejects_stale_puts():
+    cache = SearchResultCache(max_size=4, ttl_seconds=60)
+    cache.put("a", SCOPE, "q", ["a"], cache.version("a"))
+    cache.put("b", SCOPE, "q", ["b"], cache.version("b"))
+
+    stale_version = cache.version("a")
+    cache.bump("a")
+    assert cache.get("a", SCOPE, "q") is None
+    assert cache.get("b", SCOPE, "q") == ["b"]
+
+    cache.put("a", SCOPE, "q", ["old"], stale_version)
+    assert cache.get("a", SCOPE, "q") is None
+    assert cache.stats()["stale_puts"] == 1
+
+    cache.bump()
+    assert cache.get("b", SCOPE, "q") is None
+
+
+def test_lru_eviction_and_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(result_cache_module.time, "monotonic", lambda: now[0])
+    cache = SearchResultCache(max_size=2, ttl_seconds=10)
+    for query in ("q1", "q2"):
+        cache.put("cube", SCOPE, query, [query], cache.version("cube"))
+    cache.get("cube", SCOPE, "q1")
+    cache.put("cube", SCOPE, "q3", ["q3"], cache.version("cube"))
+
+    assert cache.get("cube", SCOPE, "q2") is None
+    assert cache.get("cube", SCOPE, "q1") == ["q1"]
+
+    now[0] += 11
+    assert cache.get("cube", SCOPE, "q3") is None
+    assert cache.stats()["expired"] == 1
+
+
+def test_semantic_hit_requires_threshold_and_same_scope():
+    cache = SearchResultCache(max_size=4, ttl_seconds=60, semantic_threshold=0.95)
+    cache.put("cube", SCOPE, "cats", ["cats"], cache.version("cube"), [1.0, 0.0])
+
+    assert cache.get("cube", SCOPE, "kittens", [0.99, 0.05]) == ["cats"]
+    assert cache.get("cube", SCOPE, "dogs", [0.0, 1.0]) is None
+    assert cache.get("cube", make_scope(mode="fine"), "kittens", [0.99, 0.05]) is None
+    assert cache.stats()["semantic_hits"] == 1
+
+
+def test_disabled_cache_never_stores():
+    cache = SearchResultCache(enabled=False)
+    cache.put("cube", SCOPE, "q", ["x"], cache.version("cube"))
+    assert cache.get("cube", SCOPE, "q") is None
+    assert cache.stats()["size"] == 0
+
+
+@pytest.fixture
+def searcher_with_cache(monkeypatch):
+    cache = SearchResultCache(max_size=8, ttl_seconds=60)
+    monkeypatch.setattr(
+        "memos.memories.textual.tree_text_memory.retrieve.searcher.get_shared_search_result_cache",
+        lambda: cache,
+    )
+    searcher = Searcher(MagicMock(), MagicMock(), MagicMock(), MagicMock(spec=BaseReranker))
+    searcher._search_uncached = MagicMock(return_value=[TextualMemoryItem(memory="cats")])
+    return searcher, cache
+
+
+def test_searcher_serves_repeated_search_from_cache(searcher_with_cache):
+    searcher, cache = searcher_with_cache
+    info = {"user_id": "u", "session_id": "s"}
+
+    first = searcher.search("cats?", top_k=3, info=info, user_name="cube")
+    second = searcher.search("Cats?", top_k=3, info=info, user_name="cube")
+    assert [item.memory for item in second] == [item.memory for item in first]
+    assert searcher._search_uncached.call_count == 1
+
+    searcher.search("cats?", top_k=4, info=info, user_name="cube")
+    assert searcher._search_uncached.call_count == 2
+
+    cache.bump("cube")
+    searcher.search("cats?", top_k=3, info=info, user_name="cube")
+    assert searcher._search_uncached.call_count == 3
+
+
+def test_searchers_over_different_stores_do_not_share_results(searcher_with_cache):
+    searcher, cache = searcher_with_cache
+    other = Searcher(MagicMock(), MagicMock(), MagicMock(), MagicMock(spec=BaseReranker))
+    other._search_uncached = MagicMock(return_value=[TextualMemoryItem(memory="dogs")])
+    info = {"user_id": "u", "session_id": "s"}
+
+    searcher.search("pets", top_k=3, info=info, user_name=None)
+    hits = other.search("pets", top_k=3, info=info, user_name=None)
+
+    assert [item.memory for item in hits] == ["dogs"]
+    other._search_uncached.assert_called_once()
+
+
+def test_preference_writes_invalidate_owning_cube(monkeypatch):
+    from memos.memories.textual import preference as preference_module
+    from memos.memories.textual.item import PreferenceTextualMemoryMetadata
+
+    cache = SearchResultCache(max_size=8, ttl_seconds=60)
+    monkeypatch.setattr(preference_module, "bump_cube_version", cache.bump)
+    for cube in ("a", "b"):
+        cache.put(cube, SCOPE, "q", [cube], cache.version(cube))
+
+    pref_mem = object.__new__(preference_module.PreferenceTextMemory)
+    pref_mem.adder = MagicMock()
+    pref_mem.adder.add.return_value = ["p1"]
+    item = TextualMemoryItem(
+        memory="likes tea", metadata=PreferenceTextualMemoryMetadata(mem_cube_id="a")
+    )
+    assert pref_mem.add([item]) == ["p1"]
+    assert cache.get("a", SCOPE, "q") is None
+    assert cache.get("b", SCOPE, "q") == ["b"]
+
+    pref_mem.vector_db = MagicMock()
+    pref_mem.vector_db.config.collection_name = ["explicit_preference"]
+    pref_mem.delete(["p1"])
+    assert cache.get("b", SCOPE, "q") is None
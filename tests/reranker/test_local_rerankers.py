@@ -110,3 +110,21 @@ def test_cosine_local_reranker_logs_summary_without_candidate_payload(caplog):
     assert private_memory not in message
     assert str(private_embedding_value) not in message
     assert "embedding" not in message
+
+
+def test_cosine_local_reranker_scores_quantized_embeddings():
+    from memos.embedders.quantized import QuantizedEmbedding
+
+    items = [
+        _memory_item(
+            "00000000-0000-0000-0000-000000000001",
+            "orthogonal",
+            QuantizedEmbedding.from_vector([0.0, 1.0], "int8"),
+        ),
+        _memory_item("00000000-0000-0000-0000-000000000002", "aligned", [1.0, 0.1]),
+    ]
+
+    ranked = CosineLocalReranker().rerank("query", items, top_k=2, query_embedding=[1.0, 0.0])
+
+    assert [item.memory for item, _ in ranked] == ["aligned", "orthogonal"]
+    assert abs(ranked[1][1]) < 1e-6
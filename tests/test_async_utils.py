@@ -0,0 +1,43 @@
+import asyncio
+
+from memos import async_utils
+from memos.context.context import RequestContext, get_current_trace_id, set_request_context
+
+
+def test_shared_clients_and_limiters_are_pooled_per_loop():
+    created = []
+
+    def factory():
+        created.append(object())
+        return created[-1]
+
+    async def lookup():
+        first = async_utils.get_shared_async_client(("test", "a"), factory)
+        second = async_utils.get_shared_async_client(("test", "a"), factory)
+        other = async_utils.get_shared_async_client(("test", "b"), factory)
+        limiter = async_utils.get_async_limiter(("test", "a"), limit=2)
+        assert limiter is async_utils.get_async_limiter(("test", "a"))
+        return first, second, other
+
+    first, second, other = asyncio.run(lookup())
+    assert first is second
+    assert other is not first
+
+    # A new event loop gets its own clients, since httpx connections are loop-bound.
+    assert asyncio.run(lookup())[0] is not first
+    assert len(created) == 4
+
+
+def test_background_loop_propagates_request_context():
+    async def trace_id():
+        await asyncio.sleep(0)
+        return get_current_trace_id()
+
+    set_request_context(RequestContext(trace_id="trace-123"))
+    try:
+        future = async_utils.submit_to_background_loop(trace_id())
+        assert future.result(timeout=5) == "trace-123"
+    finally:
+        set_request_context(None)
+
+    assert async_utils._get_background_loop() is async_utils._get_background_loop()
@@ -148,3 +148,43 @@ def test_qdrant_client_cloud_init():
         VecDBFactory.from_config(config)
 
         mockclient.assert_called_once_with(url="https://cloud.qdrant.example", api_key="secret-key")
+
+
+def test_search_batch(vec_db):
+    def response(point_id, score):
+        point = type(
+            "obj",
+            (object,),
+            {"id": point_id, "vector": [0.1, 0.2], "payload": {}, "score": score},
+        )
+        return type("QueryResponse", (object,), {"points": [point]})()
+
+    first, second = str(uuid.uuid4()), str(uuid.uuid4())
+    vec_db.client.query_batch_points.return_value = [response(first, 0.9), response(second, 0.5)]
+
+    results = vec_db.search_batch([[0.1, 0.2], [0.2, 0.1]], top_k=1)
+
+    vec_db.client.query_batch_points.assert_called_once()
+    assert len(vec_db.client.query_batch_points.call_args.kwargs["requests"]) == 2
+    assert [[item.id for item in items] for items in results] == [[first], [second]]
+    assert results[1][0].score == 0.5
+
+
+def test_search_projection(vec_db):
+    point = type("obj", (object,), {"id": str(uuid.uuid4()), "vector": None, "payload": None})
+    point.score = 0.7
+    vec_db.client.query_points.return_value = type("QueryResponse", (object,), {"points": [point]})
+
+    results = vec_db.search([0.1, 0.2], top_k=1, return_vector=False, payload_fields=[])
+    kwargs = vec_db.client.query_points.call_args.kwargs
+    assert (kwargs["with_vectors"], kwargs["with_payload"]) == (False, False)
+    assert results[0].vector is None and results[0].score == 0.7
+
+    vec_db.search([0.1, 0.2], top_k=1, payload_fields=["memory_type"])
+    kwargs = vec_db.client.query_points.call_args.kwargs
+    assert (kwargs["with_vectors"], kwargs["with_payload"]) == (True, ["memory_type"])
+
+    vec_db.client.scroll.return_value = ([], None)
+    vec_db.get_by_filter({"user_name": "u"}, return_vector=False, payload_fields=[])
+    kwargs = vec_db.client.scroll.call_args.kwargs
+    assert (kwargs["with_vectors"], kwargs["with_payload"]) == (False, False)